@@ -4,7 +4,7 @@ import sys
 import signal
 import time
 from telegram import Update
-from telegram.ext import ApplicationBuilder, ContextTypes, PicklePersistence, Application, JobQueue
+from telegram.ext import ApplicationBuilder, ContextTypes, Application, JobQueue
 from telegram.error import NetworkError, TimedOut
 
 from src.app.app_lifecycle import (
@@ -18,8 +18,23 @@ from src.bot.bot_initialization import (
 from src.handlers.abdm import *
 
 from src.bot.bot_telegram import setup_handlers
-from src.app.app_api_status_manager import periodic_api_status_check, update_all_api_statuses_once  # New Import
+from src.app.app_api_status_manager import periodic_api_status_check, update_all_api_statuses_once, HEALTH_CHECK_TICK_SECONDS  # New Import
+from src.app.app_metadata_refresh import periodic_metadata_refresh
+from src.services.bot_metadata_cache import METADATA_REFRESH_INTERVAL_SECONDS
+from src.app.app_catalog_sync import periodic_catalog_sync
+from src.services.bot_catalog_cache import CATALOG_SYNC_INTERVAL_SECONDS
+from src.app.app_plex_session_watch import periodic_plex_session_listener_check
+from src.services.plex.bot_plex_session_listener import PLEX_SESSION_LISTENER_CHECK_INTERVAL_SECONDS
+from src.app.app_queue_monitor import periodic_queue_poll
+from src.services.bot_queue_monitor import QUEUE_POLL_INTERVAL_SECONDS
 from src.app.app_setup import perform_initial_setup
+from src.bot.bot_broadcast import broadcast_to_chats
+from src.bot.bot_outbound_queue import PRIORITY_BACKGROUND
+from src.app.app_service_executor import shutdown_service_executors
+from src.services.bot_http_sessions import close_service_sessions
+from src.app.app_state_store import close_state_store
+from src.app.app_bot_persistence import StateStorePersistence
+from src.bot.bot_menu_fingerprints import drop_legacy_menu_content
 from src.app import app_config_holder
 
 logger = logging.getLogger(__name__)
@@ -57,6 +72,10 @@ async def post_init_tasks(application: Application) -> None:
     logger.info(
         f"Version {project_version} - Post-init tasks started: Setting commands and refreshing menus for known users.")
 
+    # Menu fingerprints are kept in a bounded store now; the old per-message
+    # entries would otherwise stay in bot_data forever.
+    drop_legacy_menu_content(application.bot_data)
+
     # Perform an initial API status check and update bot_data
     await update_all_api_statuses_once(application.bot_data)
 
@@ -78,38 +97,39 @@ async def post_init_tasks(application: Application) -> None:
 
         return
 
-    for user_id_to_refresh_str in users_to_refresh:
-        user_id_to_refresh_int = int(user_id_to_refresh_str)
-        logger.info(
-            f"Post-init: Refreshing interface for user: {user_id_to_refresh_str}")
-        menu_msg_id = await show_or_edit_main_menu(user_id_to_refresh_str, application, force_send_new=True)
-        if not menu_msg_id:
-            logger.error(
-                f"Post-init: Failed to send main menu message to user {user_id_to_refresh_str}.")
-        else:
-            logger.info(
-                f"Post-init: Main menu sent/refreshed for user {user_id_to_refresh_str}. Message ID: {menu_msg_id}")
+    no_features_enabled = not any([app_config_holder.is_plex_enabled(),
+                                   app_config_holder.is_radarr_enabled(),
+                                   app_config_holder.is_sonarr_enabled(),
+                                   app_config_holder.is_pc_control_enabled(),
+                                   app_config_holder.is_abdm_enabled()])
 
-        initial_status_text = "⏳ Media Bot is back online. Main menu refreshed."
+    async def send_menu(user_id_to_refresh_str: str):
+        return await show_or_edit_main_menu(user_id_to_refresh_str, application, force_send_new=True,
+                                            raise_on_retry_after=True, priority=PRIORITY_BACKGROUND)
 
-        if app_config_holder.get_user_role(user_id_to_refresh_str) == app_config_holder.ROLE_ADMIN and \
-           not any([app_config_holder.is_plex_enabled(),
-                    app_config_holder.is_radarr_enabled(),
-                    app_config_holder.is_sonarr_enabled(),
-                    app_config_holder.is_pc_control_enabled(),
-                    app_config_holder.is_abdm_enabled()]):
+    async def send_initial_status(user_id_to_refresh_str: str):
+        initial_status_text = "⏳ Media Bot is back online. Main menu refreshed."
+        if no_features_enabled and \
+           app_config_holder.get_user_role(user_id_to_refresh_str) == app_config_holder.ROLE_ADMIN:
             initial_status_text = "⚠️ No features enabled. Check /settings. Bot is online."
-
-        universal_msg_id = await send_or_edit_universal_status_message(
-            application.bot, user_id_to_refresh_int, initial_status_text,
-            parse_mode=None, force_send_new=True
+        return await send_or_edit_universal_status_message(
+            application.bot, int(user_id_to_refresh_str), initial_status_text,
+            parse_mode=None, force_send_new=True, raise_on_retry_after=True,
+            priority=PRIORITY_BACKGROUND
         )
+
+    logger.info(
+        f"Post-init: Refreshing interface for {len(users_to_refresh)} users.")
+    results = await broadcast_to_chats(
+        users_to_refresh, [send_menu, send_initial_status], description="post-init menu refresh")
+
+    for user_id_to_refresh_str, (menu_msg_id, universal_msg_id) in results.items():
+        if not menu_msg_id:
+            logger.error(
+                f"Post-init: Failed to send main menu message to user {user_id_to_refresh_str}.")
         if not universal_msg_id:
             logger.error(
                 f"Post-init: Failed to send initial universal status message to user {user_id_to_refresh_str}.")
-        else:
-            logger.info(
-                f"Post-init: Universal status sent/refreshed for user {user_id_to_refresh_str}. Message ID: {universal_msg_id}")
 
     logger.info(
         f"Version {project_version} - Post-init tasks complete for all known Admin/Standard users.")
@@ -121,10 +141,13 @@ def main():
         current_data_path, "mediabot_persistence.pickle")
     persistence = None
     try:
-        persistence = PicklePersistence(filepath=persistence_file)
-        logger.info(f"Using PicklePersistence: {persistence_file}")
+        # The pickle file is only read once, to migrate it into the state store.
+        persistence = StateStorePersistence(
+            legacy_pickle_path=persistence_file)
+        logger.info("Using bot state store persistence.")
     except Exception as e:
-        logger.error(f"Failed to init PicklePersistence: {e}.", exc_info=True)
+        logger.error(
+            f"Failed to init bot state store persistence: {e}.", exc_info=True)
     application = None
     for attempt in range(MAX_STARTUP_RETRIES):
         temp_app_for_context = application if application else ApplicationBuilder(
@@ -148,11 +171,23 @@ def main():
             set_bot_application_instance(application)
             logger.info("Application built.")
 
-            # Schedule the periodic API status check job
-            # Check every 5 mins, first run after 10s
+            # Schedule the periodic API status check job. It ticks often but
+            # each service is only probed when its adaptive interval is due.
             application.job_queue.run_repeating(
-                periodic_api_status_check, interval=60, first=30, name="PeriodicAPIStatusCheck")
+                periodic_api_status_check, interval=HEALTH_CHECK_TICK_SECONDS, first=30, name="PeriodicAPIStatusCheck")
             logger.info("Scheduled periodic API status check job.")
+            application.job_queue.run_repeating(
+                periodic_metadata_refresh, interval=METADATA_REFRESH_INTERVAL_SECONDS, first=45, name="PeriodicMetadataRefresh")
+            logger.info("Scheduled periodic Radarr/Sonarr metadata refresh job.")
+            application.job_queue.run_repeating(
+                periodic_catalog_sync, interval=CATALOG_SYNC_INTERVAL_SECONDS, first=60, name="PeriodicCatalogSync")
+            logger.info("Scheduled periodic library catalogue sync job.")
+            application.job_queue.run_repeating(
+                periodic_plex_session_listener_check, interval=PLEX_SESSION_LISTENER_CHECK_INTERVAL_SECONDS, first=20, name="PlexSessionListenerCheck")
+            logger.info("Scheduled Plex session listener watchdog job.")
+            application.job_queue.run_repeating(
+                periodic_queue_poll, interval=QUEUE_POLL_INTERVAL_SECONDS, first=QUEUE_POLL_INTERVAL_SECONDS, name="PeriodicQueuePoll")
+            logger.info("Scheduled shared Radarr/Sonarr queue monitor job.")
             break
         except (NetworkError, TimedOut) as ne:
             logger.warning(
@@ -200,14 +235,11 @@ def main():
             f"Unhandled exception in run_polling: {e}", exc_info=True)
     finally:
         logger.info("Bot polling loop ended.")
-        if application and application.persistence:
-            try:
-                logger.info("Flushing persistence...")
-                application.persistence.flush()
-                logger.info("Persistence flushed.")
-            except Exception as final_flush_e:
-                logger.error(
-                    f"Error flushing persistence during final shutdown: {final_flush_e}", exc_info=True)
+        # Persistence rows go through the state store's write-behind queue,
+        # which close_state_store() flushes below.
+        shutdown_service_executors()
+        close_service_sessions()
+        close_state_store()
         logger.info(
             f"--- Media Bot Version: {project_version_loaded} shutdown ---")
 
@@ -1,7 +1,10 @@
+import asyncio
 import logging
+import time
 from telegram.ext import CallbackContext
 
 import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_health_probe
 from src.services.plex.bot_plex_core import check_plex_connection
 from src.services.radarr.bot_radarr_core import check_radarr_connection
 from src.services.sonarr.bot_sonarr_core import check_sonarr_connection
@@ -16,6 +19,21 @@ API_STATUS_DISABLED = "disabled"  # Explicitly for when service is off in config
 # Default if check hasn't run or failed unexpectedly
 API_STATUS_UNKNOWN = "unknown"
 
+# The periodic job ticks this often; each tick only probes services that are due.
+HEALTH_CHECK_TICK_SECONDS = 15
+# Upper bound on one probe. Probes have their own worker per service, so this
+# is not spent queueing behind user requests.
+HEALTH_CHECK_DEADLINE_SECONDS = 5
+HEALTH_CHECK_BASE_INTERVAL_SECONDS = 60
+# After a status change a service is re-probed quickly a few times to confirm it.
+HEALTH_CHECK_FAST_INTERVAL_SECONDS = 15
+HEALTH_CHECK_FAST_PROBES_AFTER_CHANGE = 3
+# A service that stays offline is probed less and less often, up to this interval.
+HEALTH_CHECK_MAX_OFFLINE_INTERVAL_SECONDS = 600
+HEALTH_LATENCY_HISTORY_SIZE = 30
+# bot_data key holding per-service probe history and schedule.
+API_HEALTH_BOT_DATA_KEY = "api_health"
+
 SERVICE_CHECK_MAP = {
     "plex": {
         "is_enabled_func": app_config_holder.is_plex_enabled,
@@ -44,46 +62,133 @@ SERVICE_CHECK_MAP = {
 }
 
 
+# service_name -> {"next_probe_at": float (monotonic), "fast_probes_left": int}
+_probe_schedule: dict[str, dict] = {}
+
+
+async def _probe_service(service_name: str, checks: dict) -> tuple[str, float | None]:
+    """Returns (status, latency_ms). Latency is None when no probe was made."""
+    if not checks["is_enabled_func"]():
+        return API_STATUS_DISABLED, None
+    if not checks["config_check_func"]():
+        return API_STATUS_CONFIG_ERROR, None
+    started_at = time.monotonic()
+    try:
+        is_online = await asyncio.wait_for(
+            run_health_probe(service_name, checks["connection_check_func"]),
+            timeout=HEALTH_CHECK_DEADLINE_SECONDS)
+        status = API_STATUS_ONLINE if is_online else API_STATUS_OFFLINE
+    except asyncio.TimeoutError:
+        logger.debug(
+            f"{service_name} health check exceeded {HEALTH_CHECK_DEADLINE_SECONDS}s deadline.")
+        status = API_STATUS_OFFLINE
+    except Exception as e:
+        logger.error(
+            f"Error during {service_name} connection check: {e}", exc_info=False)
+        status = API_STATUS_UNKNOWN
+    return status, round((time.monotonic() - started_at) * 1000, 1)
+
+
+def _next_probe_interval(service_name: str, health: dict, status_changed: bool) -> float:
+    schedule = _probe_schedule.setdefault(
+        service_name, {"next_probe_at": 0.0, "fast_probes_left": 0})
+    if status_changed:
+        schedule["fast_probes_left"] = HEALTH_CHECK_FAST_PROBES_AFTER_CHANGE
+    if health["last_status"] in (API_STATUS_DISABLED, API_STATUS_CONFIG_ERROR):
+        schedule["fast_probes_left"] = 0
+        return HEALTH_CHECK_BASE_INTERVAL_SECONDS
+    if schedule["fast_probes_left"] > 0:
+        schedule["fast_probes_left"] -= 1
+        return HEALTH_CHECK_FAST_INTERVAL_SECONDS
+    if health["last_status"] == API_STATUS_ONLINE:
+        return HEALTH_CHECK_BASE_INTERVAL_SECONDS
+    # Failures past the fast confirmation probes double the interval each time.
+    backoff_steps = max(health["consecutive_failures"] -
+                        HEALTH_CHECK_FAST_PROBES_AFTER_CHANGE, 0)
+    return min(HEALTH_CHECK_BASE_INTERVAL_SECONDS * (2 ** min(backoff_steps, 10)),
+               HEALTH_CHECK_MAX_OFFLINE_INTERVAL_SECONDS)
+
+
+def _record_probe_result(bot_data: dict, service_name: str, status: str, latency_ms: float | None):
+    checks = SERVICE_CHECK_MAP[service_name]
+    previous_status = bot_data.get(checks["bot_data_key"])
+    bot_data[checks["bot_data_key"]] = status
+
+    health = bot_data.setdefault(API_HEALTH_BOT_DATA_KEY, {}).setdefault(
+        service_name, {"history": [], "consecutive_failures": 0, "last_changed_at": None})
+    now = time.time()
+    status_changed = previous_status is not None and previous_status != status
+    if status_changed:
+        health["last_changed_at"] = now
+        logger.info(
+            f"{service_name} API status changed: {previous_status} -> {status}")
+    health["last_status"] = status
+    health["last_checked_at"] = now
+    health["last_latency_ms"] = latency_ms
+    if status in (API_STATUS_OFFLINE, API_STATUS_UNKNOWN):
+        health["consecutive_failures"] = health.get(
+            "consecutive_failures", 0) + 1
+    else:
+        health["consecutive_failures"] = 0
+    if latency_ms is not None:
+        history = health.setdefault("history", [])
+        history.append({"at": now, "status": status, "latency_ms": latency_ms})
+        del history[:-HEALTH_LATENCY_HISTORY_SIZE]
+
+    interval = _next_probe_interval(service_name, health, status_changed)
+    _probe_schedule[service_name]["next_probe_at"] = time.monotonic() + interval
+    health["next_probe_at"] = now + interval
+    logger.debug(
+        f"{service_name} status: {status} ({latency_ms} ms), next probe in {interval:.0f}s")
+
+
+async def _probe_and_record(bot_data: dict, service_names: list[str]):
+    results = await asyncio.gather(*(_probe_service(name, SERVICE_CHECK_MAP[name])
+                                     for name in service_names))
+    for service_name, (status, latency_ms) in zip(service_names, results):
+        _record_probe_result(bot_data, service_name, status, latency_ms)
+
+
 async def update_all_api_statuses_once(bot_data: dict) -> None:
     """
-    Performs a one-time update of all API statuses and stores them in bot_data.
-    This is suitable for calling on startup or after config changes.
+    Probes every service concurrently, ignoring the adaptive schedule, and
+    stores the statuses in bot_data. Used on startup and after config changes.
     """
     logger.info("Performing one-time update of all API statuses...")
-    for service_name, checks in SERVICE_CHECK_MAP.items():
-        status_to_set = API_STATUS_UNKNOWN
-        if not checks["is_enabled_func"]():
-            status_to_set = API_STATUS_DISABLED
-        elif not checks["config_check_func"]():
-            status_to_set = API_STATUS_CONFIG_ERROR
-        else:
-            try:
-                if checks["connection_check_func"]():
-                    status_to_set = API_STATUS_ONLINE
-                else:
-                    status_to_set = API_STATUS_OFFLINE
-            except Exception as e:
-                logger.error(
-                    f"Error during {service_name} connection check for initial status: {e}", exc_info=False)
-                status_to_set = API_STATUS_UNKNOWN  # Or a specific error status
-
-        bot_data[checks["bot_data_key"]] = status_to_set
-        logger.debug(f"Initial status for {service_name}: {status_to_set}")
+    await _probe_and_record(bot_data, list(SERVICE_CHECK_MAP))
     logger.info("One-time API status update complete.")
 
 
 async def periodic_api_status_check(context: CallbackContext) -> None:
     """
-    Periodically checks the status of all configured APIs and updates bot_data.
-    This function is intended to be run as a repeating job.
+    Repeating job: probes, concurrently, only the services whose adaptive
+    interval has elapsed and updates bot_data.
     """
-    if not context.bot_data:
+    if context.bot_data is None:
         logger.warning(
             "periodic_api_status_check: context.bot_data is not available. Skipping check.")
         return
 
-    logger.debug("Performing periodic API status check...")
-    # We can reuse the logic from update_all_api_statuses_once
-    # It's designed to work with a bot_data dict directly.
-    await update_all_api_statuses_once(context.bot_data)
-    logger.debug("Periodic API status check complete.")
+    now = time.monotonic()
+    due_services = [name for name in SERVICE_CHECK_MAP
+                    if _probe_schedule.get(name, {}).get("next_probe_at", 0.0) <= now]
+    if not due_services:
+        return
+    logger.debug(f"Performing API status check for: {', '.join(due_services)}")
+    await _probe_and_record(context.bot_data, due_services)
+
+
+def get_api_health(bot_data: dict, service_name: str) -> dict:
+    """Latency summary for one service from the probe history kept in bot_data."""
+    health = (bot_data.get(API_HEALTH_BOT_DATA_KEY) or {}).get(service_name) or {}
+    latencies = [entry["latency_ms"] for entry in health.get("history", [])
+                 if entry.get("status") == API_STATUS_ONLINE]
+    return {
+        "status": health.get("last_status", API_STATUS_UNKNOWN),
+        "last_latency_ms": health.get("last_latency_ms"),
+        "avg_latency_ms": round(sum(latencies) / len(latencies), 1) if latencies else None,
+        "max_latency_ms": max(latencies) if latencies else None,
+        "consecutive_failures": health.get("consecutive_failures", 0),
+        "last_changed_at": health.get("last_changed_at"),
+        "next_probe_at": health.get("next_probe_at"),
+    }
@@ -0,0 +1,252 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+
+from telegram.ext import BasePersistence, PersistenceInput
+
+import src.app.app_state_store as app_state_store
+
+logger = logging.getLogger(__name__)
+
+SCOPE_BOT_DATA = "bot_data"
+SCOPE_USER_DATA = "user_data"
+SCOPE_CHAT_DATA = "chat_data"
+SCOPE_CALLBACK_DATA = "callback_data"
+SCOPE_CONVERSATION_PREFIX = "conversation:"
+
+KEY_PICKLE_PERSISTENCE_MIGRATED = "pickle_persistence_migrated"
+
+PERSISTENCE_STATS = {
+    "flush_calls": 0,
+    "rows_written": 0,
+    "rows_deleted": 0,
+    "rows_unchanged": 0,
+    "last_update_ms": 0.0,
+    "rows": 0,
+}
+
+
+class _TolerantUnpickler(pickle.Unpickler):
+    # PicklePersistence stores the Bot as a persistent id; it is not needed here.
+    def persistent_load(self, pid):
+        return None
+
+
+def _row_upsert_statement(scope: str, key: str, data: bytes, updated_at: float) -> tuple:
+    return ("INSERT INTO ptb_persistence (scope, key, data, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(scope, key) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+            (scope, key, data, updated_at))
+
+
+def _row_delete_statement(scope: str, key: str) -> tuple:
+    return ("DELETE FROM ptb_persistence WHERE scope = ? AND key = ?", (scope, key))
+
+
+class StateStorePersistence(BasePersistence):
+    """
+    PTB persistence kept in the bot state store (table ptb_persistence), one
+    row per bot_data key and per user/chat. Only rows whose pickled value
+    changed since the last write are queued, so a flush costs the size of
+    what changed rather than of everything the bot has ever stored.
+    """
+
+    def __init__(self, legacy_pickle_path: str | None = None, update_interval: float = 60):
+        super().__init__(store_data=PersistenceInput(), update_interval=update_interval)
+        self.legacy_pickle_path = legacy_pickle_path
+        # (scope, key) -> (digest of the stored pickle, updated_at)
+        self._written: dict[tuple, tuple] = {}
+        self._loaded = False
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._migrate_pickle_if_needed()
+        for scope, key, data, updated_at in app_state_store.fetch_rows(
+                "SELECT scope, key, data, updated_at FROM ptb_persistence"):
+            self._written[(scope, key)] = (
+                hashlib.blake2b(data, digest_size=16).digest(), updated_at)
+        self._loaded = True
+        PERSISTENCE_STATS["rows"] = len(self._written)
+        logger.info(
+            f"Bot persistence loaded ({len(self._written)} rows from the bot state store).")
+
+    def _migrate_pickle_if_needed(self):
+        if app_state_store.has_state_value(KEY_PICKLE_PERSISTENCE_MIGRATED):
+            return
+        statements = []
+        if self.legacy_pickle_path and os.path.exists(self.legacy_pickle_path):
+            try:
+                with open(self.legacy_pickle_path, "rb") as f:
+                    legacy = _TolerantUnpickler(f).load()
+                now = time.time()
+                for key, value in (legacy.get(SCOPE_BOT_DATA) or {}).items():
+                    statements.append(_row_upsert_statement(
+                        SCOPE_BOT_DATA, str(key), pickle.dumps((key, value)), now))
+                for scope in (SCOPE_USER_DATA, SCOPE_CHAT_DATA):
+                    for entity_id, value in (legacy.get(scope) or {}).items():
+                        statements.append(_row_upsert_statement(
+                            scope, str(entity_id), pickle.dumps(value), now))
+                logger.info(
+                    f"Migrating {len(statements)} entries from {self.legacy_pickle_path} into the bot state store.")
+            except Exception as e:
+                logger.warning(
+                    f"Could not read legacy persistence file {self.legacy_pickle_path}: {e}. Starting with empty bot data.")
+                statements = []
+        statements.append(app_state_store.state_value_upsert_statement(
+            KEY_PICKLE_PERSISTENCE_MIGRATED, {"source": self.legacy_pickle_path, "imported": len(statements)}))
+        if not app_state_store.apply_statements(statements):
+            logger.error("Migration of legacy bot persistence failed.")
+
+    def _fetch_scope(self, scope: str) -> list:
+        self._load()
+        return app_state_store.fetch_rows(
+            "SELECT key, data FROM ptb_persistence WHERE scope = ?", (scope,))
+
+    def _queue_if_changed(self, scope: str, key: str, data: bytes, keyed_statements: list):
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        written = self._written.get((scope, key))
+        if written is not None and written[0] == digest:
+            PERSISTENCE_STATS["rows_unchanged"] += 1
+            return
+        now = time.time()
+        self._written[(scope, key)] = (digest, now)
+        keyed_statements.append((("ptb_persistence", scope, key),
+                                 _row_upsert_statement(scope, key, data, now)))
+        PERSISTENCE_STATS["rows_written"] += 1
+        PERSISTENCE_STATS["rows"] = len(self._written)
+
+    def _queue_delete(self, scope: str, key: str, keyed_statements: list):
+        if self._written.pop((scope, key), None) is not None:
+            keyed_statements.append((("ptb_persistence", scope, key),
+                                     _row_delete_statement(scope, key)))
+            PERSISTENCE_STATS["rows_deleted"] += 1
+            PERSISTENCE_STATS["rows"] = len(self._written)
+
+    # --- bot_data ---
+
+    async def get_bot_data(self) -> dict:
+        bot_data = {}
+        for _, data in self._fetch_scope(SCOPE_BOT_DATA):
+            try:
+                key, value = pickle.loads(data)
+                bot_data[key] = value
+            except Exception as e:
+                logger.warning(f"Skipping unreadable bot_data entry: {e}")
+        return bot_data
+
+    async def update_bot_data(self, data: dict) -> None:
+        self._load()
+        started = time.monotonic()
+        keyed_statements = []
+        current_keys = set()
+        for key, value in list(data.items()):
+            row_key = str(key)
+            current_keys.add(row_key)
+            try:
+                pickled = pickle.dumps((key, value))
+            except Exception as e:
+                logger.warning(
+                    f"bot_data['{row_key}'] cannot be persisted: {e}")
+                continue
+            self._queue_if_changed(SCOPE_BOT_DATA, row_key,
+                                   pickled, keyed_statements)
+        for scope, row_key in [written_key for written_key in self._written
+                               if written_key[0] == SCOPE_BOT_DATA and written_key[1] not in current_keys]:
+            self._queue_delete(scope, row_key, keyed_statements)
+        app_state_store.queue_writes(keyed_statements)
+        PERSISTENCE_STATS["last_update_ms"] = round(
+            (time.monotonic() - started) * 1000, 2)
+
+    async def refresh_bot_data(self, bot_data: dict) -> None:
+        pass
+
+    # --- user_data / chat_data ---
+
+    async def _get_entity_data(self, scope: str) -> dict:
+        entity_data = {}
+        for key, data in self._fetch_scope(scope):
+            try:
+                entity_data[int(key)] = pickle.loads(data)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable {scope} entry {key}: {e}")
+        return entity_data
+
+    def _update_entity_data(self, scope: str, entity_id: int, data: dict):
+        self._load()
+        keyed_statements = []
+        try:
+            self._queue_if_changed(scope, str(entity_id), pickle.dumps(
+                data), keyed_statements)
+        except Exception as e:
+            logger.warning(f"{scope} for {entity_id} cannot be persisted: {e}")
+        app_state_store.queue_writes(keyed_statements)
+
+    def _drop_entity_data(self, scope: str, entity_id: int):
+        self._load()
+        keyed_statements = []
+        self._queue_delete(scope, str(entity_id), keyed_statements)
+        app_state_store.queue_writes(keyed_statements)
+
+    async def get_user_data(self) -> dict:
+        return await self._get_entity_data(SCOPE_USER_DATA)
+
+    async def update_user_data(self, user_id: int, data: dict) -> None:
+        self._update_entity_data(SCOPE_USER_DATA, user_id, data)
+
+    async def refresh_user_data(self, user_id: int, user_data: dict) -> None:
+        pass
+
+    async def drop_user_data(self, user_id: int) -> None:
+        self._drop_entity_data(SCOPE_USER_DATA, user_id)
+
+    async def get_chat_data(self) -> dict:
+        return await self._get_entity_data(SCOPE_CHAT_DATA)
+
+    async def update_chat_data(self, chat_id: int, data: dict) -> None:
+        self._update_entity_data(SCOPE_CHAT_DATA, chat_id, data)
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: dict) -> None:
+        pass
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        self._drop_entity_data(SCOPE_CHAT_DATA, chat_id)
+
+    # --- callback_data / conversations ---
+
+    async def get_callback_data(self):
+        rows = self._fetch_scope(SCOPE_CALLBACK_DATA)
+        return pickle.loads(rows[0][1]) if rows else None
+
+    async def update_callback_data(self, data) -> None:
+        self._load()
+        keyed_statements = []
+        self._queue_if_changed(SCOPE_CALLBACK_DATA, "data",
+                               pickle.dumps(data), keyed_statements)
+        app_state_store.queue_writes(keyed_statements)
+
+    async def get_conversations(self, name: str) -> dict:
+        return {tuple(json.loads(key)): pickle.loads(data)
+                for key, data in self._fetch_scope(f"{SCOPE_CONVERSATION_PREFIX}{name}")}
+
+    async def update_conversation(self, name: str, key: tuple, new_state) -> None:
+        self._load()
+        scope = f"{SCOPE_CONVERSATION_PREFIX}{name}"
+        row_key = json.dumps(list(key))
+        keyed_statements = []
+        if new_state is None:
+            self._queue_delete(scope, row_key, keyed_statements)
+        else:
+            self._queue_if_changed(scope, row_key, pickle.dumps(
+                new_state), keyed_statements)
+        app_state_store.queue_writes(keyed_statements)
+
+    async def flush(self) -> None:
+        PERSISTENCE_STATS["flush_calls"] += 1
+        app_state_store.flush_pending_writes()
+
+
+def get_persistence_stats() -> dict:
+    return dict(PERSISTENCE_STATS)
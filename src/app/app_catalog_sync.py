@@ -0,0 +1,47 @@
+import logging
+from telegram.ext import CallbackContext
+
+import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_plex_call, run_radarr_call, run_sonarr_call
+from src.services.plex.bot_plex_index import sync_plex_index
+from src.services.radarr.bot_radarr_catalog import sync_movie_catalog
+from src.services.sonarr.bot_sonarr_catalog import sync_series_catalog
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SYNC_MAP = {
+    "plex": {
+        "is_enabled_func": app_config_holder.is_plex_enabled,
+        "config_check_func": lambda: app_config_holder.get_plex_url() and app_config_holder.get_plex_token(),
+        "sync_func": sync_plex_index,
+        "service_call": run_plex_call,
+    },
+    "radarr": {
+        "is_enabled_func": app_config_holder.is_radarr_enabled,
+        "config_check_func": lambda: app_config_holder.get_radarr_base_api_url() and app_config_holder.get_radarr_api_key(),
+        "sync_func": sync_movie_catalog,
+        "service_call": run_radarr_call,
+    },
+    "sonarr": {
+        "is_enabled_func": app_config_holder.is_sonarr_enabled,
+        "config_check_func": lambda: app_config_holder.get_sonarr_base_api_url() and app_config_holder.get_sonarr_api_key(),
+        "sync_func": sync_series_catalog,
+        "service_call": run_sonarr_call,
+    },
+}
+
+
+async def periodic_catalog_sync(context: CallbackContext) -> None:
+    """
+    Keeps the library catalogues of the enabled services current, fetching
+    only what changed since the previous run. Runs as a repeating job.
+    """
+    for service_name, sync in CATALOG_SYNC_MAP.items():
+        if not sync["is_enabled_func"]() or not sync["config_check_func"]():
+            continue
+        try:
+            await sync["service_call"](sync["sync_func"])
+            logger.debug(f"{service_name} catalogue synced.")
+        except Exception as e:
+            logger.error(
+                f"Error syncing {service_name} catalogue: {e}", exc_info=False)
@@ -4,6 +4,8 @@ PROJECT_VERSION = "Unknown"
 
 DEFAULT_ADD_MEDIA_MAX_SEARCH_RESULTS = 30
 DEFAULT_ADD_MEDIA_ITEMS_PER_PAGE = 5
+DEFAULT_STATE_WRITE_BEHIND_WINDOW_SECONDS = 0.25
+DEFAULT_LOOKUP_CACHE_TTL_SECONDS = 600
 
 ROLE_ADMIN = "ADMIN"
 ROLE_STANDARD_USER = "STANDARD_USER"
@@ -43,7 +45,7 @@ def is_primary_admin(chat_id: int | str) -> bool:
 def get_user_role(chat_id: int | str, force_reload_state: bool = False) -> str:
     """
     Determines the role of a user.
-    Uses user_manager to check against bot_state.json,
+    Uses user_manager to check against the stored bot state,
     after checking for primary admin status from config.py.
     """
     return user_manager_module.get_role_for_chat_id(str(chat_id), force_reload_state=force_reload_state)
@@ -160,6 +162,26 @@ def get_add_media_items_per_page() -> int:
     return DEFAULT_ADD_MEDIA_ITEMS_PER_PAGE
 
 
+def get_state_write_behind_window_seconds() -> float:
+    """How long queued state store writes wait for the rest of a burst before one commit."""
+    if loaded_config and hasattr(loaded_config, 'STATE_WRITE_BEHIND_WINDOW_SECONDS'):
+        try:
+            return max(float(loaded_config.STATE_WRITE_BEHIND_WINDOW_SECONDS), 0.0)
+        except (ValueError, TypeError):
+            return DEFAULT_STATE_WRITE_BEHIND_WINDOW_SECONDS
+    return DEFAULT_STATE_WRITE_BEHIND_WINDOW_SECONDS
+
+
+def get_lookup_cache_ttl_seconds() -> int:
+    """How long cached Radarr/Sonarr lookup responses are reused."""
+    if loaded_config and hasattr(loaded_config, 'LOOKUP_CACHE_TTL_SECONDS'):
+        try:
+            return max(int(loaded_config.LOOKUP_CACHE_TTL_SECONDS), 0)
+        except (ValueError, TypeError):
+            return DEFAULT_LOOKUP_CACHE_TTL_SECONDS
+    return DEFAULT_LOOKUP_CACHE_TTL_SECONDS
+
+
 def _get_launcher_config_value(service_prefix: str, suffix: str, default=None):
     key = f"{service_prefix}_LAUNCHER_{suffix}"
     if loaded_config and hasattr(loaded_config, key):
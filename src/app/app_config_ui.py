@@ -17,7 +17,7 @@ from src.config.config_definitions import (
     ALL_USER_CONFIG_KEYS, CONFIG_FIELD_DEFINITIONS, CONFIG_KEYS_ABDM, LOG_LEVEL_OPTIONS
 )
 from src.app.app_config_holder import ROLE_ADMIN, ROLE_STANDARD_USER
-from .app_file_utils import get_ico_file_path, get_bot_state_file_path, load_json_data, save_json_data, get_log_directory_path
+from .app_file_utils import get_ico_file_path, get_bot_state_db_path, get_log_directory_path
 import src.app.user_manager as user_manager
 from src.app.user_manager import DEFAULT_BOT_STATE
 
@@ -38,13 +38,17 @@ def run_config_ui(config_file_to_write_path, initial_values=None):
     initial_log_level_on_ui_open = initial_values.get(
         "LOG_LEVEL", CONFIG_FIELD_DEFINITIONS.get("LOG_LEVEL", {}).get("default", "INFO"))
 
-    bot_state_path = get_bot_state_file_path()
-    loaded_bot_state = load_json_data(bot_state_path)
+    bot_state_path = get_bot_state_db_path()
+    try:
+        loaded_bot_state = user_manager._load_bot_state(force_reload=True)
+    except Exception as e_state_load:
+        logger_ui.error(
+            f"Could not load bot state from {bot_state_path}: {e_state_load}", exc_info=True)
+        loaded_bot_state = None
 
     initial_user_data_on_gui_open = {}
     initial_dynamic_launchers_on_gui_open = []
     static_launchers_already_migrated = False
-    other_bot_state_parts_on_gui_open = DEFAULT_BOT_STATE.copy()
 
     if loaded_bot_state is None:
         logger_ui.info(
@@ -52,10 +56,6 @@ def run_config_ui(config_file_to_write_path, initial_values=None):
         initial_user_data_on_gui_open = DEFAULT_BOT_STATE['users'].copy()
         initial_dynamic_launchers_on_gui_open = DEFAULT_BOT_STATE['dynamic_launchers'].copy(
         )
-
-        del other_bot_state_parts_on_gui_open['users']
-
-        del other_bot_state_parts_on_gui_open['dynamic_launchers']
     else:
         initial_user_data_on_gui_open = loaded_bot_state.get(
             "users", DEFAULT_BOT_STATE['users'].copy())
@@ -63,9 +63,6 @@ def run_config_ui(config_file_to_write_path, initial_values=None):
             "dynamic_launchers", DEFAULT_BOT_STATE['dynamic_launchers'].copy())
         static_launchers_already_migrated = loaded_bot_state.get(
             "bot_info", {}).get("static_launchers_migrated", False)
-        for key, value in loaded_bot_state.items():
-            if key not in ['users', 'dynamic_launchers']:
-                other_bot_state_parts_on_gui_open[key] = value
 
     gui_user_data_state = {k: v.copy()
                            for k, v in initial_user_data_on_gui_open.items()}
@@ -851,7 +848,9 @@ def run_config_ui(config_file_to_write_path, initial_values=None):
                     result["affected_users_for_refresh"].append(
                         new_primary_admin_id_from_config_py)
 
-        full_bot_state_to_save = other_bot_state_parts_on_gui_open.copy()
+        # Start from the live state so message IDs and access requests changed
+        # by the running bot while the UI was open are not rolled back.
+        full_bot_state_to_save = user_manager._load_bot_state()
         full_bot_state_to_save["users"] = gui_user_data_state
         full_bot_state_to_save["dynamic_launchers"] = gui_dynamic_launchers_state
         if "bot_info" not in full_bot_state_to_save or not isinstance(full_bot_state_to_save["bot_info"], dict):
@@ -862,9 +861,9 @@ def run_config_ui(config_file_to_write_path, initial_values=None):
             logger_ui.info(
                 "Static launchers migration flag set to True in bot_state.")
 
-        if save_json_data(bot_state_path, full_bot_state_to_save):
+        if user_manager._save_bot_state(full_bot_state_to_save):
             logger_ui.info(
-                f"User data and dynamic launchers (bot_state.json) saved to {bot_state_path}")
+                f"User data and dynamic launchers saved to bot state store {bot_state_path}")
             user_data_content_changed = (
                 initial_user_data_on_gui_open != gui_user_data_state)
             launcher_data_content_changed = (
@@ -965,6 +964,8 @@ if __name__ == '__main__':
         mock_data_dir, "test_config_generated_phase_a_v2.py")
     mock_bot_state_path_val = os.path.join(
         mock_data_dir, "bot_state_phase_a_v2.json")
+    mock_bot_state_db_path_val = os.path.join(
+        mock_data_dir, "bot_state_phase_a_v2.db")
     mock_initial_config_values_phase_a = {
         "TELEGRAM_BOT_TOKEN": "test_token_phase_a_v2", "CHAT_ID": "123456", "LOG_LEVEL": "DEBUG",
         "PC_CONTROL_ENABLED": True, "ADD_MEDIA_MAX_SEARCH_RESULTS": "40", "ADD_MEDIA_ITEMS_PER_PAGE": "8",
@@ -986,11 +987,14 @@ if __name__ == '__main__':
         json.dump(initial_test_bot_state, f_state, indent=4)
     import src.app.app_file_utils as app_file_utils_module
     original_get_bot_state_file_path_real = app_file_utils_module.get_bot_state_file_path
+    original_get_bot_state_db_path_real = app_file_utils_module.get_bot_state_db_path
     original_get_log_directory_path = app_file_utils_module.get_log_directory_path
     def mock_get_bot_state_file_path_for_test(): return mock_bot_state_path_val
 
     def mock_get_log_dir_path_for_test(): return mock_log_dir
+    def mock_get_bot_state_db_path_for_test(): return mock_bot_state_db_path_val
     app_file_utils_module.get_bot_state_file_path = mock_get_bot_state_file_path_for_test
+    app_file_utils_module.get_bot_state_db_path = mock_get_bot_state_db_path_for_test
     app_file_utils_module.get_log_directory_path = mock_get_log_dir_path_for_test
 
     try:
@@ -1003,13 +1007,12 @@ if __name__ == '__main__':
                 with open(mock_config_path, "r") as f_conf_check:
                     print(
                         f"\n--- Generated config.py ---\n{f_conf_check.read()}")
-            if os.path.exists(mock_bot_state_path_val):
-                with open(mock_bot_state_path_val, "r") as f_state_check:
-                    print(
-                        f"\n--- Generated bot_state.json ---\n{f_state_check.read()}")
+            print(
+                f"\n--- Stored bot state ---\n{json.dumps(user_manager._load_bot_state(force_reload=True), indent=4)}")
         if ui_result.get("affected_users_for_refresh"):
             print(
                 f"Affected users for refresh: {ui_result['affected_users_for_refresh']}")
     finally:
         app_file_utils_module.get_bot_state_file_path = original_get_bot_state_file_path_real
+        app_file_utils_module.get_bot_state_db_path = original_get_bot_state_db_path_real
         app_file_utils_module.get_log_directory_path = original_get_log_directory_path
@@ -4,6 +4,8 @@ import logging
 import json
 import shutil
 
+from src.app.app_perf_metrics import instrument_function, GROUP_BACKEND
+
 logger = logging.getLogger(__name__)
 
 APP_NAME = "MediaBot"
@@ -17,6 +19,7 @@ LOG_DIRECTORY_PATH_CACHE = None
 
 REQUESTS_FILE_NAME = "requests.json"
 BOT_STATE_FILE_NAME = "bot_state.json"
+BOT_STATE_DB_FILE_NAME = "bot_state.db"
 TICKETS_FILE_NAME = "tickets.json"  # New
 
 
@@ -78,6 +81,10 @@ def get_bot_state_file_path():
     return os.path.join(get_data_storage_path(), BOT_STATE_FILE_NAME)
 
 
+def get_bot_state_db_path():
+    return os.path.join(get_data_storage_path(), BOT_STATE_DB_FILE_NAME)
+
+
 def get_tickets_file_path():  # New function
     return os.path.join(get_data_storage_path(), TICKETS_FILE_NAME)
 
@@ -214,7 +221,7 @@ def load_json_data(file_path: str) -> dict | list | None:
     return None
 
 
-def save_json_data(file_path: str, data: dict | list, create_backup: bool = True) -> bool:
+def _save_json_data_impl(file_path: str, data: dict | list, create_backup: bool = True) -> bool:
     """Saves data to a JSON file atomically and creates a backup."""
     temp_file_path = file_path + ".tmp"
     backup_file_path = file_path + ".bak"
@@ -226,6 +233,8 @@ def save_json_data(file_path: str, data: dict | list, create_backup: bool = True
 
         with open(temp_file_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
 
         if create_backup and os.path.exists(file_path):
             try:
@@ -261,54 +270,7 @@ def save_json_data(file_path: str, data: dict | list, create_backup: bool = True
     return False
 
 
-def load_requests_data() -> list:
-    """Loads media requests from requests.json."""
-    requests_list_data = load_json_data(get_requests_file_path())
-    if isinstance(requests_list_data, list):
-        return requests_list_data
-
-    elif requests_list_data is None:
-        logger.info(
-            f"{REQUESTS_FILE_NAME} not found or empty/corrupt. Initializing as empty list.")
-        save_requests_data([])
-        return []
-    else:
-        logger.warning(
-            f"{REQUESTS_FILE_NAME} content was not a list. Re-initializing as empty list.")
-        save_requests_data([])
-        return []
-
-
-def save_requests_data(requests_list: list) -> bool:
-    """Saves media requests to requests.json."""
-    if not isinstance(requests_list, list):
-        logger.error(
-            f"Attempted to save non-list data to {REQUESTS_FILE_NAME}. Aborting save.")
-        return False
-    return save_json_data(get_requests_file_path(), requests_list)
-
-
-def load_tickets_data() -> dict:  # New function
-    """Loads support tickets from tickets.json."""
-    tickets_dict_data = load_json_data(get_tickets_file_path())
-    if isinstance(tickets_dict_data, dict):
-        return tickets_dict_data
-    elif tickets_dict_data is None:
-        logger.info(
-            f"{TICKETS_FILE_NAME} not found or empty/corrupt. Initializing as empty dict.")
-        save_tickets_data({})  # Initialize with an empty dictionary
-        return {}
-    else:
-        logger.warning(
-            f"{TICKETS_FILE_NAME} content was not a dict. Re-initializing as empty dict.")
-        save_tickets_data({})
-        return {}
-
-
-def save_tickets_data(tickets_dict: dict) -> bool:  # New function
-    """Saves support tickets to tickets.json."""
-    if not isinstance(tickets_dict, dict):
-        logger.error(
-            f"Attempted to save non-dict data to {TICKETS_FILE_NAME}. Aborting save.")
-        return False
-    return save_json_data(get_tickets_file_path(), tickets_dict)
+save_json_data = instrument_function(
+    _save_json_data_impl, GROUP_BACKEND,
+    lambda file_path, *args, **kwargs: f"json save {os.path.basename(file_path)}",
+    failure_result=False)
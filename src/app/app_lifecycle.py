@@ -8,11 +8,19 @@ from telegram.ext import CallbackContext, Application
 from .app_file_utils import get_config_file_path
 from src.config.config_manager import _load_config_module_from_path, validate_config_values
 from .app_service_initializer import initialize_services_with_config
+from src.services.bot_http_sessions import close_service_sessions
+from src.services.plex.bot_plex_session_listener import stop_plex_session_listener
+import src.app.app_state_store as app_state_store
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu, set_bot_commands
+from src.bot.bot_broadcast import broadcast_to_chats
+from src.bot.bot_outbound_queue import PRIORITY_BACKGROUND, flush_outbound_edits, get_outbound_queue_stats
 import src.app.app_config_holder as app_config_holder
 
 import src.app.user_manager as user_manager
 from src.app.app_api_status_manager import update_all_api_statuses_once  # New Import
+from src.app.app_metadata_refresh import periodic_metadata_refresh
+from src.services.bot_metadata_cache import invalidate_metadata_cache
+from src.handlers.menu_handler_main_builder import invalidate_main_menu_cache
 import sys
 from .app_config_ui import run_config_ui
 from src.config.config_definitions import ALL_USER_CONFIG_KEYS, CONFIG_FIELD_DEFINITIONS, LOG_LEVEL_OPTIONS
@@ -73,6 +81,31 @@ def _run_tkinter_ui_thread_target(config_path_in_data, initial_vals):
         logger.info("Config UI thread finished.")
 
 
+async def _refresh_affected_users_job(job_context: CallbackContext):
+    target_user_ids = job_context.job.data.get("target_user_ids", [])
+    app_instance = job_context.application
+
+    async def refresh_menu(target_user_id_str: str):
+        return await show_or_edit_main_menu(target_user_id_str, app_instance, force_send_new=True,
+                                            raise_on_retry_after=True, priority=PRIORITY_BACKGROUND)
+
+    async def send_role_update_status(target_user_id_str: str):
+        status_for_affected = "Your access permissions or role has been updated by an administrator."
+        if user_manager.get_role_for_chat_id(target_user_id_str) == app_config_holder.ROLE_UNKNOWN:
+            status_for_affected = "Your access to the bot has been revoked or changed."
+        return await send_or_edit_universal_status_message(
+            app_instance.bot, int(target_user_id_str),
+            escape_md_v2(status_for_affected),
+            parse_mode="MarkdownV2", force_send_new=True, raise_on_retry_after=True,
+            priority=PRIORITY_BACKGROUND
+        )
+
+    logger.info(
+        f"Job: Refreshing main menu and status for {len(target_user_ids)} affected users.")
+    await broadcast_to_chats(target_user_ids, [refresh_menu, send_role_update_status],
+                             description="affected user refresh")
+
+
 async def _handle_post_ui_config_reload(context: CallbackContext):
     if not context.job or not context.job.data:
         logger.error("_handle_post_ui_config_reload called without job data.")
@@ -98,6 +131,13 @@ async def _handle_post_ui_config_reload(context: CallbackContext):
 
             initialize_services_with_config(reloaded_config_module)
 
+            # URLs or API keys may have changed, so cached folders/profiles/tags are stale.
+            invalidate_metadata_cache()
+            invalidate_main_menu_cache()
+            if application.job_queue:
+                application.job_queue.run_once(
+                    periodic_metadata_refresh, when=1, name="PostReloadMetadataRefresh")
+
             user_manager.ensure_initial_bot_state()
             logger.info(
                 "User state re-initialized from user_manager after config reload.")
@@ -128,49 +168,17 @@ async def _handle_post_ui_config_reload(context: CallbackContext):
                     escape_md_v2(final_status_msg_raw), parse_mode="MarkdownV2", force_send_new=True
                 )
 
-            if affected_users_for_refresh:
+            users_to_notify = [user_chat_id_str for user_chat_id_str in affected_users_for_refresh
+                               if user_chat_id_str != admin_to_refresh_menu]
+            if users_to_notify:
                 logger.info(
-                    f"Processing menu/status refresh for affected users: {affected_users_for_refresh}")
-                for user_chat_id_str in affected_users_for_refresh:
-                    if user_chat_id_str == admin_to_refresh_menu:
-                        continue
-                    try:
-
-                        current_role_for_user = user_manager.get_role_for_chat_id(
-                            user_chat_id_str)
-
-                        logger.info(
-                            f"Scheduling immediate refresh for affected user: {user_chat_id_str} (New Role: {current_role_for_user})")
-
-                        async def refresh_affected_user_job(job_context: CallbackContext):
-                            target_user_id_str = job_context.job.data.get(
-                                "target_user_id")
-                            app_instance = job_context.application
-
-                            logger.info(
-                                f"Job: Refreshing main menu for affected user {target_user_id_str}.")
-                            await show_or_edit_main_menu(str(target_user_id_str), app_instance, force_send_new=True)
-
-                            status_for_affected = "Your access permissions or role has been updated by an administrator."
-                            if user_manager.get_role_for_chat_id(target_user_id_str, force_reload_state=True) == app_config_holder.ROLE_UNKNOWN:
-                                status_for_affected = "Your access to the bot has been revoked or changed."
-
-                            await send_or_edit_universal_status_message(
-                                app_instance.bot, int(target_user_id_str),
-                                escape_md_v2(status_for_affected),
-                                parse_mode="MarkdownV2", force_send_new=True
-                            )
-
-                        application.job_queue.run_once(
-                            refresh_affected_user_job,
-                            when=0.1,
-                            data={"target_user_id": user_chat_id_str},
-
-                            name=f"refresh_affected_user_{user_chat_id_str}_{os.urandom(4).hex()}"
-                        )
-                    except Exception as e_user_refresh:
-                        logger.error(
-                            f"Failed to schedule refresh for affected user {user_chat_id_str}: {e_user_refresh}", exc_info=True)
+                    f"Scheduling menu/status refresh for affected users: {users_to_notify}")
+                application.job_queue.run_once(
+                    _refresh_affected_users_job,
+                    when=0.1,
+                    data={"target_user_ids": users_to_notify},
+                    name=f"refresh_affected_users_{os.urandom(4).hex()}"
+                )
 
             if previous_primary_admin_chat_id_str and not new_primary_admin_chat_id_str:
                 logger.warning(
@@ -277,12 +285,28 @@ def sigint_handler_sync(signum, frame):
 
 async def actual_shutdown_task(context: CallbackContext):
     logger.info("Async shutdown task running...")
+    try:
+        await flush_outbound_edits()
+        logger.info(
+            f"Outbound edits flushed: {get_outbound_queue_stats()}")
+    except Exception as outbound_flush_e:
+        logger.error(
+            f"Error flushing outbound edits: {outbound_flush_e}", exc_info=True)
     if context.application and context.application.persistence:
         try:
             logger.info("Flushing persistence...")
-            context.application.persistence.flush()
+            await context.application.persistence.flush()
             logger.info("Persistence flushed.")
         except Exception as flush_e:
             logger.error(
                 f"Error flushing persistence: {flush_e}", exc_info=True)
+    try:
+        app_state_store.stop_write_behind()
+        logger.info(
+            f"Bot state writes flushed: {app_state_store.get_write_behind_stats()}")
+    except Exception as state_flush_e:
+        logger.error(
+            f"Error flushing bot state writes: {state_flush_e}", exc_info=True)
+    stop_plex_session_listener()
+    close_service_sessions()
     logger.info("Async shutdown task finished. Bot should exit polling soon.")
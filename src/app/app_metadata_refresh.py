@@ -0,0 +1,40 @@
+import logging
+from telegram.ext import CallbackContext
+
+import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_radarr_call, run_sonarr_call
+from src.services.radarr.bot_radarr_add import refresh_radarr_metadata
+from src.services.sonarr.bot_sonarr_add import refresh_sonarr_metadata
+
+logger = logging.getLogger(__name__)
+
+METADATA_REFRESH_MAP = {
+    "radarr": {
+        "is_enabled_func": app_config_holder.is_radarr_enabled,
+        "config_check_func": lambda: app_config_holder.get_radarr_base_api_url() and app_config_holder.get_radarr_api_key(),
+        "refresh_func": refresh_radarr_metadata,
+        "service_call": run_radarr_call,
+    },
+    "sonarr": {
+        "is_enabled_func": app_config_holder.is_sonarr_enabled,
+        "config_check_func": lambda: app_config_holder.get_sonarr_base_api_url() and app_config_holder.get_sonarr_api_key(),
+        "refresh_func": refresh_sonarr_metadata,
+        "service_call": run_sonarr_call,
+    },
+}
+
+
+async def periodic_metadata_refresh(context: CallbackContext) -> None:
+    """
+    Refetches root folders, quality/language profiles and tags for the enabled
+    services so the add flows read them from memory. Runs as a repeating job.
+    """
+    for service_name, refresh in METADATA_REFRESH_MAP.items():
+        if not refresh["is_enabled_func"]() or not refresh["config_check_func"]():
+            continue
+        try:
+            if await refresh["service_call"](refresh["refresh_func"]):
+                logger.debug(f"{service_name} metadata refreshed.")
+        except Exception as e:
+            logger.error(
+                f"Error refreshing {service_name} metadata: {e}", exc_info=False)
@@ -0,0 +1,170 @@
+import functools
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; anything slower lands in
+# a final overflow bucket. Fixed buckets keep each series a few hundred bytes
+# however many samples it records.
+PERF_HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500,
+                            1000, 2000, 5000, 10000, 30000, 60000)
+PERF_PERCENTILES = (50, 95, 99)
+
+GROUP_HANDLERS = "handlers"
+GROUP_BACKEND = "backend"
+
+_NUMERIC_PATH_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+# group -> series name -> {"buckets": [int], "count", "errors", "in_flight", "total_ms", "max_ms"}
+_series: dict[str, dict] = {}
+_series_lock = threading.Lock()
+
+
+def _get_series_locked(group: str, name: str) -> dict:
+    group_series = _series.setdefault(group, {})
+    series = group_series.get(name)
+    if series is None:
+        series = group_series[name] = {
+            "buckets": [0] * (len(PERF_HISTOGRAM_BOUNDS_MS) + 1),
+            "count": 0, "errors": 0, "in_flight": 0, "total_ms": 0.0, "max_ms": 0.0,
+        }
+    return series
+
+
+def endpoint_series_name(service_name: str, method: str, endpoint: str) -> str:
+    """'radarr', 'get', '/movie/123' -> 'radarr GET /movie/{id}', so IDs do not split a series."""
+    path = "/" + str(endpoint).strip("/")
+    return f"{service_name} {method.upper()} {_NUMERIC_PATH_SEGMENT.sub('/{id}', path)}"
+
+
+@contextmanager
+def measure(group: str, name: str):
+    """Times the block into the group/name series. An exception counts as an error and is re-raised."""
+    with _series_lock:
+        _get_series_locked(group, name)["in_flight"] += 1
+    started = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        _record(group, name, (time.perf_counter() - started) * 1000.0, failed, in_flight_delta=-1)
+
+
+def _record(group: str, name: str, elapsed_ms: float, failed: bool, in_flight_delta: int = 0):
+    with _series_lock:
+        series = _get_series_locked(group, name)
+        series["buckets"][bisect_left(PERF_HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+        series["count"] += 1
+        series["total_ms"] += elapsed_ms
+        series["max_ms"] = max(series["max_ms"], elapsed_ms)
+        series["in_flight"] += in_flight_delta
+        if failed:
+            series["errors"] += 1
+
+
+def record_failure(group: str, name: str):
+    """Counts an error for a call that reported failure through its return value rather than raising."""
+    with _series_lock:
+        _get_series_locked(group, name)["errors"] += 1
+
+
+def instrument_function(func, group: str, name_func, failure_result=None):
+    """
+    Wraps a blocking function so every call is timed into the series named by
+    name_func(*args, **kwargs). If failure_result is given, returning it
+    counts as an error too. Attributes set on the wrapper stay on the wrapper.
+    """
+    @functools.wraps(func)
+    def instrumented(*args, **kwargs):
+        try:
+            name = name_func(*args, **kwargs)
+        except Exception:
+            name = func.__name__
+        with measure(group, name):
+            result = func(*args, **kwargs)
+        if failure_result is not None and result is failure_result:
+            record_failure(group, name)
+        return result
+    instrumented.perf_instrumented = True
+    return instrumented
+
+
+def instrument_handler_callbacks(handlers):
+    """
+    Wraps the callbacks of already-built telegram handlers (recursing into
+    ConversationHandler entry points, states and fallbacks) so each update
+    they handle is timed under the callback's name.
+    """
+    for handler in handlers:
+        nested = []
+        for attribute in ("entry_points", "fallbacks"):
+            nested.extend(getattr(handler, attribute, None) or [])
+        for state_handlers in (getattr(handler, "states", None) or {}).values():
+            nested.extend(state_handlers)
+        if nested:
+            instrument_handler_callbacks(nested)
+        callback = getattr(handler, "callback", None)
+        if callback is None or getattr(callback, "perf_instrumented", False):
+            continue
+        handler.callback = _instrumented_callback(callback)
+
+
+def _instrumented_callback(callback):
+    name = getattr(callback, "__name__", type(callback).__name__)
+
+    @functools.wraps(callback)
+    async def instrumented(update, context):
+        with measure(GROUP_HANDLERS, name):
+            return await callback(update, context)
+    instrumented.perf_instrumented = True
+    return instrumented
+
+
+def _percentile_ms(buckets: list, count: int, max_ms: float, percentile: float) -> float:
+    """Upper bound of the bucket holding the percentile (the observed max for the overflow bucket)."""
+    wanted_rank = count * percentile / 100.0
+    running = 0
+    for bucket_index, bucket_count in enumerate(buckets):
+        running += bucket_count
+        if running >= wanted_rank and bucket_count:
+            if bucket_index >= len(PERF_HISTOGRAM_BOUNDS_MS):
+                return max_ms
+            return min(float(PERF_HISTOGRAM_BOUNDS_MS[bucket_index]), max_ms)
+    return max_ms
+
+
+def get_perf_snapshot(group: str) -> dict:
+    """{name: {"count", "errors", "in_flight", "avg_ms", "max_ms", "p50_ms", "p95_ms", "p99_ms"}} for a group."""
+    with _series_lock:
+        copied = {name: {**series, "buckets": list(series["buckets"])}
+                  for name, series in _series.get(group, {}).items()}
+    snapshot = {}
+    for name, series in copied.items():
+        count = series["count"]
+        entry = {
+            "count": count, "errors": series["errors"], "in_flight": series["in_flight"],
+            "avg_ms": series["total_ms"] / count if count else 0.0, "max_ms": series["max_ms"],
+        }
+        for percentile in PERF_PERCENTILES:
+            entry[f"p{percentile}_ms"] = _percentile_ms(
+                series["buckets"], count, series["max_ms"], percentile) if count else 0.0
+        snapshot[name] = entry
+    return snapshot
+
+
+def reset_perf_metrics():
+    """Clears recorded samples; calls in flight keep their gauge."""
+    with _series_lock:
+        for group_series in _series.values():
+            for series in group_series.values():
+                series.update(buckets=[0] * (len(PERF_HISTOGRAM_BOUNDS_MS) + 1), count=0,
+                              errors=0, total_ms=0.0, max_ms=0.0)
+    logger.info("Performance metrics reset.")
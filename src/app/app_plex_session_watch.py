@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from telegram.ext import CallbackContext, Application
+
+import src.app.app_config_holder as app_config_holder
+import src.app.user_manager as user_manager
+from src.app.app_service_executor import run_plex_call
+from src.bot.bot_broadcast import broadcast_to_chats
+from src.bot.bot_text_utils import escape_md_v2
+from src.services.plex.bot_plex_session_listener import (
+    ensure_plex_session_listener, stop_plex_session_listener,
+    is_plex_session_listener_running, set_plex_session_event_callback
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _stream_event_text(event: str, snapshot: dict) -> str:
+    media_title = snapshot['media_title']
+    if snapshot['type'] == 'episode' and snapshot['show_title']:
+        media_title = f"{snapshot['show_title']} - {media_title}"
+    if event == "started":
+        return f"▶️ *{escape_md_v2(snapshot['user_title'])}* started watching *{escape_md_v2(media_title)}*"
+    return f"⏹️ *{escape_md_v2(snapshot['user_title'])}* stopped watching *{escape_md_v2(media_title)}*"
+
+
+async def _notify_stream_subscribers(application: Application, event: str, snapshot: dict):
+    chat_ids = user_manager.get_plex_stream_notification_chats()
+    if not chat_ids:
+        return
+    text = _stream_event_text(event, snapshot)
+
+    # Each event is its own message: it notifies the subscriber, and neither
+    # replaces their status message nor is merged with the next event.
+    async def send_event(chat_id_str: str):
+        sent_message = await application.bot.send_message(
+            chat_id=int(chat_id_str), text=text, parse_mode="MarkdownV2")
+        return sent_message.message_id
+
+    await broadcast_to_chats(chat_ids, [send_event], description=f"plex stream {event}")
+
+
+async def periodic_plex_session_listener_check(context: CallbackContext) -> None:
+    """
+    Keeps the Plex notification listener connected while Plex is enabled and
+    stops it otherwise. Runs as a repeating job; the listener itself pushes
+    session changes, so this does not poll Plex.
+    """
+    if not app_config_holder.is_plex_enabled() or \
+            not (app_config_holder.get_plex_url() and app_config_holder.get_plex_token()):
+        if is_plex_session_listener_running():
+            stop_plex_session_listener()
+        return
+
+    # Events arrive on the listener thread; hand them to the bot's loop.
+    loop = asyncio.get_running_loop()
+    application = context.application
+    set_plex_session_event_callback(
+        lambda event, snapshot: asyncio.run_coroutine_threadsafe(
+            _notify_stream_subscribers(application, event, snapshot), loop))
+    try:
+        await run_plex_call(ensure_plex_session_listener)
+    except Exception as e:
+        logger.error(
+            f"Error starting Plex session listener: {e}", exc_info=False)
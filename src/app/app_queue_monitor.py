@@ -0,0 +1,58 @@
+import logging
+from telegram.ext import CallbackContext
+
+import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_radarr_call, run_sonarr_call
+from src.services.bot_queue_monitor import refresh_queue_snapshot, get_queue_watchers
+from src.services.radarr.bot_radarr_manage import fetch_radarr_queue_rows
+from src.services.sonarr.bot_sonarr_manage import fetch_sonarr_queue_rows
+from src.handlers.radarr.menu_handler_library_management_radarr import push_radarr_queue_update
+from src.handlers.sonarr.menu_handler_library_management_sonarr import push_sonarr_queue_update
+
+logger = logging.getLogger(__name__)
+
+QUEUE_MONITOR_MAP = {
+    "radarr": {
+        "is_enabled_func": app_config_holder.is_radarr_enabled,
+        "fetch_func": fetch_radarr_queue_rows,
+        "service_call": run_radarr_call,
+        "push_func": push_radarr_queue_update,
+    },
+    "sonarr": {
+        "is_enabled_func": app_config_holder.is_sonarr_enabled,
+        "fetch_func": fetch_sonarr_queue_rows,
+        "service_call": run_sonarr_call,
+        "push_func": push_sonarr_queue_update,
+    },
+}
+
+
+async def periodic_queue_poll(context: CallbackContext) -> None:
+    """
+    Polls the Radarr and Sonarr queues that at least one admin is watching,
+    once per tick however many are watching, and pushes the new page to
+    watchers when the queue changed. Runs as a repeating job.
+    """
+    for service_name, monitor in QUEUE_MONITOR_MAP.items():
+        if not monitor["is_enabled_func"]():
+            continue
+        watchers = get_queue_watchers(service_name)
+        if not watchers:
+            continue
+        try:
+            diff = await monitor["service_call"](refresh_queue_snapshot, service_name, monitor["fetch_func"])
+        except Exception as e:
+            logger.error(
+                f"Error polling {service_name} queue: {e}", exc_info=False)
+            continue
+        if not diff or not diff["changed_any"]:
+            continue
+        logger.debug(
+            f"{service_name} queue changed ({len(diff['added'])} added, {len(diff['removed'])} removed, "
+            f"{len(diff['changed'])} updated); refreshing {len(watchers)} watchers.")
+        for chat_id_str, watch in watchers.items():
+            try:
+                await monitor["push_func"](context.application, chat_id_str, watch)
+            except Exception as e:
+                logger.error(
+                    f"Error pushing {service_name} queue update to {chat_id_str}: {e}", exc_info=True)
@@ -0,0 +1,214 @@
+import bisect
+import copy
+import json
+import logging
+import threading
+
+import src.app.app_file_utils as app_file_utils
+import src.app.app_state_store as app_state_store
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+HISTORY_STATUSES = ("approved", "rejected", "add_failed")
+
+KEY_REQUESTS_JSON_MIGRATED = "requests_json_migrated"
+
+_requests_by_id: dict[str, dict] = {}
+# Sorted lists of (request_timestamp, request_id), oldest first.
+_user_index: dict[str, list] = {}
+_status_index: dict[str, list] = {}
+# Sorted list of (status_timestamp, request_id) for processed requests, oldest first.
+_history_index: list = []
+_store_loaded = False
+_store_lock = threading.RLock()
+
+
+def _user_key(user_id) -> str:
+    return str(user_id)
+
+
+def _request_sort_key(request: dict) -> tuple:
+    return (request.get("request_timestamp") or 0, request.get("request_id"))
+
+
+def _history_sort_key(request: dict) -> tuple:
+    return (request.get("status_timestamp") or 0, request.get("request_id"))
+
+
+def _remove_sorted(index_list: list, sort_key: tuple):
+    position = bisect.bisect_left(index_list, sort_key)
+    if position < len(index_list) and index_list[position] == sort_key:
+        del index_list[position]
+
+
+def _index_request(request: dict):
+    request_id = request.get("request_id")
+    _requests_by_id[request_id] = request
+    bisect.insort(_user_index.setdefault(
+        _user_key(request.get("user_id")), []), _request_sort_key(request))
+    bisect.insort(_status_index.setdefault(
+        request.get("status"), []), _request_sort_key(request))
+    if request.get("status") in HISTORY_STATUSES:
+        bisect.insort(_history_index, _history_sort_key(request))
+
+
+def _unindex_request(request: dict):
+    _requests_by_id.pop(request.get("request_id"), None)
+    _remove_sorted(_user_index.get(
+        _user_key(request.get("user_id")), []), _request_sort_key(request))
+    _remove_sorted(_status_index.get(
+        request.get("status"), []), _request_sort_key(request))
+    if request.get("status") in HISTORY_STATUSES:
+        _remove_sorted(_history_index, _history_sort_key(request))
+
+
+def _request_upsert_statement(request: dict) -> tuple:
+    return ("INSERT INTO media_requests (request_id, user_id, status, request_timestamp, status_timestamp, data) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(request_id) DO UPDATE SET user_id = excluded.user_id, status = excluded.status, "
+            "request_timestamp = excluded.request_timestamp, status_timestamp = excluded.status_timestamp, "
+            "data = excluded.data",
+            (request.get("request_id"), _user_key(request.get("user_id")), request.get("status"),
+             request.get("request_timestamp"), request.get("status_timestamp"), json.dumps(request)))
+
+
+def _queue_request_write(request: dict):
+    app_state_store.queue_writes([(("media_requests", request.get("request_id")),
+                                   _request_upsert_statement(request))])
+
+
+def _migrate_requests_json_if_needed():
+    if app_state_store.has_state_value(KEY_REQUESTS_JSON_MIGRATED):
+        return
+    requests_path = app_file_utils.get_requests_file_path()
+    legacy_requests = app_file_utils.load_json_data(requests_path)
+    statements = []
+    if isinstance(legacy_requests, list):
+        statements = [_request_upsert_statement(req) for req in legacy_requests
+                      if isinstance(req, dict) and req.get("request_id")]
+    statements.append(app_state_store.state_value_upsert_statement(
+        KEY_REQUESTS_JSON_MIGRATED, {"source": requests_path, "imported": len(statements)}))
+    if app_state_store.apply_statements(statements):
+        if len(statements) > 1:
+            logger.info(
+                f"Migrated {len(statements) - 1} media requests from {requests_path} into the bot state store.")
+    else:
+        logger.error(
+            f"Migration of media requests from {requests_path} failed.")
+
+
+def _ensure_loaded():
+    global _store_loaded
+    if _store_loaded:
+        return
+    with _store_lock:
+        if _store_loaded:
+            return
+        _migrate_requests_json_if_needed()
+        _requests_by_id.clear()
+        _user_index.clear()
+        _status_index.clear()
+        _history_index.clear()
+        for (data,) in app_state_store.fetch_rows("SELECT data FROM media_requests"):
+            _index_request(json.loads(data))
+        _store_loaded = True
+        logger.info(f"Request store loaded ({len(_requests_by_id)} requests).")
+
+
+def reload_request_store():
+    global _store_loaded
+    with _store_lock:
+        _store_loaded = False
+        _ensure_loaded()
+
+
+def _page_slice(index_list: list, page: int, page_size: int, newest_first: bool) -> list:
+    total_items = len(index_list)
+    start_index = (page - 1) * page_size
+    if newest_first:
+        upper = max(total_items - start_index, 0)
+        lower = max(upper - page_size, 0)
+        keys = reversed(index_list[lower:upper])
+    else:
+        keys = index_list[start_index:start_index + page_size]
+    return [copy.deepcopy(_requests_by_id[request_id]) for _, request_id in keys]
+
+
+def get_request(request_id: str, user_id=None) -> dict | None:
+    """Returns a copy of one request, optionally only if it belongs to user_id."""
+    _ensure_loaded()
+    request = _requests_by_id.get(request_id)
+    if request is None:
+        return None
+    if user_id is not None and _user_key(request.get("user_id")) != _user_key(user_id):
+        return None
+    return copy.deepcopy(request)
+
+
+def count_requests_by_status(status: str) -> int:
+    _ensure_loaded()
+    return len(_status_index.get(status, []))
+
+
+def count_user_requests(user_id) -> int:
+    _ensure_loaded()
+    return len(_user_index.get(_user_key(user_id), []))
+
+
+def get_pending_requests_page(page: int, page_size: int) -> tuple[list, int]:
+    """Pending requests, oldest request first. Returns (page_items, total_items)."""
+    _ensure_loaded()
+    with _store_lock:
+        index_list = _status_index.get(STATUS_PENDING, [])
+        return _page_slice(index_list, page, page_size, newest_first=False), len(index_list)
+
+
+def get_history_requests_page(page: int, page_size: int) -> tuple[list, int]:
+    """Processed requests, most recently processed first."""
+    _ensure_loaded()
+    with _store_lock:
+        return _page_slice(_history_index, page, page_size, newest_first=True), len(_history_index)
+
+
+def get_user_requests_page(user_id, page: int, page_size: int) -> tuple[list, int]:
+    """A user's requests, newest request first."""
+    _ensure_loaded()
+    with _store_lock:
+        index_list = _user_index.get(_user_key(user_id), [])
+        return _page_slice(index_list, page, page_size, newest_first=True), len(index_list)
+
+
+def add_request(request: dict) -> bool:
+    if not isinstance(request, dict) or not request.get("request_id"):
+        logger.error("Attempted to add a media request without request_id.")
+        return False
+    _ensure_loaded()
+    with _store_lock:
+        _queue_request_write(request)
+        existing = _requests_by_id.get(request["request_id"])
+        if existing is not None:
+            _unindex_request(existing)
+        _index_request(copy.deepcopy(request))
+        return True
+
+
+def update_request(request_id: str, expected_status: str | None = None, **changes) -> dict | None:
+    """
+    Applies field changes to one request and queues a write of only that row.
+    Returns the updated request, or None if not found or if its status does
+    not match expected_status.
+    """
+    _ensure_loaded()
+    with _store_lock:
+        existing = _requests_by_id.get(request_id)
+        if existing is None:
+            return None
+        if expected_status is not None and existing.get("status") != expected_status:
+            return None
+        updated = copy.deepcopy(existing)
+        updated.update(changes)
+        _queue_request_write(updated)
+        _unindex_request(existing)
+        _index_request(updated)
+        return copy.deepcopy(updated)
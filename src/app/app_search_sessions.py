@@ -0,0 +1,135 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import src.app.app_file_utils as app_file_utils
+
+logger = logging.getLogger(__name__)
+
+SEARCH_KIND_RADARR = "radarr"
+SEARCH_KIND_SONARR = "sonarr"
+
+SEARCH_SESSION_TTL_SECONDS = 1800
+SEARCH_SESSION_MAX_SESSIONS = 200
+# When enabled, sessions pushed out by the LRU limit are written to
+# data/search_results/ and read back on the next page flip instead of being lost.
+SEARCH_SESSION_SPILL_TO_DISK = False
+
+# (kind, chat_id_str) -> {"results": list, "query": str | None, "stored_at": float}
+_sessions: OrderedDict = OrderedDict()
+_sessions_lock = threading.Lock()
+
+SEARCH_SESSION_STATS = {
+    "stored": 0,
+    "hits": 0,
+    "misses": 0,
+    "expired": 0,
+    "evicted": 0,
+    "spilled": 0,
+    "restored": 0,
+}
+
+
+def _session_key(kind: str, chat_id) -> tuple:
+    return (kind, str(chat_id))
+
+
+def _spill_file_path(session_key: tuple) -> str:
+    kind, chat_id_str = session_key
+    return app_file_utils.get_search_results_file_path(f"{kind}_{chat_id_str}.json")
+
+
+def _is_expired(session: dict, now: float) -> bool:
+    return now - session.get("stored_at", 0) > SEARCH_SESSION_TTL_SECONDS
+
+
+def _remove_spill_file(session_key: tuple):
+    spill_path = _spill_file_path(session_key)
+    if os.path.exists(spill_path):
+        try:
+            os.remove(spill_path)
+        except OSError as e:
+            logger.warning(
+                f"Could not remove spilled search results {spill_path}: {e}")
+
+
+def _spill_session(session_key: tuple, session: dict):
+    if app_file_utils.save_json_data(_spill_file_path(session_key), session, create_backup=False):
+        SEARCH_SESSION_STATS["spilled"] += 1
+
+
+def _restore_spilled_session(session_key: tuple) -> dict | None:
+    spill_path = _spill_file_path(session_key)
+    if not os.path.exists(spill_path):
+        return None
+    session = app_file_utils.load_json_data(spill_path)
+    _remove_spill_file(session_key)
+    if not isinstance(session, dict) or _is_expired(session, time.time()):
+        return None
+    SEARCH_SESSION_STATS["restored"] += 1
+    return session
+
+
+def _evict_locked(now: float):
+    for session_key in [key for key, session in _sessions.items() if _is_expired(session, now)]:
+        del _sessions[session_key]
+        SEARCH_SESSION_STATS["expired"] += 1
+    while len(_sessions) > SEARCH_SESSION_MAX_SESSIONS:
+        session_key, session = _sessions.popitem(last=False)
+        SEARCH_SESSION_STATS["evicted"] += 1
+        if SEARCH_SESSION_SPILL_TO_DISK:
+            _spill_session(session_key, session)
+
+
+def store_search_results(kind: str, chat_id, results: list, query: str | None = None):
+    """Keeps one chat's latest search results, replacing any earlier search of the same kind."""
+    session_key = _session_key(kind, chat_id)
+    now = time.time()
+    with _sessions_lock:
+        _sessions.pop(session_key, None)
+        _sessions[session_key] = {"results": list(
+            results), "query": query, "stored_at": now}
+        SEARCH_SESSION_STATS["stored"] += 1
+        _evict_locked(now)
+    if SEARCH_SESSION_SPILL_TO_DISK:
+        _remove_spill_file(session_key)
+
+
+def get_search_results(kind: str, chat_id) -> list:
+    """Returns the chat's stored results, or [] if there are none or they expired."""
+    session_key = _session_key(kind, chat_id)
+    now = time.time()
+    with _sessions_lock:
+        session = _sessions.get(session_key)
+        if session is not None and _is_expired(session, now):
+            del _sessions[session_key]
+            SEARCH_SESSION_STATS["expired"] += 1
+            session = None
+        if session is None and SEARCH_SESSION_SPILL_TO_DISK:
+            session = _restore_spilled_session(session_key)
+            if session is not None:
+                _sessions[session_key] = session
+                _evict_locked(now)
+        if session is None:
+            SEARCH_SESSION_STATS["misses"] += 1
+            return []
+        _sessions.move_to_end(session_key)
+        SEARCH_SESSION_STATS["hits"] += 1
+        return list(session.get("results", []))
+
+
+def clear_search_results(kind: str, chat_id):
+    session_key = _session_key(kind, chat_id)
+    with _sessions_lock:
+        _sessions.pop(session_key, None)
+    if SEARCH_SESSION_SPILL_TO_DISK:
+        _remove_spill_file(session_key)
+
+
+def get_search_session_stats() -> dict:
+    with _sessions_lock:
+        stats = dict(SEARCH_SESSION_STATS)
+        stats["active_sessions"] = len(_sessions)
+    return stats
@@ -0,0 +1,122 @@
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.services.radarr.bot_radarr_core import _radarr_request
+from src.services.sonarr.bot_sonarr_core import _sonarr_request
+from src.services.plex.bot_plex_core import _plex_request
+from src.services.abdm.bot_abdm_core import add_download_to_abdm
+
+logger = logging.getLogger(__name__)
+
+SERVICE_RADARR = "radarr"
+SERVICE_SONARR = "sonarr"
+SERVICE_PLEX = "plex"
+SERVICE_ABDM = "abdm"
+
+# Each backend gets its own bounded pool so a slow or unreachable service
+# can only exhaust its own workers, never another backend's or the event loop.
+SERVICE_POOL_SIZES = {
+    SERVICE_RADARR: 4,
+    SERVICE_SONARR: 4,
+    SERVICE_PLEX: 4,
+    SERVICE_ABDM: 2,
+}
+# Health probes run on their own single worker per backend, so a pool busy
+# with user traffic cannot make a healthy service miss its probe deadline.
+HEALTH_PROBE_POOL_SIZE = 1
+HEALTH_PROBE_POOL_SUFFIX = "_health"
+
+_service_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(pool_name: str, max_workers: int) -> ThreadPoolExecutor:
+    executor = _service_executors.get(pool_name)
+    if executor is not None:
+        return executor
+    with _executors_lock:
+        executor = _service_executors.get(pool_name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"{pool_name}_svc")
+            _service_executors[pool_name] = executor
+            logger.info(
+                f"Created {pool_name} service executor with {max_workers} workers.")
+    return executor
+
+
+def get_service_executor(service_name: str) -> ThreadPoolExecutor:
+    """Returns the thread pool dedicated to a backend, creating it on first use."""
+    if service_name not in SERVICE_POOL_SIZES:
+        raise ValueError(f"Unknown service for executor: {service_name}")
+    return _get_executor(service_name, SERVICE_POOL_SIZES[service_name])
+
+
+def get_health_probe_executor(service_name: str) -> ThreadPoolExecutor:
+    """Returns the backend's health probe pool, kept apart from its user traffic pool."""
+    if service_name not in SERVICE_POOL_SIZES:
+        raise ValueError(f"Unknown service for executor: {service_name}")
+    return _get_executor(service_name + HEALTH_PROBE_POOL_SUFFIX, HEALTH_PROBE_POOL_SIZE)
+
+
+async def run_service_call(service_name: str, func, *args, **kwargs):
+    """Runs a blocking backend call in the service's pool and awaits its result."""
+    loop = asyncio.get_running_loop()
+    executor = get_service_executor(service_name)
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+async def run_health_probe(service_name: str, func, *args, **kwargs):
+    """Runs a blocking connection check in the backend's health probe pool."""
+    loop = asyncio.get_running_loop()
+    executor = get_health_probe_executor(service_name)
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+async def run_radarr_call(func, *args, **kwargs):
+    return await run_service_call(SERVICE_RADARR, func, *args, **kwargs)
+
+
+async def run_sonarr_call(func, *args, **kwargs):
+    return await run_service_call(SERVICE_SONARR, func, *args, **kwargs)
+
+
+async def run_plex_call(func, *args, **kwargs):
+    return await run_service_call(SERVICE_PLEX, func, *args, **kwargs)
+
+
+async def run_abdm_call(func, *args, **kwargs):
+    return await run_service_call(SERVICE_ABDM, func, *args, **kwargs)
+
+
+async def radarr_request_async(method, endpoint, **kwargs):
+    return await run_radarr_call(_radarr_request, method, endpoint, **kwargs)
+
+
+async def sonarr_request_async(method, endpoint, **kwargs):
+    return await run_sonarr_call(_sonarr_request, method, endpoint, **kwargs)
+
+
+async def plex_request_async(func, *args, **kwargs):
+    return await run_plex_call(_plex_request, func, *args, **kwargs)
+
+
+async def add_download_to_abdm_async(*args, **kwargs) -> str:
+    return await run_abdm_call(add_download_to_abdm, *args, **kwargs)
+
+
+def shutdown_service_executors(wait: bool = False):
+    """Stops all backend pools. Pending calls are cancelled unless wait is True."""
+    with _executors_lock:
+        executors = list(_service_executors.items())
+        _service_executors.clear()
+    for service_name, executor in executors:
+        try:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+            logger.info(f"{service_name} service executor shut down.")
+        except Exception as e:
+            logger.error(
+                f"Error shutting down {service_name} service executor: {e}", exc_info=True)
@@ -1,9 +1,13 @@
 import logging
 import src.app.app_config_holder as app_config_holder
 
-from src.services.plex.bot_plex_core import init_plex_config
+from src.services.plex.bot_plex_core import init_plex_config, invalidate_plex_server_connection
 from src.services.radarr.bot_radarr_core import init_radarr_config
 from src.services.sonarr.bot_sonarr_core import init_sonarr_config
+from src.services.bot_http_sessions import create_service_session
+from src.services.bot_lookup_cache import clear_lookup_cache
+from src.app.app_service_executor import (
+    SERVICE_PLEX, SERVICE_RADARR, SERVICE_SONARR, SERVICE_ABDM, SERVICE_POOL_SIZES)
 
 logger = logging.getLogger(__name__)
 
@@ -11,11 +15,17 @@ logger = logging.getLogger(__name__)
 def initialize_services_with_config(cfg_module):
     logger.info("Initializing services based on configuration...")
     app_config_holder.set_config(cfg_module)
+    # Lookups may point at a different Radarr/Sonarr instance after a reload.
+    clear_lookup_cache()
 
     if app_config_holder.is_plex_enabled():
         plex_url = app_config_holder.get_plex_url()
         plex_token = app_config_holder.get_plex_token()
         if plex_url and plex_token:
+            create_service_session(
+                SERVICE_PLEX, SERVICE_POOL_SIZES[SERVICE_PLEX])
+            # The cached PlexServer holds the previous session; rebuild it.
+            invalidate_plex_server_connection("HTTP session recreated")
             init_plex_config(plex_url, plex_token)
             logger.info("Plex actions initialized.")
         else:
@@ -30,6 +40,8 @@ def initialize_services_with_config(cfg_module):
         radarr_key = app_config_holder.get_radarr_api_key()
         if radarr_url and radarr_key:
             init_radarr_config(radarr_url, radarr_key)
+            create_service_session(
+                SERVICE_RADARR, SERVICE_POOL_SIZES[SERVICE_RADARR])
             logger.info("Radarr bot initialized.")
         else:
             logger.warning(
@@ -43,6 +55,8 @@ def initialize_services_with_config(cfg_module):
         sonarr_key = app_config_holder.get_sonarr_api_key()
         if sonarr_url and sonarr_key:
             init_sonarr_config(sonarr_url, sonarr_key)
+            create_service_session(
+                SERVICE_SONARR, SERVICE_POOL_SIZES[SERVICE_SONARR])
             logger.info("Sonarr bot initialized.")
         else:
             logger.warning(
@@ -51,4 +65,7 @@ def initialize_services_with_config(cfg_module):
         logger.info("Sonarr features are disabled in config.")
         init_sonarr_config(None, None)
 
+    if app_config_holder.is_abdm_enabled():
+        create_service_session(SERVICE_ABDM, SERVICE_POOL_SIZES[SERVICE_ABDM])
+
     logger.info("Service initialization check complete.")
@@ -10,9 +10,7 @@ from .app_file_utils import (
     determine_initial_data_storage_path,
     load_project_version as load_project_version_from_file_utils,
     get_config_file_path,
-    get_config_template_path,
-    load_requests_data,  # Keep for media requests
-    load_tickets_data  # New import
+    get_config_template_path
 )
 from src.config.config_manager import (
     _load_config_module_from_path, config_exists_and_is_complete,
@@ -24,6 +22,8 @@ from .app_config_ui import run_config_ui
 from src.config.config_definitions import ALL_USER_CONFIG_KEYS, CONFIG_FIELD_DEFINITIONS, LOG_LEVEL_OPTIONS
 import src.app.app_config_holder as app_config_holder
 import src.app.user_manager as user_manager
+import src.app.app_request_store as app_request_store
+import src.app.app_ticket_store as app_ticket_store
 
 logger = logging.getLogger(__name__)
 
@@ -86,9 +86,9 @@ def setup_logging(current_data_path: str, project_version: str, log_level_from_c
 
 def record_bot_startup_time_in_state():
     if user_manager.record_bot_startup_time():
-        logger.info("Bot startup time and version recorded in bot_state.json.")
+        logger.info("Bot startup time and version recorded in bot state.")
     else:
-        logger.error("Failed to record bot startup time in bot_state.json.")
+        logger.error("Failed to record bot startup time in bot state.")
 
 
 def check_pc_control_dependencies(config_file_path_in_data: str):
@@ -264,24 +264,24 @@ def perform_initial_setup():
         user_manager.ensure_initial_bot_state()
     except Exception as e_state_init:
         logger.critical(
-            f"Failed to initialize or ensure bot state (bot_state.json): {e_state_init}", exc_info=True)
+            f"Failed to initialize or ensure bot state: {e_state_init}", exc_info=True)
         sys.exit("Critical error: Bot state initialization failed.")
 
     record_bot_startup_time_in_state()
 
     try:
-        _ = load_requests_data()
-        logger.info(f"Checked/Initialized requests data file.")
+        app_request_store.reload_request_store()
+        logger.info(f"Checked/Initialized request store.")
     except Exception as e_req_init:
         logger.error(
-            f"Failed to initialize requests data file: {e_req_init}", exc_info=True)
+            f"Failed to initialize request store: {e_req_init}", exc_info=True)
 
-    try:  # New block for tickets.json
-        _ = load_tickets_data()
-        logger.info(f"Checked/Initialized tickets data file.")
+    try:
+        app_ticket_store.reload_ticket_store()
+        logger.info(f"Checked/Initialized ticket store.")
     except Exception as e_ticket_init:
         logger.error(
-            f"Failed to initialize tickets data file: {e_ticket_init}", exc_info=True)
+            f"Failed to initialize ticket store: {e_ticket_init}", exc_info=True)
 
     check_pc_control_dependencies(config_file_path)
 
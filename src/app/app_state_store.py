@@ -0,0 +1,423 @@
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import src.app.app_config_holder as app_config_holder
+import src.app.app_file_utils as app_file_utils
+
+logger = logging.getLogger(__name__)
+
+STATE_DB_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS users ("
+    " chat_id TEXT PRIMARY KEY, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS message_ids ("
+    " chat_id TEXT NOT NULL, message_type TEXT NOT NULL, message_id INTEGER,"
+    " PRIMARY KEY (chat_id, message_type))",
+    "CREATE TABLE IF NOT EXISTS access_requests_pending ("
+    " chat_id TEXT PRIMARY KEY, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS state_values ("
+    " key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS media_requests ("
+    " request_id TEXT PRIMARY KEY, user_id TEXT, status TEXT,"
+    " request_timestamp REAL, status_timestamp REAL, data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_media_requests_user"
+    " ON media_requests (user_id, request_timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_media_requests_status"
+    " ON media_requests (status, request_timestamp)",
+    "CREATE TABLE IF NOT EXISTS support_tickets ("
+    " ticket_id TEXT PRIMARY KEY, user_chat_id TEXT, status TEXT,"
+    " last_updated_at REAL, data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_support_tickets_user"
+    " ON support_tickets (user_chat_id, status)",
+    "CREATE TABLE IF NOT EXISTS ticket_messages ("
+    " message_id INTEGER PRIMARY KEY AUTOINCREMENT, ticket_id TEXT NOT NULL,"
+    " data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_ticket_messages_ticket"
+    " ON ticket_messages (ticket_id, message_id)",
+    "CREATE TABLE IF NOT EXISTS ptb_persistence ("
+    " scope TEXT NOT NULL, key TEXT NOT NULL, data BLOB NOT NULL,"
+    " updated_at REAL NOT NULL, PRIMARY KEY (scope, key))",
+)
+
+# state_values keys
+KEY_BOT_INFO = "bot_info"
+KEY_DYNAMIC_LAUNCHERS = "dynamic_launchers"
+KEY_JSON_MIGRATED = "json_state_migrated"
+
+# Queued row writes are held for the STATE_WRITE_BEHIND_WINDOW_SECONDS config
+# value (default 0.25) so that bursts (e.g. saving menu and status message IDs
+# for every user at startup) land in one transaction.
+WRITE_BEHIND_RETRY_SECONDS = 5.0
+WRITE_BEHIND_STOP_TIMEOUT_SECONDS = 5.0
+
+_connection: sqlite3.Connection | None = None
+_connection_path: str | None = None
+# Lock order: _flush_lock, then _db_lock. Nothing may take _flush_lock while
+# holding _db_lock, since the writer thread flushes under _flush_lock and
+# then writes under _db_lock.
+_db_lock = threading.RLock()
+
+# row_key -> (sql, params). A later write to the same row replaces the queued one.
+_pending_writes: dict = {}
+_pending_update_count = 0
+_write_condition = threading.Condition()
+# Re-entrant so a caller holding it can still read (fetch_rows) and write
+# (apply_statements), which flush under it.
+_flush_lock = threading.RLock()
+_writer_thread: threading.Thread | None = None
+_writer_stopping = False
+# While > 0 the background writer keeps queued rows back (see hold_write_behind).
+_write_hold_count = 0
+# Database path whose legacy JSON migration has been settled, so reloads skip the check.
+_json_migration_checked_path: str | None = None
+
+WRITE_BEHIND_STATS = {
+    "flushes": 0,
+    "rows_written": 0,
+    "updates_queued": 0,
+    "updates_merged": 0,
+    "failures": 0,
+    "last_flush_rows": 0,
+    "last_flush_merged": 0,
+    "last_flush_ms": 0.0,
+    "max_flush_ms": 0.0,
+}
+
+
+def _get_connection() -> sqlite3.Connection:
+    global _connection, _connection_path
+    db_path = app_file_utils.get_bot_state_db_path()
+    if _connection is not None and _connection_path == db_path:
+        return _connection
+    with _db_lock:
+        if _connection is not None and _connection_path == db_path:
+            return _connection
+        if _connection is not None:
+            _connection.close()
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False,
+                               isolation_level=None, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # FULL syncs the WAL on every commit, so a committed write survives a
+        # power loss. Write-behind batching keeps commits (and syncs) rare.
+        conn.execute("PRAGMA synchronous=FULL")
+        for statement in STATE_DB_SCHEMA:
+            conn.execute(statement)
+        _connection = conn
+        _connection_path = db_path
+        logger.info(f"Bot state store opened at {db_path} (WAL mode).")
+        return conn
+
+
+def close_state_store():
+    global _connection, _connection_path, _json_migration_checked_path
+    stop_write_behind()
+    _json_migration_checked_path = None
+    with _db_lock:
+        if _connection is not None:
+            try:
+                _connection.close()
+                logger.info("Bot state store closed.")
+            except Exception as e:
+                logger.error(
+                    f"Error closing bot state store: {e}", exc_info=True)
+        _connection = None
+        _connection_path = None
+
+
+def _execute_in_transaction(statements: list) -> bool:
+    """Runs (sql, params) pairs in one transaction. Returns False on failure."""
+    if not statements:
+        return True
+    with _db_lock:
+        conn = _get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for sql, params in statements:
+                conn.execute(sql, params)
+            conn.execute("COMMIT")
+            return True
+        except Exception as e:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+            logger.error(
+                f"Error writing to bot state store: {e}", exc_info=True)
+            return False
+
+
+def load_full_state() -> dict:
+    """Reads every table back into the legacy bot_state dict layout."""
+    state = {
+        "users": {},
+        "message_persistence": {},
+        "access_requests_pending": {},
+    }
+    flush_pending_writes()
+    with _db_lock:
+        conn = _get_connection()
+        for chat_id, data in conn.execute("SELECT chat_id, data FROM users"):
+            state["users"][chat_id] = json.loads(data)
+        for chat_id, message_type, message_id in conn.execute(
+                "SELECT chat_id, message_type, message_id FROM message_ids"):
+            state["message_persistence"].setdefault(
+                chat_id, {})[message_type] = message_id
+        for chat_id, data in conn.execute("SELECT chat_id, data FROM access_requests_pending"):
+            state["access_requests_pending"][chat_id] = json.loads(data)
+        for key, value in conn.execute("SELECT key, value FROM state_values"):
+            if key in (KEY_BOT_INFO, KEY_DYNAMIC_LAUNCHERS):
+                state[key] = json.loads(value)
+    return state
+
+
+def user_upsert_statement(chat_id_str: str, user_info: dict) -> tuple:
+    return ("INSERT INTO users (chat_id, data) VALUES (?, ?) "
+            "ON CONFLICT(chat_id) DO UPDATE SET data = excluded.data",
+            (str(chat_id_str), json.dumps(user_info)))
+
+
+def user_delete_statement(chat_id_str: str) -> tuple:
+    return ("DELETE FROM users WHERE chat_id = ?", (str(chat_id_str),))
+
+
+def message_id_upsert_statement(chat_id_str: str, message_type: str, message_id: int) -> tuple:
+    return ("INSERT INTO message_ids (chat_id, message_type, message_id) VALUES (?, ?, ?) "
+            "ON CONFLICT(chat_id, message_type) DO UPDATE SET message_id = excluded.message_id",
+            (str(chat_id_str), message_type, message_id))
+
+
+def message_id_delete_statement(chat_id_str: str, message_type: str) -> tuple:
+    return ("DELETE FROM message_ids WHERE chat_id = ? AND message_type = ?",
+            (str(chat_id_str), message_type))
+
+
+def pending_access_upsert_statement(chat_id_str: str, request_info: dict) -> tuple:
+    return ("INSERT INTO access_requests_pending (chat_id, data) VALUES (?, ?) "
+            "ON CONFLICT(chat_id) DO UPDATE SET data = excluded.data",
+            (str(chat_id_str), json.dumps(request_info)))
+
+
+def pending_access_delete_statement(chat_id_str: str) -> tuple:
+    return ("DELETE FROM access_requests_pending WHERE chat_id = ?", (str(chat_id_str),))
+
+
+def state_value_upsert_statement(key: str, value) -> tuple:
+    return ("INSERT INTO state_values (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, json.dumps(value)))
+
+
+def apply_statements(statements: list) -> bool:
+    """Writes statements immediately, after any queued writes so row order is kept."""
+    with _flush_lock:
+        _flush_pending_locked()
+        return _execute_in_transaction(statements)
+
+
+def fetch_rows(sql: str, params: tuple = ()) -> list:
+    if _pending_writes:
+        flush_pending_writes()
+    with _db_lock:
+        return _get_connection().execute(sql, params).fetchall()
+
+
+def queue_writes(keyed_statements: list):
+    """
+    Queues (row_key, (sql, params)) pairs for the background writer. Writes to
+    the same row_key within one window are merged, the newest one winning.
+    """
+    global _pending_update_count
+    if not keyed_statements:
+        return
+    with _write_condition:
+        for row_key, statement in keyed_statements:
+            _pending_writes[row_key] = statement
+        _pending_update_count += len(keyed_statements)
+        WRITE_BEHIND_STATS["updates_queued"] += len(keyed_statements)
+        _ensure_writer_thread()
+        _write_condition.notify()
+
+
+@contextlib.contextmanager
+def hold_write_behind():
+    """
+    Keeps the background writer from flushing until the block exits, so a
+    long burst of queued writes (e.g. a broadcast) lands in one transaction.
+    Reads and apply_statements still flush immediately.
+    """
+    global _write_hold_count
+    with _write_condition:
+        _write_hold_count += 1
+    try:
+        yield
+    finally:
+        with _write_condition:
+            _write_hold_count -= 1
+            _write_condition.notify()
+
+
+def _ensure_writer_thread():
+    global _writer_thread, _writer_stopping
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    _writer_stopping = False
+    _writer_thread = threading.Thread(
+        target=_writer_loop, name="bot-state-writer", daemon=True)
+    _writer_thread.start()
+
+
+def _writer_loop():
+    while True:
+        with _write_condition:
+            while (not _pending_writes or _write_hold_count) and not _writer_stopping:
+                _write_condition.wait()
+            if _writer_stopping:
+                return
+        # Let the rest of the burst arrive before writing.
+        time.sleep(app_config_holder.get_state_write_behind_window_seconds())
+        if not flush_pending_writes():
+            time.sleep(WRITE_BEHIND_RETRY_SECONDS)
+
+
+def _flush_pending_locked() -> bool:
+    global _pending_writes, _pending_update_count
+    with _write_condition:
+        if not _pending_writes:
+            return True
+        batch = _pending_writes
+        update_count = _pending_update_count
+        _pending_writes = {}
+        _pending_update_count = 0
+
+    started = time.monotonic()
+    if not _execute_in_transaction(list(batch.values())):
+        with _write_condition:
+            # Keep anything queued meanwhile; it is newer than the failed batch.
+            for row_key, statement in batch.items():
+                _pending_writes.setdefault(row_key, statement)
+            _pending_update_count += update_count
+        WRITE_BEHIND_STATS["failures"] += 1
+        logger.error(
+            f"Write-behind flush of {len(batch)} rows failed. Will retry.")
+        return False
+
+    elapsed_ms = (time.monotonic() - started) * 1000
+    merged_count = update_count - len(batch)
+    WRITE_BEHIND_STATS["flushes"] += 1
+    WRITE_BEHIND_STATS["rows_written"] += len(batch)
+    WRITE_BEHIND_STATS["updates_merged"] += merged_count
+    WRITE_BEHIND_STATS["last_flush_rows"] = len(batch)
+    WRITE_BEHIND_STATS["last_flush_merged"] = merged_count
+    WRITE_BEHIND_STATS["last_flush_ms"] = round(elapsed_ms, 2)
+    WRITE_BEHIND_STATS["max_flush_ms"] = max(
+        WRITE_BEHIND_STATS["max_flush_ms"], round(elapsed_ms, 2))
+    logger.debug(
+        f"Bot state flush: {len(batch)} rows from {update_count} updates ({merged_count} merged) in {elapsed_ms:.1f} ms.")
+    return True
+
+
+def flush_pending_writes() -> bool:
+    """Writes all queued rows now. Returns False if the write failed."""
+    with _flush_lock:
+        return _flush_pending_locked()
+
+
+def stop_write_behind():
+    """Stops the background writer and flushes whatever is still queued."""
+    global _writer_stopping, _writer_thread
+    with _write_condition:
+        _writer_stopping = True
+        _write_condition.notify_all()
+    writer_thread = _writer_thread
+    if writer_thread is not None and writer_thread is not threading.current_thread():
+        writer_thread.join(timeout=WRITE_BEHIND_STOP_TIMEOUT_SECONDS)
+    _writer_thread = None
+    if not flush_pending_writes():
+        logger.error(
+            f"{len(_pending_writes)} queued bot state rows could not be written on shutdown.")
+
+
+def get_write_behind_stats() -> dict:
+    with _write_condition:
+        stats = dict(WRITE_BEHIND_STATS)
+        stats["pending_rows"] = len(_pending_writes)
+    return stats
+
+
+def has_state_value(key: str) -> bool:
+    return bool(fetch_rows("SELECT 1 FROM state_values WHERE key = ?", (key,)))
+
+
+def _full_state_statements(state_data: dict) -> list:
+    statements = []
+    for chat_id_str, user_info in (state_data.get("users") or {}).items():
+        statements.append(user_upsert_statement(chat_id_str, user_info))
+    for chat_id_str, ids in (state_data.get("message_persistence") or {}).items():
+        for message_type, message_id in (ids or {}).items():
+            statements.append(message_id_upsert_statement(
+                chat_id_str, message_type, message_id))
+    for chat_id_str, request_info in (state_data.get("access_requests_pending") or {}).items():
+        statements.append(pending_access_upsert_statement(
+            chat_id_str, request_info))
+    if isinstance(state_data.get("bot_info"), dict):
+        statements.append(state_value_upsert_statement(
+            KEY_BOT_INFO, state_data["bot_info"]))
+    if isinstance(state_data.get("dynamic_launchers"), list):
+        statements.append(state_value_upsert_statement(
+            KEY_DYNAMIC_LAUNCHERS, state_data["dynamic_launchers"]))
+    return statements
+
+
+def migrate_json_state_if_needed() -> bool:
+    """
+    One-shot import of a legacy bot_state.json (or its .bak) into the store.
+    Returns True if a migration was performed.
+    """
+    global _json_migration_checked_path
+    db_path = app_file_utils.get_bot_state_db_path()
+    if _json_migration_checked_path == db_path:
+        return False
+    # Under _flush_lock, not _db_lock: the check and the writes below flush
+    # queued rows, which must not happen with _db_lock held (see lock order).
+    with _flush_lock:
+        if _json_migration_checked_path == db_path:
+            return False
+        if has_state_value(KEY_JSON_MIGRATED):
+            _json_migration_checked_path = db_path
+            return False
+
+        json_state_path = app_file_utils.get_bot_state_file_path()
+        if not os.path.exists(json_state_path) and not os.path.exists(json_state_path + ".bak"):
+            if apply_statements([state_value_upsert_statement(
+                    KEY_JSON_MIGRATED, {"source": None})]):
+                _json_migration_checked_path = db_path
+            return False
+
+        legacy_state = app_file_utils.load_json_data(json_state_path)
+        if not isinstance(legacy_state, dict):
+            logger.warning(
+                f"Legacy bot state at {json_state_path} (and its backup) could not be read. Nothing migrated.")
+            if apply_statements([state_value_upsert_statement(
+                    KEY_JSON_MIGRATED, {"source": json_state_path, "imported": False})]):
+                _json_migration_checked_path = db_path
+            return False
+
+        statements = _full_state_statements(legacy_state)
+        statements.append(state_value_upsert_statement(
+            KEY_JSON_MIGRATED, {"source": json_state_path, "imported": True}))
+        if not apply_statements(statements):
+            logger.error(
+                f"Migration of {json_state_path} into the bot state store failed.")
+            return False
+        _json_migration_checked_path = db_path
+        logger.info(
+            f"Migrated legacy bot state from {json_state_path} into {app_file_utils.get_bot_state_db_path()} "
+            f"({len(legacy_state.get('users', {}))} users). The JSON file is no longer used.")
+        return True
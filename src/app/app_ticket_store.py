@@ -0,0 +1,292 @@
+import bisect
+import copy
+import itertools
+import json
+import logging
+import threading
+
+import src.app.app_file_utils as app_file_utils
+import src.app.app_state_store as app_state_store
+
+logger = logging.getLogger(__name__)
+
+ADMIN_ACTIONABLE_STATUSES = ("open_by_user", "user_replied")
+USER_ACTIONABLE_STATUSES = ("open_by_admin", "admin_replied")
+
+KEY_TICKETS_JSON_MIGRATED = "tickets_json_migrated"
+
+# Ticket headers (everything except the message thread), by ticket_id.
+_tickets_by_id: dict[str, dict] = {}
+# Message threads are loaded per ticket on first use.
+_messages_cache: dict[str, list] = {}
+# Sorted lists of (last_updated_at, ticket_id) for open tickets, oldest activity first.
+_open_user_index: dict[str, list] = {}
+_open_admin_actionable_index: list = []
+_open_other_index: list = []
+_store_loaded = False
+_store_lock = threading.RLock()
+# Message rows are append-only, so each one gets its own write-behind key.
+_message_write_sequence = itertools.count()
+
+
+def is_ticket_open(ticket: dict) -> bool:
+    return not (ticket.get("status") or "").startswith("closed")
+
+
+def _user_key(user_chat_id) -> str:
+    return str(user_chat_id)
+
+
+def _activity_sort_key(ticket: dict) -> tuple:
+    return (ticket.get("last_updated_at") or 0, ticket.get("ticket_id"))
+
+
+def _remove_sorted(index_list: list, sort_key: tuple):
+    position = bisect.bisect_left(index_list, sort_key)
+    if position < len(index_list) and index_list[position] == sort_key:
+        del index_list[position]
+
+
+def _admin_index_for(ticket: dict) -> list:
+    if ticket.get("status") in ADMIN_ACTIONABLE_STATUSES:
+        return _open_admin_actionable_index
+    return _open_other_index
+
+
+def _index_ticket(ticket: dict):
+    _tickets_by_id[ticket.get("ticket_id")] = ticket
+    if not is_ticket_open(ticket):
+        return
+    sort_key = _activity_sort_key(ticket)
+    bisect.insort(_open_user_index.setdefault(
+        _user_key(ticket.get("user_chat_id")), []), sort_key)
+    bisect.insort(_admin_index_for(ticket), sort_key)
+
+
+def _unindex_ticket(ticket: dict):
+    _tickets_by_id.pop(ticket.get("ticket_id"), None)
+    if not is_ticket_open(ticket):
+        return
+    sort_key = _activity_sort_key(ticket)
+    _remove_sorted(_open_user_index.get(
+        _user_key(ticket.get("user_chat_id")), []), sort_key)
+    _remove_sorted(_admin_index_for(ticket), sort_key)
+
+
+def _ticket_header(ticket: dict) -> dict:
+    return {key: value for key, value in ticket.items() if key != "messages"}
+
+
+def _ticket_upsert_statement(header: dict) -> tuple:
+    return ("INSERT INTO support_tickets (ticket_id, user_chat_id, status, last_updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(ticket_id) DO UPDATE SET user_chat_id = excluded.user_chat_id, "
+            "status = excluded.status, last_updated_at = excluded.last_updated_at, data = excluded.data",
+            (header.get("ticket_id"), _user_key(header.get("user_chat_id")), header.get("status"),
+             header.get("last_updated_at"), json.dumps(header)))
+
+
+def _message_insert_statement(ticket_id: str, message: dict) -> tuple:
+    return ("INSERT INTO ticket_messages (ticket_id, data) VALUES (?, ?)",
+            (ticket_id, json.dumps(message)))
+
+
+def _queue_ticket_write(header: dict, messages: list):
+    ticket_id = header.get("ticket_id")
+    keyed_statements = [(("support_tickets", ticket_id),
+                         _ticket_upsert_statement(header))]
+    for message in messages:
+        keyed_statements.append((("ticket_messages", ticket_id, next(_message_write_sequence)),
+                                 _message_insert_statement(ticket_id, message)))
+    app_state_store.queue_writes(keyed_statements)
+
+
+def _ticket_statements(ticket: dict) -> list:
+    statements = [_ticket_upsert_statement(_ticket_header(ticket))]
+    for message in ticket.get("messages") or []:
+        statements.append(_message_insert_statement(
+            ticket.get("ticket_id"), message))
+    return statements
+
+
+def _migrate_tickets_json_if_needed():
+    if app_state_store.has_state_value(KEY_TICKETS_JSON_MIGRATED):
+        return
+    tickets_path = app_file_utils.get_tickets_file_path()
+    legacy_tickets = app_file_utils.load_json_data(tickets_path)
+    statements = []
+    imported_count = 0
+    if isinstance(legacy_tickets, dict):
+        for ticket_id, ticket in legacy_tickets.items():
+            if not isinstance(ticket, dict):
+                continue
+            ticket.setdefault("ticket_id", ticket_id)
+            statements.extend(_ticket_statements(ticket))
+            imported_count += 1
+    statements.append(app_state_store.state_value_upsert_statement(
+        KEY_TICKETS_JSON_MIGRATED, {"source": tickets_path, "imported": imported_count}))
+    if app_state_store.apply_statements(statements):
+        if imported_count:
+            logger.info(
+                f"Migrated {imported_count} support tickets from {tickets_path} into the bot state store.")
+    else:
+        logger.error(
+            f"Migration of support tickets from {tickets_path} failed.")
+
+
+def _ensure_loaded():
+    global _store_loaded
+    if _store_loaded:
+        return
+    with _store_lock:
+        if _store_loaded:
+            return
+        _migrate_tickets_json_if_needed()
+        _tickets_by_id.clear()
+        _messages_cache.clear()
+        _open_user_index.clear()
+        _open_admin_actionable_index.clear()
+        _open_other_index.clear()
+        for (data,) in app_state_store.fetch_rows("SELECT data FROM support_tickets"):
+            _index_ticket(json.loads(data))
+        _store_loaded = True
+        logger.info(
+            f"Ticket store loaded ({len(_tickets_by_id)} tickets, "
+            f"{len(_open_admin_actionable_index) + len(_open_other_index)} open).")
+
+
+def reload_ticket_store():
+    global _store_loaded
+    with _store_lock:
+        _store_loaded = False
+        _ensure_loaded()
+
+
+def _get_messages(ticket_id: str) -> list:
+    messages = _messages_cache.get(ticket_id)
+    if messages is None:
+        messages = [json.loads(data) for (data,) in app_state_store.fetch_rows(
+            "SELECT data FROM ticket_messages WHERE ticket_id = ? ORDER BY message_id", (ticket_id,))]
+        _messages_cache[ticket_id] = messages
+    return messages
+
+
+def _full_ticket(ticket_id: str) -> dict:
+    ticket = copy.deepcopy(_tickets_by_id[ticket_id])
+    ticket["messages"] = copy.deepcopy(_get_messages(ticket_id))
+    return ticket
+
+
+def _first_message_only(ticket_id: str) -> dict:
+    """Header plus the opening message, which is all the ticket lists show."""
+    ticket = copy.deepcopy(_tickets_by_id[ticket_id])
+    messages = _get_messages(ticket_id)
+    ticket["messages"] = copy.deepcopy(messages[:1])
+    return ticket
+
+
+def get_ticket(ticket_id: str, user_chat_id=None) -> dict | None:
+    """Returns a copy of one ticket with its thread, optionally only if it belongs to user_chat_id."""
+    _ensure_loaded()
+    with _store_lock:
+        ticket = _tickets_by_id.get(ticket_id)
+        if ticket is None:
+            return None
+        if user_chat_id is not None and _user_key(ticket.get("user_chat_id")) != _user_key(user_chat_id):
+            return None
+        return _full_ticket(ticket_id)
+
+
+def get_user_open_tickets(user_chat_id) -> list:
+    """A user's open ticket headers (no thread), most recent activity first."""
+    _ensure_loaded()
+    with _store_lock:
+        index_list = _open_user_index.get(_user_key(user_chat_id), [])
+        return [copy.deepcopy(_tickets_by_id[ticket_id]) for _, ticket_id in reversed(index_list)]
+
+
+def get_user_open_tickets_page(user_chat_id, page: int, page_size: int) -> tuple[list, int]:
+    """A user's open tickets, most recent activity first. Returns (page_items, total_items)."""
+    _ensure_loaded()
+    with _store_lock:
+        index_list = _open_user_index.get(_user_key(user_chat_id), [])
+        total_items = len(index_list)
+        start_index = (page - 1) * page_size
+        upper = max(total_items - start_index, 0)
+        lower = max(upper - page_size, 0)
+        page_items = [_first_message_only(ticket_id)
+                      for _, ticket_id in reversed(index_list[lower:upper])]
+        return page_items, total_items
+
+
+def get_admin_open_tickets_page(page: int, page_size: int) -> tuple[list, int]:
+    """
+    All open tickets for the admin list: tickets waiting on an admin first,
+    then the rest, each group oldest activity first.
+    """
+    _ensure_loaded()
+    with _store_lock:
+        actionable_count = len(_open_admin_actionable_index)
+        total_items = actionable_count + len(_open_other_index)
+        start_index = (page - 1) * page_size
+        end_index = start_index + page_size
+        keys = _open_admin_actionable_index[start_index:end_index]
+        if end_index > actionable_count:
+            keys = keys + _open_other_index[max(start_index - actionable_count, 0):
+                                            end_index - actionable_count]
+        return [_first_message_only(ticket_id) for _, ticket_id in keys], total_items
+
+
+def count_admin_actionable_tickets() -> int:
+    _ensure_loaded()
+    return len(_open_admin_actionable_index)
+
+
+def count_user_actionable_tickets(user_chat_id) -> int:
+    _ensure_loaded()
+    with _store_lock:
+        return sum(1 for _, ticket_id in _open_user_index.get(_user_key(user_chat_id), [])
+                   if _tickets_by_id[ticket_id].get("status") in USER_ACTIONABLE_STATUSES)
+
+
+def create_ticket(ticket: dict) -> bool:
+    if not isinstance(ticket, dict) or not ticket.get("ticket_id"):
+        logger.error("Attempted to create a support ticket without ticket_id.")
+        return False
+    _ensure_loaded()
+    with _store_lock:
+        ticket_id = ticket["ticket_id"]
+        if ticket_id in _tickets_by_id:
+            logger.error(f"Support ticket {ticket_id} already exists.")
+            return False
+        _queue_ticket_write(_ticket_header(ticket),
+                            ticket.get("messages") or [])
+        _index_ticket(copy.deepcopy(_ticket_header(ticket)))
+        _messages_cache[ticket_id] = copy.deepcopy(
+            ticket.get("messages") or [])
+        return True
+
+
+def update_ticket(ticket_id: str, message: dict | None = None, require_open: bool = False, **changes) -> dict | None:
+    """
+    Applies field changes to one ticket and, if given, appends one message to
+    its thread. Only that ticket's row (and the new message row) is queued for
+    writing. Returns the updated ticket, or None if not found or if
+    require_open is set and the ticket is closed.
+    """
+    _ensure_loaded()
+    with _store_lock:
+        existing = _tickets_by_id.get(ticket_id)
+        if existing is None:
+            return None
+        if require_open and not is_ticket_open(existing):
+            return None
+        updated = copy.deepcopy(existing)
+        updated.update(changes)
+        updated.pop("messages", None)
+        _queue_ticket_write(updated, [message] if message is not None else [])
+        _unindex_ticket(existing)
+        _index_ticket(updated)
+        if message is not None and ticket_id in _messages_cache:
+            _messages_cache[ticket_id].append(copy.deepcopy(message))
+        return _full_ticket(ticket_id)
@@ -16,7 +16,7 @@ DYNAMIC_LAUNCHERS_CACHE_TTL = 300
 
 def _load_all_dynamic_launchers_from_state(force_reload: bool = False) -> list[dict]:
     """
-    Loads the dynamic launchers list from bot_state.json via user_manager.
+    Loads the dynamic launchers list from the bot state via user_manager.
     Uses a simple time-based cache.
     """
     global _dynamic_launchers_cache, _dynamic_launchers_cache_timestamp
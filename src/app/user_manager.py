@@ -1,10 +1,11 @@
 
+import copy
 import logging
-import os
 import datetime
+import threading
 from telegram import User
-from .app_file_utils import get_bot_state_file_path, load_json_data, save_json_data
 import src.app.app_config_holder as app_config_holder
+import src.app.app_state_store as app_state_store
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,13 @@ DEFAULT_BOT_STATE = {
 }
 
 _bot_state_cache = None
+_state_lock = threading.RLock()
+
+# chat_id_str -> (role, username), derived from the users in _bot_state_cache.
+# Replaced (never mutated) by the functions that change users, so role checks
+# read it without locking or copying.
+_auth_index: dict[str, tuple] = {}
+AUTH_INDEX_STATS = {"lookups": 0, "rebuilds": 0, "updates": 0}
 
 PLACEHOLDER_USERNAME_PREFIXES = ["User_", "PrimaryAdmin_"]
 OTHER_PLACEHOLDERS = ["N/A", "Unknown User", "Unknown (to be fetched)"]
@@ -41,75 +49,141 @@ def _is_username_placeholder(username: str | None, chat_id_str: str | None = Non
     return False
 
 
-def _load_bot_state(force_reload: bool = False) -> dict:
+def _auth_entry(chat_id_str: str, user_info: dict) -> tuple:
+    role = user_info.get("role")
+    if role not in (app_config_holder.ROLE_ADMIN, app_config_holder.ROLE_STANDARD_USER):
+        logger.warning(
+            f"User {chat_id_str} has an unknown role '{role}'. Defaulting to UNKNOWN.")
+        role = app_config_holder.ROLE_UNKNOWN
+    return role, user_info.get("username")
 
-    global _bot_state_cache
-    if not force_reload and _bot_state_cache is not None:
-        return _bot_state_cache.copy()
 
-    bot_state_path = get_bot_state_file_path()
-    loaded_state = load_json_data(bot_state_path)
+def _rebuild_auth_index(users: dict):
+    global _auth_index
+    _auth_index = {str(chat_id_str): _auth_entry(chat_id_str, user_info)
+                   for chat_id_str, user_info in (users or {}).items() if isinstance(user_info, dict)}
+    AUTH_INDEX_STATS["rebuilds"] += 1
 
-    if loaded_state is None:
-        logger.warning(
-            f"{bot_state_path} (and its backup) not found or invalid. Initializing with default structure.")
-        _bot_state_cache = DEFAULT_BOT_STATE.copy()
-        if not os.path.exists(bot_state_path) or (loaded_state is None and os.path.exists(bot_state_path)):
-            _save_bot_state(_bot_state_cache)
+
+def _update_auth_index(chat_id_str: str, user_info: dict | None):
+    global _auth_index
+    new_index = dict(_auth_index)
+    if user_info is None:
+        new_index.pop(str(chat_id_str), None)
     else:
-        _bot_state_cache = loaded_state
+        new_index[str(chat_id_str)] = _auth_entry(chat_id_str, user_info)
+    _auth_index = new_index
+    AUTH_INDEX_STATS["updates"] += 1
 
-    updated_during_load = False
-    for key, default_value in DEFAULT_BOT_STATE.items():
-        if key not in _bot_state_cache:
-            logger.info(
-                f"Key '{key}' missing in bot_state.json, initializing with default.")
-            _bot_state_cache[key] = default_value.copy() if isinstance(
-                default_value, (dict, list)) else default_value
-            updated_during_load = True
 
-        if key == "bot_info" and isinstance(_bot_state_cache.get(key), dict):
-            bot_info_state = _bot_state_cache[key]
-            default_bot_info = DEFAULT_BOT_STATE["bot_info"]
-            for sub_key, sub_default_value in default_bot_info.items():
-                if sub_key not in bot_info_state:
-                    logger.info(
-                        f"Sub-key '{sub_key}' missing in bot_state.json['bot_info'], initializing.")
-                    bot_info_state[sub_key] = sub_default_value
-                    updated_during_load = True
+def _get_state_cache() -> dict:
+    """Returns the live state cache (not a copy). Callers must not mutate it."""
+    if _bot_state_cache is None:
+        _load_bot_state(force_reload=True)
+    return _bot_state_cache
 
-        elif key == "access_requests_pending" and not isinstance(_bot_state_cache.get(key), dict):
-            logger.warning(
-                f"Key '{key}' in bot_state.json is not a dict. Resetting to default.")
-            _bot_state_cache[key] = default_value.copy()
-            updated_during_load = True
 
-    if updated_during_load:
-        _save_bot_state(_bot_state_cache)
+def _load_bot_state(force_reload: bool = False) -> dict:
 
-    return _bot_state_cache.copy()
+    global _bot_state_cache
+    with _state_lock:
+        if not force_reload and _bot_state_cache is not None:
+            return copy.deepcopy(_bot_state_cache)
+
+        app_state_store.migrate_json_state_if_needed()
+        loaded_state = app_state_store.load_full_state()
+
+        missing_value_statements = []
+        for key, default_value in DEFAULT_BOT_STATE.items():
+            if key not in loaded_state:
+                logger.info(
+                    f"Key '{key}' missing in bot state store, initializing with default.")
+                loaded_state[key] = copy.deepcopy(default_value)
+                if key in ("bot_info", "dynamic_launchers"):
+                    missing_value_statements.append(
+                        app_state_store.state_value_upsert_statement(key, loaded_state[key]))
+
+            if key == "bot_info" and isinstance(loaded_state.get(key), dict):
+                bot_info_state = loaded_state[key]
+                updated_bot_info = False
+                for sub_key, sub_default_value in DEFAULT_BOT_STATE["bot_info"].items():
+                    if sub_key not in bot_info_state:
+                        logger.info(
+                            f"Sub-key '{sub_key}' missing in bot state 'bot_info', initializing.")
+                        bot_info_state[sub_key] = sub_default_value
+                        updated_bot_info = True
+                if updated_bot_info:
+                    missing_value_statements.append(
+                        app_state_store.state_value_upsert_statement(key, bot_info_state))
+
+        if missing_value_statements:
+            app_state_store.apply_statements(missing_value_statements)
 
+        _bot_state_cache = loaded_state
+        _rebuild_auth_index(_bot_state_cache.get("users"))
+        return copy.deepcopy(_bot_state_cache)
+
+
+def _diff_dict_rows(old_rows: dict, new_rows: dict, upsert_func, delete_func) -> list:
+    statements = []
+    for row_key, row_value in new_rows.items():
+        if old_rows.get(row_key) != row_value:
+            statements.append(upsert_func(row_key, row_value))
+    for row_key in old_rows.keys() - new_rows.keys():
+        statements.append(delete_func(row_key))
+    return statements
+
+
+def _flatten_message_ids(message_persistence: dict) -> dict:
+    return {(chat_id, message_type): message_id
+            for chat_id, ids in (message_persistence or {}).items()
+            for message_type, message_id in (ids or {}).items()}
 
-def _save_bot_state(state_data: dict) -> bool:
 
+def _save_bot_state(state_data: dict) -> bool:
+    """
+    Persists a full state dict by writing only the rows that differ from the
+    cached state, so the cost follows the size of the change, not of the state.
+    """
     global _bot_state_cache
-    bot_state_path = get_bot_state_file_path()
-    data_to_save = state_data.copy()
-    if save_json_data(bot_state_path, data_to_save):
-        _bot_state_cache = data_to_save
+    with _state_lock:
+        old_state = _get_state_cache()
+        new_state = copy.deepcopy(state_data)
+        for key, default_value in DEFAULT_BOT_STATE.items():
+            if key not in new_state or new_state[key] is None:
+                new_state[key] = copy.deepcopy(default_value)
+
+        statements = _diff_dict_rows(
+            old_state.get("users", {}), new_state["users"],
+            app_state_store.user_upsert_statement, app_state_store.user_delete_statement)
+        statements += _diff_dict_rows(
+            old_state.get("access_requests_pending", {}), new_state["access_requests_pending"],
+            app_state_store.pending_access_upsert_statement, app_state_store.pending_access_delete_statement)
+        statements += _diff_dict_rows(
+            _flatten_message_ids(old_state.get("message_persistence")),
+            _flatten_message_ids(new_state["message_persistence"]),
+            lambda row_key, message_id: app_state_store.message_id_upsert_statement(
+                row_key[0], row_key[1], message_id),
+            lambda row_key: app_state_store.message_id_delete_statement(row_key[0], row_key[1]))
+        for key in ("bot_info", "dynamic_launchers"):
+            if old_state.get(key) != new_state[key]:
+                statements.append(
+                    app_state_store.state_value_upsert_statement(key, new_state[key]))
+
+        if not app_state_store.apply_statements(statements):
+            logger.error("Failed to save bot state. Cache not updated.")
+            return False
+        _bot_state_cache = new_state
+        if old_state.get("users") != new_state["users"]:
+            _rebuild_auth_index(new_state["users"])
         logger.debug(
-            f"Bot state successfully saved to {bot_state_path} and cache updated.")
+            f"Bot state saved ({len(statements)} changed rows) and cache updated.")
         return True
-    else:
-        logger.error(
-            f"Failed to save bot state to {bot_state_path}. Cache not updated.")
-        return False
 
 
 def get_all_users_from_state() -> dict:
 
-    state = _load_bot_state(force_reload=True)
-    return state.get("users", {}).copy()
+    return copy.deepcopy(_get_state_cache().get("users", {}))
 
 
 def get_role_for_chat_id(chat_id_str: str, force_reload_state: bool = False) -> str:
@@ -118,23 +192,37 @@ def get_role_for_chat_id(chat_id_str: str, force_reload_state: bool = False) ->
         return app_config_holder.ROLE_UNKNOWN
     if app_config_holder.is_primary_admin(chat_id_str):
         return app_config_holder.ROLE_ADMIN
-    # Use the parameter here
-    state = _load_bot_state(force_reload=force_reload_state)
-    users = state.get("users", {})
-    user_info = users.get(str(chat_id_str))
-    if user_info and "role" in user_info:
-        role = user_info["role"]
-        if role in [app_config_holder.ROLE_ADMIN, app_config_holder.ROLE_STANDARD_USER]:
-            return role
-        else:
-            logger.warning(
-                f"User {chat_id_str} has an unknown role '{role}'. Defaulting to UNKNOWN.")
-            return app_config_holder.ROLE_UNKNOWN
+    if force_reload_state:
+        _load_bot_state(force_reload=True)
+    elif _bot_state_cache is None:
+        _get_state_cache()
+    AUTH_INDEX_STATS["lookups"] += 1
+    auth_entry = _auth_index.get(str(chat_id_str))
+    if auth_entry is not None:
+        return auth_entry[0]
     logger.debug(
-        f"User {chat_id_str} not found in bot_state.json and is not primary admin. Assigning ROLE_UNKNOWN.")
+        f"User {chat_id_str} not found in bot state and is not primary admin. Assigning ROLE_UNKNOWN.")
     return app_config_holder.ROLE_UNKNOWN
 
 
+def get_username_for_chat_id(chat_id_str: str) -> str | None:
+
+    auth_entry = _auth_index.get(str(chat_id_str))
+    return auth_entry[1] if auth_entry is not None else None
+
+
+def get_admin_chat_ids() -> list:
+    """Chat IDs of users stored with the admin role (the primary admin included once saved)."""
+    return [chat_id_str for chat_id_str, (role, _username) in _auth_index.items()
+            if role == app_config_holder.ROLE_ADMIN]
+
+
+def get_auth_index_stats() -> dict:
+    stats = dict(AUTH_INDEX_STATS)
+    stats["users"] = len(_auth_index)
+    return stats
+
+
 def ensure_initial_bot_state():
 
     logger.info("Ensuring initial bot state and primary admin configuration...")
@@ -147,27 +235,43 @@ def ensure_primary_admin_in_state():
     primary_admin_id_str = app_config_holder.get_chat_id_str()
     if not primary_admin_id_str:
         logger.critical(
-            "Primary Admin CHAT_ID not configured! Cannot ensure admin state in bot_state.json.")
+            "Primary Admin CHAT_ID not configured! Cannot ensure admin state in bot state.")
         return
-    current_bot_state = _load_bot_state(force_reload=True)
-    users_in_state = current_bot_state.get("users", {})
-    needs_save = False
-    primary_admin_info = users_in_state.get(primary_admin_id_str)
-    desired_username = f"PrimaryAdmin_{primary_admin_id_str}"
-    if not primary_admin_info:
-        users_in_state[primary_admin_id_str] = {
-            "username": desired_username, "role": app_config_holder.ROLE_ADMIN}
-        needs_save = True
-    else:
-        if primary_admin_info.get("role") != app_config_holder.ROLE_ADMIN:
-            primary_admin_info["role"] = app_config_holder.ROLE_ADMIN
+    with _state_lock:
+        users_in_state = _get_state_cache().get("users", {})
+        primary_admin_info = copy.deepcopy(
+            users_in_state.get(primary_admin_id_str))
+        desired_username = f"PrimaryAdmin_{primary_admin_id_str}"
+        needs_save = False
+        if not primary_admin_info:
+            primary_admin_info = {
+                "username": desired_username, "role": app_config_holder.ROLE_ADMIN}
             needs_save = True
-        if not primary_admin_info.get("username"):
-            primary_admin_info["username"] = desired_username
-            needs_save = True
-    if needs_save:
-        current_bot_state["users"] = users_in_state
-        _save_bot_state(current_bot_state)
+        else:
+            if primary_admin_info.get("role") != app_config_holder.ROLE_ADMIN:
+                primary_admin_info["role"] = app_config_holder.ROLE_ADMIN
+                needs_save = True
+            if not primary_admin_info.get("username"):
+                primary_admin_info["username"] = desired_username
+                needs_save = True
+        if needs_save:
+            _upsert_user(primary_admin_id_str, primary_admin_info)
+
+
+def _upsert_user(chat_id_str: str, user_info: dict, remove_pending: bool = False) -> bool:
+    keyed_statements = [(("users", str(chat_id_str)), app_state_store.user_upsert_statement(
+        chat_id_str, user_info))]
+    state = _get_state_cache()
+    pending = state.get("access_requests_pending", {})
+    if remove_pending and str(chat_id_str) in pending:
+        keyed_statements.append((("access_requests_pending", str(chat_id_str)),
+                                 app_state_store.pending_access_delete_statement(chat_id_str)))
+    app_state_store.queue_writes(keyed_statements)
+    state["users"][str(chat_id_str)] = copy.deepcopy(user_info)
+    _update_auth_index(chat_id_str, user_info)
+    if remove_pending:
+        pending.pop(str(chat_id_str), None)
+    return True
 
 
 def save_users_from_gui(users_data_from_gui: dict):
@@ -182,66 +286,77 @@ def save_users_from_gui(users_data_from_gui: dict):
             users_data_from_gui[primary_admin_id_str]["role"] = app_config_holder.ROLE_ADMIN
         if not users_data_from_gui[primary_admin_id_str].get("username"):
             users_data_from_gui[primary_admin_id_str]["username"] = desired_pa_username
-    current_full_state = _load_bot_state(force_reload=True)
-    current_full_state["users"] = users_data_from_gui
-    return _save_bot_state(current_full_state)
+    with _state_lock:
+        current_full_state = _load_bot_state()
+        current_full_state["users"] = users_data_from_gui
+        return _save_bot_state(current_full_state)
 
 
 def get_message_ids_for_chat(chat_id_str: str) -> dict:
 
-    state = _load_bot_state()
-    return state.get("message_persistence", {}).get(str(chat_id_str), {}).copy()
+    return _get_state_cache().get("message_persistence", {}).get(str(chat_id_str), {}).copy()
 
 
 def save_message_id_for_chat(chat_id_str: str, message_type: str, message_id: int) -> bool:
 
     if not chat_id_str or not message_type:
         return False
-    current_full_state = _load_bot_state(force_reload=True)
-    if "message_persistence" not in current_full_state:
-        current_full_state["message_persistence"] = {}
-    if str(chat_id_str) not in current_full_state["message_persistence"]:
-        current_full_state["message_persistence"][str(chat_id_str)] = {}
-    current_full_state["message_persistence"][str(
-        chat_id_str)][message_type] = message_id
-    return _save_bot_state(current_full_state)
+    with _state_lock:
+        chat_ids = _get_state_cache().setdefault(
+            "message_persistence", {}).setdefault(str(chat_id_str), {})
+        if chat_ids.get(message_type) == message_id:
+            return True
+        app_state_store.queue_writes([(
+            ("message_ids", str(chat_id_str), message_type),
+            app_state_store.message_id_upsert_statement(chat_id_str, message_type, message_id))])
+        chat_ids[message_type] = message_id
+        return True
 
 
 def clear_message_id_for_chat(chat_id_str: str, message_type: str) -> bool:
 
     if not chat_id_str or not message_type:
         return False
-    current_full_state = _load_bot_state(force_reload=True)
-    if "message_persistence" in current_full_state and \
-       str(chat_id_str) in current_full_state["message_persistence"] and \
-       message_type in current_full_state["message_persistence"][str(chat_id_str)]:
-        del current_full_state["message_persistence"][str(
-            chat_id_str)][message_type]
-        if not current_full_state["message_persistence"][str(chat_id_str)]:
-            del current_full_state["message_persistence"][str(chat_id_str)]
-        if not current_full_state["message_persistence"]:
-            current_full_state.pop("message_persistence", None)
-        return _save_bot_state(current_full_state)
-    return False
+    with _state_lock:
+        message_persistence = _get_state_cache().get("message_persistence", {})
+        chat_ids = message_persistence.get(str(chat_id_str), {})
+        if message_type not in chat_ids:
+            return False
+        app_state_store.queue_writes([(
+            ("message_ids", str(chat_id_str), message_type),
+            app_state_store.message_id_delete_statement(chat_id_str, message_type))])
+        del chat_ids[message_type]
+        if not chat_ids:
+            message_persistence.pop(str(chat_id_str), None)
+        return True
+
+
+def _update_bot_info(**changes) -> bool:
+    with _state_lock:
+        state = _get_state_cache()
+        bot_info = copy.deepcopy(state.get("bot_info")) if isinstance(
+            state.get("bot_info"), dict) else DEFAULT_BOT_STATE["bot_info"].copy()
+        bot_info.update(changes)
+        app_state_store.queue_writes([(
+            ("state_values", "bot_info"),
+            app_state_store.state_value_upsert_statement("bot_info", bot_info))])
+        state["bot_info"] = bot_info
+        return True
 
 
 def record_bot_startup_time() -> bool:
 
-    current_full_state = _load_bot_state(force_reload=True)
-    if "bot_info" not in current_full_state or not isinstance(current_full_state.get("bot_info"), dict):
-        current_full_state["bot_info"] = DEFAULT_BOT_STATE["bot_info"].copy()
-    current_full_state["bot_info"]["last_startup_time"] = datetime.datetime.now(
+    last_startup_time = datetime.datetime.now(
         datetime.timezone.utc).isoformat()
-    current_full_state["bot_info"]["version_at_last_run"] = app_config_holder.get_project_version()
+    version_at_last_run = app_config_holder.get_project_version()
     logger.info(
-        f"Recording startup time: {current_full_state['bot_info']['last_startup_time']} and version: {current_full_state['bot_info']['version_at_last_run']}")
-    return _save_bot_state(current_full_state)
+        f"Recording startup time: {last_startup_time} and version: {version_at_last_run}")
+    return _update_bot_info(last_startup_time=last_startup_time, version_at_last_run=version_at_last_run)
 
 
 def get_last_startup_time_str() -> str | None:
 
-    state = _load_bot_state()
-    return state.get("bot_info", {}).get("last_startup_time")
+    return _get_state_cache().get("bot_info", {}).get("last_startup_time")
 
 
 def update_username_if_changed_or_placeholder(chat_id_str: str, effective_user: User | None) -> bool:
@@ -252,41 +367,41 @@ def update_username_if_changed_or_placeholder(chat_id_str: str, effective_user:
     """
     if not chat_id_str or not effective_user:
         return False
+    # Nearly every call finds the name unchanged; answer that from the index without locking.
+    new_telegram_username = effective_user.username or effective_user.first_name
+    auth_entry = _auth_index.get(str(chat_id_str))
+    if auth_entry is None or not new_telegram_username or auth_entry[1] == new_telegram_username:
+        return False
 
-    state = _load_bot_state(force_reload=True)
-    users = state.get("users", {})
-    user_info = users.get(str(chat_id_str))
+    with _state_lock:
+        user_info = _get_state_cache().get("users", {}).get(str(chat_id_str))
 
-    if not user_info:
-        logger.debug(
-            f"User {chat_id_str} not found in state for username update/check.")
-        return False
+        if not user_info:
+            logger.debug(
+                f"User {chat_id_str} not found in state for username update/check.")
+            return False
 
-    current_username_in_state = user_info.get("username")
-    # Prioritize username
-    new_telegram_username = effective_user.username or effective_user.first_name
+        current_username_in_state = user_info.get("username")
 
-    needs_update = False
-    if new_telegram_username:  # Only update if we have a new name from Telegram
-        if _is_username_placeholder(current_username_in_state, chat_id_str) and current_username_in_state != new_telegram_username:
-            needs_update = True
-        elif not _is_username_placeholder(current_username_in_state, chat_id_str) and current_username_in_state != new_telegram_username:
-            needs_update = True
+        needs_update = False
+        if new_telegram_username:  # Only update if we have a new name from Telegram
+            if _is_username_placeholder(current_username_in_state, chat_id_str) and current_username_in_state != new_telegram_username:
+                needs_update = True
+            elif not _is_username_placeholder(current_username_in_state, chat_id_str) and current_username_in_state != new_telegram_username:
+                needs_update = True
 
-    if needs_update:
-        user_info["username"] = new_telegram_username
-        logger.info(
-            f"Updating username for {chat_id_str} from '{current_username_in_state}' to '{new_telegram_username}'.")
-        # No need to re-assign users to state if user_info is a direct reference from it.
-        # state["users"] = users # This line might be redundant if user_info is a reference
-        return _save_bot_state(state)
-    return False
+        if needs_update:
+            logger.info(
+                f"Updating username for {chat_id_str} from '{current_username_in_state}' to '{new_telegram_username}'.")
+            updated_user_info = copy.deepcopy(user_info)
+            updated_user_info["username"] = new_telegram_username
+            return _upsert_user(chat_id_str, updated_user_info)
+        return False
 
 
 def get_dynamic_launchers() -> list:
 
-    state = _load_bot_state()
-    return state.get("dynamic_launchers", []).copy()
+    return copy.deepcopy(_get_state_cache().get("dynamic_launchers", []))
 
 
 def save_dynamic_launchers(launchers_list: list) -> bool:
@@ -294,24 +409,22 @@ def save_dynamic_launchers(launchers_list: list) -> bool:
     if not isinstance(launchers_list, list):
         logger.error("Attempted to save non-list data as dynamic_launchers.")
         return False
-    current_full_state = _load_bot_state(force_reload=True)
-    current_full_state["dynamic_launchers"] = launchers_list
-    return _save_bot_state(current_full_state)
+    with _state_lock:
+        app_state_store.queue_writes([(
+            ("state_values", "dynamic_launchers"),
+            app_state_store.state_value_upsert_statement("dynamic_launchers", launchers_list))])
+        _get_state_cache()["dynamic_launchers"] = copy.deepcopy(launchers_list)
+        return True
 
 
 def get_static_launchers_migrated_flag() -> bool:
 
-    state = _load_bot_state()
-    return state.get("bot_info", {}).get("static_launchers_migrated", False)
+    return _get_state_cache().get("bot_info", {}).get("static_launchers_migrated", False)
 
 
 def set_static_launchers_migrated_flag(migrated: bool) -> bool:
 
-    current_full_state = _load_bot_state(force_reload=True)
-    if "bot_info" not in current_full_state or not isinstance(current_full_state.get("bot_info"), dict):
-        current_full_state["bot_info"] = DEFAULT_BOT_STATE["bot_info"].copy()
-    current_full_state["bot_info"]["static_launchers_migrated"] = migrated
-    return _save_bot_state(current_full_state)
+    return _update_bot_info(static_launchers_migrated=migrated)
 
 
 def add_pending_access_request(chat_id_str: str, username: str | None) -> bool:
@@ -319,41 +432,42 @@ def add_pending_access_request(chat_id_str: str, username: str | None) -> bool:
     if not chat_id_str:
         return False
 
-    current_full_state = _load_bot_state(force_reload=True)
-
-    if "access_requests_pending" not in current_full_state or not isinstance(current_full_state["access_requests_pending"], dict):
-        current_full_state["access_requests_pending"] = {}
+    with _state_lock:
+        state = _get_state_cache()
+        pending = state.setdefault("access_requests_pending", {})
 
-    users = current_full_state.get("users", {})
-    if str(chat_id_str) in users:
-        logger.info(
-            f"User {chat_id_str} already exists in users list. Not adding to pending access.")
-        return False
-    if str(chat_id_str) in current_full_state["access_requests_pending"]:
-        logger.info(
-            f"User {chat_id_str} already has a pending access request.")
+        if str(chat_id_str) in state.get("users", {}):
+            logger.info(
+                f"User {chat_id_str} already exists in users list. Not adding to pending access.")
+            return False
+        if str(chat_id_str) in pending:
+            logger.info(
+                f"User {chat_id_str} already has a pending access request.")
 
-        current_full_state["access_requests_pending"][str(
-            chat_id_str)]["timestamp"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        if username and current_full_state["access_requests_pending"][str(chat_id_str)].get("username") != username:
-            current_full_state["access_requests_pending"][str(
-                chat_id_str)]["username"] = username
-        return _save_bot_state(current_full_state)
+            request_info = copy.deepcopy(pending[str(chat_id_str)])
+            request_info["timestamp"] = datetime.datetime.now(
+                datetime.timezone.utc).isoformat()
+            if username and request_info.get("username") != username:
+                request_info["username"] = username
+        else:
+            request_info = {
 
-    current_full_state["access_requests_pending"][str(chat_id_str)] = {
+                "username": username or f"User_{chat_id_str}",
+                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
+            }
+            logger.info(
+                f"User {chat_id_str} (Username: {username}) added to pending access requests.")
 
-        "username": username or f"User_{chat_id_str}",
-        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
-    }
-    logger.info(
-        f"User {chat_id_str} (Username: {username}) added to pending access requests.")
-    return _save_bot_state(current_full_state)
+        app_state_store.queue_writes([(
+            ("access_requests_pending", str(chat_id_str)),
+            app_state_store.pending_access_upsert_statement(chat_id_str, request_info))])
+        pending[str(chat_id_str)] = request_info
+        return True
 
 
 def get_pending_access_requests() -> dict:
     """Retrieves the dictionary of pending access requests."""
-    state = _load_bot_state(force_reload=True)
-    return state.get("access_requests_pending", {}).copy()
+    return copy.deepcopy(_get_state_cache().get("access_requests_pending", {}))
 
 
 def remove_pending_access_request(chat_id_str: str) -> bool:
@@ -361,20 +475,67 @@ def remove_pending_access_request(chat_id_str: str) -> bool:
     if not chat_id_str:
         return False
 
-    current_full_state = _load_bot_state(force_reload=True)
-    if "access_requests_pending" in current_full_state and str(chat_id_str) in current_full_state["access_requests_pending"]:
-        del current_full_state["access_requests_pending"][str(chat_id_str)]
-
-        if not current_full_state["access_requests_pending"]:
-            current_full_state.pop("access_requests_pending", None)
-        logger.info(
-            f"User {chat_id_str} removed from pending access requests.")
-        return _save_bot_state(current_full_state)
+    with _state_lock:
+        pending = _get_state_cache().get("access_requests_pending", {})
+        if str(chat_id_str) in pending:
+            app_state_store.queue_writes([(
+                ("access_requests_pending", str(chat_id_str)),
+                app_state_store.pending_access_delete_statement(chat_id_str))])
+            del pending[str(chat_id_str)]
+            logger.info(
+                f"User {chat_id_str} removed from pending access requests.")
+            return True
     logger.info(
         f"User {chat_id_str} not found in pending access requests for removal.")
     return False
 
 
+def set_user_role(chat_id_str: str, role: str) -> bool:
+    """Changes the role of an existing user. Returns False if the user is unknown."""
+    with _state_lock:
+        user_info = _get_state_cache().get("users", {}).get(str(chat_id_str))
+        if not user_info:
+            return False
+        updated_user_info = copy.deepcopy(user_info)
+        updated_user_info["role"] = role
+        return _upsert_user(chat_id_str, updated_user_info)
+
+
+def set_plex_stream_notifications(chat_id_str: str, enabled: bool) -> bool:
+    """Opts a user in or out of Plex stream start/stop messages. Returns False if the user is unknown."""
+    with _state_lock:
+        user_info = _get_state_cache().get("users", {}).get(str(chat_id_str))
+        if not user_info:
+            return False
+        updated_user_info = copy.deepcopy(user_info)
+        updated_user_info["plex_stream_notifications"] = bool(enabled)
+        return _upsert_user(chat_id_str, updated_user_info)
+
+
+def get_plex_stream_notifications(chat_id_str: str) -> bool:
+
+    return bool(_get_state_cache().get("users", {}).get(str(chat_id_str), {}).get("plex_stream_notifications"))
+
+
+def get_plex_stream_notification_chats() -> list:
+    """Chat IDs of admins who opted in to Plex stream start/stop messages."""
+    return [chat_id_str for chat_id_str, user_info in _get_state_cache().get("users", {}).items()
+            if user_info.get("plex_stream_notifications") and user_info.get("role") == app_config_holder.ROLE_ADMIN]
+
+
+def remove_user(chat_id_str: str) -> dict | None:
+    """Removes a user and returns their previous data, or None if not found/failed."""
+    with _state_lock:
+        users = _get_state_cache().get("users", {})
+        user_info = users.get(str(chat_id_str))
+        if not user_info:
+            return None
+        app_state_store.queue_writes([(
+            ("users", str(chat_id_str)), app_state_store.user_delete_statement(chat_id_str))])
+        _update_auth_index(chat_id_str, None)
+        return users.pop(str(chat_id_str))
+
+
 def add_approved_user(chat_id_str: str, username: str, role: str) -> bool:
     """Adds an approved user to the main users list and removes them from pending."""
     if not chat_id_str or not role or role not in [app_config_holder.ROLE_ADMIN, app_config_holder.ROLE_STANDARD_USER]:
@@ -388,23 +549,18 @@ def add_approved_user(chat_id_str: str, username: str, role: str) -> bool:
             f"Attempt to approve primary admin {chat_id_str} with role {role} blocked. Primary admin must be ADMIN.")
         role = app_config_holder.ROLE_ADMIN
 
-    current_full_state = _load_bot_state(force_reload=True)
-    users = current_full_state.get("users", {})
+    with _state_lock:
+        was_pending = str(chat_id_str) in _get_state_cache().get(
+            "access_requests_pending", {})
+        saved = _upsert_user(chat_id_str, {
 
-    users[str(chat_id_str)] = {
-
-        "username": username or f"User_{chat_id_str}",
-        "role": role
-    }
-    current_full_state["users"] = users
-    logger.info(
-        f"User {chat_id_str} (Username: {username}) added/updated in users list with role {role}.")
-
-    if "access_requests_pending" in current_full_state and str(chat_id_str) in current_full_state["access_requests_pending"]:
-        del current_full_state["access_requests_pending"][str(chat_id_str)]
-        if not current_full_state["access_requests_pending"]:
-            current_full_state.pop("access_requests_pending", None)
+            "username": username or f"User_{chat_id_str}",
+            "role": role
+        }, remove_pending=True)
+    if saved:
         logger.info(
-            f"User {chat_id_str} also removed from pending access requests after approval.")
-
-    return _save_bot_state(current_full_state)
+            f"User {chat_id_str} (Username: {username}) added/updated in users list with role {role}.")
+        if was_pending:
+            logger.info(
+                f"User {chat_id_str} also removed from pending access requests after approval.")
+    return saved
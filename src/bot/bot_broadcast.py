@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import time
+
+from telegram.error import RetryAfter
+
+import src.app.app_state_store as app_state_store
+
+logger = logging.getLogger(__name__)
+
+# Telegram allows about 30 messages per second per bot; stay a little under.
+BROADCAST_GLOBAL_RATE_PER_SECOND = 25
+# Telegram allows about one message per second per chat, with short bursts.
+BROADCAST_PER_CHAT_INTERVAL_SECONDS = 1.0
+BROADCAST_MAX_CONCURRENCY = 32
+BROADCAST_MAX_ATTEMPTS = 3
+
+BROADCAST_STATS = {
+    "broadcasts": 0,
+    "steps_sent": 0,
+    "steps_failed": 0,
+    "retry_after_hits": 0,
+    "last_description": None,
+    "last_chats": 0,
+    "last_elapsed_seconds": 0.0,
+}
+
+
+class _SendRateLimiter:
+    """Token bucket shared by all broadcast workers, with a global pause for flood control."""
+
+    def __init__(self, rate_per_second: float):
+        self.rate_per_second = rate_per_second
+        self.tokens = float(rate_per_second)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def pause(self, seconds: float):
+        self.paused_until = max(self.paused_until,
+                                time.monotonic() + seconds)
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(float(self.rate_per_second),
+                                  self.tokens + (now - self.updated_at) * self.rate_per_second)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate_per_second)
+
+
+async def broadcast_to_chats(chat_ids, steps: list, description: str = "broadcast") -> dict:
+    """
+    Runs every step (an async callable taking chat_id_str) for every chat,
+    many chats at once but within the global and per-chat Telegram limits.
+    A step hitting RetryAfter pauses all sends for the requested time and is
+    retried up to BROADCAST_MAX_ATTEMPTS. Message IDs saved by the steps are
+    written to the state store in one batch when the broadcast ends.
+
+    Returns {chat_id_str: [result of each step, None if it failed]}.
+    """
+    chat_id_list = list(dict.fromkeys(str(chat_id) for chat_id in chat_ids))
+    results = {chat_id: [None] * len(steps) for chat_id in chat_id_list}
+    if not chat_id_list or not steps:
+        return results
+
+    limiter = _SendRateLimiter(BROADCAST_GLOBAL_RATE_PER_SECOND)
+    work_queue: asyncio.Queue = asyncio.Queue()
+    for chat_id in chat_id_list:
+        work_queue.put_nowait((chat_id, 0, 1))
+    last_send_at: dict[str, float] = {}
+    started_at = time.monotonic()
+
+    async def worker():
+        while True:
+            chat_id, step_index, attempt = await work_queue.get()
+            try:
+                wait_for_chat = last_send_at.get(chat_id, 0.0) + \
+                    BROADCAST_PER_CHAT_INTERVAL_SECONDS - time.monotonic()
+                if wait_for_chat > 0:
+                    await asyncio.sleep(wait_for_chat)
+                await limiter.acquire()
+                last_send_at[chat_id] = time.monotonic()
+                try:
+                    results[chat_id][step_index] = await steps[step_index](chat_id)
+                    BROADCAST_STATS["steps_sent"] += 1
+                except RetryAfter as e_retry:
+                    BROADCAST_STATS["retry_after_hits"] += 1
+                    retry_after = getattr(e_retry, "retry_after", 1)
+                    retry_seconds = retry_after.total_seconds() if hasattr(
+                        retry_after, "total_seconds") else float(retry_after)
+                    limiter.pause(retry_seconds)
+                    if attempt < BROADCAST_MAX_ATTEMPTS:
+                        logger.warning(
+                            f"Broadcast '{description}': rate limited at chat {chat_id}, pausing {retry_seconds}s and retrying (attempt {attempt}).")
+                        work_queue.put_nowait((chat_id, step_index, attempt + 1))
+                        continue
+                    logger.error(
+                        f"Broadcast '{description}': giving up on chat {chat_id} after {attempt} rate-limited attempts.")
+                    BROADCAST_STATS["steps_failed"] += 1
+                    continue
+                except Exception as e:
+                    BROADCAST_STATS["steps_failed"] += 1
+                    logger.error(
+                        f"Broadcast '{description}': step {step_index} failed for chat {chat_id}: {e}", exc_info=True)
+                if step_index + 1 < len(steps):
+                    work_queue.put_nowait((chat_id, step_index + 1, 1))
+            finally:
+                work_queue.task_done()
+
+    worker_count = min(BROADCAST_MAX_CONCURRENCY, len(chat_id_list))
+    with app_state_store.hold_write_behind():
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        try:
+            await work_queue.join()
+        finally:
+            for worker_task in workers:
+                worker_task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    elapsed = round(time.monotonic() - started_at, 2)
+    BROADCAST_STATS["broadcasts"] += 1
+    BROADCAST_STATS["last_description"] = description
+    BROADCAST_STATS["last_chats"] = len(chat_id_list)
+    BROADCAST_STATS["last_elapsed_seconds"] = elapsed
+    logger.info(
+        f"Broadcast '{description}' to {len(chat_id_list)} chats ({len(steps)} steps each) finished in {elapsed}s.")
+    return results
+
+
+def get_broadcast_stats() -> dict:
+    return dict(BROADCAST_STATS)
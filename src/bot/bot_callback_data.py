@@ -53,6 +53,7 @@ class CallbackData(str, Enum):
     CMD_SONARR_WANTED_REFRESH = "cmd_sonarr_wanted_refresh"
     CMD_SONARR_WANTED_PAGE_PREFIX = "sonarr_wanted_page_"
     CMD_SONARR_WANTED_SEARCH_EPISODE_PREFIX = "sonarr_wanted_search_ep_"
+    CMD_SONARR_WANTED_SEARCH_PAGE = "cmd_sonarr_wanted_search_page"
     CMD_SONARR_SCAN_FILES = "cmd_sonarr_scan_files"
     CMD_SONARR_UPDATE_METADATA = "cmd_sonarr_update_metadata"
     CMD_SONARR_RENAME_FILES = "cmd_sonarr_rename_files"
@@ -62,6 +63,7 @@ class CallbackData(str, Enum):
     CMD_PLEX_INITIATE_SEARCH = "cmd_plex_initiate_search"
     CMD_PLEX_LIBRARY_SERVER_TOOLS = "cmd_plex_library_server_tools"
     CMD_PLEX_STOP_STREAM_PREFIX = "cmd_plex_stop_stream_"
+    CMD_PLEX_TOGGLE_STREAM_NOTIFICATIONS = "cmd_plex_toggle_stream_notifs"
     CMD_PLEX_RECENTLY_ADDED_SHOW_ITEMS_FOR_LIB_PREFIX = "cmd_plex_recent_items_lib_"
     CMD_PLEX_RECENTLY_ADDED_PAGE_PREFIX = "plex_ra_page_"
     CMD_PLEX_SEARCH_SHOW_DETAILS_PREFIX = "cmd_plex_search_details_"
@@ -1,15 +1,18 @@
 import logging
 from telegram import Update, Bot, BotCommand, BotCommandScopeChat, BotCommandScopeDefault
 from telegram.ext import ContextTypes, Application, CallbackContext, JobQueue
-from telegram.error import BadRequest, RetryAfter, TimedOut, NetworkError
+from telegram.error import BadRequest, RetryAfter
 
 import src.app.app_config_holder as app_config_holder
 from .bot_message_persistence import (
     load_menu_message_id, save_menu_message_id, delete_menu_id_file,
     load_universal_status_message_id, save_universal_status_message_id, delete_universal_status_message_id_file
 )
-from src.handlers.menu_handler_main_builder import build_main_menu_content
+from src.handlers.menu_handler_main_builder import get_main_menu_content
 import src.app.user_manager as user_manager
+from .bot_outbound_queue import queue_message_edit, cancel_message_edit, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+from .bot_broadcast import broadcast_to_chats
+from .bot_menu_fingerprints import get_menu_fingerprint, set_menu_fingerprint, forget_menu_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +23,13 @@ async def send_or_edit_universal_status_message(
     text: str,
     parse_mode="MarkdownV2",
     reply_markup=None,
-    force_send_new=False
+    force_send_new=False,
+    raise_on_retry_after=False,
+    priority=PRIORITY_INTERACTIVE
 ) -> int | None:
+    # raise_on_retry_after lets a caller that schedules many sends (the
+    # broadcast engine) see flood-control errors instead of a plain failure.
+    # priority orders queued edits: background refreshes yield to user actions.
     if isinstance(bot_or_app, Application):
         bot = bot_or_app.bot
     else:
@@ -35,6 +43,7 @@ async def send_or_edit_universal_status_message(
         if existing_message_id:
             logger.info(
                 f"UniversalStatus: Force sending new or no existing ID for chat {chat_id}. Deleting old uni_msg {existing_message_id} if it exists.")
+            cancel_message_edit(chat_id, existing_message_id)
             try:
                 await bot.delete_message(chat_id=chat_id, message_id=existing_message_id)
             except Exception:
@@ -53,6 +62,11 @@ async def send_or_edit_universal_status_message(
             logger.info(
                 f"UniversalStatus: Sent new uni_msg {new_id} for chat {chat_id}.")
             return new_id
+        except RetryAfter as e_retry:
+            if raise_on_retry_after:
+                raise
+            logger.error(
+                f"UniversalStatus: Rate limited sending new uni_msg to chat {chat_id}. Retry after {e_retry.retry_after}s.")
         except BadRequest as e:
             logger.error(
                 f"UniversalStatus: BadRequest sending new uni_msg to chat {chat_id} (text: '{text[:50]}...'): {e}", exc_info=True)
@@ -62,40 +76,35 @@ async def send_or_edit_universal_status_message(
         return None
 
     else:
-        try:
-            await bot.edit_message_text(
-                chat_id=chat_id, message_id=existing_message_id, text=text,
-                parse_mode=parse_mode, reply_markup=reply_markup, disable_web_page_preview=True
-            )
-            logger.info(
-                f"UniversalStatus: Edited uni_msg {existing_message_id} for chat {chat_id}.")
-            return existing_message_id
-        except BadRequest as e:
-            err_lower = str(e).lower()
-            if "message is not modified" in err_lower:
-                logger.debug(
-                    f"UniversalStatus: uni_msg {existing_message_id} for chat {chat_id} not modified.")
-                return existing_message_id
-            logger.warning(
-                f"UniversalStatus: Edit failed for uni_msg {existing_message_id} for chat {chat_id} ('{err_lower}'). Deleting ID and sending new.")
-            delete_universal_status_message_id_file(str(chat_id))
-            return await send_or_edit_universal_status_message(bot, chat_id, text, parse_mode, reply_markup, force_send_new=True)
-        except (NetworkError, TimedOut, RetryAfter) as e:
+        async def resend_after_failed_edit(edit_error: Exception):
+            # Only replace the message if no newer status message took its place meanwhile.
+            if load_universal_status_message_id(str(chat_id)) != existing_message_id:
+                return
             logger.warning(
-                f"UniversalStatus: Network/Timeout error editing uni_msg {existing_message_id} for chat {chat_id}: {e}. Preserving ID.")
-            return existing_message_id
-        except Exception as e:
-            logger.error(
-                f"UniversalStatus: Unexpected error editing uni_msg {existing_message_id} for chat {chat_id}: {e}", exc_info=True)
+                f"UniversalStatus: Edit failed for uni_msg {existing_message_id} for chat {chat_id} ('{edit_error}'). Deleting ID and sending new.")
             delete_universal_status_message_id_file(str(chat_id))
-            return await send_or_edit_universal_status_message(bot, chat_id, text, parse_mode, reply_markup, force_send_new=True)
+            await send_or_edit_universal_status_message(bot, chat_id, text, parse_mode, reply_markup,
+                                                        force_send_new=True, priority=priority)
+
+        # Edits go through the outbound queue, which merges bursts of edits
+        # to this message and only sends the newest text.
+        queue_message_edit(
+            bot, chat_id, existing_message_id,
+            {"text": text, "parse_mode": parse_mode,
+                "reply_markup": reply_markup, "disable_web_page_preview": True},
+            priority=priority, on_failure=resend_after_failed_edit)
+        logger.debug(
+            f"UniversalStatus: Queued edit of uni_msg {existing_message_id} for chat {chat_id}.")
+        return existing_message_id
     return None
 
 
 async def show_or_edit_main_menu(
     chat_id_str: str,
     context_or_app: Application | CallbackContext,
-    force_send_new=False
+    force_send_new=False,
+    raise_on_retry_after=False,
+    priority=PRIORITY_INTERACTIVE
 ) -> int | None:
     if not chat_id_str or not chat_id_str.lstrip('-').isdigit():
         logger.error(
@@ -119,7 +128,7 @@ async def show_or_edit_main_menu(
 
     user_role = app_config_holder.get_user_role(str(chat_id))
     version = app_config_holder.get_project_version()
-    dynamic_menu_text, reply_markup = build_main_menu_content(
+    dynamic_menu_text, reply_markup, menu_fingerprint = get_main_menu_content(
         version, user_role, str(chat_id), bot_data_obj)
 
     menu_msg_id_persisted = load_menu_message_id(str(chat_id))
@@ -130,13 +139,14 @@ async def show_or_edit_main_menu(
         if menu_msg_id_persisted:
             logger.info(
                 f"MainMenu: Force sending new or no ID for chat {chat_id}. Deleting old menu_msg {menu_msg_id_persisted} if it exists.")
+            cancel_message_edit(chat_id, menu_msg_id_persisted)
             try:
                 await bot_obj.delete_message(chat_id=chat_id, message_id=menu_msg_id_persisted)
             except Exception:
                 pass
             delete_menu_id_file(str(chat_id))
-            bot_data_obj.pop(
-                f"menu_message_content_{chat_id}_{menu_msg_id_persisted}", None)
+            forget_menu_fingerprint(
+                bot_data_obj, chat_id, menu_msg_id_persisted)
 
         logger.info(
             f"MainMenu: Sending new main menu to chat {chat_id} (Role: {user_role}). Text: '{dynamic_menu_text[:100]}...'")
@@ -147,11 +157,16 @@ async def show_or_edit_main_menu(
             )
             new_id = sent_message.message_id
             save_menu_message_id(new_id, str(chat_id))
-            bot_data_obj[f"menu_message_content_{chat_id}_{new_id}"] = (
-                dynamic_menu_text, reply_markup.to_json())
+            set_menu_fingerprint(bot_data_obj, chat_id,
+                                 new_id, menu_fingerprint)
             logger.info(
                 f"MainMenu: Sent new menu_msg {new_id} to chat {chat_id}.")
             return new_id
+        except RetryAfter as e_retry:
+            if raise_on_retry_after:
+                raise
+            logger.error(
+                f"MainMenu: Rate limited sending new menu_msg to chat {chat_id}. Retry after {e_retry.retry_after}s.")
         except BadRequest as e:
             logger.error(
                 f"MainMenu: BadRequest sending new menu_msg to chat {chat_id} (text: '{dynamic_menu_text[:100]}...'): {e}", exc_info=True)
@@ -161,58 +176,33 @@ async def show_or_edit_main_menu(
         return None
 
     else:
-        try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_msg_id_persisted}"
-            old_content_tuple_json = bot_data_obj.get(current_content_key)
-            new_content_tuple_json = (
-                dynamic_menu_text, reply_markup.to_json())
-
-            if old_content_tuple_json != new_content_tuple_json:
-                logger.info(
-                    f"MainMenu: Editing menu_msg {menu_msg_id_persisted} for chat {chat_id}. Text: '{dynamic_menu_text[:100]}...'")
-                await bot_obj.edit_message_text(
-                    chat_id=chat_id, message_id=menu_msg_id_persisted,
-                    text=dynamic_menu_text, reply_markup=reply_markup, parse_mode="MarkdownV2"
-                )
-                bot_data_obj[current_content_key] = new_content_tuple_json
-                logger.info(
-                    f"MainMenu: Edited menu_msg {menu_msg_id_persisted} for chat {chat_id}.")
-            else:
-                logger.debug(
-                    f"MainMenu: menu_msg {menu_msg_id_persisted} for chat {chat_id} content not modified, edit skipped.")
-
-            if load_menu_message_id(str(chat_id)) != menu_msg_id_persisted:
-                save_menu_message_id(menu_msg_id_persisted, str(chat_id))
-            return menu_msg_id_persisted
-        except BadRequest as e:
-            err_lower = str(e).lower()
-            if "message is not modified" in err_lower:
-                logger.debug(
-                    f"MainMenu: menu_msg {menu_msg_id_persisted} for chat {chat_id} not modified (API).")
+        if get_menu_fingerprint(bot_data_obj, chat_id, menu_msg_id_persisted) != menu_fingerprint:
+            async def resend_after_failed_edit(edit_error: Exception):
+                forget_menu_fingerprint(
+                    bot_data_obj, chat_id, menu_msg_id_persisted)
                 if load_menu_message_id(str(chat_id)) != menu_msg_id_persisted:
-                    save_menu_message_id(menu_msg_id_persisted, str(chat_id))
-                return menu_msg_id_persisted
-            logger.warning(
-                f"MainMenu: Edit failed for menu_msg {menu_msg_id_persisted} for chat {chat_id} ('{err_lower}'). Text was '{dynamic_menu_text[:100]}...'. Deleting ID and sending new.")
-            delete_menu_id_file(str(chat_id))
-            if menu_msg_id_persisted:
-                bot_data_obj.pop(
-                    f"menu_message_content_{chat_id}_{menu_msg_id_persisted}", None)
-            return await show_or_edit_main_menu(chat_id_str, context_or_app, force_send_new=True)
-
-        except RetryAfter as e_retry:
-            logger.warning(
-                f"MainMenu: Rate limited editing menu_msg {menu_msg_id_persisted} for chat {chat_id}. Retry after {e_retry.retry_after}s. Preserving ID.")
+                    return
+                logger.warning(
+                    f"MainMenu: Edit failed for menu_msg {menu_msg_id_persisted} for chat {chat_id} ('{edit_error}'). Deleting ID and sending new.")
+                delete_menu_id_file(str(chat_id))
+                await show_or_edit_main_menu(chat_id_str, context_or_app, force_send_new=True, priority=priority)
 
-            return menu_msg_id_persisted
-        except Exception as e:
-            logger.error(
-                f"MainMenu: Unexpected error editing menu_msg {menu_msg_id_persisted} for chat {chat_id}: {e}. Text was '{dynamic_menu_text[:100]}...'", exc_info=True)
-            delete_menu_id_file(str(chat_id))
-            if menu_msg_id_persisted:
-                bot_data_obj.pop(
-                    f"menu_message_content_{chat_id}_{menu_msg_id_persisted}", None)
-            return await show_or_edit_main_menu(chat_id_str, context_or_app, force_send_new=True)
+            logger.info(
+                f"MainMenu: Queueing edit of menu_msg {menu_msg_id_persisted} for chat {chat_id}. Text: '{dynamic_menu_text[:100]}...'")
+            queue_message_edit(
+                bot_obj, chat_id, menu_msg_id_persisted,
+                {"text": dynamic_menu_text, "reply_markup": reply_markup,
+                    "parse_mode": "MarkdownV2"},
+                priority=priority, on_failure=resend_after_failed_edit,
+                on_dropped=lambda: forget_menu_fingerprint(bot_data_obj, chat_id, menu_msg_id_persisted))
+            # Recorded now so identical refreshes before the edit lands are
+            # skipped; forgotten again if the edit is dropped or fails.
+            set_menu_fingerprint(bot_data_obj, chat_id,
+                                 menu_msg_id_persisted, menu_fingerprint)
+        else:
+            logger.debug(
+                f"MainMenu: menu_msg {menu_msg_id_persisted} for chat {chat_id} content not modified, edit skipped.")
+        return menu_msg_id_persisted
     return None
 
 
@@ -227,6 +217,7 @@ async def set_bot_commands(application: Application):
         BotCommand("start", "Show the main menu (Admin)"),
         BotCommand("home", "Show the main menu (Admin)"),
         BotCommand("status", "Show current bot status message"),
+        BotCommand("perf", "Show handler and backend latencies"),
         BotCommand("settings", "Open bot configuration panel"),
     ]
 
@@ -269,31 +260,29 @@ async def refresh_main_menus_for_all_admins(context_or_app: Application | Callba
     if primary_admin_id_str:
         admin_chat_ids_to_refresh.add(primary_admin_id_str)
 
-    all_users = user_manager.get_all_users_from_state()
-    for user_id_str, user_data in all_users.items():
-        if user_data.get("role") == app_config_holder.ROLE_ADMIN:
-            admin_chat_ids_to_refresh.add(user_id_str)
+    admin_chat_ids_to_refresh.update(user_manager.get_admin_chat_ids())
 
     if not admin_chat_ids_to_refresh:
         logger.info("No admins found to refresh menus for.")
         return
 
-    for admin_id_str in admin_chat_ids_to_refresh:
-        try:
+    app_instance = None
+    if isinstance(context_or_app, Application):
+        app_instance = context_or_app
+    elif isinstance(context_or_app, CallbackContext):
+        app_instance = context_or_app.application
+    if not app_instance:
+        logger.error(
+            "Could not get Application instance to refresh admin main menus.")
+        return
 
-            app_instance = None
-            if isinstance(context_or_app, Application):
-                app_instance = context_or_app
-            elif isinstance(context_or_app, CallbackContext):
-                app_instance = context_or_app.application
+    async def refresh_admin_menu(admin_id_str: str):
+        return await show_or_edit_main_menu(admin_id_str, app_instance, force_send_new=False,
+                                            raise_on_retry_after=True, priority=PRIORITY_BACKGROUND)
 
-            if app_instance:
-                await show_or_edit_main_menu(admin_id_str, app_instance, force_send_new=False)
-                logger.info(
-                    f"Requested main menu refresh for admin: {admin_id_str}")
-            else:
-                logger.error(
-                    f"Could not get Application instance to refresh menu for admin {admin_id_str}")
-        except Exception as e:
+    results = await broadcast_to_chats(
+        admin_chat_ids_to_refresh, [refresh_admin_menu], description="admin menu refresh")
+    for admin_id_str, (menu_msg_id,) in results.items():
+        if not menu_msg_id:
             logger.error(
-                f"Failed to refresh main menu for admin {admin_id_str}: {e}", exc_info=True)
+                f"Failed to refresh main menu for admin {admin_id_str}.")
@@ -0,0 +1,86 @@
+import hashlib
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# bot_data key holding chat_id_str -> OrderedDict(message_id -> fingerprint).
+MENU_FINGERPRINTS_BOT_DATA_KEY = "menu_fingerprints"
+# Chats are evicted least recently used first beyond this many.
+MENU_FINGERPRINT_MAX_CHATS = 2000
+# A chat normally has one menu message; a few more cover messages being replaced.
+MENU_FINGERPRINTS_PER_CHAT = 4
+
+LEGACY_MENU_CONTENT_KEY_PREFIX = "menu_message_content_"
+
+
+def menu_content_fingerprint(text: str, reply_markup=None) -> str:
+    """Fixed-size fingerprint of what a menu message shows (text plus keyboard)."""
+    markup_json = reply_markup.to_json() if reply_markup is not None else ""
+    return hashlib.blake2b(f"{text}\n{markup_json}".encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _get_store(bot_data: dict) -> OrderedDict:
+    store = bot_data.get(MENU_FINGERPRINTS_BOT_DATA_KEY)
+    if not isinstance(store, OrderedDict):
+        store = OrderedDict(store or {})
+        bot_data[MENU_FINGERPRINTS_BOT_DATA_KEY] = store
+    return store
+
+
+def get_menu_fingerprint(bot_data: dict, chat_id, message_id) -> str | None:
+    if message_id is None:
+        return None
+    store = _get_store(bot_data)
+    chat_key = str(chat_id)
+    chat_fingerprints = store.get(chat_key)
+    if not chat_fingerprints:
+        return None
+    store.move_to_end(chat_key)
+    return chat_fingerprints.get(int(message_id))
+
+
+def set_menu_fingerprint(bot_data: dict, chat_id, message_id, fingerprint: str):
+    if message_id is None:
+        return
+    store = _get_store(bot_data)
+    chat_key = str(chat_id)
+    chat_fingerprints = store.pop(chat_key, None) or OrderedDict()
+    chat_fingerprints.pop(int(message_id), None)
+    chat_fingerprints[int(message_id)] = fingerprint
+    while len(chat_fingerprints) > MENU_FINGERPRINTS_PER_CHAT:
+        chat_fingerprints.popitem(last=False)
+    store[chat_key] = chat_fingerprints
+    while len(store) > MENU_FINGERPRINT_MAX_CHATS:
+        store.popitem(last=False)
+
+
+def forget_menu_fingerprint(bot_data: dict, chat_id, message_id=None):
+    """Drops one message's fingerprint, or all of a chat's when message_id is None."""
+    store = _get_store(bot_data)
+    chat_key = str(chat_id)
+    if message_id is None:
+        store.pop(chat_key, None)
+        return
+    chat_fingerprints = store.get(chat_key)
+    if chat_fingerprints:
+        chat_fingerprints.pop(int(message_id), None)
+        if not chat_fingerprints:
+            store.pop(chat_key, None)
+
+
+def drop_legacy_menu_content(bot_data: dict) -> int:
+    """Removes the old menu_message_content_* (text, markup_json) entries from bot_data."""
+    legacy_keys = [key for key in list(bot_data)
+                   if isinstance(key, str) and key.startswith(LEGACY_MENU_CONTENT_KEY_PREFIX)]
+    for key in legacy_keys:
+        bot_data.pop(key, None)
+    if legacy_keys:
+        logger.info(
+            f"Dropped {len(legacy_keys)} legacy menu content entries from bot_data.")
+    return len(legacy_keys)
+
+
+def get_menu_fingerprint_stats(bot_data: dict) -> dict:
+    store = _get_store(bot_data)
+    return {"chats": len(store), "fingerprints": sum(len(chat_fingerprints) for chat_fingerprints in store.values())}
@@ -10,7 +10,7 @@ MESSAGE_TYPE_UNIVERSAL_STATUS = "universal_status_id"
 
 
 def load_menu_message_id(chat_id_str: str) -> int | None:
-    """Loads the persisted main menu message ID for a given chat from bot_state.json."""
+    """Loads the persisted main menu message ID for a given chat from the bot state store."""
     if not chat_id_str:
         logger.error("load_menu_message_id: chat_id_str is empty.")
         return None
@@ -27,7 +27,7 @@ def load_menu_message_id(chat_id_str: str) -> int | None:
 
 
 def save_menu_message_id(message_id: int, chat_id_str: str):
-    """Saves the main menu message ID for a given chat to bot_state.json."""
+    """Saves the main menu message ID for a given chat to the bot state store."""
     if not chat_id_str:
         logger.error("save_menu_message_id: chat_id_str is empty.")
         return
@@ -45,7 +45,7 @@ def save_menu_message_id(message_id: int, chat_id_str: str):
 
 
 def delete_menu_id_file(chat_id_str: str):
-    """Clears the persisted main menu message ID for a given chat from bot_state.json."""
+    """Clears the persisted main menu message ID for a given chat from the bot state store."""
     if not chat_id_str:
         logger.error(
             "delete_menu_id_file (clear_menu_id_in_state): chat_id_str is empty.")
@@ -60,7 +60,7 @@ def delete_menu_id_file(chat_id_str: str):
 
 
 def load_universal_status_message_id(chat_id_str: str) -> int | None:
-    """Loads the persisted universal status message ID for a given chat from bot_state.json."""
+    """Loads the persisted universal status message ID for a given chat from the bot state store."""
     if not chat_id_str:
         logger.error("load_universal_status_message_id: chat_id_str is empty.")
         return None
@@ -77,7 +77,7 @@ def load_universal_status_message_id(chat_id_str: str) -> int | None:
 
 
 def save_universal_status_message_id(message_id: int, chat_id_str: str):
-    """Saves the universal status message ID for a given chat to bot_state.json."""
+    """Saves the universal status message ID for a given chat to the bot state store."""
     if not chat_id_str:
         logger.error("save_universal_status_message_id: chat_id_str is empty.")
         return
@@ -95,7 +95,7 @@ def save_universal_status_message_id(message_id: int, chat_id_str: str):
 
 
 def delete_universal_status_message_id_file(chat_id_str: str):
-    """Clears the persisted universal status message ID for a given chat from bot_state.json."""
+    """Clears the persisted universal status message ID for a given chat from the bot state store."""
     if not chat_id_str:
         logger.error(
             "delete_universal_status_message_id_file (clear_universal_status_id_in_state): chat_id_str is empty.")
@@ -112,7 +112,7 @@ def delete_universal_status_message_id_file(chat_id_str: str):
 def load_message_id_from_file(filename_key: str) -> int | None:
     logger.warning(
         f"DEPRECATED: load_message_id_from_file called for '{filename_key}'. "
-        "Message IDs are now managed in bot_state.json via user_manager. Use chat_id specific functions."
+        "Message IDs are now managed in the bot state store via user_manager. Use chat_id specific functions."
     )
     return None
 
@@ -120,7 +120,7 @@ def load_message_id_from_file(filename_key: str) -> int | None:
 def save_message_id_to_file(message_id: int, filename_key: str):
     logger.warning(
         f"DEPRECATED: save_message_id_to_file called for '{filename_key}'. "
-        "Message IDs are now managed in bot_state.json via user_manager. Use chat_id specific functions."
+        "Message IDs are now managed in the bot state store via user_manager. Use chat_id specific functions."
     )
     return
 
@@ -128,6 +128,6 @@ def save_message_id_to_file(message_id: int, filename_key: str):
 def delete_message_id_file(filename_key: str):
     logger.warning(
         f"DEPRECATED: delete_message_id_file (singular) called for '{filename_key}'. "
-        "Message IDs are now managed in bot_state.json. Use chat_id specific functions like delete_menu_id_file."
+        "Message IDs are now managed in the bot state store. Use chat_id specific functions like delete_menu_id_file."
     )
     return
@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import time
+
+from telegram.error import BadRequest, RetryAfter, TimedOut, NetworkError
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# How long an edit waits for later edits to the same message before it is
+# sent. Only the newest content is sent when the window closes.
+OUTBOUND_EDIT_WINDOW_SECONDS = {
+    PRIORITY_INTERACTIVE: 0.15,
+    PRIORITY_BACKGROUND: 1.0,
+}
+OUTBOUND_MAX_CONCURRENT_SENDS = 8
+OUTBOUND_FLUSH_TIMEOUT_SECONDS = 5.0
+
+# (chat_id, message_id) -> queued edit; see queue_message_edit for the fields.
+_pending_edits: dict[tuple, dict] = {}
+_in_flight_keys: set = set()
+_wakeup: asyncio.Event | None = None
+_dispatcher_task: asyncio.Task | None = None
+
+OUTBOUND_STATS = {
+    "queued": 0,
+    "merged": 0,
+    "sent": 0,
+    "not_modified": 0,
+    "cancelled": 0,
+    "retry_after": 0,
+    "failed": 0,
+}
+
+
+def _retry_after_seconds(e: RetryAfter) -> float:
+    retry_after = getattr(e, "retry_after", 1)
+    return retry_after.total_seconds() if hasattr(retry_after, "total_seconds") else float(retry_after)
+
+
+def _ensure_dispatcher():
+    global _wakeup, _dispatcher_task
+    loop = asyncio.get_running_loop()
+    if _dispatcher_task is not None and not _dispatcher_task.done() and _dispatcher_task.get_loop() is loop:
+        return
+    _wakeup = asyncio.Event()
+    _dispatcher_task = loop.create_task(_dispatch_loop())
+
+
+def queue_message_edit(bot, chat_id: int, message_id: int, edit_kwargs: dict,
+                       priority: int = PRIORITY_INTERACTIVE, on_failure=None, on_dropped=None):
+    """
+    Queues bot.edit_message_text(chat_id, message_id, **edit_kwargs). A later
+    edit of the same message before this one is sent replaces its content and
+    keeps the earlier send time, so a burst of edits costs one API call.
+    on_failure is an async callable taking the exception, awaited when the
+    edit fails for a reason other than "not modified" or a network error.
+    on_dropped is a plain callable run when the edit is never sent: it was
+    cancelled, or dropped after a network error. Callers that record what the
+    message shows at queue time use it to forget that record.
+    Must be called from the bot's event loop.
+    """
+    key = (int(chat_id), int(message_id))
+    now = time.monotonic()
+    OUTBOUND_STATS["queued"] += 1
+    existing = _pending_edits.get(key)
+    if existing is not None:
+        OUTBOUND_STATS["merged"] += 1
+        existing["bot"] = bot
+        existing["edit_kwargs"] = edit_kwargs
+        existing["on_failure"] = on_failure
+        existing["on_dropped"] = on_dropped
+        if priority < existing["priority"]:
+            existing["priority"] = priority
+            existing["due_at"] = min(
+                existing["due_at"], now + OUTBOUND_EDIT_WINDOW_SECONDS[priority])
+        existing["merged_count"] += 1
+    else:
+        _pending_edits[key] = {
+            "bot": bot,
+            "edit_kwargs": edit_kwargs,
+            "priority": priority,
+            "due_at": now + OUTBOUND_EDIT_WINDOW_SECONDS[priority],
+            "on_failure": on_failure,
+            "on_dropped": on_dropped,
+            "merged_count": 0,
+        }
+    _ensure_dispatcher()
+    _wakeup.set()
+
+
+def cancel_message_edit(chat_id: int, message_id: int | None):
+    """Drops a queued edit, e.g. because the message is about to be deleted and replaced."""
+    if message_id is None:
+        return
+    item = _pending_edits.pop((int(chat_id), int(message_id)), None)
+    if item is not None:
+        OUTBOUND_STATS["cancelled"] += 1
+        _run_on_dropped(item, chat_id, message_id)
+
+
+def _run_on_dropped(item: dict, chat_id: int, message_id: int):
+    if item["on_dropped"] is None:
+        return
+    try:
+        item["on_dropped"]()
+    except Exception as e:
+        logger.error(
+            f"Outbound: drop handler for message {message_id} in chat {chat_id} raised: {e}", exc_info=True)
+
+
+async def _dispatch_loop():
+    in_flight_limit = asyncio.Semaphore(OUTBOUND_MAX_CONCURRENT_SENDS)
+    while True:
+        now = time.monotonic()
+        ready_keys = sorted(
+            (key for key, item in _pending_edits.items()
+             if item["due_at"] <= now and key not in _in_flight_keys),
+            key=lambda key: (_pending_edits[key]["priority"], _pending_edits[key]["due_at"]))
+        if not ready_keys:
+            waiting = [item["due_at"] for key, item in _pending_edits.items()
+                       if key not in _in_flight_keys]
+            _wakeup.clear()
+            try:
+                await asyncio.wait_for(_wakeup.wait(), timeout=(min(waiting) - now) if waiting else None)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        for key in ready_keys:
+            await in_flight_limit.acquire()
+            item = _pending_edits.pop(key, None)
+            if item is None:
+                in_flight_limit.release()
+                continue
+            _in_flight_keys.add(key)
+            asyncio.get_running_loop().create_task(
+                _send_edit(key, item, in_flight_limit))
+
+
+async def _send_edit(key: tuple, item: dict, in_flight_limit: asyncio.Semaphore):
+    chat_id, message_id = key
+    failure = None
+    try:
+        await item["bot"].edit_message_text(chat_id=chat_id, message_id=message_id, **item["edit_kwargs"])
+        OUTBOUND_STATS["sent"] += 1
+        logger.debug(
+            f"Outbound: edited message {message_id} in chat {chat_id} ({item['merged_count']} edits merged).")
+    except RetryAfter as e_retry:
+        OUTBOUND_STATS["retry_after"] += 1
+        retry_seconds = _retry_after_seconds(e_retry)
+        logger.warning(
+            f"Outbound: rate limited editing message {message_id} in chat {chat_id}. Retrying in {retry_seconds}s.")
+        # A newer edit queued meanwhile supersedes this one; it just has to wait too.
+        requeued = _pending_edits.setdefault(key, item)
+        requeued["due_at"] = max(
+            requeued["due_at"], time.monotonic() + retry_seconds)
+    except BadRequest as e:
+        if "message is not modified" in str(e).lower():
+            OUTBOUND_STATS["not_modified"] += 1
+        else:
+            failure = e
+    except (NetworkError, TimedOut) as e:
+        OUTBOUND_STATS["failed"] += 1
+        logger.warning(
+            f"Outbound: network error editing message {message_id} in chat {chat_id}: {e}. Edit dropped.")
+        _run_on_dropped(item, chat_id, message_id)
+    except Exception as e:
+        failure = e
+    finally:
+        _in_flight_keys.discard(key)
+        in_flight_limit.release()
+        _wakeup.set()
+
+    if failure is not None:
+        OUTBOUND_STATS["failed"] += 1
+        logger.warning(
+            f"Outbound: edit of message {message_id} in chat {chat_id} failed: {failure}")
+        if item["on_failure"] is not None:
+            try:
+                await item["on_failure"](failure)
+            except Exception as e_fallback:
+                logger.error(
+                    f"Outbound: failure handler for message {message_id} in chat {chat_id} raised: {e_fallback}", exc_info=True)
+
+
+async def flush_outbound_edits(timeout: float = OUTBOUND_FLUSH_TIMEOUT_SECONDS):
+    """Sends every queued edit now and waits (up to timeout) for the queue to drain."""
+    if not _pending_edits and not _in_flight_keys:
+        return
+    for item in _pending_edits.values():
+        item["due_at"] = 0.0
+    _ensure_dispatcher()
+    _wakeup.set()
+    deadline = time.monotonic() + timeout
+    while (_pending_edits or _in_flight_keys) and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+
+
+def get_outbound_queue_stats() -> dict:
+    stats = dict(OUTBOUND_STATS)
+    stats["queue_depth"] = len(_pending_edits)
+    stats["in_flight"] = len(_in_flight_keys)
+    stats["queued_interactive"] = sum(1 for item in _pending_edits.values()
+                                      if item["priority"] == PRIORITY_INTERACTIVE)
+    stats["queued_background"] = stats["queue_depth"] - \
+        stats["queued_interactive"]
+    return stats
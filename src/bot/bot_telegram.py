@@ -18,6 +18,8 @@ from src.handlers.menu_handler_root import (
 import src.app.user_manager as user_manager
 import src.app.app_config_holder as app_config_holder
 from src.app.app_lifecycle import trigger_config_ui_from_bot
+from src.app.app_perf_metrics import instrument_handler_callbacks
+from src.services.bot_lookup_cache import format_lookup_cache_stats
 from src.bot.bot_callback_data import CallbackData
 
 from src.handlers.radarr.menu_handler_radarr_controls import display_radarr_controls_menu
@@ -42,7 +44,8 @@ from src.handlers.plex.menu_handler_plex_main import (
     plex_scan_library_execute_callback,
     plex_refresh_library_metadata_select_callback,
     plex_refresh_library_metadata_execute_callback,
-    plex_stop_stream_callback
+    plex_stop_stream_callback,
+    plex_toggle_stream_notifications_callback
 )
 from src.handlers.plex.menu_handler_plex_recently_added import (
     plex_recently_added_select_library_callback,
@@ -92,6 +95,7 @@ from src.handlers.admin_requests.menu_handler_admin_requests import (
 )
 
 from src.handlers.access_request_handler import handle_request_access_button
+from src.handlers.admin_perf_handler import perf_command
 from src.handlers.admin_access_handler import (
     display_pending_access_requests_menu as admin_display_access_reqs,
     handle_approve_access_request_initiate,
@@ -211,7 +215,13 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
     logger.info(
         f"/status command received from user {chat_id} (Role: {user_role})")
-    await send_or_edit_universal_status_message(context.bot, chat_id, "⏳ Current bot status is being refreshed...", force_send_new=True, parse_mode=None)
+    status_text = "⏳ Current bot status is being refreshed..."
+    if user_role == app_config_holder.ROLE_ADMIN:
+        for service_label, service_name, is_enabled in (("Radarr", "radarr", app_config_holder.is_radarr_enabled()),
+                                                        ("Sonarr", "sonarr", app_config_holder.is_sonarr_enabled())):
+            if is_enabled:
+                status_text += f"\n{service_label} {format_lookup_cache_stats(service_name)}"
+    await send_or_edit_universal_status_message(context.bot, chat_id, status_text, force_send_new=True, parse_mode=None)
 
 
 async def radarr_queue_menu_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -257,6 +267,7 @@ def setup_handlers(application: Application):
     application.add_handler(CommandHandler("home", home_command))
     application.add_handler(CommandHandler("settings", settings_command))
     application.add_handler(CommandHandler("status", status_command))
+    application.add_handler(CommandHandler("perf", perf_command))
 
     application.add_handler(CallbackQueryHandler(
         handle_subgroup_selection, pattern=rf"^{CallbackData.CMD_LAUNCHER_SUBGROUP_PREFIX.value}.+$"))
@@ -487,6 +498,8 @@ def setup_handlers(application: Application):
                             pattern=rf"^{CallbackData.CMD_PLEX_EMPTY_TRASH_EXECUTE_PREFIX.value}(all|\d+)$"))
     application.add_handler(CallbackQueryHandler(
         plex_stop_stream_callback, pattern=rf"^{CallbackData.CMD_PLEX_STOP_STREAM_PREFIX.value}.+"))
+    application.add_handler(CallbackQueryHandler(plex_toggle_stream_notifications_callback,
+                            pattern=f"^{CallbackData.CMD_PLEX_TOGGLE_STREAM_NOTIFICATIONS.value}$"))
     application.add_handler(CallbackQueryHandler(plex_search_list_episodes_callback,
                             pattern=rf"^{CallbackData.CMD_PLEX_SEARCH_LIST_EPISODES_PREFIX.value}\d+_\d+$"))
     application.add_handler(CallbackQueryHandler(plex_search_show_episode_details_callback,
@@ -539,6 +552,9 @@ def setup_handlers(application: Application):
 
     application.add_handler(MessageHandler(
         filters.TEXT & ~filters.COMMAND, handle_pending_search))
+
+    for group_handlers in application.handlers.values():
+        instrument_handler_callbacks(group_handlers)
     logger.info(
         "Telegram bot handlers configured with Phase C access request system.")
 
@@ -548,7 +564,7 @@ RADARR_ACTIONS_REGEX = "^(" + "|".join(re.escape(e.value) for e in [CallbackData
     f"|{re.escape(CallbackData.CMD_RADARR_QUEUE_ITEM_REMOVE_NO_BLOCKLIST_PREFIX.value)}[0-9a-zA-Z_.-]+" + \
     f"|{re.escape(CallbackData.CMD_RADARR_QUEUE_ITEM_BLOCKLIST_ONLY_PREFIX.value)}[0-9a-zA-Z_.-]+" + \
     f"|{re.escape(CallbackData.CMD_RADARR_QUEUE_ITEM_BLOCKLIST_SEARCH_PREFIX.value)}[0-9a-zA-Z_.-]+" + ")$"
-SONARR_ACTIONS_REGEX = "^(" + "|".join(re.escape(e.value) for e in [CallbackData.CMD_SONARR_SCAN_FILES, CallbackData.CMD_SONARR_UPDATE_METADATA, CallbackData.CMD_SONARR_RENAME_FILES, CallbackData.CMD_SONARR_SEARCH_WANTED_ALL_NOW, CallbackData.CMD_SONARR_QUEUE_BACK_TO_LIST,]) + \
+SONARR_ACTIONS_REGEX = "^(" + "|".join(re.escape(e.value) for e in [CallbackData.CMD_SONARR_SCAN_FILES, CallbackData.CMD_SONARR_UPDATE_METADATA, CallbackData.CMD_SONARR_RENAME_FILES, CallbackData.CMD_SONARR_SEARCH_WANTED_ALL_NOW, CallbackData.CMD_SONARR_WANTED_SEARCH_PAGE, CallbackData.CMD_SONARR_QUEUE_BACK_TO_LIST,]) + \
     f"|{re.escape(CallbackData.CMD_SONARR_WANTED_SEARCH_EPISODE_PREFIX.value)}[0-9]+" + f"|{re.escape(CallbackData.CMD_SONARR_QUEUE_ITEM_ACTIONS_MENU_PREFIX.value)}[0-9a-zA-Z_.-]+" + \
     f"|{re.escape(CallbackData.CMD_SONARR_QUEUE_ITEM_REMOVE_NO_BLOCKLIST_PREFIX.value)}[0-9a-zA-Z_.-]+" + \
     f"|{re.escape(CallbackData.CMD_SONARR_QUEUE_ITEM_BLOCKLIST_ONLY_PREFIX.value)}[0-9a-zA-Z_.-]+" + \
@@ -3,7 +3,7 @@ from telegram import Update, constants
 from telegram.ext import ContextTypes
 import src.app.app_config_holder as app_config_holder
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
-from src.services.abdm.bot_abdm_core import add_download_to_abdm
+from src.app.app_service_executor import add_download_to_abdm_async
 from src.bot.bot_text_utils import escape_md_v2, escape_for_inline_code
 
 logger = logging.getLogger(__name__)
@@ -32,7 +32,7 @@ async def handle_abdm_download_initiation(update: Update, context: ContextTypes.
         parse_mode="MarkdownV2"
     )
 
-    abdm_response = add_download_to_abdm(
+    abdm_response = await add_download_to_abdm_async(
         url=download_url,
         filename=None,
         destination_path=None,
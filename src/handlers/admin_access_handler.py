@@ -13,6 +13,8 @@ from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu, refresh_main_menus_for_all_admins
 from src.bot.bot_message_persistence import load_menu_message_id
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -135,16 +137,18 @@ async def display_pending_access_requests_menu(update: Update, context: ContextT
     menu_message_id = load_menu_message_id(str(admin_chat_id))
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{admin_chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (final_menu_display_text,
-                                 reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, admin_chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                final_menu_display_text, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(admin_chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=admin_chat_id, message_id=menu_message_id,
                     text=final_menu_display_text, reply_markup=reply_markup, parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, admin_chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -213,12 +217,13 @@ async def handle_approve_access_request_initiate(update: Update, context: Contex
     menu_message_id = load_menu_message_id(str(admin_chat_id))
     if menu_message_id:
         try:
+            cancel_message_edit(admin_chat_id, menu_message_id)
             await context.bot.edit_message_text(
                 chat_id=admin_chat_id, message_id=menu_message_id,
                 text=menu_text, reply_markup=reply_markup, parse_mode="MarkdownV2"
             )
-            context.bot_data[f"menu_message_content_{admin_chat_id}_{menu_message_id}"] = (
-                menu_text, reply_markup.to_json())
+            set_menu_fingerprint(context.bot_data, admin_chat_id, menu_message_id,
+                                 menu_content_fingerprint(menu_text, reply_markup))
         except Exception as e:
             logger.error(
                 f"Error displaying role assignment menu: {e}", exc_info=True)
@@ -8,9 +8,11 @@ import src.app.app_config_holder as app_config_holder
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_message_persistence import load_menu_message_id
-from src.app.app_file_utils import load_tickets_data, save_tickets_data  # New import
+import src.app.app_ticket_store as app_ticket_store
 from src.handlers.tickets_handler import display_tickets_menu  # Added import
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +36,7 @@ async def handle_admin_view_ticket_details(update: Update, context: ContextTypes
     ticket_id_to_view = query.data.replace(
         CallbackData.CMD_ADMIN_VIEW_TICKET_PREFIX.value, "")  # Updated CB
 
-    support_tickets_store = load_tickets_data()  # New
-    ticket_data = support_tickets_store.get(ticket_id_to_view)
+    ticket_data = app_ticket_store.get_ticket(ticket_id_to_view)
 
     if not ticket_data:
         await send_or_edit_universal_status_message(context.bot, int(admin_chat_id_str), "⚠️ Ticket not found or already handled. Returning to ticket list.", parse_mode=None, force_send_new=True)
@@ -71,9 +72,8 @@ async def handle_admin_view_ticket_details(update: Update, context: ContextTypes
 
     # Mark ticket as admin_viewed if it was user_replied or open_by_user
     if ticket_data.get("status") in ["user_replied", "open_by_user"]:
-        ticket_data["status"] = "admin_viewed"  # Or a more specific status
-        ticket_data["last_updated_at"] = time.time()
-        save_tickets_data(support_tickets_store)  # New
+        app_ticket_store.update_ticket(
+            ticket_id_to_view, status="admin_viewed", last_updated_at=time.time())  # Or a more specific status
         logger.info(
             f"Admin {admin_chat_id_str} viewed ticket {ticket_id_to_view}. Status updated.")
     keyboard = []
@@ -93,17 +93,19 @@ async def handle_admin_view_ticket_details(update: Update, context: ContextTypes
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{admin_chat_id_str}_{menu_message_id}"
-            old_content_tuple_json = context.application.bot_data.get(
-                current_content_key)
-            new_content_tuple_json = (menu_title_text, reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.application.bot_data, admin_chat_id_str, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                menu_title_text, reply_markup)
 
-            if old_content_tuple_json != new_content_tuple_json:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(int(admin_chat_id_str), menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=int(admin_chat_id_str), message_id=menu_message_id,
                     text=menu_title_text, reply_markup=reply_markup, parse_mode="MarkdownV2"
                 )
-                context.application.bot_data[current_content_key] = new_content_tuple_json
+                set_menu_fingerprint(context.application.bot_data, admin_chat_id_str, menu_message_id,
+                                     new_content_fingerprint)
             # else: logger.debug(f"Admin view ticket details: Menu content for {admin_chat_id_str} not modified, edit skipped.")
         except Exception as e:
             logger.error(
@@ -185,8 +187,7 @@ async def handle_admin_close_ticket(update: Update, context: ContextTypes.DEFAUL
     ticket_id_to_close = query.data.replace(
         CallbackData.CMD_ADMIN_CLOSE_TICKET_PREFIX.value, "")
 
-    support_tickets_store = load_tickets_data()  # New
-    ticket_data = support_tickets_store.get(ticket_id_to_close)
+    ticket_data = app_ticket_store.get_ticket(ticket_id_to_close)
     admin_username = update.effective_user.username or update.effective_user.first_name or f"Admin_{admin_chat_id_str}"
 
     if not ticket_data:
@@ -199,15 +200,15 @@ async def handle_admin_close_ticket(update: Update, context: ContextTypes.DEFAUL
         await display_tickets_menu(update, context)
         return
 
-    ticket_data["status"] = "closed_by_admin"
-    ticket_data["last_updated_at"] = time.time()
     # Optionally add a closing message from admin
-    ticket_data.setdefault("messages", []).append({
+    closing_message = {
         "sender_id": admin_chat_id_str, "sender_username": admin_username,
         "sender_type": "admin", "text": f"Ticket closed by administrator.",
         "timestamp": time.time()
-    })
-    save_tickets_data(support_tickets_store)  # New
+    }
+    app_ticket_store.update_ticket(
+        ticket_id_to_close, message=closing_message,
+        status="closed_by_admin", last_updated_at=time.time())
     replying_user_id_to_notify = ticket_data.get("user_chat_id")
 
     logger.info(
@@ -244,9 +245,7 @@ async def handle_admin_reply_to_ticket_init(update: Update, context: ContextType
     ticket_id_to_reply_to = query.data.replace(
         CallbackData.CMD_ADMIN_REPLY_TO_TICKET_INIT_PREFIX.value, "")
 
-    # support_tickets_store = context.application.bot_data.get('support_tickets', {}) # Old
-    support_tickets_store = load_tickets_data()  # New
-    ticket_data = support_tickets_store.get(ticket_id_to_reply_to)
+    ticket_data = app_ticket_store.get_ticket(ticket_id_to_reply_to)
 
     if not ticket_data or ticket_data.get("status", "").startswith("closed"):
         await send_or_edit_universal_status_message(context.bot, int(admin_chat_id_str), "⚠️ Cannot reply: Ticket not found or already closed.", parse_mode=None)
@@ -283,22 +282,17 @@ async def handle_admin_ticket_reply_input(update: Update, context: ContextTypes.
         await send_or_edit_universal_status_message(context.bot, int(admin_chat_id_str), "⚠️ Error: Ticket/User ID for reply not found. Please try again.", parse_mode=None)
         return ConversationHandler.END
 
-    support_tickets_store = load_tickets_data()  # New
-    ticket_data = support_tickets_store.get(ticket_id)
+    # Append the new message to the ticket thread
+    ticket_data = app_ticket_store.update_ticket(
+        ticket_id, message={
+            "sender_id": admin_chat_id_str, "sender_username": admin_username,
+            "sender_type": "admin", "text": admin_reply_text, "timestamp": time.time()
+        }, require_open=True, status="admin_replied", last_updated_at=time.time())
 
-    if not ticket_data or ticket_data.get("status", "").startswith("closed"):
+    if not ticket_data:
         await send_or_edit_universal_status_message(context.bot, int(admin_chat_id_str), "⚠️ Cannot send reply: Ticket not found or already closed.", parse_mode=None)
         return ConversationHandler.END
 
-    ticket_data.setdefault("messages", []).append({
-        "sender_id": admin_chat_id_str, "sender_username": admin_username,
-        "sender_type": "admin", "text": admin_reply_text, "timestamp": time.time()
-    })
-    ticket_data["status"] = "admin_replied"
-    ticket_data["last_updated_at"] = time.time()
-    # Save the ticket with the new message
-    save_tickets_data(support_tickets_store)
-
     await send_or_edit_universal_status_message(context.bot, int(admin_chat_id_str), f"✅ Your reply to Ticket \\#{escape_md_v2(ticket_id[:8])} has been sent to {escape_md_v2(target_user_username)}\\.", parse_mode="MarkdownV2")
 
     # Notify User
@@ -0,0 +1,136 @@
+import logging
+from telegram import Update
+from telegram.ext import ContextTypes
+
+import src.app.app_config_holder as app_config_holder
+import src.app.user_manager as user_manager
+import src.app.app_state_store as app_state_store
+from src.app.app_perf_metrics import get_perf_snapshot, reset_perf_metrics, GROUP_HANDLERS, GROUP_BACKEND
+from src.app.app_api_status_manager import get_api_health
+from src.app.app_bot_persistence import get_persistence_stats
+from src.app.app_search_sessions import get_search_session_stats
+from src.bot.bot_broadcast import get_broadcast_stats
+from src.bot.bot_outbound_queue import get_outbound_queue_stats
+from src.bot.bot_menu_fingerprints import get_menu_fingerprint_stats
+from src.bot.bot_initialization import send_or_edit_universal_status_message
+from src.handlers.menu_handler_main_builder import get_menu_render_stats
+from src.services.bot_catalog_cache import get_catalog_stats
+from src.services.bot_lookup_cache import get_lookup_cache_stats
+from src.services.bot_queue_monitor import get_queue_monitor_stats
+from src.services.plex.bot_plex_core import get_plex_connection_stats
+from src.services.plex.bot_plex_index import get_plex_index_stats
+from src.services.plex.bot_plex_session_listener import get_plex_session_listener_stats
+from src.services.sonarr.bot_sonarr_wanted import get_wanted_pipeline_stats
+
+logger = logging.getLogger(__name__)
+
+# Rows shown per latency table, slowest p95 first.
+PERF_REPORT_MAX_ROWS = 15
+TELEGRAM_MESSAGE_LIMIT = 4096
+PERF_NAME_COLUMN_WIDTH = 34
+
+
+def _format_ms(value: float) -> str:
+    return f"{value / 1000:.1f}s" if value >= 10000 else f"{value:.0f}ms"
+
+
+def _latency_table(title: str, snapshot: dict) -> list:
+    lines = [f"{title} (p50 / p95 / p99, calls, errors, in flight)"]
+    if not snapshot:
+        return lines + ["  no calls recorded yet"]
+    rows = sorted(snapshot.items(),
+                  key=lambda item: item[1]["p95_ms"], reverse=True)
+    for name, entry in rows[:PERF_REPORT_MAX_ROWS]:
+        short_name = name if len(name) <= PERF_NAME_COLUMN_WIDTH else name[:PERF_NAME_COLUMN_WIDTH - 1] + "…"
+        lines.append(
+            f"  {short_name}: {_format_ms(entry['p50_ms'])} / {_format_ms(entry['p95_ms'])} / "
+            f"{_format_ms(entry['p99_ms'])}, {entry['count']}, {entry['errors']}, {entry['in_flight']}")
+    if len(rows) > PERF_REPORT_MAX_ROWS:
+        lines.append(f"  … {len(rows) - PERF_REPORT_MAX_ROWS} more")
+    return lines
+
+
+def _stats_line(label: str, stats: dict) -> str:
+    parts = []
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            value = ", ".join(f"{sub_key}={sub_value}" for sub_key, sub_value in value.items()) or "-"
+            value = f"[{value}]"
+        parts.append(f"{key}={value}")
+    return f"  {label}: " + " ".join(parts)
+
+
+def _collect_component_stats(bot_data: dict) -> list:
+    """(label, getter) pairs; a getter that fails is reported instead of breaking the whole report."""
+    components = [
+        ("state writes", app_state_store.get_write_behind_stats),
+        ("ptb persistence", get_persistence_stats),
+        ("auth index", user_manager.get_auth_index_stats),
+        ("outbound edits", get_outbound_queue_stats),
+        ("broadcasts", get_broadcast_stats),
+        ("menu renders", get_menu_render_stats),
+        ("menu fingerprints", lambda: get_menu_fingerprint_stats(bot_data)),
+        ("search sessions", get_search_session_stats),
+        ("queue monitor", get_queue_monitor_stats),
+        ("sonarr wanted", get_wanted_pipeline_stats),
+    ]
+    for service_name in ("radarr", "sonarr"):
+        components.append((f"{service_name} catalogue",
+                           lambda service_name=service_name: get_catalog_stats(service_name)))
+        components.append((f"{service_name} lookups",
+                           lambda service_name=service_name: get_lookup_cache_stats(service_name)))
+    components += [
+        ("plex connection", get_plex_connection_stats),
+        ("plex index", get_plex_index_stats),
+        ("plex sessions", get_plex_session_listener_stats),
+    ]
+    for service_name in ("plex", "radarr", "sonarr", "abdm"):
+        components.append((f"{service_name} health",
+                           lambda service_name=service_name: {
+                               key: value for key, value in get_api_health(bot_data, service_name).items()
+                               if key in ("status", "last_latency_ms", "avg_latency_ms", "max_latency_ms", "consecutive_failures")}))
+
+    lines = []
+    for label, getter in components:
+        try:
+            lines.append(_stats_line(label, getter()))
+        except Exception as e:
+            logger.warning(f"Could not collect {label} stats: {e}")
+            lines.append(f"  {label}: unavailable ({type(e).__name__})")
+    return lines
+
+
+def build_perf_report(bot_data: dict) -> str:
+    lines = ["📈 Performance"]
+    lines += _latency_table("Handlers", get_perf_snapshot(GROUP_HANDLERS))
+    lines += _latency_table("Backend calls", get_perf_snapshot(GROUP_BACKEND))
+    lines.append("Caches and queues")
+    lines += _collect_component_stats(bot_data)
+    report = "\n".join(lines)
+    if len(report) > TELEGRAM_MESSAGE_LIMIT:
+        report = report[:TELEGRAM_MESSAGE_LIMIT - 1] + "…"
+    return report
+
+
+async def perf_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """/perf shows handler and backend latency percentiles plus cache and queue counters; /perf reset clears the latencies."""
+    if not update.effective_user or not update.message or not update.effective_chat:
+        return
+    chat_id = update.effective_chat.id
+    try:
+        await update.message.delete()
+    except Exception as e:
+        logger.debug(f"Could not delete /perf command message in chat {chat_id}: {e}")
+    if app_config_holder.get_user_role(str(chat_id)) != app_config_holder.ROLE_ADMIN:
+        await send_or_edit_universal_status_message(context.bot, chat_id, "⚠️ Access Denied. This command is for administrators.", parse_mode=None)
+        return
+
+    if context.args and context.args[0].lower() == "reset":
+        reset_perf_metrics()
+        logger.info(f"/perf reset by admin {chat_id}")
+        await send_or_edit_universal_status_message(context.bot, chat_id, "✅ Performance metrics reset.", parse_mode=None)
+        return
+
+    logger.info(f"/perf command received from admin {chat_id}")
+    # Sent as its own message so the next status update does not replace it.
+    await context.bot.send_message(chat_id=chat_id, text=build_perf_report(context.bot_data))
@@ -11,14 +11,17 @@ import src.app.app_config_holder as app_config_holder
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_message_persistence import load_menu_message_id
-from src.app.app_file_utils import load_requests_data, save_requests_data
+import src.app.app_request_store as app_request_store
 from src.bot.bot_text_utils import escape_md_v2, escape_md_v1
 from src.handlers.user_requests.menu_handler_my_requests import format_request_timestamp
 
 from src.handlers.radarr.menu_handler_radarr_add_flow import radarr_movie_selection_callback as admin_radarr_add_flow_initiator
 from src.handlers.sonarr.menu_handler_sonarr_add_flow import sonarr_show_selection_callback as admin_sonarr_add_flow_initiator
-from src.services.radarr.bot_radarr_core import _radarr_request as radarr_api_get
-from src.services.sonarr.bot_sonarr_core import _sonarr_request as sonarr_api_get
+from src.app.app_service_executor import run_radarr_call, run_sonarr_call
+from src.services.radarr.bot_radarr_add import lookup_movie_by_tmdb_id
+from src.services.sonarr.bot_sonarr_add import lookup_series
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -53,20 +56,14 @@ async def display_admin_pending_requests_menu(update: Update, context: ContextTy
         await send_or_edit_universal_status_message(context.bot, chat_id, "⚠️ Access Denied. This section is for administrators.", parse_mode=None)
         return
 
-    all_requests = load_requests_data()
-    pending_requests = [
-        req for req in all_requests if req.get("status") == "pending"]
-    pending_requests.sort(key=lambda r: r.get(
-        "request_timestamp", 0), reverse=False)
-
-    total_items = len(pending_requests)
+    total_items = app_request_store.count_requests_by_status(
+        app_request_store.STATUS_PENDING)
     total_pages = math.ceil(
         total_items / ITEMS_PER_PAGE_ADMIN_REQUESTS) if total_items > 0 else 1
     current_page = max(1, min(page, total_pages))
 
-    start_index = (current_page - 1) * ITEMS_PER_PAGE_ADMIN_REQUESTS
-    end_index = start_index + ITEMS_PER_PAGE_ADMIN_REQUESTS
-    page_items = pending_requests[start_index:end_index]
+    page_items, total_items = app_request_store.get_pending_requests_page(
+        current_page, ITEMS_PER_PAGE_ADMIN_REQUESTS)
 
     keyboard = []
 
@@ -151,12 +148,13 @@ async def display_admin_pending_requests_menu(update: Update, context: ContextTy
     menu_message_id = load_menu_message_id(str(chat_id))
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (final_menu_display_text,
-                                 reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                final_menu_display_text, reply_markup)
 
-            if old_content_tuple != new_content_tuple:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -164,7 +162,8 @@ async def display_admin_pending_requests_menu(update: Update, context: ContextTy
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -193,13 +192,7 @@ async def display_admin_request_details_view(update: Update, context: ContextTyp
         CallbackData.CMD_ADMIN_VIEW_REQUEST_PREFIX.value, "")
     await query.answer()
 
-    all_requests = load_requests_data()
-    target_request_idx, target_request = -1, None
-    for idx, req in enumerate(all_requests):
-        if req.get("request_id") == request_id:
-            target_request = req
-            target_request_idx = idx
-            break
+    target_request = app_request_store.get_request(request_id)
 
     if not target_request:
         await send_or_edit_universal_status_message(context.bot, chat_id, "⚠️ Request not found (it might have been processed or deleted).", parse_mode=None)
@@ -207,7 +200,6 @@ async def display_admin_request_details_view(update: Update, context: ContextTyp
         return
 
     context.user_data['admin_current_request_to_process'] = target_request
-    context.user_data['admin_current_request_idx_to_process'] = target_request_idx
 
     media_title_raw = target_request.get("media_title", "N/A")
     media_year_raw = target_request.get("media_year", "N/A")
@@ -268,6 +260,7 @@ async def display_admin_request_details_view(update: Update, context: ContextTyp
     menu_message_id = load_menu_message_id(str(chat_id))
     if menu_message_id:
         try:
+            cancel_message_edit(chat_id, menu_message_id)
             await context.bot.edit_message_text(
                 chat_id=chat_id,
                 message_id=menu_message_id,
@@ -275,8 +268,8 @@ async def display_admin_request_details_view(update: Update, context: ContextTyp
                 reply_markup=reply_markup,
                 parse_mode="MarkdownV2"
             )
-            context.bot_data[f"menu_message_content_{chat_id}_{menu_message_id}"] = (
-                final_text, reply_markup.to_json())
+            set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                 menu_content_fingerprint(final_text, reply_markup))
         except BadRequest as e_bad:
             logger.error(
                 f"BadRequest editing admin request details view: {e_bad}. Text was: '{final_text}'", exc_info=True)
@@ -309,13 +302,9 @@ async def admin_approve_request_callback(update: Update, context: ContextTypes.D
     target_request = context.user_data.get('admin_current_request_to_process')
 
     if not target_request or target_request.get("request_id") != request_id:
-        all_requests_list = load_requests_data()
-        for idx, req in enumerate(all_requests_list):
-            if req.get("request_id") == request_id:
-                target_request = req
-                context.user_data['admin_current_request_to_process'] = target_request
-
-                break
+        target_request = app_request_store.get_request(request_id)
+        if target_request:
+            context.user_data['admin_current_request_to_process'] = target_request
 
     if not target_request:
         await send_or_edit_universal_status_message(context.bot, admin_chat_id, "⚠️ Error: Could not find the request to approve. It might have been processed already.", parse_mode=None)
@@ -346,8 +335,8 @@ async def admin_approve_request_callback(update: Update, context: ContextTypes.D
     full_media_object_for_add_flow = None
     if media_type == "movie":
         try:
-            lookup_response = radarr_api_get(
-                'get', f'/movie/lookup/tmdb?tmdbId={media_id}')
+            lookup_response = await run_radarr_call(
+                lookup_movie_by_tmdb_id, media_id)
             if isinstance(lookup_response, list) and lookup_response:
                 full_media_object_for_add_flow = lookup_response[0]
             elif isinstance(lookup_response, dict):
@@ -357,8 +346,8 @@ async def admin_approve_request_callback(update: Update, context: ContextTypes.D
                 f"Failed to re-fetch Radarr movie details for approved request {request_id}: {e}")
     elif media_type == "tv":
         try:
-            lookup_response = sonarr_api_get(
-                'get', f'/series/lookup', params={'term': f'tvdb:{media_id}'})
+            lookup_response = await run_sonarr_call(
+                lookup_series, f'tvdb:{media_id}')
             if isinstance(lookup_response, list) and lookup_response:
                 full_media_object_for_add_flow = lookup_response[0]
             elif isinstance(lookup_response, dict):
@@ -416,9 +405,7 @@ async def admin_reject_request_callback(update: Update, context: ContextTypes.DE
 
     target_request = context.user_data.get('admin_current_request_to_process')
     if not target_request or target_request.get("request_id") != request_id:
-        all_requests_list = load_requests_data()
-        target_request = next(
-            (req for req in all_requests_list if req.get("request_id") == request_id), None)
+        target_request = app_request_store.get_request(request_id)
         if target_request:
             context.user_data['admin_current_request_to_process'] = target_request
 
@@ -476,18 +463,12 @@ async def handle_rejection_reason_input(update: Update, context: ContextTypes.DE
         await send_or_edit_universal_status_message(context.bot, admin_chat_id, "⚠️ Error: No request selected for rejection.", parse_mode=None)
         return ConversationHandler.END
 
-    all_requests = load_requests_data()
-    req_found_and_updated = False
-    for i in range(len(all_requests)):
-        if all_requests[i].get("request_id") == request_id and all_requests[i].get("status") == "pending":
-            all_requests[i]["status"] = "rejected"
-            all_requests[i]["status_timestamp"] = time.time()
-            all_requests[i]["admin_notes"] = reason_text if reason_text != "/skip" else "Rejected by admin."
-            req_found_and_updated = True
-            break
+    req_found_and_updated = app_request_store.update_request(
+        request_id, expected_status=app_request_store.STATUS_PENDING,
+        status="rejected", status_timestamp=time.time(),
+        admin_notes=reason_text if reason_text != "/skip" else "Rejected by admin.") is not None
 
     if req_found_and_updated:
-        save_requests_data(all_requests)
         rejection_feedback_raw = f"✅ Request for '{media_title}' rejected."
         if reason_text != "/skip":
             rejection_feedback_raw += f" Reason: {reason_text}"
@@ -603,20 +584,14 @@ async def display_admin_history_requests_menu(update: Update, context: ContextTy
         await send_or_edit_universal_status_message(context.bot, chat_id, "⚠️ Access Denied.", parse_mode=None)
         return
 
-    all_requests = load_requests_data()
-    processed_requests = [req for req in all_requests if req.get(
-        "status") in ["approved", "rejected", "add_failed"]]
-    processed_requests.sort(key=lambda r: r.get(
-        "status_timestamp", 0), reverse=True)
-
-    total_items = len(processed_requests)
+    total_items = sum(app_request_store.count_requests_by_status(status)
+                      for status in app_request_store.HISTORY_STATUSES)
     total_pages = math.ceil(
         total_items / ITEMS_PER_PAGE_ADMIN_REQUESTS) if total_items > 0 else 1
     current_page = max(1, min(page, total_pages))
 
-    start_index = (current_page - 1) * ITEMS_PER_PAGE_ADMIN_REQUESTS
-    end_index = start_index + ITEMS_PER_PAGE_ADMIN_REQUESTS
-    page_items = processed_requests[start_index:end_index]
+    page_items, total_items = app_request_store.get_history_requests_page(
+        current_page, ITEMS_PER_PAGE_ADMIN_REQUESTS)
 
     keyboard = []
     menu_title_display = ADMIN_HISTORY_REQUESTS_TITLE_MD2_TEMPLATE.format(
@@ -699,12 +674,13 @@ async def display_admin_history_requests_menu(update: Update, context: ContextTy
     menu_message_id = load_menu_message_id(str(chat_id))
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (final_menu_display_text,
-                                 reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                final_menu_display_text, reply_markup)
 
-            if old_content_tuple != new_content_tuple:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -712,7 +688,8 @@ async def display_admin_history_requests_menu(update: Update, context: ContextTy
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
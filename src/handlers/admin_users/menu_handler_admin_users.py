@@ -12,8 +12,10 @@ import src.app.user_manager as user_manager
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_message_persistence import load_menu_message_id
-from src.app.app_file_utils import load_tickets_data, save_tickets_data  # New import
+import src.app.app_ticket_store as app_ticket_store
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -156,12 +158,13 @@ async def display_manage_users_menu(update: Update, context: ContextTypes.DEFAUL
     menu_message_id = load_menu_message_id(str(admin_chat_id))
     if menu_message_id:
         try:
+            cancel_message_edit(admin_chat_id, menu_message_id)
             await context.bot.edit_message_text(
                 chat_id=admin_chat_id, message_id=menu_message_id,
                 text=final_menu_text, reply_markup=reply_markup, parse_mode="MarkdownV2"
             )
-            context.bot_data[f"menu_message_content_{admin_chat_id}_{menu_message_id}"] = (
-                final_menu_text, reply_markup.to_json())
+            set_menu_fingerprint(context.bot_data, admin_chat_id, menu_message_id,
+                                 menu_content_fingerprint(final_menu_text, reply_markup))
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -224,12 +227,13 @@ async def display_edit_user_menu(update: Update, context: ContextTypes.DEFAULT_T
 
     menu_message_id = load_menu_message_id(str(admin_chat_id))
     if menu_message_id:
+        cancel_message_edit(admin_chat_id, menu_message_id)
         await context.bot.edit_message_text(
             chat_id=admin_chat_id, message_id=menu_message_id,
             text=menu_text, reply_markup=reply_markup, parse_mode="MarkdownV2"
         )
-        context.bot_data[f"menu_message_content_{admin_chat_id}_{menu_message_id}"] = (
-            menu_text, reply_markup.to_json())
+        set_menu_fingerprint(context.bot_data, admin_chat_id, menu_message_id,
+                             menu_content_fingerprint(menu_text, reply_markup))
     await send_or_edit_universal_status_message(context.bot, admin_chat_id, f"Editing user: {username_to_edit}.", parse_mode=None)
 
 
@@ -256,15 +260,11 @@ async def handle_change_user_role(update: Update, context: ContextTypes.DEFAULT_
         await display_manage_users_menu(update, context, page=context.user_data.get('admin_users_current_page', 1))
         return
 
-    current_full_state = user_manager._load_bot_state(force_reload=True)
-    users_in_state = current_full_state.get("users", {})
-    user_to_modify = users_in_state.get(user_to_change_id_str)
+    user_to_modify = user_manager.get_all_users_from_state().get(user_to_change_id_str)
 
     if user_to_modify:
         old_role = user_to_modify.get("role")
-        user_to_modify["role"] = new_role
-        current_full_state["users"] = users_in_state
-        if user_manager._save_bot_state(current_full_state):
+        if user_manager.set_user_role(user_to_change_id_str, new_role):
             username_changed = user_to_modify.get(
                 'username', user_to_change_id_str)
             await send_or_edit_universal_status_message(context.bot, admin_chat_id, escape_md_v2(f"✅ Role for {username_changed} changed to {new_role}."), parse_mode="MarkdownV2")
@@ -305,13 +305,10 @@ async def handle_remove_user(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await display_manage_users_menu(update, context, page=context.user_data.get('admin_users_current_page', 1))
         return
 
-    current_full_state = user_manager._load_bot_state(force_reload=True)
-    users_in_state = current_full_state.get("users", {})
-    user_removed_data = users_in_state.pop(user_to_remove_id_str, None)
+    user_removed_data = user_manager.get_all_users_from_state().get(user_to_remove_id_str)
 
     if user_removed_data:
-        current_full_state["users"] = users_in_state
-        if user_manager._save_bot_state(current_full_state):
+        if user_manager.remove_user(user_to_remove_id_str) is not None:
             username_removed = user_removed_data.get(
                 'username', user_to_remove_id_str)
             await send_or_edit_universal_status_message(context.bot, admin_chat_id, escape_md_v2(f"✅ User {username_removed} removed."), parse_mode="MarkdownV2")
@@ -425,13 +422,7 @@ async def handle_add_user_role_selection(update: Update, context: ContextTypes.D
         await send_or_edit_universal_status_message(context.bot, admin_chat_id, "⚠️ Invalid role selection.", parse_mode=None)
         return ASK_NEW_USER_ROLE
 
-    current_full_state = user_manager._load_bot_state(force_reload=True)
-    users_in_state = current_full_state.get("users", {})
-    users_in_state[new_user_chat_id] = {
-        "username": f"User_{new_user_chat_id}", "role": selected_role}
-    current_full_state["users"] = users_in_state
-
-    if user_manager._save_bot_state(current_full_state):
+    if user_manager.add_approved_user(new_user_chat_id, f"User_{new_user_chat_id}", selected_role):
         await send_or_edit_universal_status_message(context.bot, admin_chat_id, escape_md_v2(f"✅ User {new_user_chat_id} added with role {selected_role}."), parse_mode="MarkdownV2")
         try:
             await show_or_edit_main_menu(new_user_chat_id, context, force_send_new=True)
@@ -554,8 +545,6 @@ async def handle_admin_initial_ticket_message_input(update: Update, context: Con
     try:
         # Create and store the new ticket
         ticket_id = str(uuid.uuid4())
-        # support_tickets_store = context.application.bot_data.setdefault('support_tickets', {}) # Old
-        support_tickets_store = load_tickets_data()  # New
 
         new_ticket = {
             "ticket_id": ticket_id,
@@ -577,8 +566,8 @@ async def handle_admin_initial_ticket_message_input(update: Update, context: Con
                 }
             ]
         }
-        support_tickets_store[ticket_id] = new_ticket
-        save_tickets_data(support_tickets_store)  # New
+        if not app_ticket_store.create_ticket(new_ticket):
+            raise RuntimeError(f"Ticket {ticket_id} could not be saved.")
         logger.info(
             f"Admin {admin_chat_id} created new ticket (ID: {ticket_id}) for user {target_user_id_str}")
 
@@ -11,6 +11,8 @@ from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, load_menu_message_id, show_or_edit_main_menu
 from src.app import launcher_manager
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -195,19 +197,21 @@ async def display_launchers_menu(update: Update, context: ContextTypes.DEFAULT_T
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (
-                escaped_menu_title_for_display, reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title_for_display, reply_markup)
 
-            if old_content_tuple != new_content_tuple or \
+            if old_content_fingerprint != new_content_fingerprint or \
                (query and query.data == CallbackData.CMD_LAUNCHERS_MENU.value):
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id, message_id=menu_message_id,
                     text=escaped_menu_title_for_display, reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
 
             status_msg_to_send = "Select a launcher or subgroup."
             if selected_subgroup:
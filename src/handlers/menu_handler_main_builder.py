@@ -7,26 +7,31 @@ from src.app.app_api_status_manager import (
 import logging
 import os
 import datetime
+from collections import OrderedDict
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup  # Keep this
 
 import src.app.app_config_holder as app_config_holder
 
-from src.app.app_file_utils import load_requests_data
+import src.app.app_request_store as app_request_store
+import src.app.app_ticket_store as app_ticket_store
 import src.app.user_manager as user_manager
 
 from src.bot.bot_callback_data import CallbackData
-from src.app.app_file_utils import load_tickets_data  # New import for ticket counts
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint
 from src.bot.bot_text_utils import escape_md_v2
 
 logger = logging.getLogger(__name__)
 
+# Rendered menus keyed on everything that can change them (see
+# _main_menu_cache_key); most users share a handful of entries.
+MENU_RENDER_CACHE_MAX_ENTRIES = 256
+_menu_render_cache: OrderedDict = OrderedDict()
+MENU_RENDER_STATS = {"hits": 0, "misses": 0, "invalidations": 0}
+
 
 def get_pending_request_count() -> int:
     """Counts the number of media requests with 'pending' status."""
-    all_requests = load_requests_data()
-    pending_count = sum(
-        1 for req in all_requests if req.get("status") == "pending")
-    return pending_count
+    return app_request_store.count_requests_by_status(app_request_store.STATUS_PENDING)
 
 
 def get_pending_access_request_count() -> int:
@@ -41,31 +46,20 @@ def get_actionable_ticket_counts(chat_id_str: str, user_role: str) -> tuple[int,
     Gets counts for actionable tickets.
     Returns: (admin_actionable_count, user_actionable_count)
     """
-    all_tickets = load_tickets_data()
     admin_actionable_count = 0
-    user_actionable_count = 0
-
     if user_role == app_config_holder.ROLE_ADMIN:
-        for ticket_data in all_tickets.values():
-            if ticket_data.get("status") in ["open_by_user", "user_replied"]:
-                admin_actionable_count += 1
+        admin_actionable_count = app_ticket_store.count_admin_actionable_tickets()
 
     # For any user (including admin viewing their own tickets if they submitted any)
-    for ticket_data in all_tickets.values():
-        if ticket_data.get("user_chat_id") == chat_id_str and \
-           ticket_data.get("status") in ["open_by_admin", "admin_replied"]:
-            user_actionable_count += 1
+    user_actionable_count = app_ticket_store.count_user_actionable_tickets(
+        chat_id_str)
 
     return admin_actionable_count, user_actionable_count
 
 
-def build_main_menu_content(version: str, user_role: str, chat_id_str: str, bot_data: dict):
-    is_primary_admin = app_config_holder.is_primary_admin(chat_id_str)
-    is_general_admin = (user_role == app_config_holder.ROLE_ADMIN)
-    is_standard_user = (user_role == app_config_holder.ROLE_STANDARD_USER)
-    is_unknown_user = (user_role == app_config_holder.ROLE_UNKNOWN)
-
-    def get_emoji_for_status(service_name: str, enabled_func, config_check_func, bot_data_key: str) -> str:
+def get_service_status_emojis(bot_data: dict) -> tuple[str, str, str, str]:
+    """Status emojis for (Plex, Radarr, Sonarr, ABDM) as shown in the admin menu header."""
+    def get_emoji_for_status(enabled_func, config_check_func, bot_data_key: str) -> str:
         if not enabled_func():
             return "🔘"  # Disabled
         if not config_check_func():
@@ -79,39 +73,105 @@ def build_main_menu_content(version: str, user_role: str, chat_id_str: str, bot_
         else:  # API_STATUS_UNKNOWN or other error during check
             return "❓"
 
-    # Plex Status
-    plex_status_emoji = get_emoji_for_status(
-        "Plex",
-        app_config_holder.is_plex_enabled,
-        lambda: app_config_holder.get_plex_url() and app_config_holder.get_plex_token(),
-        "plex_api_status"
+    return (
+        get_emoji_for_status(
+            app_config_holder.is_plex_enabled,
+            lambda: app_config_holder.get_plex_url() and app_config_holder.get_plex_token(),
+            "plex_api_status"),
+        get_emoji_for_status(
+            app_config_holder.is_radarr_enabled,
+            lambda: app_config_holder.get_radarr_base_api_url() and app_config_holder.get_radarr_api_key(),
+            "radarr_api_status"),
+        get_emoji_for_status(
+            app_config_holder.is_sonarr_enabled,
+            lambda: app_config_holder.get_sonarr_base_api_url() and app_config_holder.get_sonarr_api_key(),
+            "sonarr_api_status"),
+        get_emoji_for_status(
+            app_config_holder.is_abdm_enabled,
+            lambda: app_config_holder.get_abdm_port() is not None,
+            "abdm_api_status"),
     )
 
-    # Radarr Status
-    radarr_status_emoji = get_emoji_for_status(
-        "Radarr",
-        app_config_holder.is_radarr_enabled,
-        lambda: app_config_holder.get_radarr_base_api_url(
-        ) and app_config_holder.get_radarr_api_key(),
-        "radarr_api_status"
-    )
 
-    # Sonarr Status
-    sonarr_status_emoji = get_emoji_for_status(
-        "Sonarr",
-        app_config_holder.is_sonarr_enabled,
-        lambda: app_config_holder.get_sonarr_base_api_url(
-        ) and app_config_holder.get_sonarr_api_key(),
-        "sonarr_api_status"
-    )
+def get_new_admin_ticket_id(chat_id_str: str) -> str | None:
+    """An open ticket the admin opened for this user that the user has not viewed yet."""
+    for ticket_data in app_ticket_store.get_user_open_tickets(chat_id_str):
+        if ticket_data.get("status") == "open_by_admin" and \
+           (not ticket_data.get("user_viewed_initial_admin_msg", False)):  # New flag to track if user saw it
+            return ticket_data.get("ticket_id")  # Simplification: just link to one
+    return None
 
-    # ABDM Status
-    abdm_status_emoji = get_emoji_for_status(
-        "ABDM",
-        app_config_holder.is_abdm_enabled,
-        lambda: app_config_holder.get_abdm_port() is not None,
-        "abdm_api_status"
-    )
+
+def get_oldest_unread_reply_id(bot_data: dict, chat_id_str: str):
+    unread_user_replies = bot_data.get(
+        'unread_user_replies', {}).get(chat_id_str, [])
+    return unread_user_replies[0]['id'] if unread_user_replies else None
+
+
+def _main_menu_cache_key(version: str, user_role: str, chat_id_str: str, bot_data: dict) -> tuple:
+    """Only the inputs the given role's menu actually shows, so unrelated changes keep hitting."""
+    is_primary_admin = app_config_holder.is_primary_admin(chat_id_str)
+    features = (app_config_holder.is_plex_enabled(), app_config_holder.is_radarr_enabled(),
+                app_config_holder.is_sonarr_enabled(), app_config_holder.is_abdm_enabled(),
+                app_config_holder.is_pc_control_enabled())
+    key = [version, user_role, is_primary_admin, features,
+           get_new_admin_ticket_id(chat_id_str)]
+    if user_role == app_config_holder.ROLE_ADMIN:
+        key.extend([get_service_status_emojis(bot_data), user_manager.get_last_startup_time_str(),
+                    get_pending_request_count(), app_ticket_store.count_admin_actionable_tickets()])
+    elif user_role == app_config_holder.ROLE_UNKNOWN:
+        key.append(str(chat_id_str) in user_manager.get_pending_access_requests())
+    if is_primary_admin:
+        key.extend([get_pending_access_request_count(),
+                    get_oldest_unread_reply_id(bot_data, chat_id_str)])
+    return tuple(key)
+
+
+def get_main_menu_content(version: str, user_role: str, chat_id_str: str, bot_data: dict) -> tuple[str, InlineKeyboardMarkup, str]:
+    """
+    Returns (menu_text, reply_markup, content_fingerprint), reusing a
+    previously rendered menu when none of its inputs changed. The fingerprint
+    is the one set_menu_fingerprint stores, so callers can detect an
+    unchanged menu without serializing the markup.
+    """
+    cache_key = _main_menu_cache_key(
+        version, user_role, str(chat_id_str), bot_data)
+    cached = _menu_render_cache.get(cache_key)
+    if cached is not None:
+        _menu_render_cache.move_to_end(cache_key)
+        MENU_RENDER_STATS["hits"] += 1
+        return cached
+    MENU_RENDER_STATS["misses"] += 1
+    menu_text, reply_markup = build_main_menu_content(
+        version, user_role, str(chat_id_str), bot_data)
+    rendered = (menu_text, reply_markup,
+                menu_content_fingerprint(menu_text, reply_markup))
+    _menu_render_cache[cache_key] = rendered
+    while len(_menu_render_cache) > MENU_RENDER_CACHE_MAX_ENTRIES:
+        _menu_render_cache.popitem(last=False)
+    return rendered
+
+
+def invalidate_main_menu_cache():
+    """Drops all rendered menus, e.g. after the configuration is reloaded."""
+    _menu_render_cache.clear()
+    MENU_RENDER_STATS["invalidations"] += 1
+
+
+def get_menu_render_stats() -> dict:
+    stats = dict(MENU_RENDER_STATS)
+    stats["entries"] = len(_menu_render_cache)
+    return stats
+
+
+def build_main_menu_content(version: str, user_role: str, chat_id_str: str, bot_data: dict):
+    is_primary_admin = app_config_holder.is_primary_admin(chat_id_str)
+    is_general_admin = (user_role == app_config_holder.ROLE_ADMIN)
+    is_standard_user = (user_role == app_config_holder.ROLE_STANDARD_USER)
+    is_unknown_user = (user_role == app_config_holder.ROLE_UNKNOWN)
+
+    plex_status_emoji, radarr_status_emoji, sonarr_status_emoji, abdm_status_emoji = \
+        get_service_status_emojis(bot_data)
 
     formatted_startup_time = "Unknown"
     iso_startup_timestamp = user_manager.get_last_startup_time_str()
@@ -131,7 +191,7 @@ def build_main_menu_content(version: str, user_role: str, chat_id_str: str, bot_
                 f"Error converting startup timestamp '{iso_startup_timestamp}': {e_time}", exc_info=True)
             formatted_startup_time = "Error Converting Time"
     else:
-        logger.info("Last startup time not yet recorded in bot_state.json.")
+        logger.info("Last startup time not yet recorded in bot state.")
         formatted_startup_time = "Not yet recorded"
 
     escaped_version = escape_md_v2(version)
@@ -258,18 +318,8 @@ def build_main_menu_content(version: str, user_role: str, chat_id_str: str, bot_
                         callback_data=CallbackData.CMD_SETTINGS.value)])
 
     # Check for open tickets initiated by admin for this user
-    support_tickets_store = bot_data.get('support_tickets', {})
-    user_has_new_ticket_from_admin = False
-    newest_ticket_id_from_admin = None
-
-    for ticket_id, ticket_data in support_tickets_store.items():
-        if ticket_data.get("user_chat_id") == chat_id_str and \
-           ticket_data.get("status") == "open_by_admin" and \
-           (not ticket_data.get("user_viewed_initial_admin_msg", False)):  # New flag to track if user saw it
-            user_has_new_ticket_from_admin = True
-            newest_ticket_id_from_admin = ticket_id  # Simplification: just link to one
-            break
-    if user_has_new_ticket_from_admin and newest_ticket_id_from_admin:
+    newest_ticket_id_from_admin = get_new_admin_ticket_id(chat_id_str)
+    if newest_ticket_id_from_admin:
         dynamic_menu_text += f"\n\n📬 *New ticket from Admin\\!*"
         view_message_button = [InlineKeyboardButton("✉️ View Ticket",
                                callback_data=f"{CallbackData.CMD_USER_VIEW_TICKET_PREFIX.value}{newest_ticket_id_from_admin}")]
@@ -278,16 +328,14 @@ def build_main_menu_content(version: str, user_role: str, chat_id_str: str, bot_
 
     # Check for unread user replies for the primary admin
     if is_primary_admin:
-        unread_user_replies = bot_data.get(
-            'unread_user_replies', {}).get(chat_id_str, [])
-        if unread_user_replies:  # Check if the list is not empty
-            # For simplicity, we'll just show one button to view the oldest reply.
-            # More complex logic could show a count or individual buttons if needed.
-            # Get the first (oldest) reply
-            oldest_unread_reply = unread_user_replies[0]
+        # For simplicity, we'll just show one button to view the oldest reply.
+        # More complex logic could show a count or individual buttons if needed.
+        oldest_unread_reply_id = get_oldest_unread_reply_id(
+            bot_data, chat_id_str)
+        if oldest_unread_reply_id:
             dynamic_menu_text += f"\n\n📬 *New reply from a user\\!*"
             view_reply_button = [InlineKeyboardButton("✉️ View User Reply",
-                                                      callback_data=f"{CallbackData.CMD_ADMIN_VIEW_USER_REPLY_PREFIX.value}{oldest_unread_reply['id']}")]
+                                                      callback_data=f"{CallbackData.CMD_ADMIN_VIEW_USER_REPLY_PREFIX.value}{oldest_unread_reply_id}")]
             keyboard.insert(0, view_reply_button)  # Add to the beginning
 
     if not keyboard:
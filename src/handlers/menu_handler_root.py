@@ -1,6 +1,5 @@
 
 import logging
-import os
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -13,6 +12,7 @@ from src.bot.bot_initialization import (
 )
 import src.app.app_config_holder as app_config_holder
 import src.app.user_manager as user_manager
+from src.app.app_service_executor import run_plex_call
 from src.handlers.radarr.menu_handler_radarr_add_search import handle_radarr_search_initiation
 from src.handlers.sonarr.menu_handler_sonarr_add_search import handle_sonarr_search_initiation
 from src.app.app_lifecycle import trigger_config_ui_from_bot
@@ -20,8 +20,7 @@ from src.config.config_definitions import SearchType
 from src.bot.bot_callback_data import CallbackData
 
 from src.handlers.menu_handler_launchers import display_launchers_menu
-from src.services.radarr.bot_radarr_add import get_movie_results_file_path_local as get_radarr_search_file_path
-from src.services.sonarr.bot_sonarr_add import get_show_results_file_path_local as get_sonarr_search_file_path
+import src.app.app_search_sessions as app_search_sessions
 
 from src.handlers.radarr.menu_handler_radarr_controls import display_radarr_controls_menu
 from src.handlers.sonarr.menu_handler_sonarr_controls import display_sonarr_controls_menu
@@ -212,15 +211,10 @@ async def main_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     elif data == CallbackData.RADARR_CANCEL.value or data == CallbackData.SONARR_CANCEL.value:
 
-        results_file_to_clean = get_radarr_search_file_path(
-        ) if data == CallbackData.RADARR_CANCEL.value else get_sonarr_search_file_path()
-        if os.path.exists(results_file_to_clean):
-            try:
-                os.remove(results_file_to_clean)
-                logger.info(
-                    f"Cleaned search results on cancel: {results_file_to_clean}")
-            except OSError as e:
-                logger.warning(f"Could not remove results on cancel: {e}")
+        search_kind_to_clean = app_search_sessions.SEARCH_KIND_RADARR if data == CallbackData.RADARR_CANCEL.value else app_search_sessions.SEARCH_KIND_SONARR
+        app_search_sessions.clear_search_results(search_kind_to_clean, chat_id)
+        logger.info(
+            f"Cleaned {search_kind_to_clean} search results for {chat_id} on cancel.")
         await show_or_edit_main_menu(str(chat_id), context, force_send_new=False)
         await send_or_edit_universal_status_message(context.bot, chat_id, "✅ Add/Request process cancelled.", parse_mode=None, force_send_new=False)
 
@@ -297,7 +291,7 @@ async def handle_pending_search(update: Update, context: ContextTypes.DEFAULT_TY
 
         if app_config_holder.is_plex_enabled():
             await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Searching Plex for: \"{query_text_raw}\"\\.\\.\\."), parse_mode="MarkdownV2")
-            search_results_data = search_plex_media(query_text_raw)
+            search_results_data = await run_plex_call(search_plex_media, query_text_raw)
 
             await display_plex_search_results(update, context, search_results_data)
         else:
@@ -16,6 +16,8 @@ from .menu_handler_pc_root import display_pc_control_categories_menu
 
 from src.app.app_lifecycle import _bot_application_instance_for_shutdown as global_app_instance
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -79,17 +81,19 @@ async def display_system_power_controls_menu(update: Update, context: ContextTyp
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (
-                final_menu_text_md2, reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                final_menu_text_md2, reply_markup)
 
-            if old_content_tuple != new_content_tuple:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id, message_id=menu_message_id,
                     text=final_menu_text_md2, reply_markup=reply_markup, parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
             await send_or_edit_universal_status_message(context.bot, chat_id, "System Power controls displayed. Use with caution.", parse_mode=None)
         except Exception as e:
             logger.error(
@@ -9,6 +9,8 @@ from src.bot.bot_message_persistence import load_menu_message_id
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -59,12 +61,13 @@ async def display_plex_controls_menu(update: Update, context: ContextTypes.DEFAU
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (
-                escaped_menu_title_for_display, reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title_for_display, reply_markup)
 
-            if old_content_tuple != new_content_tuple:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -72,7 +75,8 @@ async def display_plex_controls_menu(update: Update, context: ContextTypes.DEFAU
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
             await send_or_edit_universal_status_message(context.bot, chat_id, "Select a Plex control option.", parse_mode=None)
         except BadRequest as e:
             if "message is not modified" in str(e).lower():
@@ -9,11 +9,14 @@ from src.bot.bot_initialization import (
     send_or_edit_universal_status_message,
     show_or_edit_main_menu
 )
+from src.app.app_service_executor import run_plex_call
 from src.bot.bot_message_persistence import load_menu_message_id
 from src.services.plex.bot_plex_media_items import get_plex_item_details
 from src.services.plex.bot_plex_library import trigger_item_metadata_refresh
 from src.handlers.plex.menu_handler_plex_controls import display_plex_controls_menu
 from src.handlers.plex.menu_handler_plex_show_navigation import plex_search_list_seasons_callback
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +48,7 @@ async def plex_search_show_details_callback(update: Update, context: ContextType
 
     status_msg_fetching = f"⏳ Fetching details for Plex item \\(RK: {escape_md_v2(rating_key)}\\)\\.\\.\\."
     await send_or_edit_universal_status_message(context.bot, chat_id, status_msg_fetching, parse_mode="MarkdownV2")
-    item_data = get_plex_item_details(rating_key)
+    item_data = await run_plex_call(get_plex_item_details, rating_key)
 
     if "error" in item_data:
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(item_data["error"]), parse_mode="MarkdownV2")
@@ -131,11 +134,13 @@ async def plex_search_show_details_callback(update: Update, context: ContextType
     if menu_message_id:
         try:
             menu_display_title = escape_md_v2(PLEX_ITEM_DETAILS_TEXT_RAW)
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (menu_display_title, reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                menu_display_title, reply_markup)
 
-            if old_content_tuple != new_content_tuple:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -143,7 +148,8 @@ async def plex_search_show_details_callback(update: Update, context: ContextType
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
             logger.info(
                 f"Plex item details menu (type: {item_type_from_details}) displayed by editing message {menu_message_id}")
         except Exception as e:
@@ -184,7 +190,7 @@ async def plex_search_show_episode_details_callback(update: Update, context: Con
 
     status_msg_fetching_ep = f"⏳ Fetching details for Plex episode \\(RK: {escape_md_v2(episode_rating_key)}\\)\\.\\.\\."
     await send_or_edit_universal_status_message(context.bot, chat_id, status_msg_fetching_ep, parse_mode="MarkdownV2")
-    item_data = get_plex_item_details(episode_rating_key)
+    item_data = await run_plex_call(get_plex_item_details, episode_rating_key)
 
     if "error" in item_data:
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(item_data["error"]), parse_mode="MarkdownV2")
@@ -306,16 +312,19 @@ async def plex_search_show_episode_details_callback(update: Update, context: Con
     if menu_message_id:
         try:
             menu_display_title = escape_md_v2(PLEX_EPISODE_DETAILS_TEXT_RAW)
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (menu_display_title, reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                menu_display_title, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id, message_id=menu_message_id,
                     text=menu_display_title, reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except Exception as e:
             if "message is not modified" in str(e).lower():
                 logger.debug(
@@ -356,8 +365,8 @@ async def plex_search_refresh_item_metadata_callback(update: Update, context: Co
     status_msg_initiating_refresh = f"⏳ Initiating metadata refresh for item {escape_md_v2(rating_key)}\\.\\.\\."
     await send_or_edit_universal_status_message(context.bot, chat_id, status_msg_initiating_refresh, parse_mode="MarkdownV2")
 
-    refresh_result = trigger_item_metadata_refresh(
-        rating_key)
+    refresh_result = await run_plex_call(
+        trigger_item_metadata_refresh, rating_key)
     await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(refresh_result), parse_mode="MarkdownV2")
 
     class DummyQuery:
@@ -5,8 +5,10 @@ from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 
 import src.app.app_config_holder as app_config_holder
+import src.app.user_manager as user_manager
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
+from src.app.app_service_executor import run_plex_call
 from src.bot.bot_message_persistence import load_menu_message_id
 
 from src.services.plex.bot_plex_library import get_plex_libraries, trigger_library_scan, trigger_metadata_refresh
@@ -16,6 +18,8 @@ from src.handlers.plex.menu_handler_plex_controls import display_plex_controls_m
 from src.handlers.plex.menu_handler_plex_library_server_tools import display_plex_library_server_tools_menu
 
 from src.bot.bot_text_utils import escape_md_v2, escape_md_v1
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +70,7 @@ async def plex_now_playing_callback(update: Update, context: ContextTypes.DEFAUL
         await send_or_edit_universal_status_message(context.bot, chat_id, "ℹ️ Plex features are disabled.", parse_mode=None)
         return
 
-    now_playing_data = get_now_playing_structured()
+    now_playing_data = await run_plex_call(get_now_playing_structured)
 
     if "error" in now_playing_data:
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(now_playing_data["error"]), parse_mode="MarkdownV2")
@@ -102,6 +106,10 @@ async def plex_now_playing_callback(update: Update, context: ContextTypes.DEFAUL
             keyboard.append([InlineKeyboardButton(
                 button_text, callback_data=f"{CallbackData.CMD_PLEX_STOP_STREAM_PREFIX.value}{stop_identifier_for_cb}")])
 
+    notifications_enabled = user_manager.get_plex_stream_notifications(
+        str(chat_id))
+    keyboard.append([InlineKeyboardButton(f"{'🔔' if notifications_enabled else '🔕'} Stream Alerts: {'On' if notifications_enabled else 'Off'}",
+                    callback_data=CallbackData.CMD_PLEX_TOGGLE_STREAM_NOTIFICATIONS.value)])
     keyboard.append([InlineKeyboardButton("🔄 Refresh Now Playing",
                     callback_data=CallbackData.CMD_PLEX_VIEW_NOW_PLAYING.value)])
     keyboard.append([InlineKeyboardButton("🔙 Back to Plex Controls",
@@ -112,10 +120,12 @@ async def plex_now_playing_callback(update: Update, context: ContextTypes.DEFAUL
     if menu_message_id:
         try:
             escaped_menu_title = escape_md_v2(PLEX_NOW_PLAYING_TEXT_RAW)
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (escaped_menu_title, reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -123,7 +133,8 @@ async def plex_now_playing_callback(update: Update, context: ContextTypes.DEFAUL
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -182,8 +193,8 @@ async def plex_stop_stream_callback(update: Update, context: ContextTypes.DEFAUL
 
     await send_or_edit_universal_status_message(context.bot, chat_id, f"⏳ Attempting to stop stream \\({escape_md_v2(log_msg_ids_raw)}\\)\\.\\.\\.", parse_mode="MarkdownV2")
 
-    stop_result_mdv2_escaped = stop_plex_stream(
-        session_id_to_stop=session_id_to_stop, player_identifier_to_stop=player_id_to_stop)
+    stop_result_mdv2_escaped = await run_plex_call(
+        stop_plex_stream, session_id_to_stop=session_id_to_stop, player_identifier_to_stop=player_id_to_stop)
     logger.info(
         f"Plex stop_plex_stream result for {log_msg_ids_raw}: {stop_result_mdv2_escaped}")
 
@@ -207,6 +218,27 @@ async def plex_stop_stream_callback(update: Update, context: ContextTypes.DEFAUL
                 f"Secondary answerCallbackQuery for stop stream result failed: {e_ans}")
 
 
+async def plex_toggle_stream_notifications_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    query = update.callback_query
+    chat_id = update.effective_chat.id
+    user_role = app_config_holder.get_user_role(str(chat_id))
+
+    if user_role != app_config_holder.ROLE_ADMIN:
+        await query.answer()
+        logger.warning(
+            f"Plex stream alerts toggle attempt by non-admin {chat_id} (Role: {user_role}).")
+        await send_or_edit_universal_status_message(context.bot, chat_id, "⚠️ Access Denied. Plex stream alerts are for administrators.", parse_mode=None)
+        return
+
+    enabled = not user_manager.get_plex_stream_notifications(str(chat_id))
+    user_manager.set_plex_stream_notifications(str(chat_id), enabled)
+    await query.answer(text=f"Plex stream alerts {'enabled' if enabled else 'disabled'}.")
+    logger.info(
+        f"Plex stream alerts {'enabled' if enabled else 'disabled'} for admin {chat_id}.")
+
+    await plex_now_playing_callback(update, context, from_stop_action=True)
+
+
 async def plex_scan_libraries_select_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     chat_id = update.effective_chat.id
@@ -226,7 +258,7 @@ async def plex_scan_libraries_select_callback(update: Update, context: ContextTy
         await display_plex_library_server_tools_menu(update, context, called_internally=True)
         return
 
-    libraries = get_plex_libraries()
+    libraries = await run_plex_call(get_plex_libraries)
     if not libraries:
         await send_or_edit_universal_status_message(context.bot, chat_id, "ℹ️ No Plex libraries found or error fetching them.", parse_mode=None)
 
@@ -251,10 +283,12 @@ async def plex_scan_libraries_select_callback(update: Update, context: ContextTy
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (escaped_menu_title, reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -262,7 +296,8 @@ async def plex_scan_libraries_select_callback(update: Update, context: ContextTy
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
             await send_or_edit_universal_status_message(context.bot, chat_id, "Select a library to scan, or scan all.", parse_mode=None)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
@@ -309,8 +344,8 @@ async def plex_scan_library_execute_callback(update: Update, context: ContextTyp
     scan_target_msg_raw = "all libraries" if library_key_or_all == "all" else f"library key {library_key_or_all}"
     await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Initiating Plex scan for {scan_target_msg_raw}\\.\\.\\."), parse_mode="MarkdownV2")
 
-    scan_result_text_raw = trigger_library_scan(
-        library_key_or_all if library_key_or_all != "all" else None)
+    scan_result_text_raw = await run_plex_call(
+        trigger_library_scan, library_key_or_all if library_key_or_all != "all" else None)
     await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(scan_result_text_raw), parse_mode="MarkdownV2")
 
     await display_plex_library_server_tools_menu(update, context, called_internally=True)
@@ -335,7 +370,7 @@ async def plex_refresh_library_metadata_select_callback(update: Update, context:
         await display_plex_library_server_tools_menu(update, context, called_internally=True)
         return
 
-    libraries = get_plex_libraries()
+    libraries = await run_plex_call(get_plex_libraries)
     if not libraries:
         await send_or_edit_universal_status_message(context.bot, chat_id, "ℹ️ No Plex libraries found or error fetching them.", parse_mode=None)
 
@@ -361,10 +396,12 @@ async def plex_refresh_library_metadata_select_callback(update: Update, context:
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (escaped_menu_title, reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -372,7 +409,8 @@ async def plex_refresh_library_metadata_select_callback(update: Update, context:
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
             await send_or_edit_universal_status_message(context.bot, chat_id, "Select a library to refresh metadata, or refresh all.", parse_mode=None)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
@@ -419,8 +457,8 @@ async def plex_refresh_library_metadata_execute_callback(update: Update, context
     refresh_target_msg_raw = "all eligible libraries" if library_key_or_all == "all" else f"library key {library_key_or_all}"
     await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Initiating Plex metadata refresh for {refresh_target_msg_raw}\\.\\.\\."), parse_mode="MarkdownV2")
 
-    refresh_result_text_raw = trigger_metadata_refresh(
-        library_key_or_all if library_key_or_all != "all" else None)
+    refresh_result_text_raw = await run_plex_call(
+        trigger_metadata_refresh, library_key_or_all if library_key_or_all != "all" else None)
     await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(refresh_result_text_raw), parse_mode="MarkdownV2")
 
     await display_plex_library_server_tools_menu(update, context, called_internally=True)
@@ -8,10 +8,13 @@ import src.app.app_config_holder as app_config_holder
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_message_persistence import load_menu_message_id
+from src.app.app_service_executor import run_plex_call
 from src.services.plex.bot_plex_library import get_plex_libraries
 from src.services.plex.bot_plex_media_items import get_recently_added_from_library
 
 from src.handlers.plex.menu_handler_plex_controls import display_plex_controls_menu
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +41,7 @@ async def plex_recently_added_select_library_callback(update: Update, context: C
         await send_or_edit_universal_status_message(context.bot, chat_id, "ℹ️ Plex features are disabled.", parse_mode=None)
         return
 
-    libraries = get_plex_libraries()
+    libraries = await run_plex_call(get_plex_libraries)
     if not libraries:
         await send_or_edit_universal_status_message(context.bot, chat_id, "ℹ️ No Plex libraries found or error fetching them.", parse_mode=None)
 
@@ -62,10 +65,12 @@ async def plex_recently_added_select_library_callback(update: Update, context: C
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (escaped_menu_title, reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -73,7 +78,8 @@ async def plex_recently_added_select_library_callback(update: Update, context: C
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
             else:
                 logger.debug(
                     f"Plex library list for recently added (message {menu_message_id}) is already up to date.")
@@ -157,7 +163,7 @@ async def plex_recently_added_show_results_menu(update: Update, context: Context
         return
 
     library_name_raw = "Selected Library"
-    libs = get_plex_libraries()
+    libs = await run_plex_call(get_plex_libraries)
     for lib_item in libs:
         if str(lib_item.get('key')) == library_key:
             library_name_raw = lib_item.get('title', library_name_raw)
@@ -170,8 +176,8 @@ async def plex_recently_added_show_results_menu(update: Update, context: Context
     if not all_items or query.data.startswith(CallbackData.CMD_PLEX_RECENTLY_ADDED_SHOW_ITEMS_FOR_LIB_PREFIX.value):
         await send_or_edit_universal_status_message(context.bot, chat_id, f"⏳ Fetching recently added for '{escaped_library_name_status_v2}'\\.\\.\\.", parse_mode="MarkdownV2")
         max_fetch = app_config_holder.get_add_media_max_search_results()
-        results_data = get_recently_added_from_library(
-            library_key, max_items=max_fetch)
+        results_data = await run_plex_call(
+            get_recently_added_from_library, library_key, max_items=max_fetch)
 
         if "error" in results_data:
             await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(results_data["error"]), parse_mode="MarkdownV2")
@@ -244,11 +250,13 @@ async def plex_recently_added_show_results_menu(update: Update, context: Context
                 total_pages=escape_md_v2(str(total_pages))
             )
 
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (menu_text_display, reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                menu_text_display, reply_markup)
 
-            if old_content_tuple != new_content_tuple:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -256,7 +264,8 @@ async def plex_recently_added_show_results_menu(update: Update, context: Context
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except Exception as e:
             if "message is not modified" in str(e).lower():
                 logger.debug(
@@ -5,6 +5,7 @@ from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 
 import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_plex_call, run_radarr_call, run_sonarr_call
 from src.bot.bot_message_persistence import load_menu_message_id
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_callback_data import CallbackData
@@ -21,6 +22,8 @@ from src.services.plex.bot_plex_library import get_plex_libraries, format_bytes_
 from src.handlers.plex.menu_handler_plex_library_server_tools import display_plex_library_server_tools_menu
 
 from src.handlers.plex.menu_handler_plex_main import _truncate_button_text_plex_lib
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -92,17 +95,20 @@ async def display_plex_server_tools_sub_menu(update: Update, context: ContextTyp
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (menu_text_display, reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                menu_text_display, reply_markup)
 
-            if old_content_tuple != new_content_tuple:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id, message_id=menu_message_id,
                     text=menu_text_display,
                     reply_markup=reply_markup, parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
 
             await send_or_edit_universal_status_message(context.bot, chat_id, status_update_text, parse_mode=None)
 
@@ -152,16 +158,16 @@ async def handle_plex_server_action(update: Update, context: ContextTypes.DEFAUL
     if callback_data_str == CallbackData.CMD_PLEX_CLEAN_BUNDLES.value:
         action_status_message_raw = "⏳ Initiating Plex 'Clean Bundles'..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_status_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = clean_plex_bundles()
+        result_message_raw = await run_plex_call(clean_plex_bundles)
     elif callback_data_str == CallbackData.CMD_PLEX_OPTIMIZE_DB.value:
         action_status_message_raw = "⏳ Initiating Plex 'Optimize Database'..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_status_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = optimize_plex_database()
+        result_message_raw = await run_plex_call(optimize_plex_database)
     elif callback_data_str == CallbackData.CMD_PLEX_SERVER_INFO.value:
         action_status_message_raw = "⏳ Fetching Plex server & library info..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_status_message_raw), parse_mode="MarkdownV2")
 
-        server_info_data = get_plex_server_info_formatted()
+        server_info_data = await run_plex_call(get_plex_server_info_formatted)
 
         info_parts_display = []
 
@@ -173,7 +179,8 @@ async def handle_plex_server_action(update: Update, context: ContextTypes.DEFAUL
                 value_v2 = escape_md_v2(str(value_raw))
                 info_parts_display.append(f"  *{key_v2}:*\n    {value_v2}")
 
-            all_libraries_detailed = get_plex_libraries(force_refresh=True)
+            all_libraries_detailed = await run_plex_call(
+                get_plex_libraries, force_refresh=True)
             library_stats = {"movie": {"count": 0}, "show": {
                 "count": 0}, "artist": {"count": 0}}
             if all_libraries_detailed:
@@ -200,7 +207,7 @@ async def handle_plex_server_action(update: Update, context: ContextTypes.DEFAUL
 
             if app_config_holder.is_sonarr_enabled():
                 from src.services.sonarr.bot_sonarr_manage import get_sonarr_library_stats
-                sonarr_stats = get_sonarr_library_stats()
+                sonarr_stats = await run_sonarr_call(get_sonarr_library_stats)
                 info_parts_display.append(
                     f"\n*{escape_md_v2('Sonarr Managed:')}*")
                 if not sonarr_stats.get("error"):
@@ -215,14 +222,23 @@ async def handle_plex_server_action(update: Update, context: ContextTypes.DEFAUL
 
             if app_config_holder.is_radarr_enabled():
                 from src.services.radarr.bot_radarr_manage import get_radarr_library_stats
-                radarr_stats = get_radarr_library_stats()
+                radarr_stats = await run_radarr_call(get_radarr_library_stats)
                 info_parts_display.append(
                     f"\n*{escape_md_v2('Radarr Managed:')}*")
                 if not radarr_stats.get("error"):
                     info_parts_display.extend([
-                        f"  Movies: {escape_md_v2(str(radarr_stats['total_movies']))}",
+                        f"  Movies: {escape_md_v2(str(radarr_stats['total_movies']))} {escape_md_v2('(' + str(radarr_stats['movies_with_files']) + ' on disk)')}",
                         f"  Disk Usage: {escape_md_v2(format_bytes_to_readable(radarr_stats['total_size_on_disk_bytes']))}"
                     ])
+                    for breakdown_title, breakdown in (("By Root Folder:", radarr_stats["by_root_folder"]),
+                                                       ("By Quality Profile:", radarr_stats["by_quality_profile"])):
+                        if len(breakdown) < 2:
+                            continue
+                        info_parts_display.append(
+                            f"  _{escape_md_v2(breakdown_title)}_")
+                        for group_name, group_stats in sorted(breakdown.items(), key=lambda item: -item[1]["size_on_disk_bytes"]):
+                            info_parts_display.append(
+                                f"    {escape_md_v2(str(group_name))}: {escape_md_v2(str(group_stats['movies']))}, {escape_md_v2(format_bytes_to_readable(group_stats['size_on_disk_bytes']))}")
                 else:
                     info_parts_display.append(
                         f"  {escape_md_v2(radarr_stats.get('error'))}")
@@ -260,7 +276,7 @@ async def plex_empty_trash_select_library_callback(update: Update, context: Cont
         await display_plex_server_tools_sub_menu(update, context)
         return
 
-    libraries = get_plex_libraries()
+    libraries = await run_plex_call(get_plex_libraries)
     if not libraries:
         await send_or_edit_universal_status_message(context.bot, chat_id, "ℹ️ No Plex libraries found or error fetching them.", parse_mode=None)
 
@@ -285,10 +301,12 @@ async def plex_empty_trash_select_library_callback(update: Update, context: Cont
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (escaped_menu_title, reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -296,7 +314,8 @@ async def plex_empty_trash_select_library_callback(update: Update, context: Cont
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
             await send_or_edit_universal_status_message(context.bot, chat_id, "Select a library to empty its trash, or all.", parse_mode=None)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
@@ -343,8 +362,8 @@ async def plex_empty_trash_execute_callback(update: Update, context: ContextType
     target_raw = "all libraries" if library_key_or_all == "all" else f"library key {library_key_or_all}"
     await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Initiating Plex 'Empty Trash' for {target_raw}\\.\\.\\."), parse_mode="MarkdownV2")
 
-    result_message_raw = empty_plex_trash(
-        library_key_or_all if library_key_or_all != "all" else None)
+    result_message_raw = await run_plex_call(
+        empty_plex_trash, library_key_or_all if library_key_or_all != "all" else None)
     await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(result_message_raw), parse_mode="MarkdownV2")
 
     await display_plex_server_tools_sub_menu(update, context)
@@ -7,9 +7,12 @@ from src.bot.bot_text_utils import escape_md_v1, escape_md_v2
 import src.app.app_config_holder as app_config_holder
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
+from src.app.app_service_executor import run_plex_call
 from src.bot.bot_message_persistence import load_menu_message_id
 from src.services.plex.bot_plex_media_items import get_plex_show_seasons, get_plex_season_episodes
 from src.handlers.plex.menu_handler_plex_controls import display_plex_controls_menu
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +45,7 @@ async def plex_search_list_seasons_callback(update: Update, context: ContextType
 
     status_msg_fetching_seasons = f"⏳ Fetching seasons for show RK: {escape_md_v2(show_rating_key)}\\.\\.\\."
     await send_or_edit_universal_status_message(context.bot, chat_id, status_msg_fetching_seasons, parse_mode="MarkdownV2")
-    seasons_data_result = get_plex_show_seasons(show_rating_key)
+    seasons_data_result = await run_plex_call(get_plex_show_seasons, show_rating_key)
 
     if "error" in seasons_data_result:
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(seasons_data_result["error"]), parse_mode="MarkdownV2")
@@ -100,10 +103,12 @@ async def plex_search_list_seasons_callback(update: Update, context: ContextType
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (menu_text_display, reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                menu_text_display, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -111,7 +116,8 @@ async def plex_search_list_seasons_callback(update: Update, context: ContextType
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
 
             if seasons:
                 await send_or_edit_universal_status_message(context.bot, chat_id, f"Displaying seasons for '{escape_md_v2(show_title_raw)}'\\.", parse_mode="MarkdownV2")
@@ -172,8 +178,8 @@ async def plex_search_list_episodes_callback(update: Update, context: ContextTyp
 
     status_msg_fetching_eps = f"⏳ Fetching episodes for S{escape_md_v2(season_number_str)} of show RK: {escape_md_v2(show_rating_key)}\\.\\.\\."
     await send_or_edit_universal_status_message(context.bot, chat_id, status_msg_fetching_eps, parse_mode="MarkdownV2")
-    episodes_data_result = get_plex_season_episodes(
-        show_rating_key, season_number_str)
+    episodes_data_result = await run_plex_call(
+        get_plex_season_episodes, show_rating_key, season_number_str)
 
     if "error" in episodes_data_result:
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(episodes_data_result["error"]), parse_mode="MarkdownV2")
@@ -241,10 +247,12 @@ async def plex_search_list_episodes_callback(update: Update, context: ContextTyp
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (menu_text_display, reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                menu_text_display, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=menu_message_id,
@@ -252,7 +260,8 @@ async def plex_search_list_episodes_callback(update: Update, context: ContextTyp
                     reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except Exception as e:
             if "message is not modified" in str(e).lower():
                 logger.debug(
@@ -6,14 +6,18 @@ from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 
 import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_radarr_call
 from src.bot.bot_message_persistence import load_menu_message_id
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_callback_data import CallbackData
-from src.services.radarr.bot_radarr_manage import get_radarr_queue
+from src.services.radarr.bot_radarr_manage import get_radarr_queue, QUEUE_SERVICE_NAME
+from src.services.bot_queue_monitor import watch_queue, update_queue_watch, unwatch_queue
+from src.bot.bot_outbound_queue import queue_message_edit, PRIORITY_BACKGROUND, cancel_message_edit
 
 from src.handlers.radarr.menu_handler_radarr_controls import display_radarr_controls_menu
 
 from src.bot.bot_text_utils import escape_md_v2, escape_md_v1
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint, forget_menu_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,52 @@ DEFAULT_PAGE_SIZE_CONFIG_KEY = "ADD_MEDIA_ITEMS_PER_PAGE"
 DEFAULT_PAGE_SIZE_FALLBACK = 5
 
 
+def _build_radarr_queue_keyboard(queue_data: dict) -> tuple:
+    """(menu title, reply markup) for a page returned by get_radarr_queue."""
+    items = queue_data['records']
+    total_records = queue_data.get('totalRecords', 0)
+    current_page = queue_data.get('page', 1)
+    page_size = queue_data.get('pageSize') or DEFAULT_PAGE_SIZE_FALLBACK
+    total_pages = math.ceil(
+        total_records / page_size) if total_records > 0 else 1
+
+    menu_title_text_raw = RADARR_QUEUE_MENU_TEXT_TEMPLATE_RAW.format(
+        current_page=current_page, total_pages=total_pages)
+
+    keyboard = []
+    for item in items:
+        progress_percent_raw = f"{item.progress:.1f}%"
+
+        display_text = f"{item.title} ({item.status} - {progress_percent_raw} - {item.timeleft})"
+        if len(display_text) > 50:
+            display_text = display_text[:47] + \
+                "..."
+
+        callback_payload = f"{item.id}_{item.media_id or 0}"
+        keyboard.append([InlineKeyboardButton(
+            f"➡️ {display_text}", callback_data=f"{CallbackData.CMD_RADARR_QUEUE_ITEM_ACTIONS_MENU_PREFIX.value}{callback_payload}")])
+
+    pagination_row = []
+    if current_page > 1:
+        pagination_row.append(InlineKeyboardButton(
+            "◀️ Prev", callback_data=f"{CallbackData.CMD_RADARR_QUEUE_PAGE_PREFIX.value}{current_page-1}"))
+    if current_page < total_pages:
+        pagination_row.append(InlineKeyboardButton(
+            "Next ▶️", callback_data=f"{CallbackData.CMD_RADARR_QUEUE_PAGE_PREFIX.value}{current_page+1}"))
+    if pagination_row:
+        keyboard.append(pagination_row)
+
+    keyboard.append([InlineKeyboardButton(
+        "🔄 Refresh Queue", callback_data=CallbackData.CMD_RADARR_QUEUE_REFRESH.value)])
+    keyboard.append([InlineKeyboardButton("🔙 Back to Radarr Controls",
+                    callback_data=CallbackData.CMD_RADARR_CONTROLS.value)])
+    return menu_title_text_raw, InlineKeyboardMarkup(keyboard)
+
+
+def _escape_queue_menu_title(menu_title_text_raw: str) -> str:
+    return escape_md_v2(menu_title_text_raw.replace("(", "\\(").replace(")", "\\)"))
+
+
 async def display_radarr_queue_menu(update: Update, context: ContextTypes.DEFAULT_TYPE, page: int = 1) -> None:
     query = update.callback_query
     chat_id = update.effective_chat.id
@@ -49,107 +99,60 @@ async def display_radarr_queue_menu(update: Update, context: ContextTypes.DEFAUL
 
     items_per_page = app_config_holder.get_add_media_items_per_page(
     ) or DEFAULT_PAGE_SIZE_FALLBACK
-    queue_data = get_radarr_queue(page=page, page_size=items_per_page)
-    keyboard = []
-    menu_title_text_raw = "📥 Radarr - Download Queue"
-
-    if queue_data and 'records' in queue_data:
-        items = queue_data['records']
-        total_records = queue_data.get('totalRecords', 0)
-        current_page = queue_data.get('page', page)
-        page_size_from_api = queue_data.get('pageSize', items_per_page)
-        total_pages = math.ceil(
-            total_records / page_size_from_api) if total_records > 0 else 1
-
-        menu_title_text_raw = RADARR_QUEUE_MENU_TEXT_TEMPLATE_RAW.format(
-            current_page=current_page, total_pages=total_pages)
-
-        context.user_data['radarr_queue_current_page'] = current_page
-
-        status_msg_raw = f"Displaying page {current_page} of {total_pages} for Radarr queue."
-        if is_refresh_call:
-            status_msg_raw = f"🔄 Radarr queue refreshed. {status_msg_raw}"
-        if not items and total_records == 0:
-            status_msg_raw = "✅ Radarr download queue is empty."
-        elif not items and current_page > 1:
-            status_msg_raw = "ℹ️ No more items on this page of Radarr queue."
-        await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(status_msg_raw), parse_mode="MarkdownV2")
-
-        for item in items:
-            if not isinstance(item, dict):
-                logger.warning(
-                    f"Skipping non-dict item in Radarr queue: {item}")
-                continue
-            movie_info = item.get('movie', {})
-
-            title_raw = movie_info.get(
-                'title', item.get('title', 'Unknown Movie'))
-            status_raw = item.get('status', 'N/A')
-            progress_value = 0.0
-            if 'sizeleft' in item and 'size' in item and item.get('size', 0) > 0:
-                progress_value = (
-                    (item['size'] - item['sizeleft']) / item['size']) * 100.0
-            elif 'progress' in item:
-                progress_value = item.get('progress', 0.0)
-            progress_percent_raw = f"{progress_value:.1f}%"
-            timeleft_raw = item.get('timeleft', 'N/A')
-
-            item_id_for_actions = str(item.get('id'))
-
-            movie_id_for_search = str(
-                movie_info.get('id', item.get('movieId', '0')))
-
-            display_text = f"{title_raw} ({status_raw} - {progress_percent_raw} - {timeleft_raw})"
-            if len(display_text) > 50:
-                display_text = display_text[:47] + \
-                    "..."
-
-            callback_payload = f"{item_id_for_actions}_{movie_id_for_search}"
-            keyboard.append([InlineKeyboardButton(
-                f"➡️ {display_text}", callback_data=f"{CallbackData.CMD_RADARR_QUEUE_ITEM_ACTIONS_MENU_PREFIX.value}{callback_payload}")])
-
-        pagination_row = []
-        if current_page > 1:
-            pagination_row.append(InlineKeyboardButton(
-                "◀️ Prev", callback_data=f"{CallbackData.CMD_RADARR_QUEUE_PAGE_PREFIX.value}{current_page-1}"))
-        if current_page < total_pages:
-            pagination_row.append(InlineKeyboardButton(
-                "Next ▶️", callback_data=f"{CallbackData.CMD_RADARR_QUEUE_PAGE_PREFIX.value}{current_page+1}"))
-        if pagination_row:
-            keyboard.append(pagination_row)
-    else:
+    # Pages come from the shared queue snapshot, so page flips and refreshes
+    # by any number of admins cost at most one /queue call per snapshot age.
+    queue_data = await run_radarr_call(
+        get_radarr_queue, page=page, page_size=items_per_page)
+
+    if queue_data.get("error") or 'records' not in queue_data:
         error_msg_raw = queue_data.get(
             "error", "⚠️ Could not fetch Radarr queue.")
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(error_msg_raw), parse_mode="MarkdownV2")
         await display_radarr_controls_menu(update, context)
         return
 
-    keyboard.append([InlineKeyboardButton(
-        "🔄 Refresh Queue", callback_data=CallbackData.CMD_RADARR_QUEUE_REFRESH.value)])
-    keyboard.append([InlineKeyboardButton("🔙 Back to Radarr Controls",
-                    callback_data=CallbackData.CMD_RADARR_CONTROLS.value)])
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    items = queue_data['records']
+    total_records = queue_data.get('totalRecords', 0)
+    current_page = queue_data.get('page', page)
+    menu_title_text_raw, reply_markup = _build_radarr_queue_keyboard(
+        queue_data)
+    total_pages = math.ceil(
+        total_records / queue_data['pageSize']) if total_records > 0 else 1
+
+    context.user_data['radarr_queue_current_page'] = current_page
+
+    status_msg_raw = f"Displaying page {current_page} of {total_pages} for Radarr queue."
+    if is_refresh_call:
+        status_msg_raw = f"🔄 Radarr queue refreshed. {status_msg_raw}"
+    if not items and total_records == 0:
+        status_msg_raw = "✅ Radarr download queue is empty."
+    elif not items and current_page > 1:
+        status_msg_raw = "ℹ️ No more items on this page of Radarr queue."
+    await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(status_msg_raw), parse_mode="MarkdownV2")
 
     menu_message_id = load_menu_message_id(str(chat_id))
     if not menu_message_id and context.bot_data:
         menu_message_id = context.bot_data.get(
             f"main_menu_message_id_{chat_id}")
 
-    escaped_menu_title_display = escape_md_v2(
-        menu_title_text_raw.replace("(", "\\(").replace(")", "\\)"))
+    escaped_menu_title_display = _escape_queue_menu_title(menu_title_text_raw)
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (escaped_menu_title_display,
-                                 reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title_display, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id, message_id=menu_message_id,
                     text=escaped_menu_title_display, reply_markup=reply_markup, parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
+            watch_queue(QUEUE_SERVICE_NAME, chat_id, current_page,
+                        menu_message_id, new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -161,3 +164,49 @@ async def display_radarr_queue_menu(update: Update, context: ContextTypes.DEFAUL
         logger.error("Cannot find menu_message_id for Radarr Queue menu.")
 
         await show_or_edit_main_menu(str(chat_id), context, force_send_new=True)
+
+
+async def push_radarr_queue_update(application, chat_id_str: str, watch: dict) -> None:
+    """
+    Re-renders a watched queue page from the current snapshot. Called by the
+    queue monitor job after the queue changed; a chat whose menu now shows
+    something else is dropped from the watchers instead.
+    """
+    chat_id = int(chat_id_str)
+    menu_message_id = watch["message_id"]
+    if get_menu_fingerprint(application.bot_data, chat_id, menu_message_id) != watch["fingerprint"]:
+        unwatch_queue(QUEUE_SERVICE_NAME, chat_id_str)
+        return
+
+    items_per_page = app_config_holder.get_add_media_items_per_page(
+    ) or DEFAULT_PAGE_SIZE_FALLBACK
+    queue_data = await run_radarr_call(
+        get_radarr_queue, page=watch["page"], page_size=items_per_page)
+    if queue_data.get("error") or 'records' not in queue_data:
+        return
+    menu_title_text_raw, reply_markup = _build_radarr_queue_keyboard(
+        queue_data)
+    escaped_menu_title_display = _escape_queue_menu_title(menu_title_text_raw)
+    new_content_fingerprint = menu_content_fingerprint(
+        escaped_menu_title_display, reply_markup)
+    if new_content_fingerprint == watch["fingerprint"]:
+        return
+
+    async def on_edit_failure(error):
+        forget_menu_fingerprint(application.bot_data,
+                                chat_id, menu_message_id)
+        unwatch_queue(QUEUE_SERVICE_NAME, chat_id_str)
+
+    def on_edit_dropped():
+        # Nothing was shown, so the next poll has to edit again.
+        forget_menu_fingerprint(application.bot_data,
+                                chat_id, menu_message_id)
+        update_queue_watch(QUEUE_SERVICE_NAME, chat_id_str, None)
+
+    queue_message_edit(application.bot, chat_id, menu_message_id, {
+        "text": escaped_menu_title_display, "reply_markup": reply_markup, "parse_mode": "MarkdownV2"
+    }, priority=PRIORITY_BACKGROUND, on_failure=on_edit_failure, on_dropped=on_edit_dropped)
+    set_menu_fingerprint(application.bot_data, chat_id,
+                         menu_message_id, new_content_fingerprint)
+    update_queue_watch(QUEUE_SERVICE_NAME, chat_id_str,
+                       new_content_fingerprint)
@@ -4,6 +4,7 @@ from telegram import Update
 from telegram.ext import ContextTypes
 
 import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_radarr_call
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_callback_data import CallbackData
 from src.services.radarr.bot_radarr_manage import (
@@ -53,19 +54,19 @@ async def handle_radarr_library_action(update: Update, context: ContextTypes.DEF
     if callback_data_str == CallbackData.CMD_RADARR_SCAN_FILES.value:
         action_message_raw = "⏳ Initiating Radarr disk rescan for all movies..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = rescan_all_movies()
+        result_message_raw = await run_radarr_call(rescan_all_movies)
 
         await display_radarr_library_maintenance_menu(update, context)
     elif callback_data_str == CallbackData.CMD_RADARR_UPDATE_METADATA.value:
         action_message_raw = "⏳ Initiating Radarr metadata refresh for all movies..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = refresh_all_movies()
+        result_message_raw = await run_radarr_call(refresh_all_movies)
 
         await display_radarr_library_maintenance_menu(update, context)
     elif callback_data_str == CallbackData.CMD_RADARR_RENAME_FILES.value:
         action_message_raw = "⏳ Initiating Radarr movie file renaming..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = rename_all_movie_files()
+        result_message_raw = await run_radarr_call(rename_all_movie_files)
 
         await display_radarr_library_maintenance_menu(update, context)
     elif callback_data_str.startswith(CallbackData.CMD_RADARR_QUEUE_ITEM_ACTIONS_MENU_PREFIX.value):
@@ -101,8 +102,8 @@ async def handle_radarr_library_action(update: Update, context: ContextTypes.DEF
             CallbackData.CMD_RADARR_QUEUE_ITEM_REMOVE_NO_BLOCKLIST_PREFIX.value, ""))
 
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Removing item {queue_item_id} (no blocklist)..."), parse_mode="MarkdownV2")
-        result_message_raw = radarr_remove_queue_item(
-            queue_item_id, blocklist=False)
+        result_message_raw = await run_radarr_call(
+            radarr_remove_queue_item, queue_item_id, blocklist=False)
         if context.user_data.get('current_queue_action_item'):
             del context.user_data['current_queue_action_item']
 
@@ -112,8 +113,8 @@ async def handle_radarr_library_action(update: Update, context: ContextTypes.DEF
             CallbackData.CMD_RADARR_QUEUE_ITEM_BLOCKLIST_ONLY_PREFIX.value, "")
 
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Blocklisting item {queue_item_id} (no search)..."), parse_mode="MarkdownV2")
-        blocklist_success, result_message_raw = radarr_remove_queue_item(
-            queue_item_id, blocklist=True)
+        blocklist_success, result_message_raw = await run_radarr_call(
+            radarr_remove_queue_item, queue_item_id, blocklist=True)
 
         if context.user_data.get('current_queue_action_item'):
             del context.user_data['current_queue_action_item']
@@ -127,14 +128,14 @@ async def handle_radarr_library_action(update: Update, context: ContextTypes.DEF
         media_search_id = parts[1] if len(parts) > 1 else "0"
 
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Blocklisting item {queue_item_id} and searching again..."), parse_mode="MarkdownV2")
-        result_message_raw = radarr_remove_queue_item(
-            queue_item_id, blocklist=True)
+        result_message_raw = await run_radarr_call(
+            radarr_remove_queue_item, queue_item_id, blocklist=True)
 
         if "✅" in result_message_raw and media_search_id != "0":
             try:
                 radarr_movie_id_for_search = int(media_search_id)
-                search_msg_raw = radarr_trigger_movie_search(
-                    radarr_movie_id_for_search)
+                search_msg_raw = await run_radarr_call(
+                    radarr_trigger_movie_search, radarr_movie_id_for_search)
 
                 result_message_raw += f"\n{search_msg_raw}"
             except ValueError:
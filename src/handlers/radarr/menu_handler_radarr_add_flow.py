@@ -12,9 +12,9 @@ from src.services.radarr.bot_radarr_add import (
     add_movie as radarr_add_movie_func,
     get_root_folders, get_quality_profiles, get_tags,
     get_default_root_folder_id, get_default_quality_profile_id,
-    get_minimum_availability_options
+    get_minimum_availability_options, lookup_movie_by_tmdb_id
 )
-from src.services.radarr.bot_radarr_core import _radarr_request as radarr_api_get
+from src.app.app_service_executor import run_radarr_call
 from src.bot.bot_initialization import (
     show_or_edit_main_menu,
     send_or_edit_universal_status_message,
@@ -22,7 +22,9 @@ from src.bot.bot_initialization import (
 )
 from src.bot.bot_callback_data import CallbackData
 import src.app.app_config_holder as app_config_holder
-from src.app.app_file_utils import load_requests_data, save_requests_data
+import src.app.app_request_store as app_request_store
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -116,8 +118,8 @@ async def radarr_movie_selection_callback(update: Update, context: ContextTypes.
         raw_overview = "Overview not available."
         has_collection_info = False
         try:
-            lookup_response = radarr_api_get(
-                'get', f'/movie/lookup/tmdb?tmdbId={tmdb_id}')
+            lookup_response = await run_radarr_call(
+                lookup_movie_by_tmdb_id, tmdb_id)
             if isinstance(lookup_response, list) and lookup_response:
                 movie_api_details = lookup_response[0]
             elif isinstance(lookup_response, dict):
@@ -222,6 +224,7 @@ async def radarr_movie_selection_callback(update: Update, context: ContextTypes.
 
         final_msg_text = "".join(msg_text_parts)
 
+        cancel_message_edit(chat_id, query.message.message_id)
         await context.bot.edit_message_text(
             chat_id=chat_id,
             message_id=query.message.message_id,
@@ -229,8 +232,8 @@ async def radarr_movie_selection_callback(update: Update, context: ContextTypes.
             reply_markup=reply_markup,
             parse_mode="MarkdownV2"
         )
-        context.bot_data[f"menu_message_content_{chat_id}_{query.message.message_id}"] = (
-            final_msg_text, reply_markup.to_json())
+        set_menu_fingerprint(context.bot_data, chat_id, query.message.message_id,
+                             menu_content_fingerprint(final_msg_text, reply_markup))
 
     except (IndexError, ValueError, KeyError) as e:
         logger.error(
@@ -254,11 +257,12 @@ async def display_radarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
         step_counter = 1
         text_parts.append(escape_md_v2(
             f"**Step {step_counter}: Select Root Folder**"))
-        root_folders = get_root_folders()
+        root_folders = await run_radarr_call(get_root_folders)
         if not root_folders:
             err_text = "Error: Could not fetch root folders from Radarr."
             logger.error(err_text)
             if message_id:
+                cancel_message_edit(chat_id, message_id)
                 await context.bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=escape_md_v2(err_text), reply_markup=None, parse_mode="MarkdownV2")
             return
         for rf in root_folders:
@@ -268,10 +272,11 @@ async def display_radarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
         step_counter = 2
         text_parts.append(escape_md_v2(
             f"**Step {step_counter}: Select Quality Profile**"))
-        quality_profiles = get_quality_profiles()
+        quality_profiles = await run_radarr_call(get_quality_profiles)
         if not quality_profiles:
             err_text = "Error: Could not fetch quality profiles from Radarr."
             if message_id:
+                cancel_message_edit(chat_id, message_id)
                 await context.bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=escape_md_v2(err_text), reply_markup=None, parse_mode="MarkdownV2")
             return
         for qp in quality_profiles:
@@ -303,7 +308,7 @@ async def display_radarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
         step_counter = 5 if not flow_data.get('movie_has_collection') else 6
         text_parts.append(escape_md_v2(
             f"**Step {step_counter}: Select Tags (Optional)**\n_Choose multiple then 'Done with Tags'_"))
-        all_tags = get_tags()
+        all_tags = await run_radarr_call(get_tags)
         current_tags_ids = flow_data.get('tags', [])
         if all_tags:
             for tag_idx, tag in enumerate(all_tags):
@@ -329,7 +334,7 @@ async def display_radarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
 
         rf_path_display = "Default (Not Set)"
         if rf_id:
-            all_rf_confirm = get_root_folders()
+            all_rf_confirm = await run_radarr_call(get_root_folders)
             sel_rf_confirm = next(
                 (r for r in all_rf_confirm if r['id'] == rf_id), None)
             if sel_rf_confirm:
@@ -338,7 +343,7 @@ async def display_radarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
 
         qp_name_display = "Default (Not Set)"
         if qp_id:
-            all_qp_confirm = get_quality_profiles()
+            all_qp_confirm = await run_radarr_call(get_quality_profiles)
             sel_qp_confirm = next(
                 (q for q in all_qp_confirm if q['id'] == qp_id), None)
             if sel_qp_confirm:
@@ -355,7 +360,7 @@ async def display_radarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
 
         tags_str_display = "None"
         if tags_ids:
-            all_tags_api_confirm = get_tags()
+            all_tags_api_confirm = await run_radarr_call(get_tags)
             sel_tag_labels = [t['label']
                               for t in all_tags_api_confirm if t['id'] in tags_ids]
             if sel_tag_labels:
@@ -384,9 +389,10 @@ async def display_radarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
 
     try:
         if message_id:
+            cancel_message_edit(chat_id, message_id)
             await context.bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=final_text_display, reply_markup=reply_markup, parse_mode="MarkdownV2")
-            context.bot_data[f"menu_message_content_{chat_id}_{message_id}"] = (
-                final_text_display, reply_markup.to_json())
+            set_menu_fingerprint(context.bot_data, chat_id, message_id,
+                                 menu_content_fingerprint(final_text_display, reply_markup))
         else:
             logger.error(
                 "Radarr customization step called without main_menu_message_id. This indicates a flow error.")
@@ -458,10 +464,8 @@ async def radarr_customization_callback(update: Update, context: ContextTypes.DE
             "request_timestamp": time.time(), "status": "pending",
             "status_timestamp": time.time(), "admin_notes": None
         }
-        requests_list = load_requests_data()
-        requests_list.append(new_request)
         result_msg_raw = ""
-        if save_requests_data(requests_list):
+        if app_request_store.add_request(new_request):
             result_msg_raw = f"✅ Your request for '{flow_data['movie_title']}' has been submitted for admin approval."
             logger.info(
                 f"Movie request submitted by user {user_id} ({username}) for '{flow_data['movie_title']}' (TMDB ID: {flow_data['movie_tmdb_id']}). Request ID: {request_id}")
@@ -493,15 +497,15 @@ async def radarr_customization_callback(update: Update, context: ContextTypes.DE
             'add_options_monitor': "movieOnly", 'search_on_add': True
         }
         if data == CB_ADD_DEFAULT:
-            add_params['quality_profile_id'] = get_default_quality_profile_id()
-            add_params['root_folder_path_or_id'] = get_default_root_folder_id()
+            add_params['quality_profile_id'] = await run_radarr_call(get_default_quality_profile_id)
+            add_params['root_folder_path_or_id'] = await run_radarr_call(get_default_root_folder_id)
             if flow_data.get('movie_has_collection'):
                 add_params['add_options_monitor'] = "movieAndCollection"
         else:
-            add_params['quality_profile_id'] = flow_data.get(
-                'quality_profile_id', get_default_quality_profile_id())
-            add_params['root_folder_path_or_id'] = flow_data.get(
-                'root_folder_id', get_default_root_folder_id())
+            add_params['quality_profile_id'] = flow_data.get('quality_profile_id') \
+                or await run_radarr_call(get_default_quality_profile_id)
+            add_params['root_folder_path_or_id'] = flow_data.get('root_folder_id') \
+                or await run_radarr_call(get_default_root_folder_id)
             add_params['minimum_availability'] = flow_data.get(
                 'minimum_availability', "released")
             if flow_data.get('movie_has_collection'):
@@ -517,32 +521,21 @@ async def radarr_customization_callback(update: Update, context: ContextTypes.DE
             logger.error(
                 f"Missing quality profile or root folder for Radarr add. QP: {add_params['quality_profile_id']}, RF: {add_params['root_folder_path_or_id']}")
             if is_from_admin_approval and approved_request_id:
-                all_reqs = load_requests_data()
-                for req in all_reqs:
-                    if req.get("request_id") == approved_request_id:
-                        req["status"] = "add_failed"
-                        req["admin_notes"] = f"Admin approved, but auto-add failed: {error_detail_raw}"
-                        req["status_timestamp"] = time.time()
-                        save_requests_data(all_reqs)
-                        break
+                app_request_store.update_request(
+                    approved_request_id, status="add_failed",
+                    admin_notes=f"Admin approved, but auto-add failed: {error_detail_raw}",
+                    status_timestamp=time.time())
         else:
-            result_msg_raw = radarr_add_movie_func(**add_params)
+            result_msg_raw = await run_radarr_call(radarr_add_movie_func, **add_params)
             if is_from_admin_approval and approved_request_id:
                 success_keywords = ["successfully", "already in Radarr"]
                 is_add_successful = any(
                     keyword.lower() in result_msg_raw.lower() for keyword in success_keywords)
-                all_reqs = load_requests_data()
-                updated_req = False
-                for req_idx, req_item in enumerate(all_reqs):
-                    if req_item.get("request_id") == approved_request_id:
-                        all_reqs[req_idx]["status"] = "approved" if is_add_successful else "add_failed"
-                        all_reqs[req_idx][
-                            "admin_notes"] = f"Admin {username or chat_id} fulfilled. Radarr response: {result_msg_raw}"
-                        all_reqs[req_idx]["status_timestamp"] = time.time()
-                        updated_req = True
-                        break
-                if updated_req:
-                    save_requests_data(all_reqs)
+                app_request_store.update_request(
+                    approved_request_id,
+                    status="approved" if is_add_successful else "add_failed",
+                    admin_notes=f"Admin {username or chat_id} fulfilled. Radarr response: {result_msg_raw}",
+                    status_timestamp=time.time())
 
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(result_msg_raw), parse_mode="MarkdownV2")
         context.user_data.pop(flow_data_key, None)
@@ -5,7 +5,7 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, constan
 from telegram.ext import ContextTypes
 from telegram.error import RetryAfter, BadRequest
 
-from src.services.radarr.bot_radarr_add import search_movie, load_results as load_movie_results, get_movie_results_file_path_local
+from src.services.radarr.bot_radarr_add import search_movie
 from src.bot.bot_initialization import (
     show_or_edit_main_menu,
     send_or_edit_universal_status_message,
@@ -13,8 +13,12 @@ from src.bot.bot_initialization import (
 )
 from src.bot.bot_callback_data import CallbackData
 import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_radarr_call
+import src.app.app_search_sessions as app_search_sessions
 
 from src.bot.bot_text_utils import escape_md_v1, escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +43,7 @@ async def handle_radarr_search_initiation(update: Update, context: ContextTypes.
         parse_mode="MarkdownV2"
     )
 
-    search_output_data = search_movie(query_text)
+    search_output_data = await run_radarr_call(search_movie, query_text)
 
     if isinstance(search_output_data, str):
         logger.warning(
@@ -50,6 +54,8 @@ async def handle_radarr_search_initiation(update: Update, context: ContextTypes.
         await show_or_edit_main_menu(str(chat_id), context)
         return
 
+    app_search_sessions.store_search_results(
+        app_search_sessions.SEARCH_KIND_RADARR, chat_id, search_output_data, query=query_text)
     await display_radarr_search_results_page(update, context, page=1, user_chat_id=chat_id)
 
 
@@ -79,7 +85,8 @@ async def display_radarr_search_results_page(update: Update, context: ContextTyp
 
         return
 
-    results = load_movie_results(get_movie_results_file_path_local())
+    results = app_search_sessions.get_search_results(
+        app_search_sessions.SEARCH_KIND_RADARR, chat_id_to_use)
     if not results:
         await send_or_edit_universal_status_message(context.bot, chat_id_to_use, "No Radarr results found or results expired. Please try searching again.", parse_mode=None)
 
@@ -148,13 +155,14 @@ async def display_radarr_search_results_page(update: Update, context: ContextTyp
     )
 
     try:
+        cancel_message_edit(chat_id_to_use, main_menu_msg_id)
         await context.bot.edit_message_text(
             chat_id=chat_id_to_use, message_id=main_menu_msg_id, text=menu_text_display_v2,
             reply_markup=reply_markup, parse_mode="MarkdownV2"
         )
 
-        context.bot_data[f"menu_message_content_{chat_id_to_use}_{main_menu_msg_id}"] = (
-            menu_text_display_v2, reply_markup.to_json())
+        set_menu_fingerprint(context.bot_data, chat_id_to_use, main_menu_msg_id,
+                             menu_content_fingerprint(menu_text_display_v2, reply_markup))
 
         if not status_for_page_display_raw and page_items:
             status_msg_text = f"Displaying Radarr search results: Page {current_page} of {total_pages}."
@@ -6,9 +6,11 @@ from src.bot.bot_message_persistence import load_menu_message_id
 from src.bot.bot_initialization import send_or_edit_universal_status_message
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, set_menu_fingerprint
 
 from src.handlers.radarr.menu_handler_library_management_radarr import display_radarr_queue_menu
 from src.handlers.sonarr.menu_handler_library_management_sonarr import display_sonarr_queue_menu
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -67,12 +69,13 @@ async def display_queue_item_action_menu(update: Update, context: ContextTypes.D
 
     if menu_message_id:
         try:
+            cancel_message_edit(chat_id, menu_message_id)
             await context.bot.edit_message_text(
                 chat_id=chat_id, message_id=menu_message_id,
                 text=menu_text, reply_markup=reply_markup, parse_mode="MarkdownV2"
             )
-            context.bot_data[f"menu_message_content_{menu_message_id}"] = (
-                menu_text, reply_markup.to_json())
+            set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                 menu_content_fingerprint(menu_text, reply_markup))
             await send_or_edit_universal_status_message(context.bot, chat_id, f"Select action for queue item.", parse_mode=None)
         except Exception as e:
             logger.error(
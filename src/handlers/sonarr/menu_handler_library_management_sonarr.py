@@ -6,14 +6,18 @@ from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 
 import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_sonarr_call
 from src.bot.bot_message_persistence import load_menu_message_id
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_callback_data import CallbackData
-from src.services.sonarr.bot_sonarr_manage import get_wanted_missing_episodes, get_sonarr_queue
-from src.services.sonarr.bot_sonarr_core import get_all_series_ids_and_titles_cached
+from src.services.sonarr.bot_sonarr_manage import get_sonarr_queue, QUEUE_SERVICE_NAME
+from src.services.sonarr.bot_sonarr_wanted import get_wanted_missing_episodes, prefetch_wanted_page, invalidate_wanted_cache
+from src.services.bot_queue_monitor import watch_queue, update_queue_watch, unwatch_queue
+from src.bot.bot_outbound_queue import queue_message_edit, PRIORITY_BACKGROUND, cancel_message_edit
 
 from src.handlers.sonarr.menu_handler_sonarr_controls import display_sonarr_controls_menu
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint, forget_menu_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,11 @@ DEFAULT_PAGE_SIZE_CONFIG_KEY = "ADD_MEDIA_ITEMS_PER_PAGE"
 DEFAULT_PAGE_SIZE_FALLBACK = 5
 
 
+async def _prefetch_wanted_page_job(context: ContextTypes.DEFAULT_TYPE):
+    job_data = context.job.data
+    await run_sonarr_call(prefetch_wanted_page, job_data['page'], job_data['page_size'])
+
+
 async def display_sonarr_wanted_episodes_menu(update: Update, context: ContextTypes.DEFAULT_TYPE, page: int = 1) -> None:
     query = update.callback_query
     chat_id = update.effective_chat.id
@@ -47,15 +56,15 @@ async def display_sonarr_wanted_episodes_menu(update: Update, context: ContextTy
         return
 
     is_refresh_call = query and query.data == CallbackData.CMD_SONARR_WANTED_REFRESH.value
-    if page == 1 or is_refresh_call:
-        logger.debug(
-            "Refreshing Sonarr series title cache for wanted episodes list.")
-        get_all_series_ids_and_titles_cached(force_refresh=True)
+    if is_refresh_call:
+        # Series titles come from the catalogue; ones it lacks are fetched by ID.
+        logger.debug("Dropping cached Sonarr wanted episodes.")
+        invalidate_wanted_cache()
 
     items_per_page = app_config_holder.get_add_media_items_per_page(
     ) or DEFAULT_PAGE_SIZE_FALLBACK
-    wanted_data = get_wanted_missing_episodes(
-        page=page, page_size=items_per_page)
+    wanted_data = await run_sonarr_call(
+        get_wanted_missing_episodes, page=page, page_size=items_per_page)
     keyboard = []
     menu_title_text_raw = "🎯 Sonarr - Wanted Episodes"
 
@@ -82,19 +91,15 @@ async def display_sonarr_wanted_episodes_menu(update: Update, context: ContextTy
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(status_message_text_raw), parse_mode="MarkdownV2")
 
         for ep_item in episodes:
-            if not isinstance(ep_item, dict):
-                logger.warning(
-                    f"Skipping non-dict item in Sonarr wanted episodes: {ep_item}")
-                continue
-            series_title_raw = ep_item.get(
-                'seriesTitle', 'Unknown Series')
-            ep_title_raw = ep_item.get(
-                'title', f"Ep {ep_item.get('episodeNumber', '?')}")
-            button_text = f"{series_title_raw} - S{ep_item.get('seasonNumber'):02d}E{ep_item.get('episodeNumber'):02d} - {ep_title_raw}"
+            ep_title_raw = ep_item.title or f"Ep {ep_item.episode_number or '?'}"
+            button_text = f"{ep_item.series_title} - S{ep_item.season_number or 0:02d}E{ep_item.episode_number or 0:02d} - {ep_title_raw}"
             if len(button_text) > 60:
                 button_text = button_text[:57] + "..."
             keyboard.append([InlineKeyboardButton(
-                button_text, callback_data=f"{CallbackData.CMD_SONARR_WANTED_SEARCH_EPISODE_PREFIX.value}{ep_item.get('id')}")])
+                button_text, callback_data=f"{CallbackData.CMD_SONARR_WANTED_SEARCH_EPISODE_PREFIX.value}{ep_item.id}")])
+        if episodes:
+            keyboard.append([InlineKeyboardButton(
+                "🔍 Search This Page", callback_data=CallbackData.CMD_SONARR_WANTED_SEARCH_PAGE.value)])
 
         pagination_row = []
         if current_page > 1:
@@ -105,6 +110,10 @@ async def display_sonarr_wanted_episodes_menu(update: Update, context: ContextTy
                 "Next ▶️", callback_data=f"{CallbackData.CMD_SONARR_WANTED_PAGE_PREFIX.value}{current_page+1}"))
         if pagination_row:
             keyboard.append(pagination_row)
+        if current_page < total_pages:
+            # Load the next page while this one is read, so "Next" is served from the cache.
+            context.application.job_queue.run_once(_prefetch_wanted_page_job, 0, data={
+                'page': current_page + 1, 'page_size': page_size_from_api})
     else:
         error_msg_raw = wanted_data.get(
             "error", "⚠️ Could not fetch wanted episodes.")
@@ -130,16 +139,18 @@ async def display_sonarr_wanted_episodes_menu(update: Update, context: ContextTy
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (escaped_menu_title_display,
-                                 reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title_display, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id, message_id=menu_message_id,
                     text=escaped_menu_title_display, reply_markup=reply_markup, parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -154,6 +165,56 @@ async def display_sonarr_wanted_episodes_menu(update: Update, context: ContextTy
         await show_or_edit_main_menu(str(chat_id), context, force_send_new=True)
 
 
+def _build_sonarr_queue_keyboard(queue_data: dict) -> tuple:
+    """(menu title, reply markup) for a page returned by get_sonarr_queue."""
+    items = queue_data['records']
+    total_records = queue_data.get('totalRecords', 0)
+    current_page = queue_data.get('page', 1)
+    page_size = queue_data.get('pageSize') or DEFAULT_PAGE_SIZE_FALLBACK
+    total_pages = math.ceil(
+        total_records / page_size) if total_records > 0 else 1
+
+    menu_title_text_raw = SONARR_QUEUE_MENU_TEXT_TEMPLATE_RAW.format(
+        current_page=current_page, total_pages=total_pages)
+
+    keyboard = []
+    for item in items:
+        progress_percent_raw = f"{item.progress:.1f}%"
+
+        button_display_title = f"{item.title} - S{item.season_number:02d}E{item.episode_number:02d}" \
+            if isinstance(item.season_number, int) and isinstance(item.episode_number, int) else item.title
+        if len(button_display_title) > 30:
+            button_display_title = button_display_title[:27] + "..."
+
+        display_text = f"{button_display_title} ({item.status} - {progress_percent_raw})"
+        if len(display_text) > 50:
+
+            display_text = display_text[:47] + "..."
+        callback_payload = f"{item.id}_{item.media_id or 0}"
+        keyboard.append([InlineKeyboardButton(
+            f"➡️ {display_text}", callback_data=f"{CallbackData.CMD_SONARR_QUEUE_ITEM_ACTIONS_MENU_PREFIX.value}{callback_payload}")])
+
+    pagination_row = []
+    if current_page > 1:
+        pagination_row.append(InlineKeyboardButton(
+            "◀️ Prev", callback_data=f"{CallbackData.CMD_SONARR_QUEUE_PAGE_PREFIX.value}{current_page-1}"))
+    if current_page < total_pages:
+        pagination_row.append(InlineKeyboardButton(
+            "Next ▶️", callback_data=f"{CallbackData.CMD_SONARR_QUEUE_PAGE_PREFIX.value}{current_page+1}"))
+    if pagination_row:
+        keyboard.append(pagination_row)
+
+    keyboard.append([InlineKeyboardButton(
+        "🔄 Refresh Queue", callback_data=CallbackData.CMD_SONARR_QUEUE_REFRESH.value)])
+    keyboard.append([InlineKeyboardButton("🔙 Back to Sonarr Controls",
+                    callback_data=CallbackData.CMD_SONARR_CONTROLS.value)])
+    return menu_title_text_raw, InlineKeyboardMarkup(keyboard)
+
+
+def _escape_queue_menu_title(menu_title_text_raw: str) -> str:
+    return escape_md_v2(menu_title_text_raw.replace("(", "\\(").replace(")", "\\)"))
+
+
 async def display_sonarr_queue_menu(update: Update, context: ContextTypes.DEFAULT_TYPE, page: int = 1) -> None:
     query = update.callback_query
     chat_id = update.effective_chat.id
@@ -179,107 +240,60 @@ async def display_sonarr_queue_menu(update: Update, context: ContextTypes.DEFAUL
 
     items_per_page = app_config_holder.get_add_media_items_per_page(
     ) or DEFAULT_PAGE_SIZE_FALLBACK
-    queue_data = get_sonarr_queue(page=page, page_size=items_per_page)
-    keyboard = []
-    menu_title_text_raw = "📥 Sonarr - Download Queue"
-
-    if queue_data and 'records' in queue_data:
-        items = queue_data['records']
-        total_records = queue_data.get('totalRecords', 0)
-        current_page = queue_data.get('page', page)
-        page_size_from_api = queue_data.get('pageSize', items_per_page)
-        total_pages = math.ceil(
-            total_records / page_size_from_api) if total_records > 0 else 1
-
-        menu_title_text_raw = SONARR_QUEUE_MENU_TEXT_TEMPLATE_RAW.format(
-            current_page=current_page, total_pages=total_pages)
-
-        context.user_data['sonarr_queue_current_page'] = current_page
-
-        status_msg_raw = f"Displaying page {current_page} of {total_pages} for Sonarr queue."
-        if is_refresh_call:
-            status_msg_raw = f"🔄 Sonarr queue refreshed. {status_msg_raw}"
-        if not items and total_records == 0:
-            status_msg_raw = "✅ Sonarr download queue is empty."
-        elif not items and current_page > 1:
-            status_msg_raw = "ℹ️ No more items on this page of Sonarr queue."
-        await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(status_msg_raw), parse_mode="MarkdownV2")
-
-        for item in items:
-            if not isinstance(item, dict):
-                logger.warning(
-                    f"Skipping non-dict item in Sonarr queue: {item}")
-                continue
-
-            series_title_raw = item.get('seriesTitle', 'Unknown Series')
-            ep_info = item.get('episode', {})
-            status_raw = item.get('status', 'N/A')
-            season_num_raw = ep_info.get(
-                'seasonNumber', item.get('seasonNumber', ''))
-            ep_num_raw = ep_info.get(
-                'episodeNumber', item.get('episodeNumber', ''))
-
-            progress_value = item.get(
-                'progress', item.get('totalProgress', 0.0))
-            progress_percent_raw = f"{progress_value:.1f}%"
-            item_id_for_actions = str(item.get('id'))
-            episode_id_for_search = str(
-                ep_info.get('id', '0'))
-
-            button_display_title = f"{series_title_raw} - S{season_num_raw:02d}E{ep_num_raw:02d}" if season_num_raw != '' and ep_num_raw != '' else series_title_raw
-            if len(button_display_title) > 30:
-                button_display_title = button_display_title[:27] + "..."
-
-            display_text = f"{button_display_title} ({status_raw} - {progress_percent_raw})"
-            if len(display_text) > 50:
-
-                display_text = display_text[:47] + "..."
-            callback_payload = f"{item_id_for_actions}_{episode_id_for_search}"
-            keyboard.append([InlineKeyboardButton(
-                f"➡️ {display_text}", callback_data=f"{CallbackData.CMD_SONARR_QUEUE_ITEM_ACTIONS_MENU_PREFIX.value}{callback_payload}")])
+    # Pages come from the shared queue snapshot, so page flips and refreshes
+    # by any number of admins cost at most one /queue call per snapshot age.
+    queue_data = await run_sonarr_call(
+        get_sonarr_queue, page=page, page_size=items_per_page)
 
-        pagination_row = []
-        if current_page > 1:
-            pagination_row.append(InlineKeyboardButton(
-                "◀️ Prev", callback_data=f"{CallbackData.CMD_SONARR_QUEUE_PAGE_PREFIX.value}{current_page-1}"))
-        if current_page < total_pages:
-            pagination_row.append(InlineKeyboardButton(
-                "Next ▶️", callback_data=f"{CallbackData.CMD_SONARR_QUEUE_PAGE_PREFIX.value}{current_page+1}"))
-        if pagination_row:
-            keyboard.append(pagination_row)
-    else:
+    if queue_data.get("error") or 'records' not in queue_data:
         error_msg_raw = queue_data.get(
             "error", "⚠️ Could not fetch Sonarr queue.")
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(error_msg_raw), parse_mode="MarkdownV2")
         await display_sonarr_controls_menu(update, context)
         return
 
-    keyboard.append([InlineKeyboardButton(
-        "🔄 Refresh Queue", callback_data=CallbackData.CMD_SONARR_QUEUE_REFRESH.value)])
-    keyboard.append([InlineKeyboardButton("🔙 Back to Sonarr Controls",
-                    callback_data=CallbackData.CMD_SONARR_CONTROLS.value)])
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    items = queue_data['records']
+    total_records = queue_data.get('totalRecords', 0)
+    current_page = queue_data.get('page', page)
+    menu_title_text_raw, reply_markup = _build_sonarr_queue_keyboard(
+        queue_data)
+    total_pages = math.ceil(
+        total_records / queue_data['pageSize']) if total_records > 0 else 1
+
+    context.user_data['sonarr_queue_current_page'] = current_page
+
+    status_msg_raw = f"Displaying page {current_page} of {total_pages} for Sonarr queue."
+    if is_refresh_call:
+        status_msg_raw = f"🔄 Sonarr queue refreshed. {status_msg_raw}"
+    if not items and total_records == 0:
+        status_msg_raw = "✅ Sonarr download queue is empty."
+    elif not items and current_page > 1:
+        status_msg_raw = "ℹ️ No more items on this page of Sonarr queue."
+    await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(status_msg_raw), parse_mode="MarkdownV2")
 
     menu_message_id = load_menu_message_id(str(chat_id))
     if not menu_message_id and context.bot_data:
         menu_message_id = context.bot_data.get(
             f"main_menu_message_id_{chat_id}")
 
-    escaped_menu_title_display = escape_md_v2(
-        menu_title_text_raw.replace("(", "\\(").replace(")", "\\)"))
+    escaped_menu_title_display = _escape_queue_menu_title(menu_title_text_raw)
 
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (escaped_menu_title_display,
-                                 reply_markup.to_json())
-            if old_content_tuple != new_content_tuple:
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                escaped_menu_title_display, reply_markup)
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id, message_id=menu_message_id,
                     text=escaped_menu_title_display, reply_markup=reply_markup, parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
+            watch_queue(QUEUE_SERVICE_NAME, chat_id, current_page,
+                        menu_message_id, new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -291,3 +305,49 @@ async def display_sonarr_queue_menu(update: Update, context: ContextTypes.DEFAUL
         logger.error("Cannot find menu_message_id for Sonarr Queue menu.")
 
         await show_or_edit_main_menu(str(chat_id), context, force_send_new=True)
+
+
+async def push_sonarr_queue_update(application, chat_id_str: str, watch: dict) -> None:
+    """
+    Re-renders a watched queue page from the current snapshot. Called by the
+    queue monitor job after the queue changed; a chat whose menu now shows
+    something else is dropped from the watchers instead.
+    """
+    chat_id = int(chat_id_str)
+    menu_message_id = watch["message_id"]
+    if get_menu_fingerprint(application.bot_data, chat_id, menu_message_id) != watch["fingerprint"]:
+        unwatch_queue(QUEUE_SERVICE_NAME, chat_id_str)
+        return
+
+    items_per_page = app_config_holder.get_add_media_items_per_page(
+    ) or DEFAULT_PAGE_SIZE_FALLBACK
+    queue_data = await run_sonarr_call(
+        get_sonarr_queue, page=watch["page"], page_size=items_per_page)
+    if queue_data.get("error") or 'records' not in queue_data:
+        return
+    menu_title_text_raw, reply_markup = _build_sonarr_queue_keyboard(
+        queue_data)
+    escaped_menu_title_display = _escape_queue_menu_title(menu_title_text_raw)
+    new_content_fingerprint = menu_content_fingerprint(
+        escaped_menu_title_display, reply_markup)
+    if new_content_fingerprint == watch["fingerprint"]:
+        return
+
+    async def on_edit_failure(error):
+        forget_menu_fingerprint(application.bot_data,
+                                chat_id, menu_message_id)
+        unwatch_queue(QUEUE_SERVICE_NAME, chat_id_str)
+
+    def on_edit_dropped():
+        # Nothing was shown, so the next poll has to edit again.
+        forget_menu_fingerprint(application.bot_data,
+                                chat_id, menu_message_id)
+        update_queue_watch(QUEUE_SERVICE_NAME, chat_id_str, None)
+
+    queue_message_edit(application.bot, chat_id, menu_message_id, {
+        "text": escaped_menu_title_display, "reply_markup": reply_markup, "parse_mode": "MarkdownV2"
+    }, priority=PRIORITY_BACKGROUND, on_failure=on_edit_failure, on_dropped=on_edit_dropped)
+    set_menu_fingerprint(application.bot_data, chat_id,
+                         menu_message_id, new_content_fingerprint)
+    update_queue_watch(QUEUE_SERVICE_NAME, chat_id_str,
+                       new_content_fingerprint)
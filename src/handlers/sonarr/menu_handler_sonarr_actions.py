@@ -4,6 +4,7 @@ from telegram import Update
 from telegram.ext import ContextTypes
 
 import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_sonarr_call
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_callback_data import CallbackData
 from src.services.sonarr.bot_sonarr_manage import (
@@ -14,10 +15,17 @@ from src.services.sonarr.bot_sonarr_manage import (
     trigger_episode_search,
     remove_queue_item as sonarr_remove_queue_item
 )
+from src.services.sonarr.bot_sonarr_wanted import (
+    get_wanted_missing_episodes,
+    queue_episode_search,
+    flush_episode_search_batch,
+    EPISODE_SEARCH_BATCH_WINDOW_SECONDS
+)
 
 from .menu_handler_library_management_sonarr import (
     display_sonarr_queue_menu,
-    display_sonarr_wanted_episodes_menu
+    display_sonarr_wanted_episodes_menu,
+    DEFAULT_PAGE_SIZE_FALLBACK
 )
 from .menu_handler_sonarr_tools import display_sonarr_library_maintenance_menu
 from src.handlers.shared.menu_handler_library_management_actions_shared import display_queue_item_action_menu
@@ -25,6 +33,18 @@ from src.bot.bot_text_utils import escape_md_v2
 
 logger = logging.getLogger(__name__)
 
+EPISODE_SEARCH_BATCH_JOB_NAME = "SonarrEpisodeSearchBatch"
+
+
+async def _flush_episode_search_batch_job(context: ContextTypes.DEFAULT_TYPE):
+    success, result_message_raw, chat_ids = await run_sonarr_call(flush_episode_search_batch)
+    for chat_id_str in chat_ids:
+        try:
+            await send_or_edit_universal_status_message(context.bot, int(chat_id_str), escape_md_v2(result_message_raw), parse_mode="MarkdownV2")
+        except Exception as e:
+            logger.error(
+                f"Error reporting Sonarr episode search batch to {chat_id_str}: {e}", exc_info=True)
+
 
 async def handle_sonarr_library_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
@@ -58,34 +78,50 @@ async def handle_sonarr_library_action(update: Update, context: ContextTypes.DEF
     if callback_data_str == CallbackData.CMD_SONARR_SCAN_FILES.value:
         action_message_raw = "⏳ Initiating Sonarr disk rescan for all series..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = rescan_all_series()
+        result_message_raw = await run_sonarr_call(rescan_all_series)
         await display_sonarr_library_maintenance_menu(update, context)
     elif callback_data_str == CallbackData.CMD_SONARR_UPDATE_METADATA.value:
         action_message_raw = "⏳ Initiating Sonarr metadata refresh for all series..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = refresh_all_series()
+        result_message_raw = await run_sonarr_call(refresh_all_series)
         await display_sonarr_library_maintenance_menu(update, context)
     elif callback_data_str == CallbackData.CMD_SONARR_RENAME_FILES.value:
         action_message_raw = "⏳ Initiating Sonarr series/episode file renaming..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = rename_all_series_files()
+        result_message_raw = await run_sonarr_call(rename_all_series_files)
         await display_sonarr_library_maintenance_menu(update, context)
     elif callback_data_str == CallbackData.CMD_SONARR_SEARCH_WANTED_ALL_NOW.value:
         action_message_raw = "⏳ Initiating Sonarr search for all wanted/missing episodes..."
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
-        result_message_raw = trigger_missing_episode_search()
+        result_message_raw = await run_sonarr_call(trigger_missing_episode_search)
 
         await display_sonarr_wanted_episodes_menu(update, context, page=current_page_sonarr_wanted)
     elif callback_data_str.startswith(CallbackData.CMD_SONARR_WANTED_SEARCH_EPISODE_PREFIX.value):
         episode_id_to_search = callback_data_str.replace(
             CallbackData.CMD_SONARR_WANTED_SEARCH_EPISODE_PREFIX.value, "")
         if episode_id_to_search.isdigit():
-            action_message_raw = f"⏳ Initiating Sonarr search for episode ID {episode_id_to_search}..."
-            await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
-            result_message_raw = trigger_episode_search(
-                episode_ids=[int(episode_id_to_search)])
+            # Clicks within the batch window go to Sonarr as one EpisodeSearch.
+            batch_size, starts_batch = queue_episode_search(
+                [int(episode_id_to_search)], chat_id)
+            if starts_batch:
+                context.application.job_queue.run_once(
+                    _flush_episode_search_batch_job, EPISODE_SEARCH_BATCH_WINDOW_SECONDS, name=EPISODE_SEARCH_BATCH_JOB_NAME)
+            action_message_raw = f"⏳ Episode ID {episode_id_to_search} queued for search ({batch_size} in this batch, sent in a few seconds)..."
+            result_message_raw = action_message_raw
         else:
-            result_message_raw = "⚠️ Invalid episode ID for search."
+            action_message_raw = "⚠️ Invalid episode ID for search."
+            result_message_raw = action_message_raw
+
+        await display_sonarr_wanted_episodes_menu(update, context, page=current_page_sonarr_wanted)
+    elif callback_data_str == CallbackData.CMD_SONARR_WANTED_SEARCH_PAGE.value:
+        items_per_page = app_config_holder.get_add_media_items_per_page() or DEFAULT_PAGE_SIZE_FALLBACK
+        wanted_data = await run_sonarr_call(
+            get_wanted_missing_episodes, page=current_page_sonarr_wanted, page_size=items_per_page)
+        episode_ids = [episode.id for episode in wanted_data.get('records', [])]
+        action_message_raw = f"⏳ Initiating Sonarr search for {len(episode_ids)} episodes on this page..."
+        await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(action_message_raw), parse_mode="MarkdownV2")
+        search_success, result_message_raw = await run_sonarr_call(
+            trigger_episode_search, episode_ids=episode_ids)
 
         await display_sonarr_wanted_episodes_menu(update, context, page=current_page_sonarr_wanted)
     elif callback_data_str.startswith(CallbackData.CMD_SONARR_QUEUE_ITEM_ACTIONS_MENU_PREFIX.value):
@@ -119,8 +155,8 @@ async def handle_sonarr_library_action(update: Update, context: ContextTypes.DEF
             CallbackData.CMD_SONARR_QUEUE_ITEM_REMOVE_NO_BLOCKLIST_PREFIX.value, ""))
 
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Removing item {queue_item_id} (no blocklist)..."), parse_mode="MarkdownV2")
-        result_message_raw = sonarr_remove_queue_item(
-            queue_item_id, blocklist=False)
+        result_message_raw = await run_sonarr_call(
+            sonarr_remove_queue_item, queue_item_id, blocklist=False)
         if context.user_data.get('current_queue_action_item'):
             del context.user_data['current_queue_action_item']
         await display_sonarr_queue_menu(update, context, page=current_page_sonarr_queue)
@@ -129,8 +165,8 @@ async def handle_sonarr_library_action(update: Update, context: ContextTypes.DEF
             CallbackData.CMD_SONARR_QUEUE_ITEM_BLOCKLIST_ONLY_PREFIX.value, "")
 
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Blocklisting item {queue_item_id} (no search)..."), parse_mode="MarkdownV2")
-        blocklist_success, result_message_raw = sonarr_remove_queue_item(
-            queue_item_id, blocklist=True)
+        blocklist_success, result_message_raw = await run_sonarr_call(
+            sonarr_remove_queue_item, queue_item_id, blocklist=True)
 
         if context.user_data.get('current_queue_action_item'):
             del context.user_data['current_queue_action_item']
@@ -143,16 +179,16 @@ async def handle_sonarr_library_action(update: Update, context: ContextTypes.DEF
         media_search_id = parts[1] if len(parts) > 1 else "0"
 
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(f"⏳ Blocklisting item {queue_item_id} and searching again..."), parse_mode="MarkdownV2")
-        blocklist_success, blocklist_message_raw = sonarr_remove_queue_item(
-            queue_item_id, blocklist=True)
+        blocklist_success, blocklist_message_raw = await run_sonarr_call(
+            sonarr_remove_queue_item, queue_item_id, blocklist=True)
 
         final_status_parts = [blocklist_message_raw]
 
         if blocklist_success and media_search_id != "0":
             try:
                 sonarr_episode_id_for_search = int(media_search_id)
-                search_success, search_msg_raw = trigger_episode_search(
-                    episode_ids=[sonarr_episode_id_for_search])
+                search_success, search_msg_raw = await run_sonarr_call(
+                    trigger_episode_search, episode_ids=[sonarr_episode_id_for_search])
                 final_status_parts.append(search_msg_raw)
             except ValueError:
                 final_status_parts.append(
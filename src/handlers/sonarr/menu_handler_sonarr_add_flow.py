@@ -20,9 +20,9 @@ from src.services.sonarr.bot_sonarr_add import (
     get_tags as get_sonarr_tags,
     get_series_type_options, get_episode_monitor_options,
     get_default_root_folder_path, get_default_quality_profile_id,
-    get_default_language_profile_id
+    get_default_language_profile_id, lookup_series
 )
-from src.services.sonarr.bot_sonarr_core import _sonarr_request as sonarr_api_get
+from src.app.app_service_executor import run_sonarr_call
 from src.bot.bot_initialization import (
     show_or_edit_main_menu,
     send_or_edit_universal_status_message,
@@ -30,7 +30,9 @@ from src.bot.bot_initialization import (
 )
 from src.bot.bot_callback_data import CallbackData
 import src.app.app_config_holder as app_config_holder
-from src.app.app_file_utils import load_requests_data, save_requests_data
+import src.app.app_request_store as app_request_store
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -111,8 +113,8 @@ async def sonarr_show_selection_callback(update: Update, context: ContextTypes.D
         show_api_details = None
         raw_overview = "Overview not available."
         try:
-            lookup_result = sonarr_api_get(
-                'get', f'/series/lookup', params={'term': f'tvdb:{tvdb_id}'})
+            lookup_result = await run_sonarr_call(
+                lookup_series, f'tvdb:{tvdb_id}')
             if isinstance(lookup_result, list) and lookup_result:
                 show_api_details = lookup_result[0]
             elif isinstance(lookup_result, dict) and lookup_result.get("tvdbId"):
@@ -206,12 +208,13 @@ async def sonarr_show_selection_callback(update: Update, context: ContextTypes.D
 
         final_msg_text = "".join(msg_text_parts)
 
+        cancel_message_edit(chat_id, query.message.message_id)
         await context.bot.edit_message_text(
             chat_id=chat_id, message_id=query.message.message_id, text=final_msg_text,
             reply_markup=reply_markup, parse_mode="MarkdownV2"
         )
-        context.bot_data[f"menu_message_content_{chat_id}_{query.message.message_id}"] = (
-            final_msg_text, reply_markup.to_json())
+        set_menu_fingerprint(context.bot_data, chat_id, query.message.message_id,
+                             menu_content_fingerprint(final_msg_text, reply_markup))
     except (IndexError, ValueError, KeyError) as e:
         logger.error(
             f"Error in Sonarr show selection processing: {e}", exc_info=True)
@@ -234,10 +237,11 @@ async def display_sonarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
         step_counter = 1
         text_parts.append(escape_md_v2(
             f"**Step {step_counter}: Select Root Folder**"))
-        root_folders = get_sonarr_root_folders()
+        root_folders = await run_sonarr_call(get_sonarr_root_folders)
         if not root_folders:
             err_text = "Error: Could not fetch root folders from Sonarr."
             if message_id:
+                cancel_message_edit(chat_id, message_id)
                 await context.bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=escape_md_v2(err_text), reply_markup=None, parse_mode="MarkdownV2")
             return
         for rf in root_folders:
@@ -247,10 +251,11 @@ async def display_sonarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
         step_counter = 2
         text_parts.append(escape_md_v2(
             f"**Step {step_counter}: Select Quality Profile**"))
-        quality_profiles = get_sonarr_quality_profiles()
+        quality_profiles = await run_sonarr_call(get_sonarr_quality_profiles)
         if not quality_profiles:
             err_text = "Error: Could not fetch quality profiles from Sonarr."
             if message_id:
+                cancel_message_edit(chat_id, message_id)
                 await context.bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=escape_md_v2(err_text), reply_markup=None, parse_mode="MarkdownV2")
             return
         for qp in quality_profiles:
@@ -260,11 +265,11 @@ async def display_sonarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
         step_counter = 3
         text_parts.append(escape_md_v2(
             f"**Step {step_counter}: Select Language Profile**"))
-        lang_profiles = get_sonarr_language_profiles()
+        lang_profiles = await run_sonarr_call(get_sonarr_language_profiles)
         if not lang_profiles:
             logger.warning(
                 "No language profiles found via /languageprofile or /profile. Using hardcoded default or skipping step.")
-            flow_data['language_profile_id_s'] = get_default_language_profile_id()
+            flow_data['language_profile_id_s'] = await run_sonarr_call(get_default_language_profile_id)
             flow_data['current_step'] = 'select_series_type_s'
             await display_sonarr_customization_step(context, flow_data)
             return
@@ -305,7 +310,7 @@ async def display_sonarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
         step_counter = 8
         text_parts.append(escape_md_v2(
             f"**Step {step_counter}: Select Tags (Optional)**\n_Choose multiple then 'Done with Tags'_"))
-        all_tags = get_sonarr_tags()
+        all_tags = await run_sonarr_call(get_sonarr_tags)
         current_tags_ids = flow_data.get('tags_s', [])
         if all_tags:
             for tag_idx, tag in enumerate(all_tags):
@@ -322,12 +327,12 @@ async def display_sonarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
         step_counter = 9
         text_parts.append(escape_md_v2(
             f"**Step {step_counter}: Confirm Add**") + "\n\n")
-        rf_path = flow_data.get('root_folder_path_s',
-                                get_default_root_folder_path() or "Not Set")
-        qp_id = flow_data.get('quality_profile_id_s',
-                              get_default_quality_profile_id())
-        lp_id = flow_data.get('language_profile_id_s',
-                              get_default_language_profile_id())
+        rf_path = flow_data.get('root_folder_path_s') \
+            or await run_sonarr_call(get_default_root_folder_path) or "Not Set"
+        qp_id = flow_data.get('quality_profile_id_s') \
+            or await run_sonarr_call(get_default_quality_profile_id)
+        lp_id = flow_data.get('language_profile_id_s') \
+            or await run_sonarr_call(get_default_language_profile_id)
         stype = flow_data.get('series_type_s', 'standard')
         sfolder = flow_data.get('season_folder_s', True)
         moneps = flow_data.get('monitor_episodes_s', 'all')
@@ -339,14 +344,16 @@ async def display_sonarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
 
         qp_name_display = "Default (Not Set)"
         if qp_id:
+            all_qp_confirm = await run_sonarr_call(get_sonarr_quality_profiles)
             sel_qp_confirm = next(
-                (q['name'] for q in get_sonarr_quality_profiles() if q['id'] == qp_id), None)
+                (q['name'] for q in all_qp_confirm if q['id'] == qp_id), None)
             qp_name_display = sel_qp_confirm if sel_qp_confirm else qp_name_display
 
         lp_name_display = "Default (Not Set)"
         if lp_id:
+            all_lp_confirm = await run_sonarr_call(get_sonarr_language_profiles)
             sel_lp_confirm = next(
-                (l['name'] for l in get_sonarr_language_profiles() if l['id'] == lp_id), None)
+                (l['name'] for l in all_lp_confirm if l['id'] == lp_id), None)
             lp_name_display = sel_lp_confirm if sel_lp_confirm else lp_name_display
 
         stype_display = next((s['label'] for s in get_series_type_options(
@@ -358,8 +365,9 @@ async def display_sonarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
 
         tags_str_display = "None"
         if tags_ids:
+            all_tags_confirm = await run_sonarr_call(get_sonarr_tags)
             sel_tag_labels = [t['label']
-                              for t in get_sonarr_tags() if t['id'] in tags_ids]
+                              for t in all_tags_confirm if t['id'] in tags_ids]
             tags_str_display = ", ".join(
                 sel_tag_labels) if sel_tag_labels else tags_str_display
 
@@ -389,9 +397,10 @@ async def display_sonarr_customization_step(context: ContextTypes.DEFAULT_TYPE,
 
     try:
         if message_id:
+            cancel_message_edit(chat_id, message_id)
             await context.bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=final_text_display, reply_markup=reply_markup, parse_mode="MarkdownV2")
-            context.bot_data[f"menu_message_content_{chat_id}_{message_id}"] = (
-                final_text_display, reply_markup.to_json())
+            set_menu_fingerprint(context.bot_data, chat_id, message_id,
+                                 menu_content_fingerprint(final_text_display, reply_markup))
         else:
             logger.error(
                 "Sonarr customization step called without main_menu_message_id. This indicates a flow error.")
@@ -462,10 +471,8 @@ async def sonarr_customization_callback(update: Update, context: ContextTypes.DE
             "request_timestamp": time.time(), "status": "pending",
             "status_timestamp": time.time(), "admin_notes": None
         }
-        requests_list = load_requests_data()
-        requests_list.append(new_request)
         result_msg_raw = ""
-        if save_requests_data(requests_list):
+        if app_request_store.add_request(new_request):
             result_msg_raw = f"✅ Your request for '{flow_data['show_title']}' has been submitted for admin approval."
             logger.info(
                 f"TV show request submitted by user {user_id} ({username}) for '{flow_data['show_title']}' (TVDB ID: {flow_data['show_tvdb_id']}). Request ID: {request_id}")
@@ -497,16 +504,16 @@ async def sonarr_customization_callback(update: Update, context: ContextTypes.DE
             'monitor_episodes': "all", 'search_for_missing': True, 'tags': []
         }
         if data == CB_ADD_DEFAULT_S:
-            add_params['quality_profile_id'] = get_default_quality_profile_id()
-            add_params['root_folder_path'] = get_default_root_folder_path()
-            add_params['language_profile_id'] = get_default_language_profile_id()
+            add_params['quality_profile_id'] = await run_sonarr_call(get_default_quality_profile_id)
+            add_params['root_folder_path'] = await run_sonarr_call(get_default_root_folder_path)
+            add_params['language_profile_id'] = await run_sonarr_call(get_default_language_profile_id)
         else:
-            add_params['quality_profile_id'] = flow_data.get(
-                'quality_profile_id_s', get_default_quality_profile_id())
-            add_params['root_folder_path'] = flow_data.get(
-                'root_folder_path_s', get_default_root_folder_path())
-            add_params['language_profile_id'] = flow_data.get(
-                'language_profile_id_s', get_default_language_profile_id())
+            add_params['quality_profile_id'] = flow_data.get('quality_profile_id_s') \
+                or await run_sonarr_call(get_default_quality_profile_id)
+            add_params['root_folder_path'] = flow_data.get('root_folder_path_s') \
+                or await run_sonarr_call(get_default_root_folder_path)
+            add_params['language_profile_id'] = flow_data.get('language_profile_id_s') \
+                or await run_sonarr_call(get_default_language_profile_id)
             add_params['series_type'] = flow_data.get(
                 'series_type_s', "standard")
             add_params['season_folder'] = flow_data.get(
@@ -530,29 +537,21 @@ async def sonarr_customization_callback(update: Update, context: ContextTypes.DE
             logger.error(
                 f"Missing critical params for Sonarr add. QP: {add_params['quality_profile_id']}, RF: {add_params['root_folder_path']}, LP: {add_params['language_profile_id']}")
             if is_from_admin_approval and approved_request_id:
-                all_reqs = load_requests_data()
-                for req in all_reqs:
-                    if req.get("request_id") == approved_request_id:
-                        req["status"] = "add_failed"
-                        req["admin_notes"] = f"Admin approved, but auto-add failed: {error_detail_raw}"
-                        req["status_timestamp"] = time.time()
-                        save_requests_data(all_reqs)
-                        break
+                app_request_store.update_request(
+                    approved_request_id, status="add_failed",
+                    admin_notes=f"Admin approved, but auto-add failed: {error_detail_raw}",
+                    status_timestamp=time.time())
         else:
-            result_msg_raw = sonarr_add_show_func(**add_params)
+            result_msg_raw = await run_sonarr_call(sonarr_add_show_func, **add_params)
             if is_from_admin_approval and approved_request_id:
                 success_keywords = ["successfully", "already in Sonarr"]
                 is_add_successful = any(
                     keyword.lower() in result_msg_raw.lower() for keyword in success_keywords)
-                all_reqs = load_requests_data()
-                for req_idx, req_item in enumerate(all_reqs):
-                    if req_item.get("request_id") == approved_request_id:
-                        all_reqs[req_idx]["status"] = "approved" if is_add_successful else "add_failed"
-                        all_reqs[req_idx][
-                            "admin_notes"] = f"Admin {username or chat_id} fulfilled. Sonarr response: {result_msg_raw}"
-                        all_reqs[req_idx]["status_timestamp"] = time.time()
-                        save_requests_data(all_reqs)
-                        break
+                app_request_store.update_request(
+                    approved_request_id,
+                    status="approved" if is_add_successful else "add_failed",
+                    admin_notes=f"Admin {username or chat_id} fulfilled. Sonarr response: {result_msg_raw}",
+                    status_timestamp=time.time())
 
         await send_or_edit_universal_status_message(context.bot, chat_id, escape_md_v2(result_msg_raw), parse_mode="MarkdownV2")
         context.user_data.pop(flow_data_key, None)
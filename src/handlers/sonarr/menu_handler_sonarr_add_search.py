@@ -6,7 +6,7 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, constan
 from telegram.ext import ContextTypes
 from telegram.error import RetryAfter, BadRequest
 
-from src.services.sonarr.bot_sonarr_add import search_show, load_results as load_show_results, get_show_results_file_path_local
+from src.services.sonarr.bot_sonarr_add import search_show
 
 from src.bot.bot_initialization import (
     show_or_edit_main_menu,
@@ -15,8 +15,12 @@ from src.bot.bot_initialization import (
 )
 from src.bot.bot_callback_data import CallbackData
 import src.app.app_config_holder as app_config_holder
+from src.app.app_service_executor import run_sonarr_call
+import src.app.app_search_sessions as app_search_sessions
 
 from src.bot.bot_text_utils import escape_md_v1, escape_md_v2, format_media_title_for_md2, format_overview_for_md2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +47,7 @@ async def handle_sonarr_search_initiation(update: Update, context: ContextTypes.
         parse_mode="MarkdownV2"
     )
 
-    search_output_data = search_show(query_text)
+    search_output_data = await run_sonarr_call(search_show, query_text)
 
     if isinstance(search_output_data, str):
         logger.warning(
@@ -54,6 +58,8 @@ async def handle_sonarr_search_initiation(update: Update, context: ContextTypes.
         await show_or_edit_main_menu(str(chat_id), context)
         return
 
+    app_search_sessions.store_search_results(
+        app_search_sessions.SEARCH_KIND_SONARR, chat_id, search_output_data, query=query_text)
     await display_sonarr_search_results_page(update, context, page=1, user_chat_id=chat_id)
 
 
@@ -82,7 +88,8 @@ async def display_sonarr_search_results_page(update: Update, context: ContextTyp
         await send_or_edit_universal_status_message(context.bot, chat_id_to_use, "⚠️ Error: Could not display search results (menu ID missing). Please try /start.", parse_mode=None)
         return
 
-    results = load_show_results(get_show_results_file_path_local())
+    results = app_search_sessions.get_search_results(
+        app_search_sessions.SEARCH_KIND_SONARR, chat_id_to_use)
     if not results:
         await send_or_edit_universal_status_message(context.bot, chat_id_to_use, "No Sonarr results found or results expired. Please try searching again.", parse_mode=None)
 
@@ -150,12 +157,13 @@ async def display_sonarr_search_results_page(update: Update, context: ContextTyp
     )
 
     try:
+        cancel_message_edit(chat_id_to_use, main_menu_msg_id)
         await context.bot.edit_message_text(
             chat_id=chat_id_to_use, message_id=main_menu_msg_id, text=menu_text_display_v2,
             reply_markup=reply_markup, parse_mode="MarkdownV2"
         )
-        context.bot_data[f"menu_message_content_{chat_id_to_use}_{main_menu_msg_id}"] = (
-            menu_text_display_v2, reply_markup.to_json())
+        set_menu_fingerprint(context.bot_data, chat_id_to_use, main_menu_msg_id,
+                             menu_content_fingerprint(menu_text_display_v2, reply_markup))
 
         if not status_for_page_display_raw and page_items:
             status_msg_text = f"Displaying Sonarr search results: Page {current_page} of {total_pages}."
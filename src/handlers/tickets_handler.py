@@ -10,9 +10,11 @@ import src.app.app_config_holder as app_config_holder
 import src.app.user_manager as user_manager
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
-from src.app.app_file_utils import load_tickets_data, save_tickets_data
+import src.app.app_ticket_store as app_ticket_store
 from src.bot.bot_message_persistence import load_menu_message_id  # Added import
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -23,25 +25,11 @@ AWAITING_NEW_TICKET_TEXT = 0  # Define as a simple integer for a single state
 ITEMS_PER_PAGE_TICKETS = 5
 
 
-def get_user_open_tickets(user_chat_id_str: str, all_tickets_store: dict) -> list:
-    user_tickets = []
-    for ticket_id, ticket_data in all_tickets_store.items():
-        if ticket_data.get("user_chat_id") == user_chat_id_str and \
-           not ticket_data.get("status", "").startswith("closed"):
-            user_tickets.append(ticket_data)
-    user_tickets.sort(key=lambda t: t.get("last_updated_at", 0), reverse=True)
-    return user_tickets
-
-
-def get_all_open_tickets_for_admin(all_tickets_store: dict) -> list:
-    open_tickets = []
-    for ticket_id, ticket_data in all_tickets_store.items():
-        if not ticket_data.get("status", "").startswith("closed"):
-            open_tickets.append(ticket_data)
-    # Prioritize tickets needing admin attention (new or user replied)
-    open_tickets.sort(key=lambda t: (t.get("status") not in [
-                      "open_by_user", "user_replied"], t.get("last_updated_at", 0)), reverse=False)
-    return open_tickets
+def _get_open_tickets_page(chat_id_str: str, is_admin_role_view: bool, page: int) -> tuple[list, int]:
+    if is_admin_role_view:
+        # Tickets needing admin attention (new or user replied) come first
+        return app_ticket_store.get_admin_open_tickets_page(page, ITEMS_PER_PAGE_TICKETS)
+    return app_ticket_store.get_user_open_tickets_page(chat_id_str, page, ITEMS_PER_PAGE_TICKETS)
 
 
 async def display_tickets_menu(update: Update, context: ContextTypes.DEFAULT_TYPE, page: int = 1) -> None:
@@ -60,20 +48,13 @@ async def display_tickets_menu(update: Update, context: ContextTypes.DEFAULT_TYP
                 page = 1
         # Add similar pagination for user if CMD_USER_TICKETS_PAGE_PREFIX is introduced
 
-    # support_tickets_store = context.application.bot_data.get('support_tickets', {}) # Old
-    support_tickets_store = load_tickets_data()
-
-    open_tickets = []
     menu_title = ""
     # Check if user has admin role
     is_admin_role_view = user_role == app_config_holder.ROLE_ADMIN
 
     if is_admin_role_view:
-        open_tickets = get_all_open_tickets_for_admin(support_tickets_store)
         menu_title = ADMIN_TICKETS_MENU_TITLE_MD2
     elif user_role == app_config_holder.ROLE_STANDARD_USER or user_role == app_config_holder.ROLE_ADMIN:  # Non-primary admins see their own
-        open_tickets = get_user_open_tickets(
-            chat_id_str, support_tickets_store)
         menu_title = USER_TICKETS_MENU_TITLE_MD2
     else:
         await send_or_edit_universal_status_message(context.bot, int(chat_id_str), "⚠️ Access to tickets is restricted.", parse_mode=None)
@@ -82,14 +63,14 @@ async def display_tickets_menu(update: Update, context: ContextTypes.DEFAULT_TYP
     keyboard = []
     menu_body_parts = ["\n"]
 
-    total_items = len(open_tickets)
+    page_items, total_items = _get_open_tickets_page(
+        chat_id_str, is_admin_role_view, max(1, page))
     total_pages = math.ceil(
         total_items / ITEMS_PER_PAGE_TICKETS) if total_items > 0 else 1
     current_page = max(1, min(page, total_pages))
-
-    start_index = (current_page - 1) * ITEMS_PER_PAGE_TICKETS
-    end_index = start_index + ITEMS_PER_PAGE_TICKETS
-    page_items = open_tickets[start_index:end_index]
+    if current_page != page:
+        page_items, total_items = _get_open_tickets_page(
+            chat_id_str, is_admin_role_view, current_page)
 
     if not page_items:
         menu_body_parts.append(escape_md_v2("_No open tickets to display._\n" if total_items ==
@@ -148,12 +129,13 @@ async def display_tickets_menu(update: Update, context: ContextTypes.DEFAULT_TYP
     menu_message_id = load_menu_message_id(chat_id_str)
     if menu_message_id:
         try:
+            cancel_message_edit(int(chat_id_str), menu_message_id)
             await context.bot.edit_message_text(
                 chat_id=int(chat_id_str), message_id=menu_message_id,
                 text=final_menu_text, reply_markup=reply_markup, parse_mode="MarkdownV2"
             )
-            context.application.bot_data[f"menu_message_content_{chat_id_str}_{menu_message_id}"] = (
-                final_menu_text, reply_markup.to_json())
+            set_menu_fingerprint(context.application.bot_data, chat_id_str, menu_message_id,
+                                 menu_content_fingerprint(final_menu_text, reply_markup))
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -192,7 +174,6 @@ async def handle_user_new_ticket_input(update: Update, context: ContextTypes.DEF
             f"Could not delete user's new ticket input message: {e_del}")
 
     ticket_id = str(uuid.uuid4())
-    support_tickets_store = load_tickets_data()  # New
     primary_admin_chat_id_str = app_config_holder.get_chat_id_str()
 
     new_ticket = {
@@ -209,8 +190,9 @@ async def handle_user_new_ticket_input(update: Update, context: ContextTypes.DEF
             "sender_type": "user", "text": user_message_text, "timestamp": time.time()
         }]
     }
-    support_tickets_store[ticket_id] = new_ticket
-    save_tickets_data(support_tickets_store)  # New
+    if not app_ticket_store.create_ticket(new_ticket):
+        await send_or_edit_universal_status_message(context.bot, int(user_chat_id_str), "⚠️ Your ticket could not be saved. Please try again.", parse_mode=None)
+        return ConversationHandler.END
     logger.info(
         f"User {user_chat_id_str} created new ticket (ID: {ticket_id})")
 
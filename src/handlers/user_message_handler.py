@@ -7,8 +7,10 @@ import time  # For timestamp
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_message_persistence import load_menu_message_id
-from src.app.app_file_utils import load_tickets_data, save_tickets_data
+import src.app.app_ticket_store as app_ticket_store
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -49,11 +51,12 @@ async def handle_view_admin_message(update: Update, context: ContextTypes.DEFAUL
     menu_title_text = escape_md_v2(VIEW_ADMIN_MESSAGE_MENU_TITLE_RAW)
     if menu_message_id:
         try:
+            cancel_message_edit(int(chat_id_str), menu_message_id)
             await context.bot.edit_message_text(
                 chat_id=int(chat_id_str), message_id=menu_message_id, text=menu_title_text,
                 reply_markup=reply_markup, parse_mode="MarkdownV2")
-            context.application.bot_data[f"menu_message_content_{chat_id_str}_{menu_message_id}"] = (
-                menu_title_text, reply_markup.to_json())
+            set_menu_fingerprint(context.application.bot_data, chat_id_str, menu_message_id,
+                                 menu_content_fingerprint(menu_title_text, reply_markup))
         except Exception as e:
             logger.error(
                 f"Error updating main menu for viewing admin message: {e}", exc_info=True)
@@ -173,16 +176,14 @@ async def handle_user_view_ticket_details(update: Update, context: ContextTypes.
     await query.answer()
     ticket_id_to_view = query.data.replace(
         CallbackData.CMD_USER_VIEW_TICKET_PREFIX.value, "")
-    support_tickets_store = load_tickets_data()
-    ticket_data = support_tickets_store.get(ticket_id_to_view)
+    ticket_data = app_ticket_store.get_ticket(ticket_id_to_view)
     if not ticket_data or ticket_data.get("user_chat_id") != chat_id_str:
         await send_or_edit_universal_status_message(context.bot, int(chat_id_str), "⚠️ Ticket not found or access denied.", parse_mode=None)
         await show_or_edit_main_menu(chat_id_str, context.application)
         return
     if ticket_data.get("status") == "open_by_admin" and not ticket_data.get("user_viewed_initial_admin_msg"):
-        ticket_data["user_viewed_initial_admin_msg"] = True
-        ticket_data["last_updated_at"] = time.time()
-        save_tickets_data(support_tickets_store)
+        ticket_data = app_ticket_store.update_ticket(
+            ticket_id_to_view, user_viewed_initial_admin_msg=True, last_updated_at=time.time()) or ticket_data
         logger.info(
             f"User {user_id_str} viewed initial admin message for ticket {ticket_id_to_view}")
     thread_display_parts = [
@@ -215,17 +216,19 @@ async def handle_user_view_ticket_details(update: Update, context: ContextTypes.
     menu_title_text = escape_md_v2(
         f"{VIEW_TICKET_MENU_TITLE_RAW} (#{ticket_id_to_view[:8]})")
     if menu_message_id:
-        current_content_key = f"menu_message_content_{chat_id_str}_{menu_message_id}"
-        old_content_tuple_json = context.application.bot_data.get(
-            current_content_key)
-        new_content_tuple_json = (menu_title_text, reply_markup.to_json())
+        old_content_fingerprint = get_menu_fingerprint(
+            context.application.bot_data, chat_id_str, menu_message_id)
+        new_content_fingerprint = menu_content_fingerprint(
+            menu_title_text, reply_markup)
 
         try:
-            if old_content_tuple_json != new_content_tuple_json:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(int(chat_id_str), menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=int(chat_id_str), message_id=menu_message_id, text=menu_title_text,
                     reply_markup=reply_markup, parse_mode="MarkdownV2")
-                context.application.bot_data[current_content_key] = new_content_tuple_json
+                set_menu_fingerprint(context.application.bot_data, chat_id_str, menu_message_id,
+                                     new_content_fingerprint)
             # else: logger.debug("User view ticket details: Menu content not modified, edit skipped.")
         except Exception as e:
             logger.error(
@@ -243,8 +246,7 @@ async def handle_user_reply_to_ticket_init(update: Update, context: ContextTypes
     await query.answer()
     ticket_id_to_reply_to = query.data.replace(
         CallbackData.CMD_USER_REPLY_TO_TICKET_INIT_PREFIX.value, "")
-    support_tickets_store = load_tickets_data()
-    ticket_data = support_tickets_store.get(ticket_id_to_reply_to)
+    ticket_data = app_ticket_store.get_ticket(ticket_id_to_reply_to)
     if not ticket_data or ticket_data.get("user_chat_id") != chat_id_str or ticket_data.get("status", "").startswith("closed"):
         await send_or_edit_universal_status_message(context.bot, int(chat_id_str), "⚠️ Cannot reply: Ticket not found, not yours, or already closed.", parse_mode=None)
         return ConversationHandler.END
@@ -266,18 +268,17 @@ async def handle_user_ticket_reply_input(update: Update, context: ContextTypes.D
     if not ticket_id:
         await send_or_edit_universal_status_message(context.bot, int(user_chat_id_str), "⚠️ Error: Ticket ID for reply not found. Please try again.", parse_mode=None)
         return ConversationHandler.END
-    support_tickets_store = load_tickets_data()
-    ticket_data = support_tickets_store.get(ticket_id)
-    if not ticket_data or ticket_data.get("user_chat_id") != user_chat_id_str or ticket_data.get("status", "").startswith("closed"):
+    ticket_data = app_ticket_store.get_ticket(
+        ticket_id, user_chat_id=user_chat_id_str)
+    if ticket_data:
+        ticket_data = app_ticket_store.update_ticket(
+            ticket_id, message={
+                "sender_id": user_chat_id_str, "sender_username": user_username,
+                "sender_type": "user", "text": user_reply_text, "timestamp": time.time()
+            }, require_open=True, status="user_replied", last_updated_at=time.time())
+    if not ticket_data:
         await send_or_edit_universal_status_message(context.bot, int(user_chat_id_str), "⚠️ Cannot send reply: Ticket not found, not yours, or already closed.", parse_mode=None)
         return ConversationHandler.END
-    ticket_data.setdefault("messages", []).append({
-        "sender_id": user_chat_id_str, "sender_username": user_username,
-        "sender_type": "user", "text": user_reply_text, "timestamp": time.time()
-    })
-    ticket_data["status"] = "user_replied"
-    ticket_data["last_updated_at"] = time.time()
-    save_tickets_data(support_tickets_store)
     await send_or_edit_universal_status_message(context.bot, int(user_chat_id_str), f"✅ Your reply to Ticket \\#{escape_md_v2(ticket_id[:8])} has been sent\\.", parse_mode="MarkdownV2")
     primary_admin_chat_id_str = app_config_holder.get_chat_id_str()
     if primary_admin_chat_id_str:
@@ -338,14 +339,13 @@ async def handle_user_close_ticket(update: Update, context: ContextTypes.DEFAULT
     await query.answer()
     ticket_id_to_close = query.data.replace(
         CallbackData.CMD_USER_CLOSE_TICKET_PREFIX.value, "")
-    support_tickets_store = load_tickets_data()
-    ticket_data = support_tickets_store.get(ticket_id_to_close)
-    if not ticket_data or ticket_data.get("user_chat_id") != chat_id_str:
+    ticket_data = app_ticket_store.get_ticket(
+        ticket_id_to_close, user_chat_id=chat_id_str)
+    if not ticket_data:
         await send_or_edit_universal_status_message(context.bot, int(chat_id_str), "⚠️ Ticket not found or you cannot close it.", parse_mode=None)
         return
-    ticket_data["status"] = "closed_by_user"
-    ticket_data["last_updated_at"] = time.time()
-    save_tickets_data(support_tickets_store)
+    app_ticket_store.update_ticket(
+        ticket_id_to_close, status="closed_by_user", last_updated_at=time.time())
     logger.info(f"User {chat_id_str} closed ticket {ticket_id_to_close}")
     await send_or_edit_universal_status_message(context.bot, int(chat_id_str), f"✅ Ticket \\#{escape_md_v2(ticket_id_to_close[:8])} has been closed\\.", parse_mode="MarkdownV2")
     primary_admin_chat_id_str = app_config_holder.get_chat_id_str()
@@ -10,8 +10,10 @@ import src.app.app_config_holder as app_config_holder
 from src.bot.bot_callback_data import CallbackData
 from src.bot.bot_initialization import send_or_edit_universal_status_message, show_or_edit_main_menu
 from src.bot.bot_message_persistence import load_menu_message_id
-from src.app.app_file_utils import load_requests_data
+import src.app.app_request_store as app_request_store
 from src.bot.bot_text_utils import escape_md_v2
+from src.bot.bot_menu_fingerprints import menu_content_fingerprint, get_menu_fingerprint, set_menu_fingerprint
+from src.bot.bot_outbound_queue import cancel_message_edit
 
 logger = logging.getLogger(__name__)
 
@@ -54,13 +56,7 @@ async def display_my_requests_menu(update: Update, context: ContextTypes.DEFAULT
         await send_or_edit_universal_status_message(context.bot, chat_id, "⚠️ Access to 'My Requests' is restricted.", parse_mode=None)
         return
 
-    all_requests = load_requests_data()
-    user_requests = [
-        req for req in all_requests if req.get("user_id") == user_id]
-    user_requests.sort(key=lambda r: r.get(
-        "request_timestamp", 0), reverse=True)
-
-    total_items = len(user_requests)
+    total_items = app_request_store.count_user_requests(user_id)
     items_per_page_config = app_config_holder.get_add_media_items_per_page()
     items_per_page_to_use = items_per_page_config if items_per_page_config > 0 else ITEMS_PER_PAGE_MY_REQUESTS
 
@@ -68,9 +64,8 @@ async def display_my_requests_menu(update: Update, context: ContextTypes.DEFAULT
         total_items / items_per_page_to_use) if total_items > 0 else 1
     current_page = max(1, min(page, total_pages))
 
-    start_index = (current_page - 1) * items_per_page_to_use
-    end_index = start_index + items_per_page_to_use
-    page_items = user_requests[start_index:end_index]
+    page_items, total_items = app_request_store.get_user_requests_page(
+        user_id, current_page, items_per_page_to_use)
 
     keyboard = []
 
@@ -144,18 +139,20 @@ async def display_my_requests_menu(update: Update, context: ContextTypes.DEFAULT
     menu_message_id = load_menu_message_id(str(chat_id))
     if menu_message_id:
         try:
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
-            old_content_tuple = context.bot_data.get(current_content_key)
-            new_content_tuple = (final_menu_display_text,
-                                 reply_markup.to_json())
+            old_content_fingerprint = get_menu_fingerprint(
+                context.bot_data, chat_id, menu_message_id)
+            new_content_fingerprint = menu_content_fingerprint(
+                final_menu_display_text, reply_markup)
 
-            if old_content_tuple != new_content_tuple:
+            if old_content_fingerprint != new_content_fingerprint:
+                cancel_message_edit(chat_id, menu_message_id)
                 await context.bot.edit_message_text(
                     chat_id=chat_id, message_id=menu_message_id,
                     text=final_menu_display_text, reply_markup=reply_markup,
                     parse_mode="MarkdownV2"
                 )
-                context.bot_data[current_content_key] = new_content_tuple
+                set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                     new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
@@ -191,9 +188,8 @@ async def display_my_request_detail(update: Update, context: ContextTypes.DEFAUL
 
     request_id_to_view = query.data.replace(
         CallbackData.MY_REQUEST_DETAIL_PREFIX.value, "")
-    all_requests = load_requests_data()
-    target_request = next((req for req in all_requests if req.get(
-        "request_id") == request_id_to_view and req.get("user_id") == user_id), None)
+    target_request = app_request_store.get_request(
+        request_id_to_view, user_id=user_id)
 
     if not target_request:
         logger.warning(
@@ -253,18 +249,19 @@ async def display_my_request_detail(update: Update, context: ContextTypes.DEFAUL
             menu_title_for_detail_view = escape_md_v2(
                 f"Request: {target_request.get('media_title', 'Details')[:30]}")
 
-            current_content_key = f"menu_message_content_{chat_id}_{menu_message_id}"
 
-            new_content_tuple = (menu_title_for_detail_view,
-                                 reply_markup.to_json())
+            new_content_fingerprint = menu_content_fingerprint(
+                menu_title_for_detail_view, reply_markup)
 
+            cancel_message_edit(chat_id, menu_message_id)
             await context.bot.edit_message_text(
                 chat_id=chat_id, message_id=menu_message_id,
                 text=menu_title_for_detail_view,
                 reply_markup=reply_markup,
                 parse_mode="MarkdownV2"
             )
-            context.bot_data[current_content_key] = new_content_tuple
+            set_menu_fingerprint(context.bot_data, chat_id, menu_message_id,
+                                 new_content_fingerprint)
         except BadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.error(
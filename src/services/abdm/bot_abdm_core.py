@@ -2,6 +2,7 @@ import logging
 import requests
 import json
 import src.app.app_config_holder as app_config_holder
+from src.services.bot_http_sessions import get_service_session
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +73,7 @@ def add_download_to_abdm(url: str, filename: str | None = None, destination_path
     logger.debug(f"ABDM Payload: {json.dumps(payload)}")
 
     try:
-        response = requests.post(abdm_url, data=json.dumps(
+        response = get_service_session("abdm").post(abdm_url, data=json.dumps(
             payload), headers=headers, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
@@ -118,7 +119,7 @@ def check_abdm_connection() -> bool:
         return False
     try:
         # Simple GET request to the base URL to see if the service is listening
-        response = requests.get(base_url, timeout=2)  # Short timeout
+        response = get_service_session("abdm").get(base_url, timeout=2)  # Short timeout
         # We are checking for connection, not necessarily a 200 OK on base path.
         # A 404 or similar is fine if the server is up and responding.
         logger.debug(
@@ -0,0 +1,147 @@
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# How often the repeating job asks each service what changed since its last sync.
+CATALOG_SYNC_INTERVAL_SECONDS = 120
+# Incremental syncs cannot see items deleted from another client (nothing in
+# history or commands records a delete), so the sync job refetches the whole
+# catalogue this often. Callers never go to the service for membership; this
+# bounds how long a deleted item can linger in bulk commands and add checks.
+CATALOG_FULL_REFRESH_INTERVAL_SECONDS = 30 * 60
+
+# service_name -> {"records": {id: record}, "indexes": {field: {value: id}},
+#                  "index_fields": tuple, "loaded_at": float, "sync_cursor": any}
+# records and indexes are replaced, never mutated, so readers need no lock.
+_catalogs: dict[str, dict] = {}
+_catalog_lock = threading.Lock()
+
+_stats: dict[str, dict] = {}
+
+
+def _service_stats(service_name: str) -> dict:
+    return _stats.setdefault(service_name, {
+        "full_refreshes": 0,
+        "incremental_syncs": 0,
+        "records_updated": 0,
+        "records_removed": 0,
+    })
+
+
+def _build_indexes(records: dict, index_fields: tuple) -> dict:
+    indexes = {field: {} for field in index_fields}
+    for record_id, record in records.items():
+        for field in index_fields:
+            value = getattr(record, field, None)
+            if value is not None:
+                indexes[field][value] = record_id
+    return indexes
+
+
+def replace_catalog(service_name: str, records: list, index_fields: tuple = (), sync_cursor=None):
+    """Installs a freshly fetched full catalogue (records are namedtuples with an id field)."""
+    records_by_id = {record.id: record for record in records}
+    catalog = {
+        "records": records_by_id,
+        "indexes": _build_indexes(records_by_id, index_fields),
+        "index_fields": index_fields,
+        "loaded_at": time.monotonic(),
+        "sync_cursor": sync_cursor,
+    }
+    with _catalog_lock:
+        _catalogs[service_name] = catalog
+        _service_stats(service_name)["full_refreshes"] += 1
+    logger.info(
+        f"{service_name} catalogue loaded with {len(records_by_id)} items.")
+
+
+def apply_catalog_changes(service_name: str, updated_records: list = (), removed_ids=(), sync_cursor=None) -> bool:
+    """Merges incrementally fetched records into a loaded catalogue. Returns False if none is loaded."""
+    with _catalog_lock:
+        catalog = _catalogs.get(service_name)
+        if catalog is None:
+            return False
+        records = dict(catalog["records"])
+        for record in updated_records:
+            records[record.id] = record
+        removed_count = 0
+        for record_id in removed_ids:
+            if records.pop(record_id, None) is not None:
+                removed_count += 1
+        _catalogs[service_name] = {
+            **catalog,
+            "records": records,
+            "indexes": _build_indexes(records, catalog["index_fields"]),
+            "sync_cursor": sync_cursor if sync_cursor is not None else catalog["sync_cursor"],
+        }
+        stats = _service_stats(service_name)
+        stats["incremental_syncs"] += 1
+        stats["records_updated"] += len(updated_records)
+        stats["records_removed"] += removed_count
+    if updated_records or removed_count:
+        logger.debug(
+            f"{service_name} catalogue: {len(updated_records)} items updated, {removed_count} removed.")
+    return True
+
+
+def is_catalog_loaded(service_name: str) -> bool:
+    return service_name in _catalogs
+
+
+def catalog_needs_full_refresh(service_name: str) -> bool:
+    catalog = _catalogs.get(service_name)
+    return catalog is None or time.monotonic() - catalog["loaded_at"] > CATALOG_FULL_REFRESH_INTERVAL_SECONDS
+
+
+def get_catalog_records(service_name: str) -> dict:
+    """{id: record} for a loaded catalogue, or {} if none is loaded. Do not modify the result."""
+    catalog = _catalogs.get(service_name)
+    return catalog["records"] if catalog is not None else {}
+
+
+def get_catalog_sync_cursor(service_name: str):
+    catalog = _catalogs.get(service_name)
+    return catalog["sync_cursor"] if catalog is not None else None
+
+
+def find_catalog_record(service_name: str, field: str, value):
+    """Looks a record up by one of the catalogue's index_fields."""
+    catalog = _catalogs.get(service_name)
+    if catalog is None:
+        return None
+    record_id = catalog["indexes"].get(field, {}).get(value)
+    return catalog["records"].get(record_id) if record_id is not None else None
+
+
+def invalidate_catalog(service_name: str | None = None):
+    """Drops the catalogue of one service, or of all services."""
+    with _catalog_lock:
+        for cached_service in [name for name in _catalogs if service_name is None or name == service_name]:
+            del _catalogs[cached_service]
+    logger.debug(
+        f"Catalogue invalidated for {service_name or 'all services'}.")
+
+
+def _approximate_size(catalog: dict) -> int:
+    size = sys.getsizeof(catalog["records"])
+    for record in catalog["records"].values():
+        size += sys.getsizeof(record) + sum(sys.getsizeof(value)
+                                            for value in record if isinstance(value, str))
+    for index in catalog["indexes"].values():
+        size += sys.getsizeof(index)
+    return size
+
+
+def get_catalog_stats(service_name: str) -> dict:
+    with _catalog_lock:
+        stats = dict(_service_stats(service_name))
+        catalog = _catalogs.get(service_name)
+    stats["items"] = len(catalog["records"]) if catalog is not None else 0
+    stats["approx_bytes"] = _approximate_size(
+        catalog) if catalog is not None else 0
+    stats["age_seconds"] = round(
+        time.monotonic() - catalog["loaded_at"]) if catalog is not None else None
+    return stats
@@ -0,0 +1,74 @@
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_MAXSIZE = 4
+
+# Retries are handled by the backoff decorators on the request functions,
+# so the adapters themselves never retry.
+ADAPTER_MAX_RETRIES = 0
+
+_sessions: dict[str, requests.Session] = {}
+_session_pool_sizes: dict[str, int] = {}
+_sessions_lock = threading.Lock()
+
+
+def _build_session(pool_maxsize: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize,
+                          max_retries=ADAPTER_MAX_RETRIES, pool_block=False)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def create_service_session(service_name: str, pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> requests.Session:
+    """Creates (or replaces) the keep-alive session used for one backend."""
+    with _sessions_lock:
+        old_session = _sessions.pop(service_name, None)
+        session = _build_session(pool_maxsize)
+        _sessions[service_name] = session
+        _session_pool_sizes[service_name] = pool_maxsize
+    if old_session is not None:
+        try:
+            old_session.close()
+        except Exception as e:
+            logger.warning(
+                f"Error closing previous {service_name} HTTP session: {e}")
+    logger.info(
+        f"HTTP session for {service_name} created (pool size {pool_maxsize}).")
+    return session
+
+
+def get_service_session(service_name: str) -> requests.Session:
+    """Returns the shared session for a backend, creating a default one if needed."""
+    session = _sessions.get(service_name)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        session = _sessions.get(service_name)
+        if session is None:
+            pool_maxsize = _session_pool_sizes.get(
+                service_name, DEFAULT_POOL_MAXSIZE)
+            session = _build_session(pool_maxsize)
+            _sessions[service_name] = session
+            logger.debug(
+                f"HTTP session for {service_name} created lazily (pool size {pool_maxsize}).")
+    return session
+
+
+def close_service_sessions():
+    """Closes every backend session and its pooled connections."""
+    with _sessions_lock:
+        sessions = list(_sessions.items())
+        _sessions.clear()
+    for service_name, session in sessions:
+        try:
+            session.close()
+            logger.info(f"HTTP session for {service_name} closed.")
+        except Exception as e:
+            logger.error(
+                f"Error closing {service_name} HTTP session: {e}", exc_info=True)
@@ -0,0 +1,83 @@
+import codecs
+import json
+
+# Bytes read from the socket at a time; the buffer never holds much more than
+# this plus the element being decoded.
+JSON_STREAM_CHUNK_BYTES = 64 * 1024
+
+_JSON_WHITESPACE = " \t\n\r"
+# Characters that can continue a JSON number.
+_JSON_NUMBER_CHARS = "0123456789.eE+-"
+_decoder = json.JSONDecoder()
+
+
+def iter_json_array(chunks):
+    """
+    Yields the elements of a top-level JSON array one at a time from an
+    iterable of byte chunks (e.g. response.iter_content()), so a large list
+    is never held in memory as a whole. Raises ValueError if the body is not
+    an array, its elements are not separated by commas, or it ends early.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    array_opened = False
+    # After "[" or ",": an element (or "]" right after "["). After an element: "," or "]".
+    expecting_element = True
+    element_count = 0
+
+    def final_chunk():
+        yield from chunks
+        yield None
+
+    for chunk in final_chunk():
+        at_end = chunk is None
+        text = text_decoder.decode(b"", final=True) if at_end else text_decoder.decode(chunk)
+        buffer = buffer[position:] + text
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _JSON_WHITESPACE:
+                position += 1
+            if position >= len(buffer):
+                break
+            char = buffer[position]
+            if not array_opened:
+                if char != "[":
+                    raise ValueError(
+                        f"Expected a JSON array, got {buffer[position:position + 20]!r}")
+                array_opened = True
+                position += 1
+                continue
+            if not expecting_element:
+                if char == "]":
+                    return
+                if char != ",":
+                    raise ValueError(
+                        f"Expected ',' or ']' after array element {element_count}, got {buffer[position:position + 20]!r}")
+                expecting_element = True
+                position += 1
+                continue
+            if char == "]" and element_count == 0:
+                return
+            if char in ",]":
+                raise ValueError(
+                    f"Expected an array element, got {buffer[position:position + 20]!r}")
+            try:
+                element, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if at_end:
+                    raise
+                break
+            # A number that ends at the end of the buffer, or just before a
+            # character that could continue it ("1." or "1e" with the rest in
+            # the next chunk), is only complete once more data arrives.
+            if not at_end and isinstance(element, (int, float)) and \
+                    (end >= len(buffer) or buffer[end] in _JSON_NUMBER_CHARS):
+                break
+            position = end
+            expecting_element = False
+            element_count += 1
+            yield element
+        if at_end:
+            break
+    raise ValueError("JSON array ended before its closing bracket")
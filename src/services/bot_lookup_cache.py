@@ -0,0 +1,137 @@
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import src.app.app_config_holder as app_config_holder
+
+logger = logging.getLogger(__name__)
+
+# Entries live for the LOOKUP_CACHE_TTL_SECONDS config value (default 600).
+LOOKUP_CACHE_MAX_ENTRIES = 256
+# Rough cap on the JSON size of all cached responses together.
+LOOKUP_CACHE_MAX_BYTES = 16 * 1024 * 1024
+# How long a caller waits for an identical lookup already in flight before
+# making the request itself.
+LOOKUP_IN_FLIGHT_WAIT_SECONDS = 60
+
+LOOKUP_KIND_TERM = "term"
+
+# (service_name, kind, normalized_term) -> {"value": ..., "stored_at": float, "size": int}
+_entries: OrderedDict = OrderedDict()
+_in_flight: dict[tuple, Future] = {}
+_total_bytes = 0
+_cache_lock = threading.Lock()
+
+_stats: dict[str, dict] = {}
+
+
+def _service_stats(service_name: str) -> dict:
+    return _stats.setdefault(service_name, {"hits": 0, "misses": 0, "shared": 0, "evicted": 0})
+
+
+def normalize_lookup_term(term) -> str:
+    return " ".join(str(term).lower().split())
+
+
+def _drop_entry_locked(cache_key: tuple):
+    global _total_bytes
+    entry = _entries.pop(cache_key, None)
+    if entry is not None:
+        _total_bytes -= entry["size"]
+
+
+def _store_entry_locked(cache_key: tuple, value):
+    global _total_bytes
+    try:
+        size = len(json.dumps(value))
+    except (TypeError, ValueError):
+        return
+    if size > LOOKUP_CACHE_MAX_BYTES:
+        return
+    _drop_entry_locked(cache_key)
+    _entries[cache_key] = {"value": value,
+                           "stored_at": time.monotonic(), "size": size}
+    _total_bytes += size
+    while len(_entries) > LOOKUP_CACHE_MAX_ENTRIES or _total_bytes > LOOKUP_CACHE_MAX_BYTES:
+        oldest_key = next(iter(_entries))
+        _drop_entry_locked(oldest_key)
+        _service_stats(oldest_key[0])["evicted"] += 1
+
+
+def cached_lookup(service_name: str, term, fetch_func, kind: str = LOOKUP_KIND_TERM):
+    """
+    Returns fetch_func()'s result for (service_name, kind, term), reusing a
+    cached copy younger than the configured TTL. kind keeps lookups by ID
+    apart from free-text terms that happen to look the same. Concurrent calls
+    for the same term share one upstream request. Only list/dict results are
+    cached; anything else (errors, None) is passed through and fetched again
+    next time.
+    """
+    cache_key = (service_name, kind, normalize_lookup_term(term))
+    ttl_seconds = app_config_holder.get_lookup_cache_ttl_seconds()
+    with _cache_lock:
+        stats = _service_stats(service_name)
+        entry = _entries.get(cache_key)
+        if entry is not None:
+            if time.monotonic() - entry["stored_at"] <= ttl_seconds:
+                _entries.move_to_end(cache_key)
+                stats["hits"] += 1
+                return copy.deepcopy(entry["value"])
+            _drop_entry_locked(cache_key)
+        pending = _in_flight.get(cache_key)
+        is_owner = pending is None
+        if is_owner:
+            pending = Future()
+            _in_flight[cache_key] = pending
+            stats["misses"] += 1
+        else:
+            stats["shared"] += 1
+
+    if not is_owner:
+        try:
+            return copy.deepcopy(pending.result(timeout=LOOKUP_IN_FLIGHT_WAIT_SECONDS))
+        except FutureTimeoutError:
+            logger.warning(
+                f"{service_name} lookup for '{cache_key[2]}' still in flight after {LOOKUP_IN_FLIGHT_WAIT_SECONDS}s; fetching it separately.")
+            return fetch_func()
+
+    try:
+        value = fetch_func()
+    except Exception as e:
+        with _cache_lock:
+            _in_flight.pop(cache_key, None)
+        pending.set_exception(e)
+        raise
+
+    with _cache_lock:
+        if isinstance(value, (list, dict)):
+            _store_entry_locked(cache_key, copy.deepcopy(value))
+        _in_flight.pop(cache_key, None)
+    pending.set_result(value)
+    return copy.deepcopy(value)
+
+
+def clear_lookup_cache(service_name: str | None = None):
+    """Drops cached lookups for one service, or for all services."""
+    with _cache_lock:
+        for cache_key in [key for key in _entries if service_name is None or key[0] == service_name]:
+            _drop_entry_locked(cache_key)
+    logger.debug(
+        f"Lookup cache cleared for {service_name or 'all services'}.")
+
+
+def get_lookup_cache_stats(service_name: str) -> dict:
+    with _cache_lock:
+        stats = dict(_service_stats(service_name))
+        stats["entries"] = sum(1 for key in _entries if key[0] == service_name)
+    return stats
+
+
+def format_lookup_cache_stats(service_name: str) -> str:
+    stats = get_lookup_cache_stats(service_name)
+    return (f"Lookup Cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['shared']} shared, {stats['entries']} cached")
@@ -0,0 +1,61 @@
+import copy
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# The refresh job normally replaces entries well before they expire; the TTL
+# only matters if the job queue is not running.
+METADATA_CACHE_TTL_SECONDS = 1800
+METADATA_REFRESH_INTERVAL_SECONDS = 600
+
+# (service_name, kind) -> {"value": list, "fetched_at": float}
+_metadata: dict[tuple, dict] = {}
+_metadata_lock = threading.Lock()
+
+
+def get_cached_metadata(service_name: str, kind: str, fetch_func) -> list:
+    """
+    Returns a copy of the cached metadata list (root folders, profiles, tags...),
+    calling fetch_func on a miss or after METADATA_CACHE_TTL_SECONDS.
+    Exceptions from fetch_func propagate and nothing is cached.
+    """
+    cache_key = (service_name, kind)
+    with _metadata_lock:
+        entry = _metadata.get(cache_key)
+        if entry is not None and time.monotonic() - entry["fetched_at"] <= METADATA_CACHE_TTL_SECONDS:
+            return copy.deepcopy(entry["value"])
+    return _fetch_and_store(cache_key, fetch_func)
+
+
+def _fetch_and_store(cache_key: tuple, fetch_func) -> list:
+    value = fetch_func()
+    with _metadata_lock:
+        _metadata[cache_key] = {"value": copy.deepcopy(
+            value), "fetched_at": time.monotonic()}
+    logger.debug(
+        f"{cache_key[0]} {cache_key[1]} metadata cached ({len(value)} items).")
+    return copy.deepcopy(value)
+
+
+def refresh_metadata(service_name: str, fetchers: dict) -> bool:
+    """Refetches every kind in fetchers ({kind: fetch_func}). Returns False if any fetch failed."""
+    all_refreshed = True
+    for kind, fetch_func in fetchers.items():
+        try:
+            _fetch_and_store((service_name, kind), fetch_func)
+        except Exception as e:
+            all_refreshed = False
+            logger.warning(
+                f"Could not refresh {service_name} {kind} metadata: {e}")
+    return all_refreshed
+
+
+def invalidate_metadata_cache(service_name: str | None = None):
+    """Drops cached metadata for one service, or for all services."""
+    with _metadata_lock:
+        for cache_key in [key for key in _metadata if service_name is None or key[0] == service_name]:
+            del _metadata[cache_key]
+    logger.info(
+        f"Metadata cache invalidated for {service_name or 'all services'}.")
@@ -0,0 +1,176 @@
+import logging
+import threading
+import time
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+# How often the monitor job polls the queues that someone is watching.
+QUEUE_POLL_INTERVAL_SECONDS = 15
+# A page request older than this refetches the queue itself (nobody watching,
+# or the job is not running).
+QUEUE_SNAPSHOT_MAX_AGE_SECONDS = 30
+# A chat stops getting live queue updates this long after it last opened a queue page.
+QUEUE_WATCH_TTL_SECONDS = 600
+# The whole queue is fetched in one request of this many items.
+QUEUE_FETCH_PAGE_SIZE = 1000
+
+# One download in a Radarr/Sonarr queue, reduced to what the queue menus show.
+# media_id is the movie ID (Radarr) or episode ID (Sonarr).
+QueueRow = namedtuple("QueueRow", [
+    "id", "title", "status", "progress", "timeleft",
+    "media_id", "season_number", "episode_number",
+])
+
+# service_name -> {"rows": tuple, "by_id": {id: QueueRow}, "fetched_at": float, "version": int}
+# Snapshots are replaced, never mutated, so readers need no lock.
+_snapshots: dict[str, dict] = {}
+_snapshot_lock = threading.Lock()
+_refresh_locks: dict[str, threading.Lock] = {}
+
+# service_name -> {chat_id_str: {"page": int, "message_id": int, "fingerprint": str, "watched_at": float}}
+_watchers: dict[str, dict] = {}
+
+QUEUE_MONITOR_STATS = {
+    "polls": 0,
+    "page_reads": 0,
+    "unchanged_polls": 0,
+    "rows_added": 0,
+    "rows_removed": 0,
+    "rows_changed": 0,
+}
+
+
+def queue_progress_percent(size, size_left, fallback_progress=0.0) -> float:
+    if size and size_left is not None and size > 0:
+        return round((size - size_left) / size * 100.0, 1)
+    return round(float(fallback_progress or 0.0), 1)
+
+
+def _diff_rows(old_by_id: dict, new_by_id: dict) -> dict:
+    return {
+        "added": [row_id for row_id in new_by_id if row_id not in old_by_id],
+        "removed": [row_id for row_id in old_by_id if row_id not in new_by_id],
+        "changed": [row_id for row_id, row in new_by_id.items()
+                    if row_id in old_by_id and old_by_id[row_id] != row],
+    }
+
+
+def store_queue_snapshot(service_name: str, rows: list) -> dict:
+    """Installs a freshly fetched queue and returns what changed since the previous one."""
+    rows = tuple(rows)
+    new_by_id = {row.id: row for row in rows}
+    with _snapshot_lock:
+        previous = _snapshots.get(service_name)
+        old_by_id = previous["by_id"] if previous else {}
+        diff = _diff_rows(old_by_id, new_by_id)
+        order_changed = previous is not None and [row.id for row in previous["rows"]] != [row.id for row in rows]
+        changed = previous is None or order_changed or any(diff.values())
+        _snapshots[service_name] = {
+            "rows": rows,
+            "by_id": new_by_id,
+            "fetched_at": time.monotonic(),
+            "version": (previous["version"] + 1 if changed else previous["version"]) if previous else 1,
+        }
+    QUEUE_MONITOR_STATS["polls"] += 1
+    if not changed:
+        QUEUE_MONITOR_STATS["unchanged_polls"] += 1
+    QUEUE_MONITOR_STATS["rows_added"] += len(diff["added"])
+    QUEUE_MONITOR_STATS["rows_removed"] += len(diff["removed"])
+    QUEUE_MONITOR_STATS["rows_changed"] += len(diff["changed"])
+    return {**diff, "changed_any": changed}
+
+
+def refresh_queue_snapshot(service_name: str, fetch_func, max_age_seconds: float = 0) -> dict | None:
+    """
+    Fetches the queue with fetch_func unless the snapshot is younger than
+    max_age_seconds. Concurrent callers share one fetch. Returns the diff, or
+    None if the existing snapshot was fresh enough. Blocking.
+    """
+    with _snapshot_lock:
+        refresh_lock = _refresh_locks.setdefault(service_name, threading.Lock())
+    with refresh_lock:
+        snapshot = _snapshots.get(service_name)
+        if snapshot is not None and time.monotonic() - snapshot["fetched_at"] < max_age_seconds:
+            return None
+        return store_queue_snapshot(service_name, fetch_func())
+
+
+def get_queue_page(service_name: str, page: int, page_size: int, fetch_func) -> dict:
+    """One page of the queue snapshot, refreshing it first if it is older than QUEUE_SNAPSHOT_MAX_AGE_SECONDS."""
+    refresh_queue_snapshot(service_name, fetch_func,
+                           max_age_seconds=QUEUE_SNAPSHOT_MAX_AGE_SECONDS)
+    QUEUE_MONITOR_STATS["page_reads"] += 1
+    snapshot = _snapshots[service_name]
+    total_records = len(snapshot["rows"])
+    total_pages = max(1, -(-total_records // page_size))
+    page = min(max(1, page), total_pages)
+    start_index = (page - 1) * page_size
+    return {
+        "records": list(snapshot["rows"][start_index:start_index + page_size]),
+        "totalRecords": total_records,
+        "page": page,
+        "pageSize": page_size,
+        "version": snapshot["version"],
+    }
+
+
+def forget_queue_row(service_name: str, row_id):
+    """Drops a row that was just removed through the bot, without refetching the queue."""
+    with _snapshot_lock:
+        snapshot = _snapshots.get(service_name)
+        # Callback data carries the ID as a string.
+        row_key = next((key for key in snapshot["by_id"] if str(key) == str(row_id)),
+                       None) if snapshot is not None else None
+        if row_key is None:
+            return
+        by_id = {key: row for key, row in snapshot["by_id"].items() if key != row_key}
+        _snapshots[service_name] = {
+            **snapshot,
+            "rows": tuple(row for row in snapshot["rows"] if row.id != row_key),
+            "by_id": by_id,
+            "version": snapshot["version"] + 1,
+        }
+
+
+def invalidate_queue_snapshot(service_name: str | None = None):
+    with _snapshot_lock:
+        for cached_service in [name for name in _snapshots if service_name is None or name == service_name]:
+            del _snapshots[cached_service]
+
+
+def watch_queue(service_name: str, chat_id, page: int, message_id: int, fingerprint: str):
+    """Records that a chat is looking at a queue page, so the monitor job keeps it current."""
+    _watchers.setdefault(service_name, {})[str(chat_id)] = {
+        "page": page, "message_id": message_id, "fingerprint": fingerprint,
+        "watched_at": time.monotonic(),
+    }
+
+
+def update_queue_watch(service_name: str, chat_id, fingerprint: str):
+    watch = _watchers.get(service_name, {}).get(str(chat_id))
+    if watch is not None:
+        watch["fingerprint"] = fingerprint
+
+
+def unwatch_queue(service_name: str, chat_id):
+    _watchers.get(service_name, {}).pop(str(chat_id), None)
+
+
+def get_queue_watchers(service_name: str) -> dict:
+    """{chat_id_str: watch} for chats that opened the queue within QUEUE_WATCH_TTL_SECONDS."""
+    service_watchers = _watchers.get(service_name, {})
+    now = time.monotonic()
+    for chat_id_str in [chat_id_str for chat_id_str, watch in service_watchers.items()
+                        if now - watch["watched_at"] > QUEUE_WATCH_TTL_SECONDS]:
+        del service_watchers[chat_id_str]
+    return dict(service_watchers)
+
+
+def get_queue_monitor_stats() -> dict:
+    stats = dict(QUEUE_MONITOR_STATS)
+    stats["watchers"] = {service_name: len(service_watchers)
+                         for service_name, service_watchers in _watchers.items()}
+    stats["queued_items"] = {service_name: len(snapshot["rows"])
+                             for service_name, snapshot in _snapshots.items()}
+    return stats
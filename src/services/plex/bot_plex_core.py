@@ -1,19 +1,64 @@
 import logging
+import threading
+import time
 from plexapi.server import PlexServer
 from plexapi.exceptions import PlexApiException, NotFound, BadRequest as PlexApiBadRequest
 import requests
 import backoff
 
+from src.services.bot_http_sessions import get_service_session
+from src.app.app_perf_metrics import instrument_function, GROUP_BACKEND
+
 logger = logging.getLogger(__name__)
 
 PLEX_URL_GLOBAL = None
 PLEX_TOKEN_GLOBAL = None
+PLEX_CONNECT_TIMEOUT = 10
+PLEX_HEALTH_CHECK_TIMEOUT = 3
+
+_plex_server_instance = None
+_plex_server_config_key = None
+_plex_connection_lock = threading.Lock()
+PLEX_CONNECTION_STATS = {
+    "reused": 0,
+    "connects": 0,
+    "reconnects": 0,
+    "failures": 0,
+    "last_connect_time": 0,
+}
 
 
 def init_plex_config(url, token):
     global PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL
+    config_changed = (url, token) != (PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL)
     PLEX_URL_GLOBAL = url
     PLEX_TOKEN_GLOBAL = token
+    if config_changed:
+        invalidate_plex_server_connection("Plex URL or token changed")
+
+
+def invalidate_plex_server_connection(reason: str = ""):
+    """Drops the cached PlexServer so the next call reconnects."""
+    global _plex_server_instance, _plex_server_config_key
+    with _plex_connection_lock:
+        had_instance = _plex_server_instance is not None
+        _plex_server_instance = None
+        _plex_server_config_key = None
+    if had_instance:
+        logger.info(
+            f"Cached Plex server connection dropped{': ' + reason if reason else '.'}")
+
+
+def get_plex_connection_stats() -> dict:
+    stats = dict(PLEX_CONNECTION_STATS)
+    stats["connected"] = _plex_server_instance is not None
+    return stats
+
+
+def _is_plex_connection_error(e) -> bool:
+    return isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)) or (
+        isinstance(e, PlexApiException) and hasattr(e, 'response') and
+        e.response is not None and e.response.status_code == 401)
 
 
 @backoff.on_exception(backoff.expo,
@@ -24,31 +69,85 @@ def init_plex_config(url, token):
                       e.response is not None and
                       400 <= e.response.status_code < 500 and
                       e.response.status_code not in [401, 403, 429])
-def _plex_request(func, *args, **kwargs):
+def _plex_request_impl(func, *args, **kwargs):
     return func(*args, **kwargs)
 
 
+def _plex_request(func, *args, **kwargs):
+    try:
+        return _plex_request_impl(func, *args, **kwargs)
+    except Exception as e:
+        if _is_plex_connection_error(e):
+            invalidate_plex_server_connection(
+                f"{type(e).__name__} during request")
+        raise
+
+
+def _plex_series_name(func, *args, **kwargs) -> str:
+    # Bound PlexAPI methods give e.g. "Library.sectionByID".
+    return f"plex {getattr(func, '__qualname__', type(func).__name__)}"
+
+
+_plex_request = instrument_function(_plex_request, GROUP_BACKEND, _plex_series_name)
+
+
+def _connect_plex_server(timeout):
+    # The PlexServer constructor already fetches the server root (which
+    # carries the version), so no extra round trip is needed to validate it.
+    return _plex_request_impl(PlexServer, PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL,
+                              session=get_service_session("plex"), timeout=timeout)
+
+
+def _remember_plex_server_locked(plex, config_key):
+    """Makes plex the cached connection. Caller holds _plex_connection_lock."""
+    global _plex_server_instance, _plex_server_config_key
+    if PLEX_CONNECTION_STATS["connects"] > 0:
+        PLEX_CONNECTION_STATS["reconnects"] += 1
+    PLEX_CONNECTION_STATS["connects"] += 1
+    PLEX_CONNECTION_STATS["last_connect_time"] = time.time()
+    _plex_server_instance = plex
+    _plex_server_config_key = config_key
+    logger.info(
+        f"Connected to Plex server (connects: {PLEX_CONNECTION_STATS['connects']}, reused: {PLEX_CONNECTION_STATS['reused']}).")
+
+
 def get_plex_server_connection():
     if not PLEX_URL_GLOBAL or not PLEX_TOKEN_GLOBAL:
         logger.error(
             "Plex URL or Token not configured for get_plex_server_connection.")
         return None
-    try:
-        plex = PlexServer(PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL, timeout=10)
-        _plex_request(getattr, plex, 'version')
+
+    config_key = (PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL)
+    plex = _plex_server_instance
+    if plex is not None and _plex_server_config_key == config_key:
+        PLEX_CONNECTION_STATS["reused"] += 1
+        return plex
+
+    with _plex_connection_lock:
+        if _plex_server_instance is not None and _plex_server_config_key == config_key:
+            PLEX_CONNECTION_STATS["reused"] += 1
+            return _plex_server_instance
+        try:
+            plex = _connect_plex_server(PLEX_CONNECT_TIMEOUT)
+        except PlexApiException as e:
+            PLEX_CONNECTION_STATS["failures"] += 1
+            logger.error(f"Plex API connection failed: {e}", exc_info=True)
+            if hasattr(e, 'response') and e.response and e.response.status_code == 401:
+                logger.error("Plex Error: Unauthorized. Check PLEX_TOKEN.")
+            return None
+        except requests.exceptions.RequestException as e:
+            PLEX_CONNECTION_STATS["failures"] += 1
+            logger.error(
+                f"Plex network connection failed: {e}", exc_info=True)
+            return None
+        except Exception as e:
+            PLEX_CONNECTION_STATS["failures"] += 1
+            logger.error(
+                f"Unexpected error connecting to Plex server: {e}", exc_info=True)
+            return None
+
+        _remember_plex_server_locked(plex, config_key)
         return plex
-    except PlexApiException as e:
-        logger.error(f"Plex API connection failed: {e}", exc_info=True)
-        if hasattr(e, 'response') and e.response and e.response.status_code == 401:
-            logger.error("Plex Error: Unauthorized. Check PLEX_TOKEN.")
-        return None
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Plex network connection failed: {e}", exc_info=True)
-        return None
-    except Exception as e:
-        logger.error(
-            f"Unexpected error connecting to Plex server: {e}", exc_info=True)
-        return None
 
 
 def clean_plex_bundles():
@@ -125,6 +224,7 @@ def get_plex_server_info_formatted():
             "Version": version,
             "Platform": f"{platform} ({platform_version})",
             "Transcoder Active Sessions": str(len(active_transcodes)) if active_transcodes is not None else "0",
+            "Bot Connection": f"reused {PLEX_CONNECTION_STATS['reused']}x, reconnects {PLEX_CONNECTION_STATS['reconnects']}",
         }
         return info
     except AttributeError as ae:
@@ -137,18 +237,31 @@ def get_plex_server_info_formatted():
 
 
 def check_plex_connection() -> bool:
-    """Performs a quick health check for Plex."""
+    """Performs a quick, single-attempt health check for Plex (no backoff retries)."""
     if not PLEX_URL_GLOBAL or not PLEX_TOKEN_GLOBAL:
         return False
+    config_key = (PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL)
     try:
-        # Use a very short timeout for a quick check
-        plex = PlexServer(PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL, timeout=3)
-        # Accessing a simple attribute like version should be lightweight
-        # Use _plex_request for backoff
-        _plex_request(getattr, plex, 'version')
+        plex = _plex_server_instance
+        if plex is not None and _plex_server_config_key == config_key:
+            # Reuse the cached connection; /identity is the cheapest endpoint.
+            plex.query('/identity', timeout=PLEX_HEALTH_CHECK_TIMEOUT)
+        else:
+            # Use a very short timeout for a quick check
+            plex = PlexServer(PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL,
+                              session=get_service_session("plex"), timeout=PLEX_HEALTH_CHECK_TIMEOUT)
+            # Kept as the cached connection so the next request does not
+            # connect again, with the normal timeout for later requests.
+            plex._timeout = PLEX_CONNECT_TIMEOUT
+            with _plex_connection_lock:
+                if _plex_server_instance is None and config_key == (PLEX_URL_GLOBAL, PLEX_TOKEN_GLOBAL):
+                    _remember_plex_server_locked(plex, config_key)
         logger.debug("Plex health check: PASSED")
         return True
     except Exception as e:
+        if _is_plex_connection_error(e):
+            invalidate_plex_server_connection(
+                f"{type(e).__name__} during health check")
         # Log at debug, as this is a health check and might fail often if service is temporarily down
         logger.debug(
             f"Plex health check: FAILED - {type(e).__name__}: {e}", exc_info=False)
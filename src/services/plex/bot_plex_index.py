@@ -0,0 +1,328 @@
+import bisect
+import datetime
+import logging
+import re
+import sys
+import threading
+import time
+import unicodedata
+from collections import namedtuple
+
+from . import bot_plex_core
+from .bot_plex_core import _plex_request, get_plex_server_connection
+
+logger = logging.getLogger(__name__)
+
+# Sections not synced for this long are considered stale; callers then use
+# live Plex queries instead of the index.
+PLEX_INDEX_MAX_AGE_SECONDS = 900
+# Deltas cannot see removed seasons/episodes, so sections are rebuilt from
+# scratch at least this often.
+PLEX_INDEX_FULL_REBUILD_SECONDS = 6 * 3600
+# Items updated within this window before the last sync are fetched again,
+# covering clock skew between the bot and the Plex server.
+PLEX_INDEX_DELTA_OVERLAP_SECONDS = 120
+PLEX_INDEX_SECTION_TYPES = ("movie", "show")
+# Only these types are returned by search; seasons/episodes are for navigation.
+PLEX_INDEX_SEARCHABLE_TYPES = ("movie", "show")
+PLEX_INDEX_SUMMARY_LENGTH = 100
+
+PlexIndexItem = namedtuple("PlexIndexItem", [
+    "rating_key", "type", "title", "year", "added_at", "section_key",
+    "parent_key", "index", "parent_index", "grandparent_title", "summary_short",
+])
+
+_items: dict[int, PlexIndexItem] = {}
+# parent rating key -> set of child rating keys (show -> seasons, season -> episodes)
+_children: dict[int, set] = {}
+# token -> set of rating keys of searchable items whose title contains it
+_tokens: dict[str, set] = {}
+_sorted_tokens: list = []
+_sorted_tokens_dirty = False
+# section_key -> {"type", "title", "synced_at", "rebuilt_at", "delta_since"}
+_sections: dict[str, dict] = {}
+# (url, token) the index was built from; a config change discards the index.
+_indexed_server_key = None
+_index_lock = threading.RLock()
+
+PLEX_INDEX_STATS = {
+    "section_rebuilds": 0,
+    "delta_syncs": 0,
+    "delta_items": 0,
+    "index_hits": 0,
+    "live_fallbacks": 0,
+    "last_sync_ms": 0.0,
+}
+
+_TOKEN_SPLIT_RE = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def _tokenize(text: str) -> list:
+    normalized = unicodedata.normalize("NFKD", str(text or "").lower())
+    normalized = "".join(
+        ch for ch in normalized if not unicodedata.combining(ch))
+    return [token for token in _TOKEN_SPLIT_RE.split(normalized) if token]
+
+
+def _timestamp(value) -> int:
+    if isinstance(value, datetime.datetime):
+        return int(value.timestamp())
+    return int(value or 0)
+
+
+def _to_index_item(plex_item, section_key: str) -> PlexIndexItem:
+    item_type = getattr(plex_item, 'type', None)
+    summary_short = None
+    if item_type in PLEX_INDEX_SEARCHABLE_TYPES:
+        summary_short = getattr(plex_item, 'summary', "") or ""
+        if len(summary_short) > PLEX_INDEX_SUMMARY_LENGTH:
+            summary_short = summary_short[:PLEX_INDEX_SUMMARY_LENGTH] + "..."
+    parent_key = getattr(plex_item, 'parentRatingKey', None)
+    grandparent_title = getattr(plex_item, 'grandparentTitle', None)
+    return PlexIndexItem(
+        rating_key=int(plex_item.ratingKey),
+        type=item_type,
+        title=getattr(plex_item, 'title', None) or "",
+        year=getattr(plex_item, 'year', None),
+        added_at=_timestamp(getattr(plex_item, 'addedAt', None)),
+        section_key=section_key,
+        parent_key=int(parent_key) if parent_key else None,
+        index=getattr(plex_item, 'index', None),
+        parent_index=getattr(plex_item, 'parentIndex', None),
+        # Shared by every episode of a show; keep one copy.
+        grandparent_title=sys.intern(
+            grandparent_title) if grandparent_title else None,
+        summary_short=summary_short,
+    )
+
+
+def _unlink_item_locked(rating_key: int):
+    global _sorted_tokens_dirty
+    old_item = _items.pop(rating_key, None)
+    if old_item is None:
+        return
+    if old_item.parent_key is not None:
+        siblings = _children.get(old_item.parent_key)
+        if siblings is not None:
+            siblings.discard(rating_key)
+    if old_item.type in PLEX_INDEX_SEARCHABLE_TYPES:
+        for token in set(_tokenize(old_item.title)):
+            token_keys = _tokens.get(token)
+            if token_keys is not None:
+                token_keys.discard(rating_key)
+                if not token_keys:
+                    del _tokens[token]
+                    _sorted_tokens_dirty = True
+
+
+def _store_item_locked(item: PlexIndexItem):
+    global _sorted_tokens_dirty
+    _unlink_item_locked(item.rating_key)
+    _items[item.rating_key] = item
+    if item.parent_key is not None:
+        _children.setdefault(item.parent_key, set()).add(item.rating_key)
+    if item.type in PLEX_INDEX_SEARCHABLE_TYPES:
+        for token in set(_tokenize(item.title)):
+            if token not in _tokens:
+                _tokens[token] = set()
+                _sorted_tokens_dirty = True
+            _tokens[token].add(item.rating_key)
+
+
+def _drop_section_locked(section_key: str):
+    for rating_key in [key for key, item in _items.items() if item.section_key == section_key]:
+        _unlink_item_locked(rating_key)
+        _children.pop(rating_key, None)
+    _sections.pop(section_key, None)
+
+
+def _section_libtypes(section_type: str) -> tuple:
+    return ("movie",) if section_type == "movie" else ("show", "season", "episode")
+
+
+def _rebuild_section(section, section_key: str):
+    fetched = []
+    for libtype in _section_libtypes(section.type):
+        fetched.extend(_plex_request(section.search, libtype=libtype))
+    now = time.time()
+    with _index_lock:
+        _drop_section_locked(section_key)
+        for plex_item in fetched:
+            _store_item_locked(_to_index_item(plex_item, section_key))
+        _sections[section_key] = {
+            "type": section.type, "title": section.title,
+            "synced_at": now, "rebuilt_at": now, "delta_since": now,
+        }
+    PLEX_INDEX_STATS["section_rebuilds"] += 1
+    logger.info(
+        f"Plex index: section '{section.title}' rebuilt with {len(fetched)} items.")
+
+
+def _sync_section_delta(section, section_key: str) -> bool:
+    """Applies items added or updated since the last sync. Returns False if a rebuild is needed."""
+    state = _sections[section_key]
+    since = datetime.datetime.fromtimestamp(
+        state["delta_since"] - PLEX_INDEX_DELTA_OVERLAP_SECONDS)
+    sync_started = time.time()
+    changed = []
+    for libtype in _section_libtypes(section.type):
+        changed.extend(_plex_request(
+            section.search, libtype=libtype, **{"updatedAt>>": since}))
+    with _index_lock:
+        for plex_item in changed:
+            _store_item_locked(_to_index_item(plex_item, section_key))
+        top_level_type = "movie" if section.type == "movie" else "show"
+        indexed_top_level = sum(1 for item in _items.values()
+                                if item.section_key == section_key and item.type == top_level_type)
+        state["synced_at"] = sync_started
+        state["delta_since"] = sync_started
+    PLEX_INDEX_STATS["delta_syncs"] += 1
+    PLEX_INDEX_STATS["delta_items"] += len(changed)
+    # Removed movies/shows do not show up in deltas; a count mismatch means
+    # something was deleted.
+    return _plex_request(lambda: section.totalSize) == indexed_top_level
+
+
+def sync_plex_index() -> bool:
+    """
+    Brings the index up to date: sections are rebuilt when new or due for a
+    full rebuild, otherwise only items updated since the last sync are
+    fetched. Runs in the Plex executor (see app_catalog_sync).
+    """
+    global _indexed_server_key
+    plex = get_plex_server_connection()
+    if not plex:
+        return False
+    server_key = (bot_plex_core.PLEX_URL_GLOBAL,
+                  bot_plex_core.PLEX_TOKEN_GLOBAL)
+    if server_key != _indexed_server_key:
+        invalidate_plex_index()
+        _indexed_server_key = server_key
+    started = time.monotonic()
+    sections = [section for section in _plex_request(plex.library.sections)
+                if section.type in PLEX_INDEX_SECTION_TYPES]
+    current_keys = {str(section.key) for section in sections}
+    with _index_lock:
+        for section_key in [key for key in _sections if key not in current_keys]:
+            _drop_section_locked(section_key)
+    for section in sections:
+        section_key = str(section.key)
+        state = _sections.get(section_key)
+        try:
+            if state is None or time.time() - state["rebuilt_at"] > PLEX_INDEX_FULL_REBUILD_SECONDS or \
+                    not _sync_section_delta(section, section_key):
+                _rebuild_section(section, section_key)
+        except Exception as e:
+            logger.warning(
+                f"Plex index: could not sync section '{getattr(section, 'title', section_key)}': {e}")
+    PLEX_INDEX_STATS["last_sync_ms"] = round(
+        (time.monotonic() - started) * 1000, 2)
+    return True
+
+
+def invalidate_plex_index():
+    global _sorted_tokens_dirty
+    with _index_lock:
+        _items.clear()
+        _children.clear()
+        _tokens.clear()
+        _sections.clear()
+        _sorted_tokens_dirty = True
+    logger.debug("Plex index cleared.")
+
+
+def _is_section_fresh(section_key) -> bool:
+    if _indexed_server_key != (bot_plex_core.PLEX_URL_GLOBAL, bot_plex_core.PLEX_TOKEN_GLOBAL):
+        return False
+    state = _sections.get(str(section_key))
+    return state is not None and time.time() - state["synced_at"] <= PLEX_INDEX_MAX_AGE_SECONDS
+
+
+def _record_lookup(hit: bool):
+    PLEX_INDEX_STATS["index_hits" if hit else "live_fallbacks"] += 1
+
+
+def search_plex_index(query_text: str, max_results: int) -> list | None:
+    """
+    Movies and shows whose title has every query word as a word prefix,
+    best matches first. None when the index has no fresh section to answer from.
+    """
+    global _sorted_tokens, _sorted_tokens_dirty
+    with _index_lock:
+        if not _sections or not all(_is_section_fresh(key) for key in _sections):
+            _record_lookup(False)
+            return None
+        query_tokens = _tokenize(query_text)
+        if not query_tokens:
+            _record_lookup(True)
+            return []
+        if _sorted_tokens_dirty:
+            _sorted_tokens = sorted(_tokens)
+            _sorted_tokens_dirty = False
+        matching_keys = None
+        for query_token in query_tokens:
+            token_matches = set()
+            position = bisect.bisect_left(_sorted_tokens, query_token)
+            while position < len(_sorted_tokens) and _sorted_tokens[position].startswith(query_token):
+                token_matches |= _tokens[_sorted_tokens[position]]
+                position += 1
+            matching_keys = token_matches if matching_keys is None else matching_keys & token_matches
+            if not matching_keys:
+                break
+        matches = [_items[key] for key in (matching_keys or ())]
+    _record_lookup(True)
+    normalized_query = " ".join(query_tokens)
+
+    def rank(item):
+        normalized_title = " ".join(_tokenize(item.title))
+        return (normalized_title != normalized_query,
+                not normalized_title.startswith(normalized_query),
+                -(item.added_at or 0))
+    return sorted(matches, key=rank)[:max_results]
+
+
+def get_indexed_recently_added(section_key, max_items: int) -> dict | None:
+    """Newest movies (movie sections) or episodes (show sections), or None if the section is not fresh."""
+    with _index_lock:
+        state = _sections.get(str(section_key))
+        if state is None or not _is_section_fresh(section_key):
+            _record_lookup(False)
+            return None
+        wanted_type = "movie" if state["type"] == "movie" else "episode"
+        items = [item for item in _items.values()
+                 if item.section_key == str(section_key) and item.type == wanted_type]
+    _record_lookup(True)
+    items.sort(key=lambda item: item.added_at or 0, reverse=True)
+    return {"section_title": state["title"], "section_type": state["type"], "items": items[:max_items]}
+
+
+def get_indexed_item(rating_key) -> PlexIndexItem | None:
+    with _index_lock:
+        item = _items.get(int(rating_key))
+        if item is None or not _is_section_fresh(item.section_key):
+            return None
+        return item
+
+
+def get_indexed_children(parent_rating_key) -> list | None:
+    """Children of a show or season sorted by index, or None if the parent is not indexed and fresh."""
+    with _index_lock:
+        parent = _items.get(int(parent_rating_key))
+        if parent is None or not _is_section_fresh(parent.section_key):
+            _record_lookup(False)
+            return None
+        children = [_items[key]
+                    for key in _children.get(parent.rating_key, ()) if key in _items]
+    _record_lookup(True)
+    return sorted(children, key=lambda item: (item.index is None, item.index or 0))
+
+
+def get_plex_index_stats() -> dict:
+    stats = dict(PLEX_INDEX_STATS)
+    with _index_lock:
+        stats["items"] = len(_items)
+        stats["tokens"] = len(_tokens)
+        stats["sections"] = len(_sections)
+        stats["fresh_sections"] = sum(
+            1 for key in _sections if _is_section_fresh(key))
+    return stats
@@ -2,13 +2,44 @@ import logging
 import math
 from src.bot.bot_text_utils import escape_md_v1, escape_md_v2, escape_for_inline_code
 from .bot_plex_core import _plex_request, get_plex_server_connection
+from .bot_plex_index import get_indexed_recently_added, get_indexed_item, get_indexed_children
 from plexapi.exceptions import PlexApiException, NotFound
 import src.app.app_config_holder as app_config_holder
 
 logger = logging.getLogger(__name__)
 
 
+def _format_season_episode(season_num, ep_num) -> str:
+    s_str = f"S{season_num:02d}" if isinstance(
+        season_num, int) else f"S{season_num}" if season_num else ""
+    e_str = f"E{ep_num:02d}" if isinstance(
+        ep_num, int) else f"E{ep_num}" if ep_num else ""
+    return f"{s_str}{e_str}"
+
+
+def _get_recently_added_indexed(library_key_str: str, max_items: int):
+    indexed = get_indexed_recently_added(library_key_str, max_items)
+    if indexed is None:
+        return None
+    items_to_return = []
+    for item in indexed["items"]:
+        if item.type == "movie":
+            display_text = f"{item.title} ({item.year})" if item.year else item.title
+        else:
+            display_text = f"{item.grandparent_title or 'Unknown Show'} - {_format_season_episode(item.parent_index, item.index)} - {item.title or 'Unknown Episode'}"
+        items_to_return.append(
+            {"type": item.type, "ratingKey": item.rating_key, "display_text": display_text})
+    section_title = escape_md_v1(indexed["section_title"])
+    if not items_to_return:
+        return {"items": [], "message": f"No recently added items found in library '{section_title}'."}
+    return {"items": items_to_return, "message": f"Fetched {len(items_to_return)} recently added from '{section_title}'."}
+
+
 def get_recently_added_from_library(library_key_str: str, max_items: int = 10):
+    indexed_response = _get_recently_added_indexed(library_key_str, max_items)
+    if indexed_response is not None:
+        return indexed_response
+
     plex = get_plex_server_connection()
     if not plex:
         return {"error": "Plex not configured or connection failed."}
@@ -40,14 +71,10 @@ def get_recently_added_from_library(library_key_str: str, max_items: int = 10):
                     season_num = getattr(episode, 'parentIndex', '')
                     ep_num = getattr(episode, 'index', '')
                     ep_title = getattr(episode, 'title', 'Unknown Episode')
-                    s_str = f"S{season_num:02d}" if isinstance(
-                        season_num, int) else f"S{season_num}" if season_num else ""
-                    e_str = f"E{ep_num:02d}" if isinstance(
-                        ep_num, int) else f"E{ep_num}" if ep_num else ""
                     items_to_return.append({
                         "type": "episode",
                         "ratingKey": episode.ratingKey,
-                        "display_text": f"{show_title} - {s_str}{e_str} - {ep_title}"
+                        "display_text": f"{show_title} - {_format_season_episode(season_num, ep_num)} - {ep_title}"
                     })
             except Exception as e_ep:
                 logger.error(
@@ -130,7 +157,36 @@ def get_plex_item_details(rating_key_str: str):
         return {"error": "Error fetching item details from Plex. Check logs."}
 
 
+def _season_title(title, season_number) -> str:
+    season_title = title or f"Season {season_number}"
+    if season_number == 0 and "Specials" not in season_title and "Season 0" in season_title:
+        season_title = "Specials"
+    return season_title
+
+
+def _get_show_seasons_indexed(show_rating_key: int):
+    show_item = get_indexed_item(show_rating_key)
+    if show_item is None or show_item.type != 'show':
+        return None
+    seasons = get_indexed_children(show_rating_key)
+    if seasons is None:
+        return None
+    seasons_data = [{
+        "title": _season_title(season.title, season.index), "season_number": season.index,
+        "ratingKey": season.rating_key, "show_rating_key": show_rating_key,
+        "show_title": show_item.title
+    } for season in seasons]
+    return {"seasons": seasons_data, "show_title": show_item.title, "show_rating_key": show_rating_key}
+
+
 def get_plex_show_seasons(show_rating_key_str: str):
+    try:
+        indexed_response = _get_show_seasons_indexed(int(show_rating_key_str))
+        if indexed_response is not None:
+            return indexed_response
+    except (TypeError, ValueError):
+        pass
+
     plex = get_plex_server_connection()
     if not plex:
         return {"error": "Plex not configured or connection failed."}
@@ -142,12 +198,8 @@ def get_plex_show_seasons(show_rating_key_str: str):
         seasons_data = []
         plex_seasons = _plex_request(show_item.seasons)
         for season_obj in plex_seasons:
-            season_title = getattr(season_obj, 'title',
-                                   f"Season {season_obj.index}")
-            if season_obj.index == 0 and "Specials" not in season_title and "Season 0" in season_title:
-                season_title = "Specials"
             seasons_data.append({
-                "title": season_title, "season_number": season_obj.index,
+                "title": _season_title(getattr(season_obj, 'title', None), season_obj.index), "season_number": season_obj.index,
                 "ratingKey": season_obj.ratingKey, "show_rating_key": show_rating_key,
                 "show_title": show_item.title
             })
@@ -160,7 +212,47 @@ def get_plex_show_seasons(show_rating_key_str: str):
         return {"error": "Error fetching show seasons from Plex."}
 
 
+def _get_season_episodes_indexed(show_rating_key: int, season_number: int):
+    show_item = get_indexed_item(show_rating_key)
+    if show_item is None or show_item.type != 'show':
+        return None
+    seasons = get_indexed_children(show_rating_key) or []
+    target_season = next(
+        (season for season in seasons if season.index == season_number), None)
+    if target_season is None:
+        return None
+    episodes = get_indexed_children(target_season.rating_key)
+    if episodes is None:
+        return None
+    episodes_data = []
+    for episode in episodes:
+        s_num_disp = episode.parent_index if episode.parent_index is not None else season_number
+        e_num_disp = episode.index if episode.index is not None else '?'
+        episodes_data.append({
+            "ratingKey": episode.rating_key,
+            "title": f"S{s_num_disp:02d}E{e_num_disp:02d} - {episode.title or f'Episode {e_num_disp}'}",
+            "show_rating_key": show_rating_key,
+            "season_number": season_number
+        })
+    return {
+        "records": episodes_data,
+        "totalRecords": len(episodes_data),
+        "show_title": show_item.title,
+        "season_title": target_season.title,
+        "show_rating_key": show_rating_key,
+        "season_number": season_number
+    }
+
+
 def get_plex_season_episodes(show_rating_key_str: str, season_number_str: str):
+    try:
+        indexed_response = _get_season_episodes_indexed(
+            int(show_rating_key_str), int(season_number_str))
+        if indexed_response is not None:
+            return indexed_response
+    except (TypeError, ValueError):
+        pass
+
     plex = get_plex_server_connection()
     if not plex:
         return {"error": "Plex not configured or connection failed."}
@@ -1,90 +1,93 @@
 import logging
 from src.bot.bot_text_utils import escape_md_v1, escape_md_v2
 from .bot_plex_core import _plex_request, get_plex_server_connection
+from .bot_plex_session_listener import get_live_plex_sessions, plex_session_snapshot
 from plexapi.exceptions import PlexApiException, NotFound, BadRequest as PlexApiBadRequest
 
 logger = logging.getLogger(__name__)
 
 
-def get_now_playing_structured():
-    plex = get_plex_server_connection()
-    if not plex:
+def _build_now_playing(snapshots: list) -> dict:
+    if not snapshots:
+        return {"playing": [], "summary_text": escape_md_v2("Nothing is currently playing.")}
 
-        return {"error": "Plex not configured or connection failed.", "playing": [], "summary_text": escape_md_v2("Plex not configured/connection failed.")}
+    playing_items = []
 
-    try:
-        sessions = _plex_request(plex.sessions)
-        if not sessions:
-            return {"playing": [], "summary_text": escape_md_v2("Nothing is currently playing.")}
+    summary_parts = [escape_md_v2("*Now Playing:*\n")]
+    for snapshot in snapshots:
+        user_title_raw = snapshot['user_title']
+        media_title_raw = snapshot['media_title']
 
-        playing_items = []
+        user_md = escape_md_v2(user_title_raw)
+        title_md = escape_md_v2(media_title_raw)
+        media_type_md = escape_md_v2(snapshot['type'] or "unknown")
+        state_raw = snapshot['state'] or "Unknown State"
+        state_md = escape_md_v2(state_raw)
 
-        summary_parts = [escape_md_v2("*Now Playing:*\n")]
-        for session in sessions:
-            user_title_raw = session.user.title if session.user else "Unknown User"
-            media_title_raw = session.title or "Unknown Title"
+        progress_percent = 0
+        duration, view_offset = snapshot['duration'], snapshot['view_offset']
+        if duration and view_offset is not None and duration > 0:
+            progress_percent = round(view_offset / duration * 100, 1)
 
-            user_md = escape_md_v2(user_title_raw)
-            title_md = escape_md_v2(media_title_raw)
-            media_type_md = escape_md_v2(session.type or "unknown")
-            state_raw = session.players[0].state if session.players else "Unknown State"
-            state_md = escape_md_v2(state_raw)
+        progress_percent_md = escape_md_v2(f"{progress_percent}%")
 
-            progress_percent = 0
-            if hasattr(session, 'duration') and session.duration and \
-               hasattr(session, 'viewOffset') and session.viewOffset is not None:
-                if session.duration > 0:
-                    progress_percent = round(
-                        session.viewOffset / session.duration * 100, 1)
+        item_summary = f"\\- *User:* {user_md}\n  *Title:* {title_md} \\({media_type_md}\\)\n  *State:* {state_md} \\({progress_percent_md}\\)\n"
 
-            progress_percent_md = escape_md_v2(f"{progress_percent}%")
+        session_id_for_stop = snapshot['session_key']
+        player_identifier = snapshot['player_identifier']
 
-            item_summary = f"\\- *User:* {user_md}\n  *Title:* {title_md} \\({media_type_md}\\)\n  *State:* {state_md} \\({progress_percent_md}\\)\n"
+        if not session_id_for_stop and not player_identifier:
+            logger.warning(
+                f"Could not determine a unique sessionKey/ID or player ID for session: User='{user_title_raw}', Title='{media_title_raw}'. Stop button might not work reliably.")
 
-            session_id_for_stop = getattr(session, 'sessionKey', None)
-            if not session_id_for_stop and hasattr(session, 'session') and session.session:
-                session_id_for_stop = getattr(session.session, 'id', None)
+        item_data = {
+            'user_title': user_title_raw,
+            'media_title': media_title_raw,
+            'type': snapshot['type'],
+            'session_id_for_stop': session_id_for_stop,
+            'player_identifier_for_stop': player_identifier,
+            'summary_text_md': item_summary
+        }
 
-            player_identifier = None
-            if session.players:
-                player_identifier = getattr(
-                    session.players[0], 'machineIdentifier', None)
+        if snapshot['type'] == 'episode':
+            show_title_md_v2 = escape_md_v2(
+                snapshot['show_title'] or "Unknown Show")
+            season_index_md_v2 = escape_md_v2(
+                str(snapshot['season_index']) if snapshot['season_index'] is not None else "N/A")
+            episode_index_md_v2 = escape_md_v2(
+                str(snapshot['episode_index']) if snapshot['episode_index'] is not None else "N/A")
+            item_data['summary_text_md'] += f"  *Show:* {show_title_md_v2}\n  *Season:* {season_index_md_v2}, *Episode:* {episode_index_md_v2}\n"
+        elif snapshot['type'] == 'movie':
+            year_str_md_v2 = escape_md_v2(
+                str(snapshot['year']) if snapshot['year'] else "N/A")
+            item_data['summary_text_md'] += f"  *Year:* {year_str_md_v2}\n"
 
-            if not session_id_for_stop and not player_identifier:
-                logger.warning(
-                    f"Could not determine a unique sessionKey/ID or player ID for session: User='{user_title_raw}', Title='{media_title_raw}'. Stop button might not work reliably.")
-
-            item_data = {
-                'user_title': user_title_raw,
-                'media_title': media_title_raw,
-                'type': session.type,
-                'session_id_for_stop': session_id_for_stop,
-                'player_identifier_for_stop': player_identifier,
-                'summary_text_md': item_summary
-            }
-
-            if session.type == 'episode':
-                show_title_md_v2 = escape_md_v2(
-                    session.grandparentTitle or "Unknown Show")
-                season_index_md_v2 = escape_md_v2(
-                    str(session.parentIndex) if session.parentIndex is not None else "N/A")
-                episode_index_md_v2 = escape_md_v2(
-                    str(session.index) if session.index is not None else "N/A")
-                item_data['summary_text_md'] += f"  *Show:* {show_title_md_v2}\n  *Season:* {season_index_md_v2}, *Episode:* {episode_index_md_v2}\n"
-            elif session.type == 'movie' and hasattr(session, 'year'):
-                year_str_md_v2 = escape_md_v2(
-                    str(session.year) if session.year else "N/A")
-                item_data['summary_text_md'] += f"  *Year:* {year_str_md_v2}\n"
-
-            item_data['summary_text_md'] += "\n"
-            summary_parts.append(item_data['summary_text_md'])
-            playing_items.append(item_data)
-
-        full_summary_text = "".join(summary_parts).strip()
-        if not playing_items:
-            full_summary_text = escape_md_v2("Nothing is currently playing.")
-
-        return {"playing": playing_items, "summary_text": full_summary_text}
+        item_data['summary_text_md'] += "\n"
+        summary_parts.append(item_data['summary_text_md'])
+        playing_items.append(item_data)
+
+    full_summary_text = "".join(summary_parts).strip()
+    if not playing_items:
+        full_summary_text = escape_md_v2("Nothing is currently playing.")
+
+    return {"playing": playing_items, "summary_text": full_summary_text}
+
+
+def get_now_playing_structured():
+    # While the notification listener is connected the session table is
+    # already current, so Plex is not asked again.
+    live_sessions = get_live_plex_sessions()
+    if live_sessions is not None:
+        return _build_now_playing(live_sessions)
+
+    plex = get_plex_server_connection()
+    if not plex:
+
+        return {"error": "Plex not configured or connection failed.", "playing": [], "summary_text": escape_md_v2("Plex not configured/connection failed.")}
+
+    try:
+        sessions = _plex_request(plex.sessions)
+        return _build_now_playing([plex_session_snapshot(session) for session in sessions or []])
 
     except Exception as e:
         logger.error(
@@ -1,12 +1,43 @@
 import logging
 from src.bot.bot_text_utils import escape_md_v1
 from .bot_plex_core import _plex_request, get_plex_server_connection
+from .bot_plex_index import search_plex_index
 import src.app.app_config_holder as app_config_holder
 
 logger = logging.getLogger(__name__)
 
 
+def _search_plex_media_indexed(query_text: str, max_results_config: int):
+    indexed_results = search_plex_index(query_text, max_results_config)
+    if indexed_results is None:
+        return None
+    escaped_query_text = escape_md_v1(query_text)
+    if not indexed_results:
+        return {"results": [], "message": f"No results found in Plex for '{escaped_query_text}'."}
+    formatted_results = [{
+        "id": item.rating_key,
+        "title": item.title,
+        "year_str": f" ({item.year})" if item.year else "",
+        "type": item.type,
+        "summary_short": item.summary_short or "No summary."
+    } for item in indexed_results]
+    return {
+        "results": formatted_results,
+        "message": f"Found {len(formatted_results)} relevant results for '{escaped_query_text}'.",
+    }
+
+
 def search_plex_media(query_text: str):
+    # Answered from the local library index while it is fresh.
+    try:
+        indexed_response = _search_plex_media_indexed(
+            query_text, app_config_holder.get_add_media_max_search_results())
+        if indexed_response is not None:
+            return indexed_response
+    except Exception as e:
+        logger.warning(
+            f"Plex index search for '{query_text}' failed, using live search: {e}")
+
     plex = get_plex_server_connection()
     if not plex:
         return {"error": "Plex not configured or connection failed."}
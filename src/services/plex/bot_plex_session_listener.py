@@ -0,0 +1,242 @@
+import logging
+import threading
+import time
+
+from . import bot_plex_core
+from .bot_plex_core import _plex_request, get_plex_server_connection
+
+logger = logging.getLogger(__name__)
+
+# How often the watchdog job checks that the websocket is still connected.
+PLEX_SESSION_LISTENER_CHECK_INTERVAL_SECONDS = 30
+# The session table is re-read from /status/sessions at least this often, in
+# case a stop notification was lost while the websocket was reconnecting.
+PLEX_SESSION_RESEED_SECONDS = 600
+# A sessionKey that /status/sessions does not list yet is not re-queried sooner than this.
+UNKNOWN_SESSION_RETRY_SECONDS = 30
+
+_listener = None
+_listener_server_key = None
+_listener_lock = threading.Lock()
+
+# sessionKey -> snapshot dict. Replaced, never mutated, so readers need no lock.
+_sessions: dict = {}
+_sessions_lock = threading.Lock()
+_sessions_seeded_at = 0.0
+_unknown_session_keys: dict = {}
+
+# Called from the listener thread as callback(event, snapshot), event being
+# "started" or "stopped".
+_session_event_callback = None
+
+PLEX_SESSION_LISTENER_STATS = {
+    "starts": 0,
+    "errors": 0,
+    "notifications": 0,
+    "session_refetches": 0,
+    "events_started": 0,
+    "events_stopped": 0,
+}
+
+
+def _session_key(session):
+    session_key = getattr(session, 'sessionKey', None)
+    if not session_key and hasattr(session, 'session') and session.session:
+        session_key = getattr(session.session, 'id', None)
+    return str(session_key) if session_key else None
+
+
+def plex_session_snapshot(session) -> dict:
+    """The fields Now Playing shows for a plexapi session, as a plain dict."""
+    player = session.players[0] if session.players else None
+    return {
+        'session_key': _session_key(session),
+        'user_title': session.user.title if session.user else "Unknown User",
+        'media_title': session.title or "Unknown Title",
+        'type': session.type,
+        'state': player.state if player else None,
+        'player_identifier': getattr(player, 'machineIdentifier', None) if player else None,
+        'view_offset': getattr(session, 'viewOffset', None),
+        'duration': getattr(session, 'duration', None),
+        'show_title': getattr(session, 'grandparentTitle', None),
+        'season_index': getattr(session, 'parentIndex', None),
+        'episode_index': getattr(session, 'index', None),
+        'year': getattr(session, 'year', None),
+    }
+
+
+def _emit_session_event(event: str, snapshot: dict):
+    PLEX_SESSION_LISTENER_STATS[f"events_{event}"] += 1
+    callback = _session_event_callback
+    if callback is None:
+        return
+    try:
+        callback(event, snapshot)
+    except Exception as e:
+        logger.error(
+            f"Error in Plex session event callback ({event}): {e}", exc_info=True)
+
+
+def _replace_sessions(snapshots: list, notify: bool):
+    global _sessions, _sessions_seeded_at
+    new_sessions = {snapshot['session_key']: snapshot for snapshot in snapshots
+                    if snapshot['session_key']}
+    with _sessions_lock:
+        old_sessions = _sessions
+        _sessions = new_sessions
+        _sessions_seeded_at = time.monotonic()
+    if not notify:
+        return
+    for session_key, snapshot in new_sessions.items():
+        if session_key not in old_sessions:
+            _emit_session_event("started", snapshot)
+    for session_key, snapshot in old_sessions.items():
+        if session_key not in new_sessions:
+            _emit_session_event("stopped", snapshot)
+
+
+def _refresh_sessions(plex, notify: bool):
+    sessions = _plex_request(plex.sessions)
+    PLEX_SESSION_LISTENER_STATS["session_refetches"] += 1
+    _replace_sessions([plex_session_snapshot(s)
+                      for s in sessions or []], notify)
+
+
+def _on_alert(data: dict):
+    global _sessions
+    if data.get("type") != "playing":
+        return
+    for notification in data.get("PlaySessionStateNotification") or []:
+        PLEX_SESSION_LISTENER_STATS["notifications"] += 1
+        session_key = str(notification.get("sessionKey") or "")
+        state = notification.get("state")
+        if not session_key:
+            continue
+
+        if state == "stopped":
+            with _sessions_lock:
+                sessions = dict(_sessions)
+                snapshot = sessions.pop(session_key, None)
+                _sessions = sessions
+            _unknown_session_keys.pop(session_key, None)
+            if snapshot:
+                _emit_session_event("stopped", snapshot)
+            continue
+
+        snapshot = _sessions.get(session_key)
+        if snapshot is None:
+            # A new stream: notifications carry no user or title, so read the
+            # session list once to learn them.
+            if time.monotonic() - _unknown_session_keys.get(session_key, 0.0) < UNKNOWN_SESSION_RETRY_SECONDS:
+                continue
+            _unknown_session_keys[session_key] = time.monotonic()
+            try:
+                plex = get_plex_server_connection()
+                if plex:
+                    _refresh_sessions(plex, notify=True)
+            except Exception as e:
+                logger.warning(
+                    f"Could not read Plex sessions for new session {session_key}: {e}")
+            if session_key in _sessions:
+                _unknown_session_keys.pop(session_key, None)
+            continue
+
+        view_offset = notification.get("viewOffset")
+        updated_snapshot = {**snapshot, 'state': state or snapshot['state'],
+                            'view_offset': view_offset if view_offset is not None else snapshot['view_offset']}
+        with _sessions_lock:
+            if session_key in _sessions:
+                _sessions = {**_sessions, session_key: updated_snapshot}
+
+
+def _on_alert_error(error):
+    PLEX_SESSION_LISTENER_STATS["errors"] += 1
+    logger.warning(f"Plex notification websocket error: {error}")
+
+
+def _current_server_key() -> tuple:
+    return (bot_plex_core.PLEX_URL_GLOBAL, bot_plex_core.PLEX_TOKEN_GLOBAL)
+
+
+def is_plex_session_listener_running() -> bool:
+    listener = _listener
+    return listener is not None and listener.is_alive() and _listener_server_key == _current_server_key()
+
+
+def ensure_plex_session_listener() -> bool:
+    """
+    Starts the notification listener if it is not connected (or Plex settings
+    changed), seeding the session table first. A connected listener only gets
+    its table re-read once it is older than PLEX_SESSION_RESEED_SECONDS.
+    Blocking; run it through run_plex_call.
+    """
+    global _listener, _listener_server_key
+    with _listener_lock:
+        server_key = _current_server_key()
+        if is_plex_session_listener_running():
+            if time.monotonic() - _sessions_seeded_at > PLEX_SESSION_RESEED_SECONDS:
+                plex = get_plex_server_connection()
+                if plex:
+                    _refresh_sessions(plex, notify=True)
+            return True
+
+        # Reconnecting to the same server reports what changed while the
+        # socket was down; the first connection only takes the current state.
+        reconnecting = _listener_server_key == server_key
+        _stop_listener_locked()
+        plex = get_plex_server_connection()
+        if not plex:
+            return False
+        _refresh_sessions(plex, notify=reconnecting)
+        _listener = plex.startAlertListener(
+            callback=_on_alert, callbackError=_on_alert_error)
+        _listener_server_key = server_key
+        PLEX_SESSION_LISTENER_STATS["starts"] += 1
+        logger.info(
+            f"Plex session listener {'reconnected' if reconnecting else 'started'} with {len(_sessions)} active sessions.")
+        return True
+
+
+def _stop_listener_locked():
+    global _listener
+    listener = _listener
+    _listener = None
+    if listener is None:
+        return
+    try:
+        listener.stop()
+    except Exception as e:
+        logger.debug(f"Error stopping Plex session listener: {e}")
+
+
+def stop_plex_session_listener():
+    """Closes the websocket; Now Playing goes back to querying Plex directly."""
+    global _listener_server_key, _sessions
+    with _listener_lock:
+        had_listener = _listener is not None
+        _stop_listener_locked()
+        _listener_server_key = None
+    with _sessions_lock:
+        _sessions = {}
+    _unknown_session_keys.clear()
+    if had_listener:
+        logger.info("Plex session listener stopped.")
+
+
+def get_live_plex_sessions() -> list | None:
+    """Snapshots of the active sessions, or None when the listener is not connected."""
+    if not is_plex_session_listener_running():
+        return None
+    return list(_sessions.values())
+
+
+def set_plex_session_event_callback(callback):
+    global _session_event_callback
+    _session_event_callback = callback
+
+
+def get_plex_session_listener_stats() -> dict:
+    stats = dict(PLEX_SESSION_LISTENER_STATS)
+    stats["connected"] = is_plex_session_listener_running()
+    stats["active_sessions"] = len(_sessions)
+    return stats
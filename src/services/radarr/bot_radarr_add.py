@@ -1,59 +1,56 @@
-import os
 import json
 import logging
 import requests
-from src.app.app_file_utils import get_search_results_file_path
 from src.services.radarr.bot_radarr_core import _radarr_request
+from src.services.radarr.bot_radarr_catalog import find_movie_by_tmdb_id, store_movie_object
+from src.services.bot_lookup_cache import cached_lookup, clear_lookup_cache
+from src.services.bot_metadata_cache import get_cached_metadata, refresh_metadata
 import src.app.app_config_holder as app_config_holder
 
 logger = logging.getLogger(__name__)
 
-MOVIE_RESULTS_FILE_NAME = 'movie_search_results.json'
+# Lookup cache kind for /movie/lookup/tmdb, kept apart from search terms.
+LOOKUP_KIND_TMDB_ID = "tmdb_id"
 
 
-def get_movie_results_file_path_local():
-    return get_search_results_file_path(MOVIE_RESULTS_FILE_NAME)
+def _fetch_root_folders():
+    folders = _radarr_request('get', '/rootfolder')
+    if folders and isinstance(folders, list):
+        accessible_folders = [rf for rf in folders if rf.get('accessible')]
+        if accessible_folders:
+            return [{'id': rf['id'], 'path': rf['path']} for rf in accessible_folders]
+        return [{'id': rf['id'], 'path': rf['path']} for rf in folders]
+    return []
 
 
-def save_results(filename, results):
-    try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(results, file, indent=4)
-        logger.info(
-            f"Saved {len(results)} Radarr search results to {filename}")
-    except IOError:
-        logger.warning(
-            f"IOError saving Radarr results to {filename}", exc_info=True)
-        pass
-
-
-def load_results(filename):
-    if os.path.exists(filename):
-        try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                logger.info(
-                    f"Loaded {len(data)} Radarr results from {filename}")
-                return data
-        except (IOError, json.JSONDecodeError) as e:
-            logger.warning(
-                f"Error loading Radarr results from {filename}: {e}. Removing corrupt file.", exc_info=True)
-            try:
-                os.remove(filename)
-            except OSError:
-                pass
+def _fetch_quality_profiles():
+    profiles = _radarr_request('get', '/qualityprofile')
+    if profiles and isinstance(profiles, list):
+        return [{'id': p['id'], 'name': p['name']} for p in profiles]
     return []
 
 
+def _fetch_tags():
+    tags_list = _radarr_request('get', '/tag')
+    if tags_list and isinstance(tags_list, list):
+        return [{'id': t['id'], 'label': t['label']} for t in tags_list]
+    return []
+
+
+METADATA_FETCHERS = {
+    "root_folders": _fetch_root_folders,
+    "quality_profiles": _fetch_quality_profiles,
+    "tags": _fetch_tags,
+}
+
+
+def refresh_radarr_metadata():
+    return refresh_metadata("radarr", METADATA_FETCHERS)
+
+
 def get_root_folders():
     try:
-        folders = _radarr_request('get', '/rootfolder')
-        if folders and isinstance(folders, list):
-            accessible_folders = [rf for rf in folders if rf.get('accessible')]
-            if accessible_folders:
-                return [{'id': rf['id'], 'path': rf['path']} for rf in accessible_folders]
-            return [{'id': rf['id'], 'path': rf['path']} for rf in folders]
-        return []
+        return get_cached_metadata("radarr", "root_folders", _fetch_root_folders)
     except Exception as e:
         logger.error(f"Error getting Radarr root folders: {e}", exc_info=True)
         return []
@@ -61,10 +58,7 @@ def get_root_folders():
 
 def get_quality_profiles():
     try:
-        profiles = _radarr_request('get', '/qualityprofile')
-        if profiles and isinstance(profiles, list):
-            return [{'id': p['id'], 'name': p['name']} for p in profiles]
-        return []
+        return get_cached_metadata("radarr", "quality_profiles", _fetch_quality_profiles)
     except Exception as e:
         logger.error(
             f"Error getting Radarr quality profiles: {e}", exc_info=True)
@@ -73,10 +67,7 @@ def get_quality_profiles():
 
 def get_tags():
     try:
-        tags_list = _radarr_request('get', '/tag')
-        if tags_list and isinstance(tags_list, list):
-            return [{'id': t['id'], 'label': t['label']} for t in tags_list]
-        return []
+        return get_cached_metadata("radarr", "tags", _fetch_tags)
     except Exception as e:
         logger.error(f"Error getting Radarr tags: {e}", exc_info=True)
         return []
@@ -120,13 +111,21 @@ def get_default_quality_profile_id():
         return None
 
 
+def lookup_movies(term):
+    """/movie/lookup for a search term, served from the shared lookup cache when fresh."""
+    return cached_lookup("radarr", term, lambda: _radarr_request('get', '/movie/lookup', params={'term': term}))
+
+
+def lookup_movie_by_tmdb_id(tmdb_id):
+    return cached_lookup("radarr", tmdb_id, lambda: _radarr_request('get', f'/movie/lookup/tmdb?tmdbId={tmdb_id}'),
+                         kind=LOOKUP_KIND_TMDB_ID)
+
+
 def search_movie(query):
-    params = {'term': query}
-    results_file_full_path = get_movie_results_file_path_local()
     max_results_config = app_config_holder.get_add_media_max_search_results()
 
     try:
-        results = _radarr_request('get', '/movie/lookup', params=params)
+        results = lookup_movies(query)
         if not results or not isinstance(results, list) or len(results) == 0:
 
             return f'No Radarr results found for your query: \'{query}\'.'
@@ -138,9 +137,7 @@ def search_movie(query):
             first_result_tmdb_id = results[0].get('tmdbId')
             if first_result_tmdb_id:
                 try:
-                    existing = _radarr_request(
-                        'get', f'/movie?tmdbId={first_result_tmdb_id}')
-                    if existing:
+                    if find_movie_by_tmdb_id(first_result_tmdb_id):
                         return "All Radarr results found are already in your library."
                 except Exception:
                     pass
@@ -151,7 +148,6 @@ def search_movie(query):
         display_results = filtered_results[:max_results_config]
         logger.info(
             f"Radarr search for '{query}' found {raw_count} raw, {filtered_count_after_initial} initially filtered, limited to {len(display_results)} results based on config ({max_results_config}).")
-        save_results(results_file_full_path, display_results)
         return display_results
     except ValueError as e:
         logger.error(f"Radarr search ValueError: {e}", exc_info=True)
@@ -185,12 +181,11 @@ def add_movie(movie_tmdb_id, radarr_movie_object, quality_profile_id, root_folde
         'title', f"TMDB ID {movie_tmdb_id}")
 
     try:
-        existing_movies = _radarr_request(
-            'get', f'/movie?tmdbId={movie_tmdb_id}')
-        if existing_movies and isinstance(existing_movies, list) and len(existing_movies) > 0:
-            movie_title_existing = existing_movies[0].get(
-                'title', f"TMDB ID {movie_tmdb_id}")
-            return f"Movie '{movie_title_existing}' is already in Radarr."
+        # The catalogue may lag behind Radarr; a movie added meanwhile is
+        # still caught by the "already been added" 400 below.
+        existing_movie = find_movie_by_tmdb_id(movie_tmdb_id)
+        if existing_movie:
+            return f"Movie '{existing_movie.title}' is already in Radarr."
         movie_details_to_add = radarr_movie_object
         if not movie_details_to_add or not movie_details_to_add.get("title"):
             logger.error(
@@ -226,6 +221,9 @@ def add_movie(movie_tmdb_id, radarr_movie_object, quality_profile_id, root_folde
     try:
         add_response = _radarr_request(
             'post', '/movie', data=data, headers=headers)
+        # Cached lookups no longer show this movie as missing from the library.
+        clear_lookup_cache("radarr")
+        store_movie_object(add_response)
         if add_response and isinstance(add_response, dict) and add_response.get('id'):
             return f"Movie '{movie_title_for_msg}' added to Radarr successfully!"
         elif add_response is None and _radarr_request.last_response_status in [201, 202]:
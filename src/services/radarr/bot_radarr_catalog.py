@@ -0,0 +1,171 @@
+import datetime
+import logging
+import sys
+from collections import namedtuple
+
+import requests
+
+from .bot_radarr_core import _radarr_request, iter_radarr_json_array
+from src.services.bot_catalog_cache import (
+    replace_catalog, apply_catalog_changes, is_catalog_loaded, catalog_needs_full_refresh,
+    get_catalog_records, get_catalog_sync_cursor, find_catalog_record, invalidate_catalog
+)
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SERVICE_NAME = "radarr"
+
+# Only what the bot shows, looks up or aggregates is kept; a full Radarr movie
+# object is several KB, this is a couple of hundred bytes.
+MovieRecord = namedtuple("MovieRecord", [
+    "id", "title", "year", "tmdb_id", "monitored", "has_file",
+    "size_on_disk", "quality_profile_id", "root_folder_path",
+])
+MOVIE_INDEX_FIELDS = ("tmdb_id",)
+
+# History events that change a movie's file state.
+MOVIE_CHANGING_HISTORY_EVENTS = {
+    "downloadFolderImported", "movieFolderImported", "movieFileDeleted", "movieFileRenamed",
+}
+# Commands that change movie data once they complete. Without movie IDs in
+# their body they apply to every movie. Radarr queues a RefreshMovie for each
+# movie added, from any client, so adds reach the catalogue this way too.
+MOVIE_CHANGING_COMMANDS = {
+    "RefreshMovie", "RescanMovie", "RenameMovie", "RenameFiles", "MoveMovie", "BulkMoveMovie",
+}
+# Beyond this many changed movies one /movie call is cheaper than single fetches.
+MAX_INCREMENTAL_MOVIE_FETCHES = 50
+# Overlap between sync windows, covering clock skew between the bot and Radarr.
+SYNC_CURSOR_OVERLAP_SECONDS = 60
+
+
+def _to_record(movie: dict) -> MovieRecord:
+    root_folder_path = movie.get("rootFolderPath")
+    return MovieRecord(
+        id=movie["id"],
+        title=movie.get("title", "Unknown Movie"),
+        year=movie.get("year"),
+        tmdb_id=movie.get("tmdbId"),
+        monitored=bool(movie.get("monitored")),
+        has_file=bool(movie.get("hasFile")),
+        size_on_disk=movie.get("sizeOnDisk") or 0,
+        quality_profile_id=movie.get("qualityProfileId"),
+        # Shared by thousands of movies; keep one copy of each path.
+        root_folder_path=sys.intern(
+            root_folder_path) if root_folder_path else None,
+    )
+
+
+def _sync_cursor_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=SYNC_CURSOR_OVERLAP_SECONDS)
+
+
+def _parse_radarr_time(value):
+    try:
+        return datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+
+
+def load_movie_catalog(force_full=False) -> dict:
+    """Fetches the full /movie list into the catalogue if it is missing, stale or force_full."""
+    if force_full or catalog_needs_full_refresh(CATALOG_SERVICE_NAME):
+        sync_cursor = _sync_cursor_now()
+        # Each movie object is reduced to a record as soon as it is parsed, so
+        # the full /movie response is never in memory at once.
+        records = [_to_record(m) for m in iter_radarr_json_array('/movie')
+                   if isinstance(m, dict) and 'id' in m]
+        replace_catalog(CATALOG_SERVICE_NAME, records,
+                        MOVIE_INDEX_FIELDS, sync_cursor)
+    return get_catalog_records(CATALOG_SERVICE_NAME)
+
+
+def _changed_movies_since(cursor: datetime.datetime) -> set | None:
+    """Movie IDs changed since cursor according to history and commands; None means 'all of them'."""
+    changed_ids = set()
+    history = _radarr_request(
+        'get', '/history/since', params={"date": cursor.strftime("%Y-%m-%dT%H:%M:%SZ")})
+    for event in history or []:
+        if event.get("eventType") in MOVIE_CHANGING_HISTORY_EVENTS and event.get("movieId"):
+            changed_ids.add(event["movieId"])
+
+    for command in _radarr_request('get', '/command') or []:
+        if command.get("name") not in MOVIE_CHANGING_COMMANDS or command.get("status") != "completed":
+            continue
+        ended = _parse_radarr_time(command.get("ended"))
+        if ended is None or ended < cursor:
+            continue
+        body = command.get("body") or {}
+        command_movie_ids = body.get("movieIds") or (
+            [body["movieId"]] if body.get("movieId") else [])
+        if not command_movie_ids:
+            return None
+        changed_ids.update(command_movie_ids)
+    return changed_ids
+
+
+def sync_movie_catalog() -> dict:
+    """
+    Brings the catalogue up to date. Only movies that Radarr's history or
+    finished commands report as changed since the last sync are refetched;
+    a full reload happens when there is no catalogue yet, it is older than
+    CATALOG_FULL_REFRESH_INTERVAL_SECONDS, or too much changed.
+    """
+    cursor = get_catalog_sync_cursor(CATALOG_SERVICE_NAME)
+    if cursor is None or catalog_needs_full_refresh(CATALOG_SERVICE_NAME):
+        return load_movie_catalog(force_full=True)
+
+    new_cursor = _sync_cursor_now()
+    changed_ids = _changed_movies_since(cursor)
+    if changed_ids is None or len(changed_ids) > MAX_INCREMENTAL_MOVIE_FETCHES:
+        return load_movie_catalog(force_full=True)
+
+    updated_records, removed_ids = [], []
+    for movie_id in changed_ids:
+        try:
+            movie = _radarr_request('get', f'/movie/{movie_id}')
+            if isinstance(movie, dict) and 'id' in movie:
+                updated_records.append(_to_record(movie))
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                removed_ids.append(movie_id)
+            else:
+                raise
+    apply_catalog_changes(CATALOG_SERVICE_NAME,
+                          updated_records, removed_ids, new_cursor)
+    return get_catalog_records(CATALOG_SERVICE_NAME)
+
+
+def store_movie_object(movie: dict):
+    """Puts a movie object Radarr just returned (e.g. after an add) into a loaded catalogue."""
+    if isinstance(movie, dict) and 'id' in movie:
+        apply_catalog_changes(CATALOG_SERVICE_NAME, [_to_record(movie)])
+    else:
+        # Added without a usable response: reload on next use rather than miss it.
+        invalidate_catalog(CATALOG_SERVICE_NAME)
+
+
+def get_movie_catalog() -> dict:
+    """{movie_id: MovieRecord}, loading the catalogue on first use."""
+    if not is_catalog_loaded(CATALOG_SERVICE_NAME):
+        return load_movie_catalog()
+    return get_catalog_records(CATALOG_SERVICE_NAME)
+
+
+def find_movie_by_tmdb_id(tmdb_id) -> MovieRecord | None:
+    get_movie_catalog()
+    try:
+        return find_catalog_record(CATALOG_SERVICE_NAME, "tmdb_id", int(tmdb_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def get_all_movie_ids() -> list:
+    """IDs of every movie in the catalogue; errors fall back to what is cached."""
+    try:
+        catalog = get_movie_catalog()
+    except Exception as e:
+        logger.error(
+            f"Error loading Radarr movie catalogue: {e}", exc_info=True)
+        catalog = get_catalog_records(CATALOG_SERVICE_NAME)
+    return list(catalog.keys())
@@ -1,34 +1,27 @@
 import logging
+from contextlib import closing
 import requests
 import backoff
 
+from src.services.bot_http_sessions import get_service_session
+from src.services.bot_catalog_cache import invalidate_catalog
+from src.services.bot_queue_monitor import invalidate_queue_snapshot
+from src.app.app_perf_metrics import instrument_function, measure, endpoint_series_name, GROUP_BACKEND
+from src.services.bot_json_stream import iter_json_array, JSON_STREAM_CHUNK_BYTES
+
 logger = logging.getLogger(__name__)
 
 RADARR_API_URL_GLOBAL = None
 RADARR_API_KEY_GLOBAL = None
+RADARR_API_BASE_URL_RESOLVED = None
+RADARR_BASE_HEADERS = {}
 REQUEST_TIMEOUT = 15
 COMMAND_TIMEOUT = 90
+HEALTH_CHECK_TIMEOUT = 3
 
 
-def init_radarr_config(base_api_url, api_key):
-    global RADARR_API_URL_GLOBAL, RADARR_API_KEY_GLOBAL
-    RADARR_API_URL_GLOBAL = base_api_url
-    RADARR_API_KEY_GLOBAL = api_key
-
-
-@backoff.on_exception(backoff.expo,
-                      requests.exceptions.RequestException,
-                      max_tries=3,
-                      max_time=60,
-                      # type: ignore
-                      giveup=lambda e: hasattr(e, 'response') and e.response is not None and 400 <= e.response.status_code < 500 and e.response.status_code not in [401, 403, 429])
-def _radarr_request_impl(method, endpoint, params=None, data=None, headers=None, timeout_override=None):
-    if not RADARR_API_URL_GLOBAL or not RADARR_API_KEY_GLOBAL:
-        logger.error(
-            "Radarr API URL or Key not configured at time of request.")
-        raise ValueError("Radarr API URL or Key not configured")
-
-    base_url_from_config = RADARR_API_URL_GLOBAL.strip()
+def _resolve_api_base_url(base_api_url):
+    base_url_from_config = base_api_url.strip()
     if not base_url_from_config.endswith('/'):
         base_url_from_config += '/'
 
@@ -45,13 +38,40 @@ def _radarr_request_impl(method, endpoint, params=None, data=None, headers=None,
 
     if not api_base_url.endswith('/'):
         api_base_url += '/'
+    return api_base_url
 
+
+def init_radarr_config(base_api_url, api_key):
+    global RADARR_API_URL_GLOBAL, RADARR_API_KEY_GLOBAL, RADARR_API_BASE_URL_RESOLVED, RADARR_BASE_HEADERS
+    RADARR_API_URL_GLOBAL = base_api_url
+    RADARR_API_KEY_GLOBAL = api_key
+    RADARR_API_BASE_URL_RESOLVED = _resolve_api_base_url(
+        base_api_url) if base_api_url else None
+    RADARR_BASE_HEADERS = {'X-Api-Key': api_key} if api_key else {}
+
+    invalidate_catalog("radarr")
+    invalidate_queue_snapshot("radarr")
+
+
+def _radarr_send(method, endpoint, params=None, data=None, headers=None, timeout_override=None, stream=False):
+    """
+    Sends one request and returns the response once its status is OK,
+    recording the status in _radarr_request.last_response_status. With
+    stream the body is left unread for the caller, who must close it.
+    """
+    if not RADARR_API_URL_GLOBAL or not RADARR_API_KEY_GLOBAL:
+        logger.error(
+            "Radarr API URL or Key not configured at time of request.")
+        raise ValueError("Radarr API URL or Key not configured")
+
+    api_base_url = RADARR_API_BASE_URL_RESOLVED or _resolve_api_base_url(
+        RADARR_API_URL_GLOBAL)
     request_endpoint = endpoint.lstrip('/')
     url = f'{api_base_url}{request_endpoint}'
 
-    base_headers = {'X-Api-Key': RADARR_API_KEY_GLOBAL}
+    base_headers = RADARR_BASE_HEADERS or {'X-Api-Key': RADARR_API_KEY_GLOBAL}
     if headers:
-        base_headers.update(headers)
+        base_headers = {**base_headers, **headers}
 
     current_timeout = timeout_override if timeout_override is not None else REQUEST_TIMEOUT
     if endpoint == "movie/editor" and method.lower() == "put" and timeout_override is None:
@@ -60,18 +80,19 @@ def _radarr_request_impl(method, endpoint, params=None, data=None, headers=None,
         current_timeout = COMMAND_TIMEOUT
 
     response_obj = None
+    session = get_service_session("radarr")
     try:
         if method.lower() == 'get':
-            response_obj = requests.get(
-                url, params=params, headers=base_headers, timeout=current_timeout)
+            response_obj = session.get(
+                url, params=params, headers=base_headers, timeout=current_timeout, stream=stream)
         elif method.lower() == 'post':
-            response_obj = requests.post(
+            response_obj = session.post(
                 url, params=params, json=data, headers=base_headers, timeout=current_timeout)
         elif method.lower() == 'put':
-            response_obj = requests.put(
+            response_obj = session.put(
                 url, params=params, json=data, headers=base_headers, timeout=current_timeout)
         elif method.lower() == 'delete':
-            response_obj = requests.delete(
+            response_obj = session.delete(
                 url, params=params, headers=base_headers, timeout=current_timeout)
         else:
             logger.error(
@@ -80,15 +101,7 @@ def _radarr_request_impl(method, endpoint, params=None, data=None, headers=None,
 
         _radarr_request.last_response_status = response_obj.status_code
         response_obj.raise_for_status()
-
-        if method.lower() == 'delete' and (response_obj.status_code == 200 or response_obj.status_code == 204) and not response_obj.content:
-            return None
-        if response_obj.status_code == 204 or not response_obj.content:
-
-            if method.lower() in ['post', 'put'] and response_obj.status_code in [200, 201, 202] and not response_obj.content:
-                return None
-            return response_obj.json() if response_obj.content else None
-        return response_obj.json()
+        return response_obj
     except requests.exceptions.HTTPError as e:
         _radarr_request.last_response_status = e.response.status_code if e.response else None
         logger.error(
@@ -96,6 +109,8 @@ def _radarr_request_impl(method, endpoint, params=None, data=None, headers=None,
         if e.response and e.response.status_code in [401, 403]:
             logger.error(
                 f"Radarr API Key invalid or insufficient permissions.")
+        if stream:
+            response_obj.close()
         raise
     except requests.exceptions.RequestException as e:
         _radarr_request.last_response_status = None
@@ -109,17 +124,73 @@ def _radarr_request_impl(method, endpoint, params=None, data=None, headers=None,
         raise
 
 
-_radarr_request = _radarr_request_impl
+@backoff.on_exception(backoff.expo,
+                      requests.exceptions.RequestException,
+                      max_tries=3,
+                      max_time=60,
+                      # type: ignore
+                      giveup=lambda e: hasattr(e, 'response') and e.response is not None and 400 <= e.response.status_code < 500 and e.response.status_code not in [401, 403, 429])
+def _radarr_request_impl(method, endpoint, params=None, data=None, headers=None, timeout_override=None):
+    response_obj = _radarr_send(method, endpoint, params=params, data=data,
+                                headers=headers, timeout_override=timeout_override)
+    try:
+        if method.lower() == 'delete' and (response_obj.status_code == 200 or response_obj.status_code == 204) and not response_obj.content:
+            return None
+        if response_obj.status_code == 204 or not response_obj.content:
+
+            if method.lower() in ['post', 'put'] and response_obj.status_code in [200, 201, 202] and not response_obj.content:
+                return None
+            return response_obj.json() if response_obj.content else None
+        return response_obj.json()
+    except Exception as e:
+        _radarr_request.last_response_status = None
+        logger.error(
+            f"Unexpected error in _radarr_request for {method.upper()} {response_obj.url}: {e}", exc_info=True)
+        raise
+
+
+_radarr_request = instrument_function(
+    _radarr_request_impl, GROUP_BACKEND,
+    lambda method, endpoint, *args, **kwargs: endpoint_series_name("radarr", method, endpoint))
 _radarr_request.last_response_status = None
 
 
+@backoff.on_exception(backoff.expo,
+                      requests.exceptions.RequestException,
+                      max_tries=3,
+                      max_time=60,
+                      # type: ignore
+                      giveup=lambda e: hasattr(e, 'response') and e.response is not None and 400 <= e.response.status_code < 500 and e.response.status_code not in [401, 403, 429])
+def _radarr_open_stream(endpoint, params=None):
+    return _radarr_send('get', endpoint, params=params, stream=True)
+
+
+def iter_radarr_json_array(endpoint, params=None):
+    """
+    GETs a list endpoint and yields its items one at a time as they are read,
+    for lists (e.g. /movie) too large to parse in one piece. Opening the
+    request is retried like _radarr_request; a failure mid-stream is raised.
+    The whole read, not just the open, is timed under the endpoint's series.
+    """
+    with measure(GROUP_BACKEND, endpoint_series_name("radarr", "get", endpoint)):
+        with closing(_radarr_open_stream(endpoint, params=params)) as response_obj:
+            yield from iter_json_array(response_obj.iter_content(JSON_STREAM_CHUNK_BYTES))
+
+
 def check_radarr_connection() -> bool:
-    """Performs a quick health check for Radarr."""
+    """Performs a quick, single-attempt health check for Radarr."""
     if not RADARR_API_URL_GLOBAL or not RADARR_API_KEY_GLOBAL:
         return False
     try:
-        # Make a lightweight call to /system/status
-        _radarr_request('get', '/system/status', timeout_override=3)
+        # A single lightweight call to /system/status, bypassing the retries in
+        # _radarr_request so an unreachable server fails within the timeout.
+        api_base_url = RADARR_API_BASE_URL_RESOLVED or _resolve_api_base_url(
+            RADARR_API_URL_GLOBAL)
+        response = get_service_session("radarr").get(
+            f"{api_base_url}system/status",
+            headers=RADARR_BASE_HEADERS or {'X-Api-Key': RADARR_API_KEY_GLOBAL},
+            timeout=HEALTH_CHECK_TIMEOUT)
+        response.raise_for_status()
         logger.debug("Radarr health check: PASSED")
         return True
     except Exception as e:
@@ -1,27 +1,33 @@
+import copy
 import logging
 import json
+import threading
+import time
 import requests
 from .bot_radarr_core import _radarr_request
+from .bot_radarr_catalog import get_all_movie_ids, get_movie_catalog, sync_movie_catalog, CATALOG_SERVICE_NAME
+from .bot_radarr_add import get_quality_profiles
+from src.services.bot_catalog_cache import get_catalog_records
+from src.services.bot_queue_monitor import (
+    QueueRow, QUEUE_FETCH_PAGE_SIZE, queue_progress_percent, get_queue_page, forget_queue_row
+)
 
 logger = logging.getLogger(__name__)
 
+QUEUE_SERVICE_NAME = "radarr"
 
-def _get_all_movie_ids():
+# Library stats are reused for this long before the catalogue is synced and
+# (if it changed) aggregated again.
+RADARR_STATS_TTL_SECONDS = 300
 
-    try:
-        movies = _radarr_request('get', '/movie')
-        if movies and isinstance(movies, list):
-            return [movie['id'] for movie in movies if 'id' in movie]
-        return []
-    except Exception as e:
-        logger.error(
-            f"Error getting all movie IDs from Radarr: {e}", exc_info=True)
-        return []
+# {"catalog": the records dict the stats were computed from, "computed_at": float, "stats": dict}
+_library_stats_cache = {"catalog": None, "computed_at": 0.0, "stats": None}
+_library_stats_lock = threading.Lock()
 
 
 def rescan_all_movies():
 
-    movie_ids = _get_all_movie_ids()
+    movie_ids = get_all_movie_ids()
     if not movie_ids:
         return "ℹ️ No movies found in Radarr to rescan, or an error occurred fetching them."
     command_data = {"name": "RescanMovie", "movieIds": movie_ids}
@@ -38,7 +44,7 @@ def rescan_all_movies():
 
 def refresh_all_movies():
 
-    movie_ids = _get_all_movie_ids()
+    movie_ids = get_all_movie_ids()
     if not movie_ids:
         return "ℹ️ No movies found in Radarr to refresh, or an error occurred fetching them."
     command_data = {"name": "RefreshMovie", "movieIds": movie_ids}
@@ -55,7 +61,7 @@ def refresh_all_movies():
 
 def rename_all_movie_files():
 
-    movie_ids = _get_all_movie_ids()
+    movie_ids = get_all_movie_ids()
     if not movie_ids:
         return "ℹ️ No movies found in Radarr to rename, or an error occurred fetching them."
     command_data = {
@@ -74,30 +80,47 @@ def rename_all_movie_files():
         return f"⚠️ Error initiating Radarr movie renaming: {type(e).__name__}. Check logs."
 
 
-def get_radarr_queue(page=1, page_size=10, sort_key="timeleft", sort_dir="asc"):
-
+def fetch_radarr_queue_rows() -> list:
+    """The whole Radarr queue, ordered by time left, as QueueRows. Titles come from the movie catalogue."""
     params = {
-        "page": page, "pageSize": page_size, "sortKey": sort_key,
-        "sortDir": sort_dir, "includeMovie": "true"
+        "page": 1, "pageSize": QUEUE_FETCH_PAGE_SIZE, "sortKey": "timeleft",
+        "sortDir": "asc", "includeMovie": "false"
     }
+    queue_data = _radarr_request('get', '/queue', params=params)
+    if isinstance(queue_data, dict) and 'records' in queue_data:
+        records = queue_data['records']
+    elif isinstance(queue_data, list):
+        records = queue_data
+    else:
+        raise ValueError(
+            f"Unexpected response type from Radarr /queue: {type(queue_data).__name__}")
+
+    movie_catalog = get_movie_catalog()
+    rows = []
+    for item in records:
+        if not isinstance(item, dict):
+            logger.warning(f"Skipping non-dict item in Radarr queue: {item}")
+            continue
+        movie_record = movie_catalog.get(item.get('movieId'))
+        rows.append(QueueRow(
+            id=item.get('id'),
+            title=movie_record.title if movie_record else item.get(
+                'title', 'Unknown Movie'),
+            status=item.get('status', 'N/A'),
+            progress=queue_progress_percent(item.get('size'), item.get(
+                'sizeleft'), item.get('progress', 0.0)),
+            timeleft=item.get('timeleft', 'N/A'),
+            media_id=item.get('movieId', 0),
+            season_number=None,
+            episode_number=None,
+        ))
+    return rows
+
+
+def get_radarr_queue(page=1, page_size=10):
+    """A page of the shared Radarr queue snapshot; see bot_queue_monitor."""
     try:
-        queue_data = _radarr_request('get', '/queue', params=params)
-        if isinstance(queue_data, dict) and 'records' in queue_data:
-            return queue_data
-        elif isinstance(queue_data, list):
-            logger.warning(
-                "Radarr /queue returned a list instead of a paginated object. Manual pagination applied.")
-            total_records = len(queue_data)
-            start_index = (page - 1) * page_size
-            end_index = start_index + page_size
-            paginated_records = queue_data[start_index:end_index]
-            return {
-                "page": page, "pageSize": page_size, "sortKey": sort_key,
-                "sortDir": sort_dir, "totalRecords": total_records, "records": paginated_records
-            }
-        logger.warning(
-            f"Unexpected response type from Radarr /queue: {type(queue_data)}. Data: {str(queue_data)[:200]}")
-        return {"error": "Unexpected response from Radarr queue.", "records": [], "totalRecords": 0, "page": page, "pageSize": page_size}
+        return get_queue_page(QUEUE_SERVICE_NAME, page, page_size, fetch_radarr_queue_rows)
     except Exception as e:
         logger.error(f"Error fetching Radarr queue: {e}", exc_info=True)
         return {"error": "Could not fetch Radarr queue.", "records": [], "totalRecords": 0, "page": page, "pageSize": page_size}
@@ -111,6 +134,7 @@ def remove_queue_item(item_id: str, blocklist: bool) -> tuple[bool, str]:
     }
     try:
         _radarr_request('delete', f'/queue/{item_id}', params=params)
+        forget_queue_row(QUEUE_SERVICE_NAME, item_id)
         action_taken = "blocklisted and removed" if blocklist else "removed (not blocklisted)"
         logger.info(
             f"Radarr queue item {item_id} {action_taken} successfully.")
@@ -147,32 +171,75 @@ def trigger_movie_search_for_id(movie_id: int) -> tuple[bool, str]:
         return False, f"⚠️ Error initiating Radarr search for movie ID {movie_id}: {type(e).__name__}. Check logs."
 
 
-def get_radarr_library_stats():
-    """Fetches all movies from Radarr and returns total count and disk size."""
-    total_movies = 0
-    total_size_on_disk_bytes = 0
-    error_message = None
-    try:
-        movies = _radarr_request('get', '/movie')
-        if movies and isinstance(movies, list):
-            total_movies = len(movies)
-            for movie in movies:
-                if isinstance(movie, dict) and 'sizeOnDisk' in movie and movie['sizeOnDisk'] is not None:
-                    total_size_on_disk_bytes += movie['sizeOnDisk']
-
-        elif movies is None:
-            pass
-        else:
-            logger.warning(
-                f"Unexpected response from Radarr /movie endpoint: {type(movies)}")
-            error_message = "Unexpected response from Radarr when fetching movies."
+def _aggregate_library_stats(movie_catalog: dict) -> dict:
+    """One pass over the catalogue: totals plus per-root-folder and per-quality-profile breakdowns."""
+    stats = {
+        "total_movies": len(movie_catalog),
+        "total_size_on_disk_bytes": 0,
+        "movies_with_files": 0,
+        "monitored_movies": 0,
+        "by_root_folder": {},
+        "by_quality_profile_id": {},
+    }
+    for movie_record in movie_catalog.values():
+        stats["total_size_on_disk_bytes"] += movie_record.size_on_disk
+        stats["movies_with_files"] += movie_record.has_file
+        stats["monitored_movies"] += movie_record.monitored
+        for breakdown_key, group in (("by_root_folder", movie_record.root_folder_path or "Unknown"),
+                                     ("by_quality_profile_id", movie_record.quality_profile_id)):
+            group_stats = stats[breakdown_key].get(group)
+            if group_stats is None:
+                group_stats = stats[breakdown_key][group] = {
+                    "movies": 0, "size_on_disk_bytes": 0}
+            group_stats["movies"] += 1
+            group_stats["size_on_disk_bytes"] += movie_record.size_on_disk
+    return stats
+
+
+def _with_quality_profile_names(stats: dict) -> dict:
+    profile_names = {profile['id']: profile['name']
+                     for profile in get_quality_profiles()}
+    result = copy.deepcopy(stats)
+    by_quality_profile_id = result.pop("by_quality_profile_id")
+    result["by_quality_profile"] = {
+        profile_names.get(profile_id, f"Profile {profile_id}" if profile_id is not None else "Unknown"): group_stats
+        for profile_id, group_stats in by_quality_profile_id.items()
+    }
+    return result
+
+
+def get_radarr_library_stats(force_refresh=False):
+    """
+    Returns movie counts and disk usage from the movie catalogue, in total
+    and broken down by root folder and quality profile. Within
+    RADARR_STATS_TTL_SECONDS of the last sync, and while the catalogue is
+    unchanged, the previous aggregates are returned without asking Radarr.
+    """
+    now = time.monotonic()
+    with _library_stats_lock:
+        cached_stats = _library_stats_cache["stats"]
+        if cached_stats is not None and not force_refresh and \
+                now - _library_stats_cache["computed_at"] <= RADARR_STATS_TTL_SECONDS and \
+                _library_stats_cache["catalog"] is get_catalog_records(CATALOG_SERVICE_NAME):
+            return {**_with_quality_profile_names(cached_stats), "error": None}
 
+    try:
+        movie_catalog = sync_movie_catalog()
     except Exception as e:
         logger.error(f"Error getting Radarr library stats: {e}", exc_info=True)
-        error_message = f"Error fetching Radarr library stats: {type(e).__name__}"
-
-    return {
-        "total_movies": total_movies,
-        "total_size_on_disk_bytes": total_size_on_disk_bytes,
-        "error": error_message
-    }
+        return {
+            "total_movies": 0,
+            "total_size_on_disk_bytes": 0,
+            "error": f"Error fetching Radarr library stats: {type(e).__name__}"
+        }
+
+    with _library_stats_lock:
+        # The catalogue is replaced rather than modified on every change, so
+        # the same dict means the previous aggregates still hold.
+        if _library_stats_cache["catalog"] is not movie_catalog or _library_stats_cache["stats"] is None:
+            _library_stats_cache["stats"] = _aggregate_library_stats(
+                movie_catalog)
+            _library_stats_cache["catalog"] = movie_catalog
+        _library_stats_cache["computed_at"] = now
+        stats = _library_stats_cache["stats"]
+    return {**_with_quality_profile_names(stats), "error": None}
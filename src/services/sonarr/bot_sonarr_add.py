@@ -1,59 +1,73 @@
-import os
 import json
 import logging
 import requests
-from src.app.app_file_utils import get_search_results_file_path
 from src.services.sonarr.bot_sonarr_core import _sonarr_request
+from src.services.sonarr.bot_sonarr_catalog import find_series_by_tvdb_id, store_series_object
+from src.services.bot_lookup_cache import cached_lookup, clear_lookup_cache
+from src.services.bot_metadata_cache import get_cached_metadata, refresh_metadata
 import src.app.app_config_holder as app_config_holder
 
 logger = logging.getLogger(__name__)
 
-SHOW_RESULTS_FILE_NAME = 'show_search_results.json'
+
+def _fetch_root_folders():
+    folders = _sonarr_request('get', '/rootfolder')
+    if folders and isinstance(folders, list):
+        accessible_folders = [rf for rf in folders if rf.get('accessible')]
+        if accessible_folders:
+            return [{'id': rf.get('id', rf['path']), 'path': rf['path']} for rf in accessible_folders]
+        return [{'id': rf.get('id', rf['path']), 'path': rf['path']} for rf in folders]
+    return []
 
 
-def get_show_results_file_path_local():
-    return get_search_results_file_path(SHOW_RESULTS_FILE_NAME)
+def _fetch_quality_profiles():
+    profiles = _sonarr_request('get', '/qualityprofile')
+    if profiles and isinstance(profiles, list):
+        return [{'id': p['id'], 'name': p['name']} for p in profiles]
+    return []
 
 
-def save_results(filename, results):
+def _fetch_language_profiles():
+    profiles = _sonarr_request('get', '/languageprofile')
+    if profiles and isinstance(profiles, list):
+        return [{'id': p['id'], 'name': p['name']} for p in profiles]
+
     try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(results, file, indent=4)
-        logger.info(
-            f"Saved {len(results)} Sonarr search results to {filename}")
-    except IOError:
-        logger.warning(
-            f"IOError saving Sonarr results to {filename}", exc_info=True)
+
+        profiles_v2 = _sonarr_request('get', '/profile')
+        if profiles_v2 and isinstance(profiles_v2, list) and any("language" in p.get("name", "").lower() for p in profiles_v2):
+            logger.info(
+                "Found language profiles via /profile endpoint (likely Sonarr v4).")
+            return [{'id': p['id'], 'name': p['name']} for p in profiles_v2 if "language" in p.get("name", "").lower()]
+    except Exception as e_profile:
+        logger.debug(
+            f"Could not fetch language profiles via /profile: {e_profile}")
         pass
+    return []
 
 
-def load_results(filename):
-    if os.path.exists(filename):
-        try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                logger.info(
-                    f"Loaded {len(data)} Sonarr results from {filename}")
-                return data
-        except (IOError, json.JSONDecodeError) as e:
-            logger.warning(
-                f"Error loading Sonarr results from {filename}: {e}. Removing corrupt file.", exc_info=True)
-            try:
-                os.remove(filename)
-            except OSError:
-                pass
+def _fetch_tags():
+    tags_list = _sonarr_request('get', '/tag')
+    if tags_list and isinstance(tags_list, list):
+        return [{'id': t['id'], 'label': t['label']} for t in tags_list]
     return []
 
 
+METADATA_FETCHERS = {
+    "root_folders": _fetch_root_folders,
+    "quality_profiles": _fetch_quality_profiles,
+    "language_profiles": _fetch_language_profiles,
+    "tags": _fetch_tags,
+}
+
+
+def refresh_sonarr_metadata():
+    return refresh_metadata("sonarr", METADATA_FETCHERS)
+
+
 def get_root_folders():
     try:
-        folders = _sonarr_request('get', '/rootfolder')
-        if folders and isinstance(folders, list):
-            accessible_folders = [rf for rf in folders if rf.get('accessible')]
-            if accessible_folders:
-                return [{'id': rf.get('id', rf['path']), 'path': rf['path']} for rf in accessible_folders]
-            return [{'id': rf.get('id', rf['path']), 'path': rf['path']} for rf in folders]
-        return []
+        return get_cached_metadata("sonarr", "root_folders", _fetch_root_folders)
     except Exception as e:
         logger.error(f"Error getting Sonarr root folders: {e}", exc_info=True)
         return []
@@ -61,10 +75,7 @@ def get_root_folders():
 
 def get_quality_profiles():
     try:
-        profiles = _sonarr_request('get', '/qualityprofile')
-        if profiles and isinstance(profiles, list):
-            return [{'id': p['id'], 'name': p['name']} for p in profiles]
-        return []
+        return get_cached_metadata("sonarr", "quality_profiles", _fetch_quality_profiles)
     except Exception as e:
         logger.error(
             f"Error getting Sonarr quality profiles: {e}", exc_info=True)
@@ -73,22 +84,7 @@ def get_quality_profiles():
 
 def get_language_profiles():
     try:
-        profiles = _sonarr_request('get', '/languageprofile')
-        if profiles and isinstance(profiles, list):
-            return [{'id': p['id'], 'name': p['name']} for p in profiles]
-
-        try:
-
-            profiles_v2 = _sonarr_request('get', '/profile')
-            if profiles_v2 and isinstance(profiles_v2, list) and any("language" in p.get("name", "").lower() for p in profiles_v2):
-                logger.info(
-                    "Found language profiles via /profile endpoint (likely Sonarr v4).")
-                return [{'id': p['id'], 'name': p['name']} for p in profiles_v2 if "language" in p.get("name", "").lower()]
-        except Exception as e_profile:
-            logger.debug(
-                f"Could not fetch language profiles via /profile: {e_profile}")
-            pass
-        return []
+        return get_cached_metadata("sonarr", "language_profiles", _fetch_language_profiles)
     except Exception as e:
         logger.error(
             f"Error getting Sonarr language profiles: {e}", exc_info=True)
@@ -97,10 +93,7 @@ def get_language_profiles():
 
 def get_tags():
     try:
-        tags_list = _sonarr_request('get', '/tag')
-        if tags_list and isinstance(tags_list, list):
-            return [{'id': t['id'], 'label': t['label']} for t in tags_list]
-        return []
+        return get_cached_metadata("sonarr", "tags", _fetch_tags)
     except Exception as e:
         logger.error(f"Error getting Sonarr tags: {e}", exc_info=True)
         return []
@@ -175,13 +168,16 @@ def get_default_language_profile_id():
         return 1
 
 
+def lookup_series(term):
+    """/series/lookup for a search term (or "tvdb:<id>"), served from the shared lookup cache when fresh."""
+    return cached_lookup("sonarr", term, lambda: _sonarr_request('get', '/series/lookup', params={'term': term}))
+
+
 def search_show(query):
-    params = {'term': query}
-    results_file_full_path = get_show_results_file_path_local()
     max_results_config = app_config_holder.get_add_media_max_search_results()
 
     try:
-        results = _sonarr_request('get', '/series/lookup', params=params)
+        results = lookup_series(query)
         if not results or not isinstance(results, list) or len(results) == 0:
 
             return f'No Sonarr results found for your query: \'{query}\'.'
@@ -193,9 +189,7 @@ def search_show(query):
             first_result_tvdb_id = results[0].get('tvdbId')
             if first_result_tvdb_id:
                 try:
-                    existing_series_list = _sonarr_request(
-                        'get', '/series')
-                    if any(s.get('tvdbId') == first_result_tvdb_id for s in existing_series_list):
+                    if find_series_by_tvdb_id(first_result_tvdb_id):
                         return "All Sonarr results found are already in your library."
                 except:
                     pass
@@ -207,7 +201,6 @@ def search_show(query):
         display_results = filtered_results[:max_results_config]
         logger.info(
             f"Sonarr search for '{query}' found {raw_count} raw, {filtered_count_after_initial} initially filtered, limited to {len(display_results)} results based on config ({max_results_config}).")
-        save_results(results_file_full_path, display_results)
         return display_results
     except ValueError as e:
         logger.error(f"Sonarr search ValueError: {e}", exc_info=True)
@@ -231,16 +224,11 @@ def add_show(tvdb_id, sonarr_show_object, quality_profile_id, root_folder_path,
     show_title_for_msg = sonarr_show_object.get('title', f"TVDB ID {tvdb_id}")
 
     try:
-        existing_series_list = _sonarr_request('get', '/series')
-        if existing_series_list and isinstance(existing_series_list, list):
-            if any(s.get('tvdbId') == int(tvdb_id) for s in existing_series_list):
-                title_for_existing_msg = f"TVDB ID {tvdb_id}"
-                existing_show_obj = next(
-                    (s for s in existing_series_list if s.get('tvdbId') == int(tvdb_id)), None)
-                if existing_show_obj:
-                    title_for_existing_msg = existing_show_obj.get(
-                        'title', title_for_existing_msg)
-                return f"Show '{title_for_existing_msg}' is already in Sonarr."
+        # The catalogue may lag behind Sonarr; a series added meanwhile is
+        # still caught by the "already exists" 400 below.
+        existing_series = find_series_by_tvdb_id(tvdb_id)
+        if existing_series:
+            return f"Show '{existing_series.title}' is already in Sonarr."
         show_to_add = sonarr_show_object
         if not show_to_add or not show_to_add.get("title"):
             logger.error(
@@ -279,8 +267,11 @@ def add_show(tvdb_id, sonarr_show_object, quality_profile_id, root_folder_path,
     try:
         add_response = _sonarr_request(
             'post', '/series', data=payload, headers=headers)
+        # Cached lookups no longer show this series as missing from the library.
+        clear_lookup_cache("sonarr")
         title_to_log = payload.get("title", f"TVDB ID {tvdb_id}")
         if add_response and isinstance(add_response, dict) and add_response.get('id'):
+            store_series_object(add_response)
             logger.info(
                 f"Show '{title_to_log}' added to Sonarr successfully. ID: {add_response.get('id')}")
             return f"Show '{show_title_for_msg}' added to Sonarr successfully!"
@@ -0,0 +1,200 @@
+import datetime
+import logging
+from collections import namedtuple
+
+import requests
+
+from .bot_sonarr_core import _sonarr_request
+from src.services.bot_catalog_cache import (
+    replace_catalog, apply_catalog_changes, is_catalog_loaded, catalog_needs_full_refresh,
+    get_catalog_records, get_catalog_sync_cursor, find_catalog_record, invalidate_catalog
+)
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SERVICE_NAME = "sonarr"
+
+# Only what the bot shows or looks up is kept; a full Sonarr series object is
+# several KB, this is a couple of hundred bytes.
+SeriesRecord = namedtuple("SeriesRecord", [
+    "id", "title", "tvdb_id", "monitored",
+    "episode_count", "episode_file_count", "size_on_disk",
+])
+SERIES_INDEX_FIELDS = ("tvdb_id",)
+
+# History events that change a series' statistics.
+SERIES_CHANGING_HISTORY_EVENTS = {
+    "downloadFolderImported", "seriesFolderImported", "episodeFileDeleted", "episodeFileRenamed",
+}
+# Commands that change series data once they complete. Without series IDs in
+# their body they apply to every series. Sonarr queues a RefreshSeries for each
+# series added, from any client, so adds reach the catalogue this way too.
+SERIES_CHANGING_COMMANDS = {
+    "RefreshSeries", "RescanSeries", "RenameSeries", "RenameFiles", "MoveSeries", "BulkMoveSeries",
+}
+# Beyond this many changed series one /series call is cheaper than single fetches.
+MAX_INCREMENTAL_SERIES_FETCHES = 50
+# Overlap between sync windows, covering clock skew between the bot and Sonarr.
+SYNC_CURSOR_OVERLAP_SECONDS = 60
+
+
+def _to_record(series: dict) -> SeriesRecord:
+    statistics = series.get("statistics") or {}
+    return SeriesRecord(
+        id=series["id"],
+        title=series.get("title", "Unknown Series"),
+        tvdb_id=series.get("tvdbId"),
+        monitored=bool(series.get("monitored")),
+        episode_count=statistics.get("episodeCount", 0),
+        episode_file_count=statistics.get("episodeFileCount", 0),
+        size_on_disk=statistics.get("sizeOnDisk", 0),
+    )
+
+
+def _sync_cursor_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=SYNC_CURSOR_OVERLAP_SECONDS)
+
+
+def _parse_sonarr_time(value):
+    try:
+        return datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+
+
+def load_series_catalog(force_full=False) -> dict:
+    """Fetches the full /series list into the catalogue if it is missing, stale or force_full."""
+    if force_full or catalog_needs_full_refresh(CATALOG_SERVICE_NAME):
+        sync_cursor = _sync_cursor_now()
+        series_list = _sonarr_request('get', '/series')
+        if not isinstance(series_list, list):
+            raise ValueError(
+                f"Unexpected response from Sonarr /series: {type(series_list).__name__}")
+        replace_catalog(CATALOG_SERVICE_NAME,
+                        [_to_record(s) for s in series_list if 'id' in s],
+                        SERIES_INDEX_FIELDS, sync_cursor)
+    return get_catalog_records(CATALOG_SERVICE_NAME)
+
+
+def _changed_series_since(cursor: datetime.datetime) -> set | None:
+    """Series IDs changed since cursor according to history and commands; None means 'all of them'."""
+    changed_ids = set()
+    history = _sonarr_request(
+        'get', '/history/since', params={"date": cursor.strftime("%Y-%m-%dT%H:%M:%SZ")})
+    for event in history or []:
+        if event.get("eventType") in SERIES_CHANGING_HISTORY_EVENTS and event.get("seriesId"):
+            changed_ids.add(event["seriesId"])
+
+    for command in _sonarr_request('get', '/command') or []:
+        if command.get("name") not in SERIES_CHANGING_COMMANDS or command.get("status") != "completed":
+            continue
+        ended = _parse_sonarr_time(command.get("ended"))
+        if ended is None or ended < cursor:
+            continue
+        body = command.get("body") or {}
+        command_series_ids = body.get("seriesIds") or (
+            [body["seriesId"]] if body.get("seriesId") else [])
+        if not command_series_ids:
+            return None
+        changed_ids.update(command_series_ids)
+    return changed_ids
+
+
+def sync_series_catalog() -> dict:
+    """
+    Brings the catalogue up to date. Only series that Sonarr's history or
+    finished commands report as changed since the last sync are refetched;
+    a full reload happens when there is no catalogue yet, it is older than
+    CATALOG_FULL_REFRESH_INTERVAL_SECONDS, or too much changed.
+    """
+    cursor = get_catalog_sync_cursor(CATALOG_SERVICE_NAME)
+    if cursor is None or catalog_needs_full_refresh(CATALOG_SERVICE_NAME):
+        return load_series_catalog(force_full=True)
+
+    new_cursor = _sync_cursor_now()
+    changed_ids = _changed_series_since(cursor)
+    if changed_ids is None or len(changed_ids) > MAX_INCREMENTAL_SERIES_FETCHES:
+        return load_series_catalog(force_full=True)
+
+    _fetch_series_into_catalog(changed_ids, new_cursor)
+    return get_catalog_records(CATALOG_SERVICE_NAME)
+
+
+def _fetch_series_into_catalog(series_ids, sync_cursor=None):
+    updated_records, removed_ids = [], []
+    for series_id in series_ids:
+        try:
+            series = _sonarr_request('get', f'/series/{series_id}')
+            if isinstance(series, dict) and 'id' in series:
+                updated_records.append(_to_record(series))
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                removed_ids.append(series_id)
+            else:
+                raise
+    apply_catalog_changes(CATALOG_SERVICE_NAME,
+                          updated_records, removed_ids, sync_cursor)
+
+
+def add_missing_series_to_catalog(series_ids) -> dict:
+    """
+    Fetches series the catalogue does not know yet (e.g. referenced by a
+    wanted episode before the next sync has seen them) one by one. Returns
+    {series_id: title} for the whole catalogue.
+    """
+    catalog = get_catalog_records(CATALOG_SERVICE_NAME)
+    missing_ids = {series_id for series_id in series_ids
+                   if series_id is not None and series_id not in catalog}
+    if missing_ids and len(missing_ids) <= MAX_INCREMENTAL_SERIES_FETCHES:
+        try:
+            _fetch_series_into_catalog(missing_ids)
+        except Exception as e:
+            logger.error(
+                f"Error fetching Sonarr series {sorted(missing_ids)}: {e}", exc_info=True)
+    return {series_id: record.title for series_id, record in get_catalog_records(CATALOG_SERVICE_NAME).items()}
+
+
+def store_series_object(series: dict):
+    """Puts a series object Sonarr just returned (e.g. after an add) into a loaded catalogue."""
+    if isinstance(series, dict) and 'id' in series:
+        apply_catalog_changes(CATALOG_SERVICE_NAME, [_to_record(series)])
+    else:
+        # Added without a usable response: reload on next use rather than miss it.
+        invalidate_catalog(CATALOG_SERVICE_NAME)
+
+
+def get_series_catalog() -> dict:
+    """{series_id: SeriesRecord}, loading the catalogue on first use."""
+    if not is_catalog_loaded(CATALOG_SERVICE_NAME):
+        return load_series_catalog()
+    return get_catalog_records(CATALOG_SERVICE_NAME)
+
+
+def find_series_by_tvdb_id(tvdb_id) -> SeriesRecord | None:
+    get_series_catalog()
+    try:
+        return find_catalog_record(CATALOG_SERVICE_NAME, "tvdb_id", int(tvdb_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def get_all_series_ids_and_titles_cached(force_refresh=False) -> dict:
+    """{series_id: title}. force_refresh syncs the catalogue first; errors fall back to what is cached."""
+    try:
+        catalog = sync_series_catalog() if force_refresh else get_series_catalog()
+    except Exception as e:
+        logger.error(
+            f"Error updating Sonarr series catalogue: {e}", exc_info=True)
+        catalog = get_catalog_records(CATALOG_SERVICE_NAME)
+    return {series_id: record.title for series_id, record in catalog.items()}
+
+
+def get_series_title_by_id(series_id: int, force_refresh_cache=False) -> str:
+    try:
+        catalog = sync_series_catalog() if force_refresh_cache else get_series_catalog()
+    except Exception as e:
+        logger.error(
+            f"Error updating Sonarr series catalogue: {e}", exc_info=True)
+        catalog = get_catalog_records(CATALOG_SERVICE_NAME)
+    record = catalog.get(series_id)
+    return record.title if record else "Unknown Series"
@@ -1,27 +1,54 @@
 import logging
 import requests
 import backoff
-import time
+
+from src.services.bot_http_sessions import get_service_session
+from src.services.bot_catalog_cache import invalidate_catalog
+from src.services.bot_queue_monitor import invalidate_queue_snapshot
+from src.app.app_perf_metrics import instrument_function, endpoint_series_name, GROUP_BACKEND
 
 logger = logging.getLogger(__name__)
 
 SONARR_API_URL_GLOBAL = None
 SONARR_API_KEY_GLOBAL = None
+SONARR_API_BASE_URL_RESOLVED = None
+SONARR_BASE_HEADERS = {}
 REQUEST_TIMEOUT = 15
 COMMAND_TIMEOUT = 90
-SERIES_TITLE_CACHE = {}
-SERIES_CACHE_LAST_REFRESH = 0
-SERIES_CACHE_TTL = 300
+HEALTH_CHECK_TIMEOUT = 3
+
+
+def _resolve_api_base_url(base_api_url):
+    base_url_from_config = base_api_url.strip()
+    if not base_url_from_config.endswith('/'):
+        base_url_from_config += '/'
+
+    if 'api/v3' not in base_url_from_config:
+
+        if base_url_from_config.count('/') == 2 and base_url_from_config.startswith(('http://', 'https://')):
+            api_base_url = base_url_from_config + 'api/v3'
+        elif base_url_from_config.count('/') > 2 and not base_url_from_config.endswith('api/v3/'):
+            api_base_url = base_url_from_config.rstrip('/') + '/api/v3'
+        else:
+            api_base_url = base_url_from_config
+    else:
+        api_base_url = base_url_from_config
+
+    if not api_base_url.endswith('/'):
+        api_base_url += '/'
+    return api_base_url
 
 
 def init_sonarr_config(base_api_url, api_key):
-    global SONARR_API_URL_GLOBAL, SONARR_API_KEY_GLOBAL
+    global SONARR_API_URL_GLOBAL, SONARR_API_KEY_GLOBAL, SONARR_API_BASE_URL_RESOLVED, SONARR_BASE_HEADERS
     SONARR_API_URL_GLOBAL = base_api_url
     SONARR_API_KEY_GLOBAL = api_key
+    SONARR_API_BASE_URL_RESOLVED = _resolve_api_base_url(
+        base_api_url) if base_api_url else None
+    SONARR_BASE_HEADERS = {'X-Api-Key': api_key} if api_key else {}
 
-    global SERIES_TITLE_CACHE, SERIES_CACHE_LAST_REFRESH
-    SERIES_TITLE_CACHE = {}
-    SERIES_CACHE_LAST_REFRESH = 0
+    invalidate_catalog("sonarr")
+    invalidate_queue_snapshot("sonarr")
 
 
 @backoff.on_exception(backoff.expo,
@@ -36,45 +63,30 @@ def _sonarr_request_impl(method, endpoint, params=None, data=None, headers=None,
             "Sonarr API URL or Key not configured at time of request.")
         raise ValueError("Sonarr API URL or Key not configured")
 
-    base_url_from_config = SONARR_API_URL_GLOBAL.strip()
-    if not base_url_from_config.endswith('/'):
-        base_url_from_config += '/'
-
-    if 'api/v3' not in base_url_from_config:
-
-        if base_url_from_config.count('/') == 2 and base_url_from_config.startswith(('http://', 'https://')):
-            api_base_url = base_url_from_config + 'api/v3'
-        elif base_url_from_config.count('/') > 2 and not base_url_from_config.endswith('api/v3/'):
-            api_base_url = base_url_from_config.rstrip('/') + '/api/v3'
-        else:
-            api_base_url = base_url_from_config
-    else:
-        api_base_url = base_url_from_config
-
-    if not api_base_url.endswith('/'):
-        api_base_url += '/'
-
+    api_base_url = SONARR_API_BASE_URL_RESOLVED or _resolve_api_base_url(
+        SONARR_API_URL_GLOBAL)
     request_endpoint = endpoint.lstrip('/')
     url = f'{api_base_url}{request_endpoint}'
 
-    base_headers = {'X-Api-Key': SONARR_API_KEY_GLOBAL}
+    base_headers = SONARR_BASE_HEADERS or {'X-Api-Key': SONARR_API_KEY_GLOBAL}
     if headers:
-        base_headers.update(headers)
+        base_headers = {**base_headers, **headers}
 
     current_timeout = timeout_override if timeout_override is not None else REQUEST_TIMEOUT
     if method.lower() == "post" and data and data.get("name") in ["RenameSeries", "MissingEpisodeSearch", "SeriesSearch", "RefreshSeries", "RescanSeries", "EpisodeSearch"] and timeout_override is None:
         current_timeout = COMMAND_TIMEOUT
 
     response_obj = None
+    session = get_service_session("sonarr")
     try:
         if method.lower() == 'get':
-            response_obj = requests.get(
+            response_obj = session.get(
                 url, params=params, headers=base_headers, timeout=current_timeout)
         elif method.lower() == 'post':
-            response_obj = requests.post(
+            response_obj = session.post(
                 url, params=params, json=data, headers=base_headers, timeout=current_timeout)
         elif method.lower() == 'delete':
-            response_obj = requests.delete(
+            response_obj = session.delete(
                 url, params=params, headers=base_headers, timeout=current_timeout)
 
         else:
@@ -112,50 +124,26 @@ def _sonarr_request_impl(method, endpoint, params=None, data=None, headers=None,
         raise
 
 
-_sonarr_request = _sonarr_request_impl
+_sonarr_request = instrument_function(
+    _sonarr_request_impl, GROUP_BACKEND,
+    lambda method, endpoint, *args, **kwargs: endpoint_series_name("sonarr", method, endpoint))
 _sonarr_request.last_response_status = None
 
 
-def get_all_series_ids_and_titles_cached(force_refresh=False):
-    global SERIES_TITLE_CACHE, SERIES_CACHE_LAST_REFRESH
-    current_time = time.time()
-    if not force_refresh and SERIES_TITLE_CACHE and (current_time - SERIES_CACHE_LAST_REFRESH < SERIES_CACHE_TTL):
-        logger.debug("Using cached series titles.")
-        return SERIES_TITLE_CACHE
-
-    logger.debug("Fetching or refreshing series titles from Sonarr.")
-    try:
-        series_list = _sonarr_request('get', '/series')
-        if series_list and isinstance(series_list, list):
-            SERIES_TITLE_CACHE = {s['id']: s.get('title', 'Unknown Series')
-                                  for s in series_list if 'id' in s}
-            SERIES_CACHE_LAST_REFRESH = current_time
-            logger.info(
-                f"Refreshed Sonarr series title cache with {len(SERIES_TITLE_CACHE)} items.")
-            return SERIES_TITLE_CACHE
-        logger.warning(
-            "No series data returned from Sonarr for title cache, or data was not a list.")
-        return {}
-    except Exception as e:
-        logger.error(
-            f"Error getting all series from Sonarr for title cache: {e}", exc_info=True)
-
-        return SERIES_TITLE_CACHE if SERIES_TITLE_CACHE else {}
-
-
-def get_series_title_by_id(series_id: int, force_refresh_cache=False) -> str:
-    series_map = get_all_series_ids_and_titles_cached(
-        force_refresh=force_refresh_cache)
-    return series_map.get(series_id, "Unknown Series")
-
-
 def check_sonarr_connection() -> bool:
-    """Performs a quick health check for Sonarr."""
+    """Performs a quick, single-attempt health check for Sonarr."""
     if not SONARR_API_URL_GLOBAL or not SONARR_API_KEY_GLOBAL:
         return False
     try:
-        # Make a lightweight call to /system/status
-        _sonarr_request('get', '/system/status', timeout_override=3)
+        # A single lightweight call to /system/status, bypassing the retries in
+        # _sonarr_request so an unreachable server fails within the timeout.
+        api_base_url = SONARR_API_BASE_URL_RESOLVED or _resolve_api_base_url(
+            SONARR_API_URL_GLOBAL)
+        response = get_service_session("sonarr").get(
+            f"{api_base_url}system/status",
+            headers=SONARR_BASE_HEADERS or {'X-Api-Key': SONARR_API_KEY_GLOBAL},
+            timeout=HEALTH_CHECK_TIMEOUT)
+        response.raise_for_status()
         logger.debug("Sonarr health check: PASSED")
         return True
     except Exception as e:
@@ -2,14 +2,20 @@ import logging
 import json
 import requests
 
-from .bot_sonarr_core import _sonarr_request, get_all_series_ids_and_titles_cached
+from .bot_sonarr_core import _sonarr_request
+from .bot_sonarr_catalog import get_all_series_ids_and_titles_cached, sync_series_catalog
+from src.services.bot_queue_monitor import (
+    QueueRow, QUEUE_FETCH_PAGE_SIZE, queue_progress_percent, get_queue_page, forget_queue_row
+)
 
 logger = logging.getLogger(__name__)
 
+QUEUE_SERVICE_NAME = "sonarr"
+
 
 def rescan_all_series():
 
-    series_map = get_all_series_ids_and_titles_cached(force_refresh=True)
+    series_map = get_all_series_ids_and_titles_cached()
     series_ids = list(series_map.keys())
     if not series_ids:
         return "ℹ️ No series found in Sonarr to rescan, or an error occurred fetching them."
@@ -27,7 +33,7 @@ def rescan_all_series():
 
 def refresh_all_series():
 
-    series_map = get_all_series_ids_and_titles_cached(force_refresh=True)
+    series_map = get_all_series_ids_and_titles_cached()
     series_ids = list(series_map.keys())
     if not series_ids:
         return "ℹ️ No series found in Sonarr to refresh, or an error occurred fetching them."
@@ -45,7 +51,7 @@ def refresh_all_series():
 
 def rename_all_series_files():
 
-    series_map = get_all_series_ids_and_titles_cached(force_refresh=True)
+    series_map = get_all_series_ids_and_titles_cached()
     series_ids = list(series_map.keys())
     if not series_ids:
         return "ℹ️ No series found in Sonarr to rename, or an error occurred fetching them."
@@ -65,30 +71,6 @@ def rename_all_series_files():
         return f"⚠️ Error initiating Sonarr series/episode file renaming: {type(e).__name__}. Check logs."
 
 
-def get_wanted_missing_episodes(page=1, page_size=5, sort_key="airDateUtc", sort_dir="desc"):
-
-    params = {
-        "page": page, "pageSize": page_size, "sortKey": sort_key,
-        "sortDir": sort_dir, "monitored": "true",
-    }
-    try:
-        data = _sonarr_request('get', '/wanted/missing', params=params)
-        if data and 'records' in data:
-            current_cache = get_all_series_ids_and_titles_cached()
-            for record in data['records']:
-                if 'series' not in record or not record['series'].get('title'):
-                    record['seriesTitle'] = current_cache.get(
-                        record.get('seriesId'), 'Unknown Series')
-                else:
-                    record['seriesTitle'] = record['series'].get(
-                        'title', 'Unknown Series')
-        return data
-    except Exception as e:
-        logger.error(
-            f"Error fetching wanted/missing episodes from Sonarr: {e}", exc_info=True)
-        return {"error": "Could not fetch wanted episodes.", "records": [], "totalRecords": 0, "page": page, "pageSize": page_size}
-
-
 def trigger_missing_episode_search():
 
     command_data = {
@@ -132,29 +114,44 @@ def trigger_episode_search(episode_ids: list) -> tuple[bool, str]:
         return False, f"⚠️ Error initiating Sonarr episode search: {type(e).__name__}. Check logs."
 
 
-def get_sonarr_queue(page=1, page_size=10, sort_key="timeleft", sort_dir="asc", include_unknown_series_items=True):
-
+def fetch_sonarr_queue_rows() -> list:
+    """The whole Sonarr queue, ordered by time left, as QueueRows. Series titles come from the series catalogue."""
     params = {
-        "page": page, "pageSize": page_size, "sortKey": sort_key, "sortDir": sort_dir,
-        "includeUnknownSeriesItems": str(include_unknown_series_items).lower(),
-        "includeSeries": "true", "includeEpisode": "true"
+        "page": 1, "pageSize": QUEUE_FETCH_PAGE_SIZE, "sortKey": "timeleft", "sortDir": "asc",
+        "includeUnknownSeriesItems": "true",
+        "includeSeries": "false", "includeEpisode": "true"
     }
+    queue_data = _sonarr_request('get', '/queue', params=params)
+    if not queue_data or 'records' not in queue_data:
+        raise ValueError(
+            f"Unexpected response structure from Sonarr /queue: {str(queue_data)[:200]}")
+
+    series_titles = get_all_series_ids_and_titles_cached()
+    rows = []
+    for item in queue_data['records']:
+        if not isinstance(item, dict):
+            logger.warning(f"Skipping non-dict item in Sonarr queue: {item}")
+            continue
+        ep_info = item.get('episode') or {}
+        rows.append(QueueRow(
+            id=item.get('id'),
+            title=series_titles.get(item.get('seriesId'), 'Unknown Series'),
+            status=item.get('status', 'N/A'),
+            progress=queue_progress_percent(item.get('size'), item.get(
+                'sizeleft'), item.get('progress', item.get('totalProgress', 0.0))),
+            timeleft=item.get('timeleft', 'N/A'),
+            media_id=ep_info.get('id', item.get('episodeId', 0)),
+            season_number=ep_info.get(
+                'seasonNumber', item.get('seasonNumber')),
+            episode_number=ep_info.get('episodeNumber'),
+        ))
+    return rows
+
+
+def get_sonarr_queue(page=1, page_size=10):
+    """A page of the shared Sonarr queue snapshot; see bot_queue_monitor."""
     try:
-        queue_data = _sonarr_request('get', '/queue', params=params)
-        if queue_data and 'records' in queue_data:
-            current_cache = get_all_series_ids_and_titles_cached()
-            for record in queue_data['records']:
-                if 'series' in record and isinstance(record['series'], dict) and 'title' in record['series']:
-                    record['seriesTitle'] = record['series']['title']
-                elif 'seriesId' in record:
-                    record['seriesTitle'] = current_cache.get(
-                        record['seriesId'], 'Unknown Series')
-                else:
-                    record['seriesTitle'] = 'Unknown Series'
-            return queue_data
-        logger.warning(
-            f"Unexpected response structure from Sonarr /queue: {queue_data}")
-        return {"error": "Unexpected response from Sonarr queue.", "records": [], "totalRecords": 0, "page": page, "pageSize": page_size}
+        return get_queue_page(QUEUE_SERVICE_NAME, page, page_size, fetch_sonarr_queue_rows)
     except Exception as e:
         logger.error(f"Error fetching Sonarr queue: {e}", exc_info=True)
         return {"error": "Could not fetch Sonarr queue.", "records": [], "totalRecords": 0, "page": page, "pageSize": page_size}
@@ -168,6 +165,7 @@ def remove_queue_item(item_id: str, blocklist: bool) -> tuple[bool, str]:
     }
     try:
         _sonarr_request('delete', f'/queue/{item_id}', params=params)
+        forget_queue_row(QUEUE_SERVICE_NAME, item_id)
         action_taken = "blocklisted and removed" if blocklist else "removed (not blocklisted)"
         logger.info(
             f"Sonarr queue item {item_id} {action_taken} successfully.")
@@ -187,29 +185,17 @@ def remove_queue_item(item_id: str, blocklist: bool) -> tuple[bool, str]:
 
 
 def get_sonarr_library_stats():
-    """Fetches all series from Sonarr and returns total series count, episode count, and disk size."""
+    """Returns total series count, episode count, and disk size from the series catalogue."""
     total_series = 0
     total_episodes = 0
     total_size_on_disk_bytes = 0
     error_message = None
     try:
-        series_list = _sonarr_request('get', '/series')
-        if series_list and isinstance(series_list, list):
-            total_series = len(series_list)
-            for series_item in series_list:
-                if isinstance(series_item, dict):
-                    if 'statistics' in series_item and isinstance(series_item['statistics'], dict):
-
-                        total_episodes += series_item['statistics'].get(
-                            'episodeFileCount', 0)
-                        total_size_on_disk_bytes += series_item['statistics'].get(
-                            'sizeOnDisk', 0)
-        elif series_list is None:
-            pass
-        else:
-            logger.warning(
-                f"Unexpected response from Sonarr /series endpoint: {type(series_list)}")
-            error_message = "Unexpected response from Sonarr when fetching series."
+        series_catalog = sync_series_catalog()
+        total_series = len(series_catalog)
+        for series_record in series_catalog.values():
+            total_episodes += series_record.episode_file_count
+            total_size_on_disk_bytes += series_record.size_on_disk
     except Exception as e:
         logger.error(f"Error getting Sonarr library stats: {e}", exc_info=True)
         error_message = f"Error fetching Sonarr library stats: {type(e).__name__}"
@@ -0,0 +1,199 @@
+import logging
+import threading
+import time
+from collections import namedtuple
+
+from . import bot_sonarr_core
+from .bot_sonarr_core import _sonarr_request
+from .bot_sonarr_catalog import get_all_series_ids_and_titles_cached, add_missing_series_to_catalog
+from .bot_sonarr_manage import trigger_episode_search
+
+logger = logging.getLogger(__name__)
+
+# /wanted/missing is read this many records at a time, however small the
+# display pages are; display pages are sliced out of the cached chunks.
+WANTED_UPSTREAM_PAGE_SIZE = 100
+# Cached chunks are dropped after this long, on an explicit refresh, or when
+# the Sonarr URL changes.
+WANTED_CACHE_TTL_SECONDS = 300
+# Episode searches requested within this window go out as one EpisodeSearch.
+EPISODE_SEARCH_BATCH_WINDOW_SECONDS = 5
+
+WANTED_SORT_KEY = "airDateUtc"
+WANTED_SORT_DIR = "desc"
+
+WantedEpisode = namedtuple("WantedEpisode", [
+    "id", "series_title", "season_number", "episode_number", "title",
+])
+
+# {"chunks": {upstream_page: (WantedEpisode, ...)}, "total_records": int | None,
+#  "created_at": float, "api_base_url": str | None}
+_wanted_cache = {"chunks": {}, "total_records": None,
+                 "created_at": 0.0, "api_base_url": None}
+_wanted_lock = threading.Lock()
+
+# episode_id -> set of chat_id_str that asked for it
+_pending_episode_searches: dict[int, set] = {}
+_pending_searches_lock = threading.Lock()
+
+WANTED_PIPELINE_STATS = {
+    "upstream_fetches": 0,
+    "page_reads": 0,
+    "page_cache_hits": 0,
+    "prefetches": 0,
+    "search_batches": 0,
+    "episodes_searched": 0,
+}
+
+
+def _to_wanted_episode(record: dict, series_titles: dict) -> WantedEpisode:
+    return WantedEpisode(
+        id=record.get('id'),
+        series_title=series_titles.get(
+            record.get('seriesId'), 'Unknown Series'),
+        season_number=record.get('seasonNumber'),
+        episode_number=record.get('episodeNumber'),
+        title=record.get('title'),
+    )
+
+
+def _reset_cache_locked():
+    _wanted_cache["chunks"] = {}
+    _wanted_cache["total_records"] = None
+    _wanted_cache["created_at"] = time.monotonic()
+    _wanted_cache["api_base_url"] = bot_sonarr_core.SONARR_API_BASE_URL_RESOLVED
+
+
+def _expire_cache_locked():
+    if time.monotonic() - _wanted_cache["created_at"] > WANTED_CACHE_TTL_SECONDS or \
+            _wanted_cache["api_base_url"] != bot_sonarr_core.SONARR_API_BASE_URL_RESOLVED:
+        _reset_cache_locked()
+
+
+def _fetch_chunk(upstream_page: int):
+    params = {
+        "page": upstream_page, "pageSize": WANTED_UPSTREAM_PAGE_SIZE, "sortKey": WANTED_SORT_KEY,
+        "sortDir": WANTED_SORT_DIR, "monitored": "true",
+    }
+    data = _sonarr_request('get', '/wanted/missing', params=params)
+    if not data or 'records' not in data:
+        raise ValueError(
+            f"Unexpected response from Sonarr /wanted/missing: {str(data)[:200]}")
+    WANTED_PIPELINE_STATS["upstream_fetches"] += 1
+    series_titles = get_all_series_ids_and_titles_cached()
+    unknown_series_ids = {record.get('seriesId') for record in data['records']
+                          if isinstance(record, dict) and record.get('seriesId') not in series_titles}
+    if unknown_series_ids:
+        # Added since the last sync; fetched by ID rather than reloading /series.
+        series_titles = add_missing_series_to_catalog(unknown_series_ids)
+    return tuple(_to_wanted_episode(record, series_titles) for record in data['records']
+                 if isinstance(record, dict)), data.get('totalRecords', 0)
+
+
+def _upstream_pages_for(page: int, page_size: int) -> range:
+    first_offset = (page - 1) * page_size
+    last_offset = first_offset + page_size - 1
+    return range(first_offset // WANTED_UPSTREAM_PAGE_SIZE + 1,
+                 last_offset // WANTED_UPSTREAM_PAGE_SIZE + 2)
+
+
+def _ensure_chunks(page: int, page_size: int) -> bool:
+    """Loads the upstream chunks a display page needs. Returns True if nothing had to be fetched."""
+    with _wanted_lock:
+        _expire_cache_locked()
+        total_records = _wanted_cache["total_records"]
+        missing_pages = [upstream_page for upstream_page in _upstream_pages_for(page, page_size)
+                         if upstream_page not in _wanted_cache["chunks"] and
+                         (total_records is None or (upstream_page - 1) * WANTED_UPSTREAM_PAGE_SIZE < total_records)]
+        if not missing_pages:
+            return True
+        generation = _wanted_cache["created_at"]
+    fetched = {upstream_page: _fetch_chunk(upstream_page)
+               for upstream_page in missing_pages}
+    with _wanted_lock:
+        # An invalidation during the fetch means these chunks may mix with newer ones.
+        if _wanted_cache["created_at"] == generation:
+            for upstream_page, (chunk, total_records) in fetched.items():
+                _wanted_cache["chunks"][upstream_page] = chunk
+                _wanted_cache["total_records"] = total_records
+    return False
+
+
+def get_wanted_missing_episodes(page=1, page_size=5):
+    """
+    A display page of monitored wanted/missing episodes (newest air date
+    first), sliced from cached upstream chunks of WANTED_UPSTREAM_PAGE_SIZE.
+    """
+    try:
+        if _ensure_chunks(page, page_size):
+            WANTED_PIPELINE_STATS["page_cache_hits"] += 1
+        WANTED_PIPELINE_STATS["page_reads"] += 1
+        with _wanted_lock:
+            chunks = dict(_wanted_cache["chunks"])
+            total_records = _wanted_cache["total_records"] or 0
+        first_offset = (page - 1) * page_size
+        records = []
+        for offset in range(first_offset, min(first_offset + page_size, total_records)):
+            chunk = chunks.get(offset // WANTED_UPSTREAM_PAGE_SIZE + 1, ())
+            index_in_chunk = offset % WANTED_UPSTREAM_PAGE_SIZE
+            if index_in_chunk < len(chunk):
+                records.append(chunk[index_in_chunk])
+        return {"records": records, "totalRecords": total_records, "page": page, "pageSize": page_size}
+    except Exception as e:
+        logger.error(
+            f"Error fetching wanted/missing episodes from Sonarr: {e}", exc_info=True)
+        return {"error": "Could not fetch wanted episodes.", "records": [], "totalRecords": 0, "page": page, "pageSize": page_size}
+
+
+def prefetch_wanted_page(page: int, page_size: int):
+    """Loads the chunks for a display page ahead of time (e.g. the next one while this one is shown)."""
+    try:
+        if not _ensure_chunks(page, page_size):
+            WANTED_PIPELINE_STATS["prefetches"] += 1
+            logger.debug(f"Prefetched Sonarr wanted episodes for page {page}.")
+    except Exception as e:
+        logger.debug(
+            f"Prefetching Sonarr wanted episodes page {page} failed: {e}")
+
+
+def invalidate_wanted_cache():
+    with _wanted_lock:
+        _reset_cache_locked()
+
+
+def queue_episode_search(episode_ids: list, chat_id) -> tuple[int, bool]:
+    """
+    Adds episodes to the pending search batch. Returns (episodes in the batch,
+    whether this call started the batch and so must schedule
+    flush_episode_search_batch after EPISODE_SEARCH_BATCH_WINDOW_SECONDS).
+    """
+    with _pending_searches_lock:
+        starts_batch = not _pending_episode_searches
+        for episode_id in episode_ids:
+            _pending_episode_searches.setdefault(
+                int(episode_id), set()).add(str(chat_id))
+        return len(_pending_episode_searches), starts_batch
+
+
+def flush_episode_search_batch() -> tuple[bool, str, set]:
+    """Sends every pending episode as one EpisodeSearch. Returns (success, message, chat IDs to tell)."""
+    with _pending_searches_lock:
+        pending = dict(_pending_episode_searches)
+        _pending_episode_searches.clear()
+    if not pending:
+        return True, "", set()
+    episode_ids = sorted(pending)
+    chat_ids = set().union(*pending.values())
+    success, message = trigger_episode_search(episode_ids)
+    if success:
+        WANTED_PIPELINE_STATS["search_batches"] += 1
+        WANTED_PIPELINE_STATS["episodes_searched"] += len(episode_ids)
+    return success, message, chat_ids
+
+
+def get_wanted_pipeline_stats() -> dict:
+    stats = dict(WANTED_PIPELINE_STATS)
+    stats["cached_episodes"] = sum(len(chunk)
+                                   for chunk in _wanted_cache["chunks"].values())
+    stats["pending_searches"] = len(_pending_episode_searches)
+    return stats